@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent SQLite auto-save writes: default settings vs the WAL profile
+vs the WAL profile plus the serialized writer queue (see database.sqlite_profile).
+Each worker thread repeatedly upserts one section row in its own transaction,
+like concurrent put_contact / put_project / put_financial calls.
+Usage from apps/backend:
+  uv run python scripts/bench_sqlite_writes.py --threads 16 --writes 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+# Ensure src is on path when run from apps/backend
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src = os.path.join(backend_dir, "src")
+if src not in sys.path:
+    sys.path.insert(0, src)
+
+from peewee import CharField, IntegerField, Model, OperationalError, SqliteDatabase  # noqa: E402
+
+from database.sqlite_profile import SQLiteWriteQueue, get_sqlite_pragmas  # noqa: E402
+
+
+class Section(Model):
+    application = CharField(unique=True)
+    payload = CharField()
+    revision = IntegerField(default=0)
+
+
+def _save(db: SqliteDatabase, application: str, payload: str) -> None:
+    with db.atomic():
+        updated = (
+            Section.update(payload=payload, revision=Section.revision + 1)
+            .where(Section.application == application)
+            .execute()
+        )
+        if not updated:
+            Section.create(application=application, payload=payload)
+
+
+def run(mode: str, threads: int, writes: int, directory: str) -> dict[str, float]:
+    pragmas = get_sqlite_pragmas() if mode != "default" else {}
+    db = SqliteDatabase(os.path.join(directory, f"{mode}.db"), pragmas=pragmas, check_same_thread=False)
+    Section.bind(db)
+    db.create_tables([Section])
+    queue = SQLiteWriteQueue(db) if mode == "wal+queue" else None
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def worker(n: int) -> None:
+        nonlocal errors
+        mine: list[float] = []
+        failed = 0
+        for i in range(writes):
+            start = time.perf_counter()
+            try:
+                if queue is not None:
+                    queue.submit(_save, db, f"app-{n}-{i % 10}", f"payload {i}")
+                else:
+                    _save(db, f"app-{n}-{i % 10}", f"payload {i}")
+            except OperationalError:  # database is locked
+                failed += 1
+            mine.append(time.perf_counter() - start)
+        db.close()
+        with lock:
+            latencies.extend(mine)
+            errors += failed
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+    batches = None
+    if queue is not None:
+        queue.close()
+        batches = queue.stats()["batches"]
+    db.close()
+    latencies.sort()
+    ok = threads * writes - errors
+    return {
+        "writes_per_sec": ok / elapsed,
+        "errors": errors,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "commits": batches if batches is not None else ok,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite concurrent write throughput: default vs WAL vs WAL + writer queue")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--writes", type=int, default=200, help="Writes per thread")
+    parser.add_argument("--dir", default=None, help="Directory for the test databases (use the deployment disk; tmpfs hides fsync cost)")
+    args = parser.parse_args()
+    print(f"{args.threads} threads x {args.writes} writes")
+    print(f"{'mode':<10} {'writes/s':>10} {'errors':>7} {'commits':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        for mode in ("default", "wal", "wal+queue"):
+            r = run(mode, args.threads, args.writes, directory)
+            print(
+                f"{mode:<10} {r['writes_per_sec']:>10.0f} {r['errors']:>7} {r['commits']:>8} "
+                f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark authentication.utils.jwt.validate_token throughput with the verified-token
+cache disabled (every call verifies the signature) and enabled, for a working set
+of distinct tokens validated round-robin, as concurrent requests from a set of
+signed-in users would.
+Usage from apps/backend:
+  uv run python scripts/bench_token_validation.py --tokens 100 --calls 200000
+"""
+import argparse
+import os
+import sys
+import time
+
+# Ensure src is on path when run from apps/backend
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src = os.path.join(backend_dir, "src")
+if src not in sys.path:
+    sys.path.insert(0, src)
+
+from authentication.utils.jwt import create_token, get_token_cache_stats, reload_keys, validate_token  # noqa: E402
+
+
+def _run(tokens: list[str], calls: int) -> float:
+    n = len(tokens)
+    start = time.perf_counter()
+    for i in range(calls):
+        if validate_token(tokens[i % n]) is None:
+            raise SystemExit("token rejected; is JWT_SECRET stable?")
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=100, help="distinct tokens in the working set")
+    parser.add_argument("--calls", type=int, default=200_000, help="validate_token calls per run")
+    args = parser.parse_args()
+
+    os.environ.setdefault("JWT_SECRET", "bench-secret-0123456789abcdef0123456789")
+    results = {}
+    for label, size in (("cache off", "0"), ("cache on", str(max(args.tokens, 1)))):
+        os.environ["JWT_CACHE_SIZE"] = size
+        reload_keys()
+        tokens = [
+            create_token({"sub": f"user-{i}", "email": f"user{i}@example.com", "role": "user"})
+            for i in range(args.tokens)
+        ]
+        results[label] = _run(tokens, args.calls)
+        print(f"{label:10s} {results[label]:12,.0f} validations/s  cache={get_token_cache_stats()}")
+    print(f"speedup    {results['cache on'] / results['cache off']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
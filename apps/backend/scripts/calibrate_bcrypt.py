@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Pick the bcrypt cost (BCRYPT_SALT_ROUNDS) whose hash time on this machine is
+closest to, without exceeding, a target latency. Run it on the task size the
+API runs on (same CPU and limits); existing hashes are upgraded transparently
+on each user's next login once the new value is deployed.
+Usage from apps/backend:
+  uv run python scripts/calibrate_bcrypt.py --target-ms 250
+  uv run python scripts/calibrate_bcrypt.py --target-ms 250 --workers 4
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Ensure src is on path when run from apps/backend
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src = os.path.join(backend_dir, "src")
+if src not in sys.path:
+    sys.path.insert(0, src)
+
+from authentication.utils.password import get_salt_rounds, hash_password  # noqa: E402
+
+MIN_ROUNDS, MAX_ROUNDS = 10, 16  # the range get_salt_rounds() accepts
+
+
+def _median_ms(rounds: int, samples: int, workers: int) -> float:
+    """Median wall time of one hash while workers hashes run concurrently (as under a login burst)."""
+
+    def one(_: int) -> float:
+        start = time.perf_counter()
+        hash_password("Calibrate-P4ssword", rounds=rounds)
+        return (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return statistics.median(pool.map(one, range(samples * workers)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target-ms", type=float, default=250.0, help="target hash latency in milliseconds")
+    parser.add_argument("--samples", type=int, default=3, help="hashes per worker per cost")
+    parser.add_argument("--workers", type=int, default=1, help="concurrent hashes (PASSWORD_HASH_WORKERS)")
+    args = parser.parse_args()
+
+    chosen = MIN_ROUNDS
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        ms = _median_ms(rounds, args.samples, max(1, args.workers))
+        print(f"cost {rounds:2d}: {ms:8.1f} ms")
+        if ms > args.target_ms:
+            break
+        chosen = rounds
+    print(f"\ncurrent BCRYPT_SALT_ROUNDS={get_salt_rounds()}")
+    print(f"BCRYPT_SALT_ROUNDS={chosen}")
+
+
+if __name__ == "__main__":
+    main()
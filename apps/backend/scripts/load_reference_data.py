@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Bulk load a reference dataset (CSV, JSON array or JSON Lines) into a table.
+Rows stream from disk and are upserted in batches (see database.bulk).
+Usage from apps/backend:
+  uv run python scripts/load_reference_data.py County counties.csv --conflict name,state_code
+  uv run python scripts/load_reference_data.py ProjectType types.jsonl --conflict code --update label
+"""
+import argparse
+import os
+import sys
+import time
+
+# Ensure src is on path when run from apps/backend
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src = os.path.join(backend_dir, "src")
+if src not in sys.path:
+    sys.path.insert(0, src)
+
+
+def _split(value: str | None) -> list[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk upsert a CSV/JSON dataset into a model's table")
+    parser.add_argument("model", help="Model class name from database.models (e.g. County)")
+    parser.add_argument("path", help="Path to .csv, .json, .jsonl or .ndjson file")
+    parser.add_argument("--conflict", required=True, help="Comma-separated unique columns (conflict target)")
+    parser.add_argument("--update", default=None, help="Comma-separated columns to overwrite on conflict")
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows per INSERT statement")
+    args = parser.parse_args()
+    path = os.path.abspath(args.path)  # resolve before chdir
+
+    os.chdir(src)
+    import config  # noqa: F401 - load .env (DATABASE_URL, etc.) before DB access
+    import database.models as models
+    from database.bulk import bulk_load
+    from database.connection import init_db
+
+    model = getattr(models, args.model, None)
+    if model is None:
+        parser.error(f"Unknown model: {args.model}")
+    init_db()
+    start = time.perf_counter()
+    count = bulk_load(model, path, _split(args.conflict), _split(args.update), args.batch_size)
+    print(f"Loaded {count} rows into {model._meta.table_name} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
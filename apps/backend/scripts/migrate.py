@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Versioned database migrations (schema_migrations table).
+Usage from apps/backend:
+  uv run python scripts/migrate.py status          # list applied and pending migrations
+  uv run python scripts/migrate.py up              # apply all pending migrations
+  uv run python scripts/migrate.py up --to 0002    # apply pending migrations up to a version
+  uv run python scripts/migrate.py new add_widget  # create the next migration file
+"""
+import argparse
+import os
+import sys
+
+# Ensure src is on path when run from apps/backend
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src = os.path.join(backend_dir, "src")
+if src not in sys.path:
+    sys.path.insert(0, src)
+
+os.chdir(src)
+
+MIGRATION_TEMPLATE = '''"""{description}"""
+from database.migrations.operations import MigrationContext
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    pass
+'''
+
+
+def _status() -> None:
+    from database.migrations.runner import applied_versions, discover_migrations
+
+    applied = applied_versions()
+    for m in discover_migrations():
+        mark = "applied" if m.version in applied else "pending"
+        print(f"{m.version}  {mark:8}  {m.name}")
+
+
+def _up(target: str | None) -> None:
+    from database.migrations.runner import run_migrations
+
+    applied = run_migrations(target=target)
+    if applied:
+        print("Applied: " + ", ".join(applied))
+    else:
+        print("Nothing to apply.")
+
+
+def _new(name: str) -> None:
+    from database.migrations import versions
+    from database.migrations.runner import discover_migrations
+
+    existing = discover_migrations()
+    version = f"{int(existing[-1].version) + 1 if existing else 1:04d}"
+    slug = "_".join(name.lower().split())
+    path = os.path.join(os.path.dirname(versions.__file__), f"{version}_{slug}.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(MIGRATION_TEMPLATE.format(description=name.replace("_", " ").capitalize() + "."))
+    print(f"Created {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Versioned database migrations")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="List applied and pending migrations")
+    up = sub.add_parser("up", help="Apply pending migrations")
+    up.add_argument("--to", dest="target", default=None, help="Last version to apply (e.g. 0002)")
+    new = sub.add_parser("new", help="Create the next migration file")
+    new.add_argument("name", help="Short name, e.g. add_county_key")
+    args = parser.parse_args()
+
+    if args.command == "new":
+        _new(args.name)
+        return
+
+    import config  # noqa: F401 - load .env (DATABASE_URL, etc.) before DB access
+    from database.connection import init_db
+
+    init_db()
+    if args.command == "status":
+        _status()
+    else:
+        _up(args.target)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Rebuild per-user preference rollups (user_preference_rollups) from user_interactions.
+Run after bulk-loading interactions or to repair counts; writes keep them current otherwise.
+Usage from apps/backend:
+  uv run python scripts/rebuild_preference_rollups.py                 # every user
+  uv run python scripts/rebuild_preference_rollups.py --user <uuid>   # one user
+"""
+import argparse
+import os
+import sys
+
+# Ensure src is on path when run from apps/backend
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src = os.path.join(backend_dir, "src")
+if src not in sys.path:
+    sys.path.insert(0, src)
+
+os.chdir(src)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild preference rollups from user_interactions")
+    parser.add_argument("--user", default=None, help="Only this user id")
+    args = parser.parse_args()
+
+    import config  # noqa: F401 - load .env (DATABASE_URL, etc.) before DB access
+    from database.connection import init_db
+    from services.preference_service import PreferenceService
+
+    init_db()
+    result = PreferenceService().rebuild_rollups(args.user)
+    if not result.get("success"):
+        print(result.get("message"))
+        sys.exit(1)
+    print(f"Rebuilt {result['data']['rows']} rollup rows.")
+
+
+if __name__ == "__main__":
+    main()
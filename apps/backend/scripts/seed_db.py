@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
 Run migrations and seed the database (without starting the server).
+Records the schema/seed fingerprint, so workers fast-start (see core.startup).
 Usage from apps/backend:
   uv run python scripts/seed_db.py
   PYTHONPATH=src uv run python scripts/seed_db.py
@@ -20,26 +21,18 @@ os.chdir(src)
 def main() -> None:
     import config  # noqa: F401 - load .env (DATABASE_URL, etc.) before DB access
     from database.connection import init_db
-    from database.migrations.runner import run_migrations
-    from utils.seed_counties import seed_counties
-    from utils.seed_project_options import seed_project_options
-    from utils.seed_budget_categories import seed_budget_categories
-    from utils.seed_users import seed_users
+    from core.startup import StartupReport, leader_lock, run_bootstrap
 
     print("Initializing database...")
-    init_db()
-    print("Running migrations...")
-    run_migrations()
-    print("Seeding counties...")
-    seed_counties()
-    print("Seeding project options...")
-    seed_project_options()
-    print("Seeding budget categories...")
-    seed_budget_categories()
-    print("Seeding users...")
-    seed_users()
+    db = init_db()
+    print("Running migrations and seeds...")
+    report = StartupReport()
+    with leader_lock(db):
+        run_bootstrap(db, report)
+    for name, seconds in report.steps:
+        print(f"  {name}: {seconds * 1000:.0f} ms")
+    # Workers started with STARTUP_MIGRATIONS=auto now skip this work (fingerprint recorded).
     print("Done.")
 
-
 if __name__ == "__main__":
     main()
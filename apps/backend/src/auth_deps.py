@@ -1,13 +1,22 @@
 """
 Auth dependency for protected routes: accepts JWT (when AUTH_PROVIDER=jwt)
 or mock provider tokens (when AUTH_PROVIDER=mock) so Dashboard works in both modes.
+
+Routes that need the caller's user id, admin flag or board membership depend on
+get_principal, which resolves them once per request: from the token's role
+claims when present, otherwise from a cached lookup (see core.principal).
 """
 import os
 from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, status
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from core.principal import Principal, cached_principal, load_principal, principal_from_claims
+from core.service_executor import run_service
+from utils.responses import error_response
+
 security = HTTPBearer(auto_error=False)
 
 
@@ -71,3 +80,32 @@ def get_current_user_optional(
         except Exception:
             pass
     return payload
+
+
+async def _principal_for(claims: dict[str, Any]) -> Principal:
+    principal = principal_from_claims(claims) or cached_principal(claims)
+    if principal is None:
+        principal = await run_service("auth", load_principal, claims)
+    return principal
+
+
+async def get_principal(user: Annotated[dict[str, Any], Depends(get_current_user)]) -> Principal:
+    """Principal for the Bearer token (401 if missing/invalid); cached across requests."""
+    return await _principal_for(user)
+
+
+async def get_principal_optional(
+    user: Annotated[dict[str, Any] | None, Depends(get_current_user_optional)],
+) -> Principal | None:
+    """Principal when a valid Bearer token is present; otherwise None."""
+    return await _principal_for(user) if user else None
+
+
+def user_id_or_401(principal: Principal) -> tuple[str | None, JSONResponse | None]:
+    """(user id, None), or (None, 401 response) when the token's subject has no user."""
+    if not principal.user_id:
+        return None, JSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content=error_response("User not found"),
+        )
+    return principal.user_id, None
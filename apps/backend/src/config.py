@@ -1,5 +1,6 @@
 """Environment-based configuration."""
 import os
+import secrets
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -23,6 +24,54 @@ CORS_ORIGINS: list[str] = [
     o.strip() for o in os.getenv("CORS_ORIGINS", "http://localhost:5173,http://127.0.0.1:5173").split(",") if o.strip()
 ]
 
+# Service execution: blocking service calls from async routes run in a bounded thread pool.
+# SERVICE_GROUP_CONCURRENCY: per route group limits, e.g. "applications=16,documents=4".
+SERVICE_EXECUTOR_THREADS: int = int(os.getenv("SERVICE_EXECUTOR_THREADS", "32"))
+SERVICE_GROUP_CONCURRENCY: dict[str, int] = {
+    k.strip(): int(v)
+    for k, _, v in (
+        p.partition("=")
+        for p in os.getenv(
+            "SERVICE_GROUP_CONCURRENCY",
+            "applications=16,documents=4,forestry_board=8,complaints=8,preferences=4,auth=8",
+        ).split(",")
+    )
+    if k.strip() and v.strip().isdigit()
+}
+
+# Audit log: "buffered" queues entries and inserts them in batches from a background writer
+# (flushed after AUDIT_LOG_BATCH_SIZE entries or AUDIT_LOG_FLUSH_SECONDS, at most AUDIT_LOG_MAX_QUEUE
+# waiting; beyond that entries are dropped and counted). "sync" writes each entry inside the request.
+AUDIT_LOG_MODE: str = "sync" if os.getenv("AUDIT_LOG_MODE", "buffered").strip().lower() == "sync" else "buffered"
+AUDIT_LOG_BATCH_SIZE: int = int(os.getenv("AUDIT_LOG_BATCH_SIZE", "200"))
+AUDIT_LOG_FLUSH_SECONDS: float = float(os.getenv("AUDIT_LOG_FLUSH_SECONDS", "1.0"))
+AUDIT_LOG_MAX_QUEUE: int = int(os.getenv("AUDIT_LOG_MAX_QUEUE", "10000"))
+
+# Interaction capture (POST /preferences/interactions): at most INTERACTION_BATCH_MAX items per request;
+# INTERACTION_SAMPLE_RATES keeps that fraction of each type (e.g. "page_view=0.25", default 1.0);
+# INTERACTION_TYPE_LIMITS caps events per user per type per minute (excess is discarded).
+# Accepted events are queued and inserted in batches like audit entries (INTERACTION_WRITE_*).
+INTERACTION_BATCH_MAX: int = int(os.getenv("INTERACTION_BATCH_MAX", "100"))
+INTERACTION_SAMPLE_RATES: dict[str, float] = {
+    k.strip(): min(1.0, max(0.0, float(v)))
+    for k, _, v in (p.partition("=") for p in os.getenv("INTERACTION_SAMPLE_RATES", "").split(","))
+    if k.strip() and v.strip().replace(".", "", 1).isdigit()
+}
+INTERACTION_TYPE_LIMITS: dict[str, int] = {
+    k.strip(): int(v)
+    for k, _, v in (
+        p.partition("=") for p in os.getenv("INTERACTION_TYPE_LIMITS", "page_view=120,form_section=60").split(",")
+    )
+    if k.strip() and v.strip().isdigit()
+}
+INTERACTION_WRITE_BATCH_SIZE: int = int(os.getenv("INTERACTION_WRITE_BATCH_SIZE", "500"))
+INTERACTION_FLUSH_SECONDS: float = float(os.getenv("INTERACTION_FLUSH_SECONDS", "2.0"))
+INTERACTION_MAX_QUEUE: int = int(os.getenv("INTERACTION_MAX_QUEUE", "50000"))
+
+# Startup: migrations and seeding. auto = skip when the schema/seed fingerprint is unchanged
+# (one worker at a time bootstraps otherwise), always = run every boot, off = never (release step).
+STARTUP_MIGRATIONS: str = os.getenv("STARTUP_MIGRATIONS", "auto").lower()
+
 # Logging
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
@@ -34,6 +83,13 @@ PROGRAM_CONFIG_CACHE_MAX_AGE: int = int(os.getenv("PROGRAM_CONFIG_CACHE_MAX_AGE"
 # Service framework (file upload, malware scan)
 MALWARE_SCAN_DISABLED: bool = os.getenv("MALWARE_SCAN_DISABLED", "true").lower() in ("true", "1", "yes")
 FILE_UPLOAD_MAX_MB: int = int(os.getenv("FILE_UPLOAD_MAX_MB", "10"))
+# Uploads are streamed to storage in chunks of this size; memory per upload is a few chunks.
+FILE_UPLOAD_CHUNK_KB: int = max(1, int(os.getenv("FILE_UPLOAD_CHUNK_KB", "64")))
+# Direct uploads (POST .../documents/uploads, then .../complete): the client sends the file straight
+# to storage with a grant valid for DIRECT_UPLOAD_EXPIRY_SECONDS. Pending-upload tickets are signed with
+# UPLOAD_SIGNING_KEY (else JWT_SECRET; else a random key, which only works with a single worker).
+DIRECT_UPLOAD_EXPIRY_SECONDS: int = int(os.getenv("DIRECT_UPLOAD_EXPIRY_SECONDS", "900"))
+UPLOAD_SIGNING_KEY: str = os.getenv("UPLOAD_SIGNING_KEY") or os.getenv("JWT_SECRET") or secrets.token_hex(32)
 
 # Document management: storage paths
 # Development: local filesystem; production: S3 or local with configured path
@@ -49,6 +105,26 @@ ADMIN_EMAILS: set[str] = set(
     if e.strip()
 )
 
+# Password hashing (bcrypt) runs on its own threads; at most PASSWORD_HASH_MAX_QUEUE calls wait
+# for one, further sign-ins get 429. Cost: BCRYPT_SALT_ROUNDS (scripts/calibrate_bcrypt.py).
+PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+
+# Login lockout counters and mock-auth tokens: memory (per process), redis (shared; AUTH_STATE_REDIS_URL)
+# or database (lockout from login_attempts rows). See core.auth_state.
+AUTH_STATE_BACKEND: str = (os.getenv("AUTH_STATE_BACKEND") or "memory").strip().lower()
+
+# Request principal (user id, admin flag, board membership) cache per process: entries kept
+# (0 disables) and seconds before a resolution is re-read from the database.
+PRINCIPAL_CACHE_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+# Seconds after issue that a token's role claims are trusted without any query (empty = the token
+# lifetime). Role changes reach other workers through the shared auth state (AUTH_STATE_BACKEND=redis);
+# with per-process state, set this to bound how long another worker may act on outdated claims.
+PRINCIPAL_CLAIMS_TTL_SECONDS: float | None = (
+    float(os.environ["PRINCIPAL_CLAIMS_TTL_SECONDS"]) if os.getenv("PRINCIPAL_CLAIMS_TTL_SECONDS") else None
+)
+
 # WhatsApp Business API (optional)
 WHATSAPP_PHONE_NUMBER_ID: str = os.getenv("WHATSAPP_PHONE_NUMBER_ID", "")
 WHATSAPP_ACCESS_TOKEN: str = os.getenv("WHATSAPP_ACCESS_TOKEN", "")
@@ -57,5 +133,12 @@ WHATSAPP_WEBHOOK_PATH: str = os.getenv("WHATSAPP_WEBHOOK_PATH", "/api/webhooks/w
 
 # Observability
 METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() in ("true", "1", "yes")
+# Per-request DB time and statement count in a Server-Timing response header (shown in browser dev tools).
+# Off unless DEBUG: the timings tell any client how much database work a request did.
+SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "true" if DEBUG else "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
 OTEL_EXPORTER_OTLP_ENDPOINT: str | None = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT") or None
 PHOENIX_COLLECTOR_ENDPOINT: str | None = os.getenv("PHOENIX_COLLECTOR_ENDPOINT") or None
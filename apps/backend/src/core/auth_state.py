@@ -0,0 +1,79 @@
+"""
+Auth state backend selection for the API (AUTH_STATE_BACKEND).
+
+memory and redis are provided by authentication.utils.shared_state. database
+keeps no extra state for lockout: LoginAttemptState counts the failed
+login_attempts rows that UserAuthenticationService already writes, since the
+user's last successful login, so every worker sharing the database agrees on
+lockouts. Other keys (mock-auth tokens) stay in process memory with that
+backend; use redis to run several workers under mock auth.
+"""
+from datetime import datetime, timedelta
+
+from authentication.utils.lockout import LockoutTracker
+from authentication.utils.shared_state import MemoryState, SharedState, get_shared_state
+from peewee import fn
+
+from config import AUTH_STATE_BACKEND
+from database.models import LoginAttempt
+
+
+class LoginAttemptState(SharedState):
+    """SharedState whose lockout counters are failed LoginAttempt rows in the window."""
+
+    def __init__(self, fallback: SharedState | None = None) -> None:
+        self._fallback = fallback or MemoryState()
+
+    @staticmethod
+    def _email(key: str) -> str | None:
+        if key.startswith(LockoutTracker.KEY_PREFIX):
+            return key[len(LockoutTracker.KEY_PREFIX):]
+        return None
+
+    def hit(self, key: str, window_seconds: float) -> int:
+        # The failed attempt is already a login_attempts row (written before record_failure).
+        if self._email(key) is None:
+            return self._fallback.hit(key, window_seconds)
+        return self.hits(key, window_seconds)
+
+    def hits(self, key: str, window_seconds: float) -> int:
+        email = self._email(key)
+        if email is None:
+            return self._fallback.hits(key, window_seconds)
+        cutoff = datetime.utcnow() - timedelta(seconds=window_seconds)
+        last_success = (
+            LoginAttempt.select(fn.MAX(LoginAttempt.attempt_time))
+            .where((LoginAttempt.email == email) & (LoginAttempt.success == True))  # noqa: E712
+        )
+        return (
+            LoginAttempt.select()
+            .where(
+                (LoginAttempt.email == email)
+                & (LoginAttempt.success == False)  # noqa: E712
+                & (LoginAttempt.attempt_time > cutoff)
+                & (LoginAttempt.attempt_time > fn.COALESCE(last_success, cutoff))
+            )
+            .count()
+        )
+
+    def set(self, key: str, value: str, ttl_seconds: float | None = None) -> None:
+        self._fallback.set(key, value, ttl_seconds)
+
+    def get(self, key: str) -> str | None:
+        return self._fallback.get(key)
+
+    def delete(self, *keys: str) -> None:
+        # Lockout reset: the successful attempt row already ends the failure streak.
+        self._fallback.delete(*[k for k in keys if self._email(k) is None])
+
+
+def get_auth_state() -> SharedState | None:
+    """State for the API's LockoutTracker / mock provider, or None for per-instance memory."""
+    if AUTH_STATE_BACKEND == "database":
+        return LoginAttemptState()
+    return get_shared_state()
+
+
+def is_shared_across_workers() -> bool:
+    """True when mock-auth tokens are visible to every worker (redis backend)."""
+    return AUTH_STATE_BACKEND == "redis"
@@ -0,0 +1,177 @@
+"""
+Buffered background writers: queue rows in memory and write them in batches.
+
+A BufferedWriter collects items from request handlers and hands them to a flush
+function (typically an insert_many) from one background thread, once
+batch_size items are queued or the oldest has waited flush_seconds. The queue
+is bounded: when max_queue items are waiting, new items are dropped and counted
+instead of growing memory. A batch that fails is retried one item at a time, so
+a single bad row costs only itself. stop() drains the queue; items submitted after that
+are flushed inline by the caller. Writers are registered by name so lifespan
+can drain them all and metrics can export their counters.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from contextvars import copy_context
+from typing import Any, Callable
+
+from database.connection import release_connection
+from database.pool import reset_connection_state
+
+logger = logging.getLogger(__name__)
+
+_writers: dict[str, "BufferedWriter"] = {}
+_registry_lock = threading.Lock()
+
+
+class BufferedWriter:
+    """One background thread flushing queued items in batches through flush(items)."""
+
+    def __init__(
+        self,
+        name: str,
+        flush: Callable[[list[Any]], Any],
+        batch_size: int = 200,
+        flush_seconds: float = 1.0,
+        max_queue: int = 10_000,
+    ) -> None:
+        self.name = name
+        self._flush_fn = flush
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = max(0.0, flush_seconds)
+        self.max_queue = max(self.batch_size, max_queue)
+        self._items: deque[tuple[float, Any]] = deque()  # (enqueued at, item)
+        self._cond = threading.Condition()
+        self._closed = False
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._flushes = 0
+        # Own context: the writer checks out its own connection, never a request's.
+        self._thread = threading.Thread(
+            target=copy_context().run, args=(self._loop,), name=f"{name}-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, item: Any) -> bool:
+        """Queue an item; False if it was dropped because the queue is full."""
+        with self._cond:
+            if not self._closed:
+                if len(self._items) >= self.max_queue:
+                    self._dropped += 1
+                    return False
+                self._items.append((time.monotonic(), item))
+                self._submitted += 1
+                if len(self._items) == 1 or len(self._items) >= self.batch_size:
+                    self._cond.notify()
+                return True
+        self._flush([item])  # stopped (shutdown): write it now rather than lose it
+        return True
+
+    def _next_batch(self) -> list[Any] | None:
+        """Block until a batch is due; None once stopped and drained."""
+        with self._cond:
+            while not self._closed and len(self._items) < self.batch_size:
+                if not self._items:
+                    self._cond.wait()
+                    continue
+                remaining = self._items[0][0] + self.flush_seconds - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            if not self._items:
+                return None
+            return [self._items.popleft()[1] for _ in range(min(self.batch_size, len(self._items)))]
+
+    def _loop(self) -> None:
+        reset_connection_state()
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            try:
+                self._flush(batch)
+            finally:
+                release_connection()  # return it to the pool between flushes
+
+    def _flush(self, batch: list[Any]) -> None:
+        try:
+            self._flush_fn(batch)
+        except Exception:
+            if len(batch) == 1:
+                logger.exception("%s writer: failed to write 1 item", self.name)
+                self._count(written=0, failed=1)
+                return
+            # One bad row fails the whole batch; retry row by row so only it is lost.
+            logger.warning("%s writer: batch of %d failed, retrying row by row", self.name, len(batch), exc_info=True)
+            written = 0
+            for item in batch:
+                try:
+                    self._flush_fn([item])
+                except Exception:
+                    logger.exception("%s writer: failed to write 1 item", self.name)
+                else:
+                    written += 1
+            self._count(written=written, failed=len(batch) - written)
+            return
+        self._count(written=len(batch), failed=0)
+
+    def _count(self, written: int, failed: int) -> None:
+        with self._cond:
+            self._written += written
+            self._failed += failed
+            self._flushes += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Queued, submitted, written, dropped (queue full), failed (flush error) and flush count."""
+        with self._cond:
+            return {
+                "queued": len(self._items),
+                "max_queue": self.max_queue,
+                "submitted": self._submitted,
+                "written": self._written,
+                "dropped": self._dropped,
+                "failed": self._failed,
+                "flushes": self._flushes,
+            }
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        """Flush everything queued and stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+
+def start_buffered_writer(name: str, flush: Callable[[list[Any]], Any], **options: Any) -> BufferedWriter:
+    """Start (or replace) the writer registered under name."""
+    writer = BufferedWriter(name, flush, **options)
+    with _registry_lock:
+        previous = _writers.get(name)
+        _writers[name] = writer
+    if previous is not None:
+        previous.stop()
+    return writer
+
+
+def get_buffered_writer(name: str) -> BufferedWriter | None:
+    return _writers.get(name)
+
+
+def stop_buffered_writers() -> None:
+    """Drain and stop every writer (call from lifespan shutdown)."""
+    with _registry_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.stop()
+
+
+def get_buffered_writer_stats() -> dict[str, Any] | None:
+    """Stats per writer name, or None when no writer is running."""
+    with _registry_lock:
+        writers = dict(_writers)
+    return {name: w.stats() for name, w in writers.items()} or None
@@ -0,0 +1,142 @@
+"""
+HTTP responses for stored files: Range, Content-Length, ETag, Last-Modified.
+
+Routes open a storage FileStream (StorageBackend.open_stream) on the service
+executor via serve_stored_file(). Local files go out as a FileResponse: Starlette
+handles Range/If-Range and uses pathsend/sendfile where the server supports it.
+Other backends stream their chunks (S3: one ranged GetObject) through a
+StreamingResponse, 206 with Content-Range for a range. Either way a large PDF
+is never held in memory, and If-None-Match revalidation answers 304.
+"""
+from email.utils import format_datetime
+from typing import Any, Callable, Iterator
+
+from fastapi import Request, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from core.service_executor import run_service
+from storage.interfaces.base import FileStream
+
+ByteRange = tuple[int | None, int | None]
+
+
+def parse_range(header: str | None) -> ByteRange | None:
+    """
+    The single byte range in a Range header as (start, end) / (start, None) /
+    (None, suffix_length); None when absent, malformed or multi-range (the whole
+    file is served then, as RFC 9110 allows).
+    """
+    if not header:
+        return None
+    unit, _, spec = header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        start = int(first) if first.strip() else None
+        end = int(last) if last.strip() else None
+    except ValueError:
+        return None
+    if start is None and end is None:
+        return None
+    return start, end
+
+
+def _last_modified(stream: FileStream) -> str | None:
+    return format_datetime(stream.last_modified, usegmt=True) if stream.last_modified else None
+
+
+def _if_range_allows(request: Request, stream: FileStream) -> bool:
+    """A Range applies unless If-Range names a different version of the file."""
+    validator = request.headers.get("if-range")
+    return validator is None or validator in (stream.etag, _last_modified(stream))
+
+
+def _not_modified(request: Request, stream: FileStream) -> bool:
+    tags = request.headers.get("if-none-match")
+    if not tags or not stream.etag:
+        return False
+    return tags.strip() == "*" or stream.etag in [t.strip().removeprefix("W/") for t in tags.split(",")]
+
+
+def range_not_satisfiable_response(total_size: int) -> Response:
+    return Response(
+        status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+        headers={"Content-Range": f"bytes */{total_size}", "Accept-Ranges": "bytes"},
+    )
+
+
+def _iterate(stream: FileStream) -> Iterator[bytes]:
+    try:
+        yield from stream
+    finally:
+        stream.close()
+
+
+def stored_file_response(
+    request: Request,
+    stream: FileStream,
+    *,
+    content_type: str | None = None,
+    filename: str | None = None,
+    disposition: str = "attachment",
+) -> Response:
+    """Response for an open FileStream (closes it); filename adds Content-Disposition."""
+    media_type = content_type or stream.content_type or "application/octet-stream"
+    headers = {"Accept-Ranges": "bytes"}
+    if stream.etag:
+        headers["ETag"] = stream.etag
+    last_modified = _last_modified(stream)
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    if _not_modified(request, stream):
+        stream.close()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if stream.path is not None:
+        stream.close()
+        return FileResponse(
+            stream.path,
+            media_type=media_type,
+            filename=filename,
+            content_disposition_type=disposition,
+            headers={"ETag": stream.etag} if stream.etag else None,
+        )
+    if filename:
+        headers["Content-Disposition"] = f'{disposition}; filename="{filename}"'
+    headers["Content-Length"] = str(stream.size)
+    code = status.HTTP_200_OK
+    if stream.partial:
+        code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {stream.start}-{stream.end}/{stream.total_size}"
+    return StreamingResponse(_iterate(stream), status_code=code, media_type=media_type, headers=headers)
+
+
+async def serve_stored_file(
+    request: Request,
+    group: str,
+    open_file: Callable[..., tuple[FileStream | None, str | None, str | None, dict | None]],
+    *args: Any,
+    disposition: str = "attachment",
+) -> tuple[Response | None, dict | None]:
+    """
+    Run open_file(*args, byte_range=...) on the service executor and build the
+    response. open_file returns (stream, filename, content_type, error_response);
+    a range past the end becomes 416 here, other errors are returned for the route.
+    """
+    byte_range = parse_range(request.headers.get("range"))
+    stream, filename, content_type, err = await run_service(group, open_file, *args, byte_range=byte_range)
+    if err is not None:
+        data = err.get("data") or {}
+        if data.get("code") == "range_not_satisfiable":
+            return range_not_satisfiable_response(data.get("size", 0)), None
+        return None, err
+    if byte_range is not None and stream.path is None and not _if_range_allows(request, stream):
+        stream.close()
+        stream, filename, content_type, err = await run_service(group, open_file, *args, byte_range=None)
+        if err is not None:
+            return None, err
+    return stored_file_response(
+        request, stream, content_type=content_type, filename=filename, disposition=disposition
+    ), None
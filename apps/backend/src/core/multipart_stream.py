@@ -0,0 +1,187 @@
+"""
+Streaming multipart/form-data reader for upload routes.
+
+FastAPI's File()/Form() parameters read (and spool) the whole body before the
+handler runs. MultipartStream parses request.stream() as it arrives instead:
+plain form fields are collected into .fields, and a file part's bytes are
+handed out chunk by chunk, so the upload can be validated, hashed, scanned and
+written to storage in one pass. The whole body is capped at max_body_bytes
+(UploadTooLargeError as soon as it is passed).
+
+Service code runs in the service executor, so sync_chunks() / sync_field()
+expose the stream to a worker thread: each pull runs on the event loop via
+run_coroutine_threadsafe while the route awaits the service call.
+"""
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.requests import Request
+
+from storage.streaming import UploadRejectedError, UploadTooLargeError
+
+MAX_FIELD_BYTES = 64 * 1024  # plain form fields (category etc.)
+
+
+@dataclass
+class FilePart:
+    """Headers of a file part; read its bytes with read_chunk()."""
+
+    field: str
+    filename: str
+    content_type: str
+
+
+class MultipartStream:
+    """Incremental multipart/form-data parser over a Starlette request body."""
+
+    def __init__(self, request: Request, *, max_body_bytes: int) -> None:
+        content_type, params = parse_options_header(request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or not params.get(b"boundary"):
+            raise UploadRejectedError("Expected a multipart/form-data body")
+        self.max_body_bytes = max_body_bytes
+        self.received = 0
+        self.fields: dict[str, str] = {}
+        self._body = request.stream()
+        self._events: deque[tuple] = deque()
+        self._ended = False  # parser saw the closing boundary
+        self._finished = False  # ... and every event before it was consumed
+        self._in_file = False
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: dict[bytes, bytes] = {}
+        self._parser = MultipartParser(
+            params[b"boundary"],
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_end": self._on_end,
+            },
+        )
+
+    # Parser callbacks: turn the byte stream into ("headers"|"data"|"part_end"|"end", ...) events.
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        self._events.append(("headers", self._headers))
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._events.append(("data", data[start:end]))
+
+    def _on_part_end(self) -> None:
+        self._events.append(("part_end",))
+
+    def _on_end(self) -> None:
+        self._ended = True
+        self._events.append(("end",))
+
+    async def _next_event(self) -> tuple:
+        while not self._events:
+            if self._ended:
+                self._finished = True
+                return ("end",)
+            try:
+                chunk = await self._body.__anext__()
+            except StopAsyncIteration:
+                raise UploadRejectedError("Incomplete multipart body") from None
+            self.received += len(chunk)
+            if self.received > self.max_body_bytes:
+                raise UploadTooLargeError(self.max_body_bytes)
+            try:
+                self._parser.write(chunk)
+            except MultipartParseError as e:
+                raise UploadRejectedError("Malformed multipart body") from e
+        event = self._events.popleft()
+        if event[0] == "end":
+            self._finished = True
+        return event
+
+    async def _read_field(self, name: str) -> None:
+        value = bytearray()
+        while True:
+            event = await self._next_event()
+            if event[0] == "data":
+                value += event[1]
+                if len(value) > MAX_FIELD_BYTES:
+                    raise UploadRejectedError(f"Form field {name!r} is too large")
+            elif event[0] in ("part_end", "end"):
+                self.fields[name] = value.decode("utf-8", "replace")
+                return
+
+    async def next_file(self) -> FilePart | None:
+        """Collect fields up to the next file part and return its headers (None at end of body)."""
+        while self._in_file:
+            await self.read_chunk()
+        while True:
+            event = await self._next_event()
+            if event[0] == "end":
+                return None
+            if event[0] != "headers":
+                continue
+            headers = event[1]
+            _, options = parse_options_header(headers.get(b"content-disposition", b""))
+            name = options.get(b"name", b"").decode("utf-8", "replace")
+            if b"filename" in options:
+                self._in_file = True
+                return FilePart(
+                    field=name,
+                    filename=options[b"filename"].decode("utf-8", "replace"),
+                    content_type=headers.get(b"content-type", b"application/octet-stream").decode("latin-1"),
+                )
+            await self._read_field(name)
+
+    async def read_chunk(self) -> bytes:
+        """Next chunk of the current file part; b"" once the part has ended."""
+        while self._in_file:
+            event = await self._next_event()
+            if event[0] == "data":
+                if event[1]:
+                    return event[1]
+            elif event[0] in ("part_end", "end"):
+                self._in_file = False
+        return b""
+
+    async def finish(self) -> dict[str, str]:
+        """Read the rest of the body (skipping any further files) and return all fields."""
+        while await self.next_file() is not None:
+            pass
+        return self.fields
+
+    def sync_chunks(self, loop: asyncio.AbstractEventLoop) -> Iterator[bytes]:
+        """Current file part's chunks for a worker thread; each pull runs on loop."""
+        while True:
+            chunk = asyncio.run_coroutine_threadsafe(self.read_chunk(), loop).result()
+            if not chunk:
+                return
+            yield chunk
+
+    def sync_field(self, loop: asyncio.AbstractEventLoop, name: str) -> Callable[[], str | None]:
+        """Getter for a field for a worker thread; reads the rest of the body if the field is not in yet."""
+
+        def get() -> str | None:
+            if name not in self.fields and not self._finished:
+                asyncio.run_coroutine_threadsafe(self.finish(), loop).result()
+            return self.fields.get(name)
+
+        return get
@@ -0,0 +1,145 @@
+"""
+Password hashing pool: bcrypt work on a small dedicated executor with a queue limit.
+
+bcrypt is deliberately slow (hundreds of ms at cost 12) and releases the GIL, so
+it runs on its own PASSWORD_HASH_WORKERS threads instead of the service
+executor. At most PASSWORD_HASH_MAX_QUEUE hashes may wait for a thread; past
+that, hash()/verify() raise PasswordHasherBusyError at once (routes answer 429
+with Retry-After), so a login burst is shed instead of starving other endpoints.
+Routes await hash_async()/verify_async() directly, outside the "auth" route
+group, so the group's concurrency limit never hides a full queue from the 429.
+Counters (hashes, verifies, rejected, queue depth, hash/wait time) are exported
+via observability.metrics.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from authentication.utils.password import hash_password, verify_password
+from config import PASSWORD_HASH_MAX_QUEUE, PASSWORD_HASH_WORKERS
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """All hashing threads are busy and the queue is full; retry shortly."""
+
+    public_message = "Too many sign-in requests right now. Please try again in a moment."
+    retry_after_seconds = 1
+
+
+class PasswordHasher:
+    """Bounded bcrypt executor: workers threads, at most max_queue calls waiting."""
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self._pending = 0  # queued + running
+        self._active = 0
+        self._hashes = 0
+        self._verifies = 0
+        self._rejected = 0
+        self._hash_seconds = 0.0
+        self._wait_seconds = 0.0
+
+    def _submit(self, kind: str, fn: Callable[..., T], *args: Any) -> Future:
+        """Queue fn(*args) on the pool and return its future; raises PasswordHasherBusyError when full."""
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordHasherBusyError()
+            self._pending += 1
+        submitted = time.perf_counter()
+
+        def call() -> T:
+            started = time.perf_counter()
+            with self._lock:
+                self._active += 1
+                self._wait_seconds += started - submitted
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._pending -= 1
+                    self._hash_seconds += time.perf_counter() - started
+                    if kind == "hash":
+                        self._hashes += 1
+                    else:
+                        self._verifies += 1
+
+        try:
+            return self._pool.submit(call)
+        except RuntimeError:  # pool shut down
+            with self._lock:
+                self._pending -= 1
+            done: Future = Future()
+            done.set_result(fn(*args))
+            return done
+
+    def _run(self, kind: str, fn: Callable[..., T], *args: Any) -> T:
+        return self._submit(kind, fn, *args).result()
+
+    def hash(self, password: str, rounds: int | None = None) -> str:
+        """bcrypt hash on the pool; raises PasswordHasherBusyError when full."""
+        return self._run("hash", hash_password, password, rounds)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        """bcrypt check on the pool; raises PasswordHasherBusyError when full."""
+        return self._run("verify", verify_password, password, hashed)
+
+    async def hash_async(self, password: str, rounds: int | None = None) -> str:
+        """hash() awaited from the event loop, holding no service thread or route-group slot."""
+        return await asyncio.wrap_future(self._submit("hash", hash_password, password, rounds))
+
+    async def verify_async(self, password: str, hashed: str) -> bool:
+        """verify() awaited from the event loop, holding no service thread or route-group slot."""
+        return await asyncio.wrap_future(self._submit("verify", verify_password, password, hashed))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queued": self._pending - self._active,
+                "active": self._active,
+                "hashes": self._hashes,
+                "verifies": self._verifies,
+                "rejected": self._rejected,
+                "hash_seconds_sum": self._hash_seconds,
+                "wait_seconds_sum": self._wait_seconds,
+            }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+_hasher: PasswordHasher | None = None
+_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide hasher (created on first use from config)."""
+    global _hasher
+    if _hasher is None:
+        with _hasher_lock:
+            if _hasher is None:
+                _hasher = PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE)
+    return _hasher
+
+
+def get_password_hasher_stats() -> dict[str, Any] | None:
+    """Hasher stats for metrics, or None if nothing has been hashed yet."""
+    return _hasher.stats() if _hasher is not None else None
+
+
+def shutdown_password_hasher() -> None:
+    """Shut down the hashing threads (call from lifespan shutdown)."""
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+        _hasher = None
@@ -0,0 +1,288 @@
+"""
+Request principal: who the caller is, resolved once per request from token claims.
+
+A Principal carries the user id (sub is a UUID for JWT tokens and an email for
+mock tokens), whether the user is an admin (ADMIN_EMAILS) and their forestry
+board assignment, if any. Resolving it costs at most one query (users left-joined
+to forestry_board); results are kept in a per-process cache for
+PRINCIPAL_CACHE_TTL_SECONDS so hot routes run no identity queries at all.
+Code that changes a user or a board assignment calls invalidate_principal();
+other processes pick the change up within the TTL.
+
+Tokens issued by UserAuthenticationService carry the resolved principal as
+claims (roles, board_member_id, board_county; see principal_claims), so requests
+with them need neither the database nor the cache: principal_from_claims builds
+the Principal directly. Role claims are trusted for PRINCIPAL_CLAIMS_TTL_SECONDS
+after the token was issued (iat; the token lifetime by default), but not once
+invalidate_principal() for the user is newer than the token. That time is kept
+in this process and in the shared auth state (authentication.utils.shared_state),
+so with AUTH_STATE_BACKEND=redis every worker sees it. Tokens it rules out fall
+back to the cache and database path. The admin flag is always re-checked against
+ADMIN_EMAILS.
+"""
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from authentication.utils.jwt import get_token_expire_seconds
+from authentication.utils.shared_state import get_shared_state
+from peewee import JOIN
+
+from config import ADMIN_EMAILS, PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL_SECONDS, PRINCIPAL_CLAIMS_TTL_SECONDS
+from database.models import ForestryBoard, User
+
+ROLE_USER = "user"
+ROLE_ADMIN = "admin"
+ROLE_BOARD_MEMBER = "board_member"
+ROLES_CHANGED_KEY_PREFIX = "principal:roles_changed:"  # + user id, in the shared auth state
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated caller. user_id is None when the token's subject has no user row."""
+
+    user_id: str | None
+    email: str | None = None
+    is_admin: bool = False
+    board_member_id: str | None = None
+    board_county: str | None = None
+
+    @property
+    def is_board_member(self) -> bool:
+        return self.board_member_id is not None
+
+    @property
+    def roles(self) -> list[str]:
+        roles = [ROLE_USER]
+        if self.is_admin:
+            roles.append(ROLE_ADMIN)
+        if self.is_board_member:
+            roles.append(ROLE_BOARD_MEMBER)
+        return roles
+
+
+class PrincipalCache:
+    """Thread-safe LRU of (sub, email claim) -> (expires_at, Principal)."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key: tuple[str, str]) -> Principal | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: tuple[str, str], principal: Principal) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str | None = None, email: str | None = None) -> int:
+        """Drop entries for a user (by id or email, as subject or resolved value); returns entries dropped."""
+        user_id = str(user_id) if user_id else None
+        email = email.strip().lower() if email else None
+        with self._lock:
+            stale = [
+                key
+                for key, (_, p) in self._entries.items()
+                if (user_id and (p.user_id == user_id or key[0] == user_id))
+                or (email and (p.email == email or key[0] == email or key[1] == email))
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+_cache: PrincipalCache | None = (
+    PrincipalCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL_SECONDS) if PRINCIPAL_CACHE_SIZE > 0 else None
+)
+# user id -> time.time() of the last change to their account or board assignment made in this process
+_roles_changed_at: dict[str, float] = {}
+_roles_lock = threading.Lock()
+
+
+def _cache_key(claims: dict[str, Any]) -> tuple[str, str]:
+    return (str(claims.get("sub") or "").strip(), (claims.get("email") or "").strip().lower())
+
+
+def resolve_principal(claims: dict[str, Any]) -> Principal:
+    """Resolve a principal from token claims with one query (no cache)."""
+    sub, email = _cache_key(claims)
+    if not sub:
+        return Principal(user_id=None)
+    try:
+        UUID(sub)
+        user_id: str | None = sub
+        match = User.id == sub
+    except ValueError:
+        user_id = None
+        email = email or sub.lower()
+        match = User.email == sub.lower()
+    row = (
+        User.select(User.id, User.email, ForestryBoard.id.alias("board_id"), ForestryBoard.county)
+        .join(ForestryBoard, JOIN.LEFT_OUTER, on=(ForestryBoard.user == User.id))
+        .where(match)
+        .dicts()
+        .first()
+    )
+    if row is None:
+        # JWT subjects are trusted as ids even without a user row (as before); mock emails are not.
+        return Principal(user_id=user_id, email=email or None, is_admin=_is_admin_email(email))
+    email = email if "@" in email else (row["email"] or "").strip().lower()
+    return Principal(
+        user_id=str(row["id"]),
+        email=email or None,
+        is_admin=_is_admin_email(email),
+        board_member_id=str(row["board_id"]) if row["board_id"] else None,
+        board_county=row["county"],
+    )
+
+
+def principal_claims(principal: Principal) -> dict[str, Any]:
+    """Authorization claims to embed in an issued token for this principal."""
+    return {
+        "roles": principal.roles,
+        "board_member_id": principal.board_member_id,
+        "board_county": principal.board_county,
+    }
+
+
+def _is_admin_email(email: str | None) -> bool:
+    return bool(email) and email in ADMIN_EMAILS
+
+
+def _recheck_admin(principal: Principal) -> Principal:
+    """principal with is_admin re-read from ADMIN_EMAILS (claims and cache entries may predate a change)."""
+    is_admin = _is_admin_email(principal.email)
+    return principal if principal.is_admin == is_admin else dataclasses.replace(principal, is_admin=is_admin)
+
+
+def _claims_ttl_seconds() -> float:
+    if PRINCIPAL_CLAIMS_TTL_SECONDS is not None:
+        return PRINCIPAL_CLAIMS_TTL_SECONDS
+    return get_token_expire_seconds()
+
+
+def _roles_changed_since(user_id: str, issued_at: float) -> bool:
+    """True when invalidate_principal() ran for user_id, here or in another worker, at or after issued_at."""
+    changed_at = _roles_changed_at.get(user_id)
+    if changed_at is not None and issued_at <= changed_at:
+        return True
+    state = get_shared_state()
+    if state is None:
+        return False
+    try:
+        shared_at = state.get(ROLES_CHANGED_KEY_PREFIX + user_id)
+        return shared_at is not None and issued_at <= float(shared_at)
+    except Exception:
+        return True  # cannot tell: take the cache and database path
+
+
+def principal_from_claims(claims: dict[str, Any]) -> Principal | None:
+    """
+    Principal built from a token's role claims alone, or None when the token has
+    none (mock tokens, tokens issued before roles were embedded), was issued more
+    than PRINCIPAL_CLAIMS_TTL_SECONDS ago, or predates the user's last role change.
+    is_admin comes from ADMIN_EMAILS, not the roles claim.
+    """
+    roles = claims.get("roles")
+    sub = str(claims.get("sub") or "").strip()
+    if not isinstance(roles, list) or not sub:
+        return None
+    try:
+        UUID(sub)
+        issued_at = float(claims.get("iat") or 0)
+    except (TypeError, ValueError):
+        return None
+    if time.time() - issued_at > _claims_ttl_seconds() or _roles_changed_since(sub, issued_at):
+        return None
+    email = (claims.get("email") or "").strip().lower() or None
+    return Principal(
+        user_id=sub,
+        email=email,
+        is_admin=_is_admin_email(email),
+        board_member_id=claims.get("board_member_id") or None,
+        board_county=claims.get("board_county") or None,
+    )
+
+
+def cached_principal(claims: dict[str, Any]) -> Principal | None:
+    """The cached principal for these claims, or None on a miss (no database access)."""
+    principal = _cache.get(_cache_key(claims)) if _cache is not None else None
+    return _recheck_admin(principal) if principal is not None else None
+
+
+def load_principal(claims: dict[str, Any]) -> Principal:
+    """Resolve the principal for these claims and cache it (call off the event loop)."""
+    principal = resolve_principal(claims)
+    if _cache is not None:
+        _cache.put(_cache_key(claims), principal)
+    return principal
+
+
+def invalidate_principal(user_id: Any = None, email: str | None = None) -> None:
+    """
+    Forget cached principals for a user after their account or board assignment
+    changes; with user_id, role claims in that user's current tokens are ignored,
+    by every worker sharing the auth state, until they log in again or refresh
+    their token.
+    """
+    if _cache is not None:
+        _cache.invalidate(user_id, email)
+    if user_id:
+        now = time.time()
+        ttl = _claims_ttl_seconds()  # older tokens' claims are not trusted anyway
+        with _roles_lock:
+            _roles_changed_at[str(user_id)] = now
+            for uid in [u for u, at in _roles_changed_at.items() if at < now - ttl]:
+                del _roles_changed_at[uid]
+        state = get_shared_state()
+        if state is not None:
+            state.set(ROLES_CHANGED_KEY_PREFIX + str(user_id), repr(now), ttl_seconds=ttl)
+
+
+def clear_principal_cache() -> None:
+    if _cache is not None:
+        _cache.clear()
+    with _roles_lock:
+        _roles_changed_at.clear()
+
+
+def get_principal_cache_stats() -> dict[str, Any] | None:
+    """Principal cache hits/misses/invalidations, or None when the cache is disabled."""
+    return _cache.stats() if _cache is not None else None
@@ -0,0 +1,125 @@
+"""
+Service execution layer: run synchronous (Peewee-backed) service calls off the event loop.
+
+Calls go to one bounded thread pool shared by the process. Each route group
+(applications, documents, forestry_board, complaints, preferences) has its own
+concurrency limit, so a burst of slow uploads cannot take every worker thread
+from auto-saves. Queue depth and active calls per group are exported via
+observability.metrics.
+"""
+import asyncio
+import contextvars
+import functools
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, TypeVar
+
+from config import SERVICE_EXECUTOR_THREADS, SERVICE_GROUP_CONCURRENCY
+
+T = TypeVar("T")
+
+
+class ServiceExecutor:
+    """Bounded thread pool with a per-group concurrency gate and queue-depth counters."""
+
+    def __init__(self, max_workers: int, group_limits: dict[str, int] | None = None) -> None:
+        self._max_workers = max(1, max_workers)
+        self._group_limits = dict(group_limits or {})
+        self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="service")
+        # Semaphores are bound to the loop they are first awaited on; keep one per loop.
+        self._gates: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+        self._lock = Lock()
+        self._waiting: dict[str, int] = defaultdict(int)
+        self._active: dict[str, int] = defaultdict(int)
+        self._calls: dict[str, int] = defaultdict(int)
+        self._wait_seconds: dict[str, float] = defaultdict(float)
+
+    def limit_for(self, group: str) -> int:
+        """Concurrency limit for a route group (defaults to the pool size)."""
+        return max(1, min(self._group_limits.get(group, self._max_workers), self._max_workers))
+
+    def _gate(self, group: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        entry = self._gates.get(group)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Semaphore(self.limit_for(group)))
+            self._gates[group] = entry
+        return entry[1]
+
+    async def run(self, group: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run fn(*args, **kwargs) in the pool once the group has capacity; await its result."""
+        gate = self._gate(group)
+        start = time.perf_counter()
+        with self._lock:
+            self._waiting[group] += 1
+        try:
+            await gate.acquire()
+        finally:
+            with self._lock:
+                self._waiting[group] -= 1
+        with self._lock:
+            self._active[group] += 1
+            self._calls[group] += 1
+            self._wait_seconds[group] += time.perf_counter() - start
+        try:
+            # Copy the request context so the worker sees the request's DB connection state.
+            ctx = contextvars.copy_context()
+            call = functools.partial(ctx.run, fn, *args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+        finally:
+            with self._lock:
+                self._active[group] -= 1
+            gate.release()
+
+    def stats(self) -> dict[str, Any]:
+        """Per-group snapshot: limit, waiting (queue depth), active, calls, wait_seconds_sum."""
+        with self._lock:
+            groups = set(self._waiting) | set(self._active) | set(self._calls)
+            return {
+                "max_workers": self._max_workers,
+                "groups": {
+                    g: {
+                        "limit": self.limit_for(g),
+                        "waiting": self._waiting[g],
+                        "active": self._active[g],
+                        "calls": self._calls[g],
+                        "wait_seconds_sum": self._wait_seconds[g],
+                    }
+                    for g in sorted(groups)
+                },
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work; running calls finish in the background."""
+        self._pool.shutdown(wait=False)
+
+
+_executor: ServiceExecutor | None = None
+
+
+def get_service_executor() -> ServiceExecutor:
+    """Return the process-wide executor (created on first use from config)."""
+    global _executor
+    if _executor is None:
+        _executor = ServiceExecutor(SERVICE_EXECUTOR_THREADS, SERVICE_GROUP_CONCURRENCY)
+    return _executor
+
+
+async def run_service(group: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking service call for a route group without blocking the event loop."""
+    return await get_service_executor().run(group, fn, *args, **kwargs)
+
+
+def get_service_executor_stats() -> dict[str, Any] | None:
+    """Executor stats for metrics, or None if no call has been made yet."""
+    return _executor.stats() if _executor is not None else None
+
+
+def shutdown_service_executor() -> None:
+    """Shut down the executor (call from lifespan shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,214 @@
+"""
+Fast start: skip migrations and seeding when nothing they depend on has changed.
+
+A fingerprint of the migration files, the seed code/data and MOCK_AUTH_USERS is
+stored in the startup_state table after a successful bootstrap. On boot a worker
+reads it (one query); if it matches, migrations and seeds are skipped. Otherwise
+one worker at a time (Postgres advisory lock / SQLite lock file) re-checks,
+migrates, seeds and records the new fingerprint, so scaling out N tasks runs the
+work once. STARTUP_MIGRATIONS: auto (default), always, or off (run
+scripts/seed_db.py as a release step instead).
+"""
+import hashlib
+import importlib.util
+import logging
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterator
+
+from peewee import CharField, Database, DateTimeField, Model, PostgresqlDatabase, SqliteDatabase
+
+from config import STARTUP_MIGRATIONS
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_KEY = "schema_seed"
+# Arbitrary constant shared by all workers for pg_advisory_lock.
+_ADVISORY_LOCK_ID = 72_163_001
+
+# Modules whose source decides what the seed step writes.
+SEED_MODULES = (
+    "data.counties_seed",
+    "data.project_seed",
+    "data.budget_categories_seed",
+    "data.seed_users_data",
+    "utils.seed_counties",
+    "utils.seed_project_options",
+    "utils.seed_budget_categories",
+    "utils.seed_users",
+    "utils.seed_forestry_board",
+)
+
+
+class StartupState(Model):
+    """Key/value row holding the last bootstrapped fingerprint."""
+
+    key = CharField(max_length=64, primary_key=True)
+    fingerprint = CharField(max_length=64)
+    updated_at = DateTimeField(default=datetime.utcnow)
+
+    class Meta:
+        table_name = "startup_state"
+
+
+class StartupReport:
+    """Collects step timings during lifespan startup and logs them as one line."""
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self.steps: list[tuple[str, float]] = []
+        self.notes: list[str] = []
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.steps.append((name, seconds))
+
+    def note(self, message: str) -> None:
+        self.notes.append(message)
+
+    def log(self) -> None:
+        total = time.perf_counter() - self._start
+        steps = ", ".join(f"{name}={seconds * 1000:.0f}ms" for name, seconds in self.steps)
+        notes = "; ".join(self.notes)
+        logger.info("Startup finished in %.0fms (%s)%s", total * 1000, steps, f" - {notes}" if notes else "")
+
+
+def _file_digest(path: str | None) -> str:
+    if not path or not os.path.isfile(path):
+        return "-"
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compute_fingerprint() -> str:
+    """Hash of migration versions/sources, seed modules and seed-affecting settings."""
+    from database.migrations.runner import discover_migrations
+
+    h = hashlib.sha256()
+    for m in discover_migrations():
+        h.update(f"migration:{m.version}:{m.name}:{_file_digest(m.module.__file__)}\n".encode())
+    for name in SEED_MODULES:
+        spec = importlib.util.find_spec(name)
+        h.update(f"seed:{name}:{_file_digest(spec.origin if spec else None)}\n".encode())
+    h.update(f"env:MOCK_AUTH_USERS:{os.getenv('MOCK_AUTH_USERS', '')}\n".encode())
+    return h.hexdigest()
+
+
+def stored_fingerprint(db: Database) -> str | None:
+    """Fingerprint recorded by the last bootstrap, or None (including when the table is missing)."""
+    try:
+        with db.bind_ctx([StartupState]):
+            row = StartupState.get_or_none(StartupState.key == FINGERPRINT_KEY)
+    except Exception:
+        return None
+    return row.fingerprint if row else None
+
+
+def record_fingerprint(db: Database, fingerprint: str) -> None:
+    with db.bind_ctx([StartupState]):
+        db.create_tables([StartupState], safe=True)
+        (
+            StartupState.insert(key=FINGERPRINT_KEY, fingerprint=fingerprint, updated_at=datetime.utcnow())
+            .on_conflict(
+                conflict_target=[StartupState.key],
+                update={StartupState.fingerprint: fingerprint, StartupState.updated_at: datetime.utcnow()},
+            )
+            .execute()
+        )
+
+
+@contextmanager
+def leader_lock(db: Database) -> Iterator[None]:
+    """
+    Serialize bootstrap across workers: pg_advisory_lock on Postgres, a lock file
+    next to the database on file-backed SQLite, nothing otherwise.
+    """
+    if isinstance(db, PostgresqlDatabase):
+        db.execute_sql("SELECT pg_advisory_lock(%s)", (_ADVISORY_LOCK_ID,))
+        try:
+            yield
+        finally:
+            db.execute_sql("SELECT pg_advisory_unlock(%s)", (_ADVISORY_LOCK_ID,))
+        return
+    path = db.database if isinstance(db, SqliteDatabase) else None
+    try:
+        import fcntl
+    except ImportError:  # non-POSIX: no cross-process lock
+        fcntl = None
+    if fcntl is None or not path or path == ":memory:":
+        yield
+        return
+    with open(f"{path}.startup.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _seed_steps() -> list[tuple[str, Callable[[], None]]]:
+    from utils.seed_budget_categories import seed_budget_categories
+    from utils.seed_counties import seed_counties
+    from utils.seed_forestry_board import seed_forestry_board
+    from utils.seed_project_options import seed_project_options
+    from utils.seed_users import seed_users
+
+    return [
+        ("seed_counties", seed_counties),
+        ("seed_project_options", seed_project_options),
+        ("seed_budget_categories", seed_budget_categories),
+        ("seed_users", seed_users),
+        ("seed_forestry_board", seed_forestry_board),
+    ]
+
+
+def run_bootstrap(db: Database, report: StartupReport | None = None, fingerprint: str | None = None) -> None:
+    """Run migrations and every seed step, then record the fingerprint."""
+    from database.migrations.runner import run_migrations
+
+    report = report or StartupReport()
+    with report.step("migrations"):
+        applied = run_migrations(db=db)
+    if applied:
+        report.note("applied migrations " + ", ".join(applied))
+    for name, seed in _seed_steps():
+        with report.step(name):
+            seed()
+    record_fingerprint(db, fingerprint or compute_fingerprint())
+
+
+def bootstrap_database(db: Database, report: StartupReport | None = None, mode: str | None = None) -> bool:
+    """
+    Bring schema and seed data up to date according to STARTUP_MIGRATIONS.
+    Returns True if migrations/seeds ran in this process, False if skipped.
+    """
+    mode = (mode or STARTUP_MIGRATIONS).lower()
+    report = report or StartupReport()
+    if mode == "off":
+        report.note("migrations and seeds disabled (STARTUP_MIGRATIONS=off)")
+        return False
+    with report.step("fingerprint"):
+        fingerprint = compute_fingerprint()
+        unchanged = stored_fingerprint(db) == fingerprint
+    if mode == "auto" and unchanged:
+        report.note(f"schema/seed fingerprint {fingerprint[:12]} unchanged, skipped migrations and seeds")
+        return False
+    wait_start = time.perf_counter()
+    with leader_lock(db):
+        report.record("leader_wait", time.perf_counter() - wait_start)
+        # Another worker may have finished while we waited for the lock.
+        if mode == "auto" and stored_fingerprint(db) == fingerprint:
+            report.note(f"fingerprint {fingerprint[:12]} recorded by another worker, skipped")
+            return False
+        run_bootstrap(db, report, fingerprint)
+    report.note(f"bootstrapped, fingerprint {fingerprint[:12]}")
+    return True
@@ -1,8 +1,36 @@
 """File upload validation: format, size, and optional malware scan."""
-from typing import BinaryIO
+import asyncio
+from typing import BinaryIO, Iterator
 
+from starlette.requests import Request
+
+from config import FILE_UPLOAD_CHUNK_KB, FILE_UPLOAD_MAX_MB
 from storage.validation import validate_file as _validate_file
 
+MAX_UPLOAD_BYTES = FILE_UPLOAD_MAX_MB * 1024 * 1024
+UPLOAD_CHUNK_BYTES = FILE_UPLOAD_CHUNK_KB * 1024
+# Multipart body allowance on top of the file: boundaries, part headers, form fields.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+MAX_UPLOAD_BODY_BYTES = MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES
+
+
+def sync_body_chunks(request: Request, loop: asyncio.AbstractEventLoop) -> Iterator[bytes]:
+    """A raw (non-multipart) request body for a worker thread; each pull runs on loop."""
+    body = request.stream()
+
+    async def pull() -> bytes | None:
+        try:
+            return await body.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    while True:
+        chunk = asyncio.run_coroutine_threadsafe(pull(), loop).result()
+        if chunk is None:
+            return
+        if chunk:
+            yield chunk
+
 
 def validate_upload(
     *,
@@ -11,13 +39,14 @@ def validate_upload(
     size: int,
 ) -> tuple[bool, str]:
     """
-    Validate file (PDF, JPG, PNG; 10MB limit).
+    Validate file (PDF, JPG, PNG; FILE_UPLOAD_MAX_MB limit).
     Returns (ok, error_message). error_message is empty when ok is True.
     """
     return _validate_file(
         filename=filename,
         content_type=content_type,
         size=size,
+        max_bytes=MAX_UPLOAD_BYTES,
     )
 
 
@@ -27,6 +27,7 @@ def generate_thumbnail(
     try:
         file_obj.seek(0)
         img = Image.open(file_obj)
+        img.draft("RGB", max_size)  # JPEG: decode at a reduced scale instead of full size
         if img.mode in ("RGBA", "P"):
             img = img.convert("RGB")
         img.thumbnail(max_size, Image.Resampling.LANCZOS)
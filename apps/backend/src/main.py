@@ -8,9 +8,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 
 from config import API_V1_PREFIX, CORS_ORIGINS, DEBUG
+from database.middleware import ConnectionMiddleware, ReadYourWritesMiddleware
 from middleware.security_headers import SecurityHeadersMiddleware
 from observability.middleware import MetricsMiddleware
-from routes import applications, auth, budget_categories, complaints, config as config_routes, counties, forestry_board, form_agent, health, observability, preferences, project_types, public, site_ownership, whatsapp
+from routes import applications, auth, budget_categories, complaints, config as config_routes, counties, forestry_board, form_agent, health, observability, preferences, project_types, public, site_ownership, storage_uploads, whatsapp
 from utils.errors import error_handler, validation_exception_handler
 from utils.logging import get_logger, setup_logging
 
@@ -21,33 +22,43 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Startup/shutdown lifecycle."""
     import os
+    from core.startup import StartupReport
     setup_logging()
     logger.info("Application starting")
+    report = StartupReport()
     try:
         from database.connection import init_db
-        init_db()
+        with report.step("init_db"):
+            db = init_db()
         if not os.getenv("TESTING"):
-            from database.migrations.runner import run_migrations
-            from utils.seed_counties import seed_counties
-            from utils.seed_project_options import seed_project_options
-            from utils.seed_budget_categories import seed_budget_categories
-            from utils.seed_users import seed_users
-            run_migrations()
-            seed_counties()
-            seed_project_options()
-            seed_budget_categories()
-            seed_users()
-            from utils.seed_forestry_board import seed_forestry_board
-            seed_forestry_board()
+            from core.startup import bootstrap_database
+            bootstrap_database(db, report)
+        from services.audit_service import start_audit_writer
+        from services.preference_service import start_interaction_writer
+        start_audit_writer()
+        start_interaction_writer()
+        from database.connection import release_connection
+        release_connection()
     except Exception as e:
         logger.warning("Database init skipped: %s", e)
     try:
         from core.container import init_container
-        init_container()
+        with report.step("init_container"):
+            init_container()
     except Exception as e:
         logger.warning("Service container init skipped: %s", e)
+    report.log()
     yield
     logger.info("Application shutting down")
+    from core.service_executor import shutdown_service_executor
+    shutdown_service_executor()
+    from core.password_hasher import shutdown_password_hasher
+    shutdown_password_hasher()
+    from core.buffered_writer import stop_buffered_writers
+    stop_buffered_writers()  # drain queued audit entries and interactions before the database closes
+    from database.connection import close_db, is_pooled
+    if is_pooled():
+        close_db()
 
 
 app = FastAPI(
@@ -60,6 +71,8 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(ConnectionMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
 app.add_middleware(MetricsMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(
@@ -86,6 +99,7 @@ app.include_router(forestry_board.router, prefix=API_V1_PREFIX)
 app.include_router(complaints.router, prefix=API_V1_PREFIX)
 app.include_router(preferences.router, prefix=API_V1_PREFIX)
 app.include_router(form_agent.router, prefix=API_V1_PREFIX)
+app.include_router(storage_uploads.router, prefix=API_V1_PREFIX)
 app.include_router(public.router, prefix="/api")
 app.include_router(whatsapp.router, prefix="/api")
 app.include_router(observability.router, prefix="/api")
@@ -97,14 +111,15 @@ def main() -> None:
     import os
     import uvicorn
     from config import HOST, PORT
-    # Mock auth stores tokens in memory; use one worker so login and later requests share state
+    from core.auth_state import is_shared_across_workers
+    # Mock auth tokens live in process memory unless AUTH_STATE_BACKEND=redis; then any worker can serve them
     use_mock = (os.getenv("AUTH_PROVIDER") or "mock").lower() == "mock"
     uvicorn.run(
         "main:app",
         host=HOST,
         port=PORT,
         reload=DEBUG,
-        workers=1 if use_mock else None,
+        workers=1 if use_mock and not is_shared_across_workers() else None,
     )
 
 
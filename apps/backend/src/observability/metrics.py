@@ -2,6 +2,7 @@
 Simple in-memory metrics for request counts and latency.
 Can be replaced or supplemented with OpenTelemetry/Phoenix (see PHOENIX_COLLECTOR_ENDPOINT).
 """
+import heapq
 import time
 from collections import defaultdict
 from threading import Lock
@@ -13,6 +14,12 @@ _request_latency_sum: dict[str, float] = defaultdict(float)
 _request_latency_count: dict[str, int] = defaultdict(int)
 _llm_span_count = 0
 _error_count: dict[str, int] = defaultdict(int)
+_db_query_count: dict[str, int] = defaultdict(int)
+_db_seconds_sum: dict[str, float] = defaultdict(float)
+_n_plus_one_count: dict[str, int] = defaultdict(int)
+_SLOW_QUERIES_KEPT = 20
+_slow_queries: list[tuple[float, int, str, str]] = []  # min-heap of (ms, seq, request key, sql)
+_slow_query_seq = 0
 
 
 def record_request(path: str, method: str, status_code: int, latency_sec: float) -> None:
@@ -25,6 +32,31 @@ def record_request(path: str, method: str, status_code: int, latency_sec: float)
             _error_count[key] += 1
 
 
+def record_request_queries(
+    path: str,
+    method: str,
+    queries: int,
+    db_seconds: float,
+    slowest: list[dict[str, Any]] | None = None,
+    n_plus_one: bool = False,
+) -> None:
+    """Record a request's database statements (count, time, slowest; see database.instrumentation)."""
+    global _slow_query_seq
+    key = f"{method}_{path}"
+    with _lock:
+        _db_query_count[key] += queries
+        _db_seconds_sum[key] += db_seconds
+        if n_plus_one:
+            _n_plus_one_count[key] += 1
+        for q in slowest or []:
+            _slow_query_seq += 1
+            entry = (q["ms"], _slow_query_seq, key, q["sql"])
+            if len(_slow_queries) < _SLOW_QUERIES_KEPT:
+                heapq.heappush(_slow_queries, entry)
+            elif entry[0] > _slow_queries[0][0]:
+                heapq.heapreplace(_slow_queries, entry)
+
+
 def record_llm_span(name: str, model: str | None = None, latency_sec: float | None = None) -> None:
     """Record an LLM call for observability (Arize Phoenix can consume via OTLP)."""
     global _llm_span_count
@@ -32,6 +64,69 @@ def record_llm_span(name: str, model: str | None = None, latency_sec: float | No
         _llm_span_count += 1
 
 
+def _db_pool_snapshot() -> dict[str, Any] | None:
+    """Connection pool stats from the database library (None when pooling is disabled)."""
+    try:
+        from database.connection import get_pool_stats
+        return get_pool_stats()
+    except Exception:
+        return None
+
+
+def _service_executor_snapshot() -> dict[str, Any] | None:
+    """Per route group queue depth and active calls of the service executor."""
+    try:
+        from core.service_executor import get_service_executor_stats
+        return get_service_executor_stats()
+    except Exception:
+        return None
+
+
+def _sqlite_write_queue_snapshot() -> dict[str, Any] | None:
+    """Serialized SQLite writer stats (None unless the primary is file-backed SQLite)."""
+    try:
+        from database.sqlite_profile import get_write_queue_stats
+        return get_write_queue_stats()
+    except Exception:
+        return None
+
+
+def _buffered_writers_snapshot() -> dict[str, Any] | None:
+    """Per-writer queue depth and written/dropped/failed counters (None when none is running)."""
+    try:
+        from core.buffered_writer import get_buffered_writer_stats
+        return get_buffered_writer_stats()
+    except Exception:
+        return None
+
+
+def _password_hasher_snapshot() -> dict[str, Any] | None:
+    """bcrypt pool queue depth, active hashes, rejections and hash/wait time (None before first use)."""
+    try:
+        from core.password_hasher import get_password_hasher_stats
+        return get_password_hasher_stats()
+    except Exception:
+        return None
+
+
+def _token_cache_snapshot() -> dict[str, Any] | None:
+    """Verified-JWT cache hits/misses/evictions (None when the cache is disabled)."""
+    try:
+        from authentication.utils.jwt import get_token_cache_stats
+        return get_token_cache_stats()
+    except Exception:
+        return None
+
+
+def _principal_cache_snapshot() -> dict[str, Any] | None:
+    """Request principal cache hits/misses/invalidations (None when disabled)."""
+    try:
+        from core.principal import get_principal_cache_stats
+        return get_principal_cache_stats()
+    except Exception:
+        return None
+
+
 def get_metrics_snapshot() -> dict[str, Any]:
     with _lock:
         requests = dict(_request_count)
@@ -39,12 +134,29 @@ def get_metrics_snapshot() -> dict[str, Any]:
         latency_count = dict(_request_latency_count)
         errors = dict(_error_count)
         llm_spans = _llm_span_count
+        db_queries = dict(_db_query_count)
+        db_seconds = dict(_db_seconds_sum)
+        n_plus_one = dict(_n_plus_one_count)
+        slow_queries = [
+            {"path": key, "sql": sql, "ms": ms} for ms, _, key, sql in sorted(_slow_queries, reverse=True)
+        ]
     return {
         "request_count": requests,
         "request_latency_sum": latency_sum,
         "request_latency_count": latency_count,
         "error_count": errors,
         "llm_span_count": llm_spans,
+        "db_query_count": db_queries,
+        "db_seconds_sum": db_seconds,
+        "n_plus_one_count": n_plus_one,
+        "slow_queries": slow_queries,
+        "db_pool": _db_pool_snapshot(),
+        "service_executor": _service_executor_snapshot(),
+        "sqlite_write_queue": _sqlite_write_queue_snapshot(),
+        "buffered_writers": _buffered_writers_snapshot(),
+        "password_hasher": _password_hasher_snapshot(),
+        "token_cache": _token_cache_snapshot(),
+        "principal_cache": _principal_cache_snapshot(),
     }
 
 
@@ -62,4 +174,61 @@ def prometheus_format() -> str:
     for key, count in snap["error_count"].items():
         lines.append(f'http_errors_total{{path="{key}"}} {count}')
     lines.append(f"llm_spans_total {snap['llm_span_count']}")
+    for key, count in snap["db_query_count"].items():
+        lines.append(f'db_queries_total{{path="{key}"}} {count}')
+        lines.append(f'db_query_duration_seconds_sum{{path="{key}"}} {snap["db_seconds_sum"].get(key, 0)}')
+    for key, count in snap["n_plus_one_count"].items():
+        lines.append(f'db_n_plus_one_requests_total{{path="{key}"}} {count}')
+    pool = snap["db_pool"]
+    if pool:
+        lines.append(f"db_pool_max_connections {pool['max_connections']}")
+        lines.append(f"db_pool_connections_in_use {pool['in_use']}")
+        lines.append(f"db_pool_connections_idle {pool['idle']}")
+        lines.append(f"db_pool_checkouts_waiting {pool['waiting']}")
+        lines.append(f"db_pool_checkout_duration_seconds_sum {pool['checkout_seconds_sum']}")
+        lines.append(f"db_pool_checkout_duration_seconds_count {pool['checkouts']}")
+        lines.append(f"db_pool_checkout_timeouts_total {pool['checkout_timeouts']}")
+    executor = snap["service_executor"]
+    if executor:
+        lines.append(f"service_executor_max_workers {executor['max_workers']}")
+        for group, g in executor["groups"].items():
+            lines.append(f'service_executor_limit{{group="{group}"}} {g["limit"]}')
+            lines.append(f'service_executor_queue_depth{{group="{group}"}} {g["waiting"]}')
+            lines.append(f'service_executor_active{{group="{group}"}} {g["active"]}')
+            lines.append(f'service_executor_calls_total{{group="{group}"}} {g["calls"]}')
+            lines.append(f'service_executor_wait_seconds_sum{{group="{group}"}} {g["wait_seconds_sum"]}')
+    writer = snap["sqlite_write_queue"]
+    if writer:
+        lines.append(f"sqlite_writes_total {writer['writes']}")
+        lines.append(f"sqlite_write_batches_total {writer['batches']}")
+        lines.append(f"sqlite_writes_failed_total {writer['failed']}")
+        lines.append(f"sqlite_write_queue_depth {writer['queued']}")
+    for name, w in (snap["buffered_writers"] or {}).items():
+        lines.append(f'buffered_writer_queue_depth{{writer="{name}"}} {w["queued"]}')
+        lines.append(f'buffered_writer_written_total{{writer="{name}"}} {w["written"]}')
+        lines.append(f'buffered_writer_dropped_total{{writer="{name}"}} {w["dropped"]}')
+        lines.append(f'buffered_writer_failed_total{{writer="{name}"}} {w["failed"]}')
+        lines.append(f'buffered_writer_flushes_total{{writer="{name}"}} {w["flushes"]}')
+    hasher = snap["password_hasher"]
+    if hasher:
+        lines.append(f"password_hash_workers {hasher['workers']}")
+        lines.append(f"password_hash_queue_depth {hasher['queued']}")
+        lines.append(f"password_hash_active {hasher['active']}")
+        lines.append(f'password_hash_calls_total{{op="hash"}} {hasher["hashes"]}')
+        lines.append(f'password_hash_calls_total{{op="verify"}} {hasher["verifies"]}')
+        lines.append(f"password_hash_rejected_total {hasher['rejected']}")
+        lines.append(f"password_hash_duration_seconds_sum {hasher['hash_seconds_sum']}")
+        lines.append(f"password_hash_wait_seconds_sum {hasher['wait_seconds_sum']}")
+    token_cache = snap["token_cache"]
+    if token_cache:
+        lines.append(f"jwt_cache_hits_total {token_cache['hits']}")
+        lines.append(f"jwt_cache_misses_total {token_cache['misses']}")
+        lines.append(f"jwt_cache_evictions_total {token_cache['evictions']}")
+        lines.append(f"jwt_cache_entries {token_cache['entries']}")
+    principal_cache = snap["principal_cache"]
+    if principal_cache:
+        lines.append(f"principal_cache_hits_total {principal_cache['hits']}")
+        lines.append(f"principal_cache_misses_total {principal_cache['misses']}")
+        lines.append(f"principal_cache_invalidations_total {principal_cache['invalidations']}")
+        lines.append(f"principal_cache_entries {principal_cache['entries']}")
     return "\n".join(lines) + "\n"
@@ -1,23 +1,57 @@
 """Middleware to record request metrics for observability."""
+import logging
 import time
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from config import METRICS_ENABLED
-from observability.metrics import record_request
+from config import METRICS_ENABLED, SERVER_TIMING_ENABLED
+from database.instrumentation import get_n_plus_one_action, start_profile
+from observability.metrics import record_request, record_request_queries
+
+logger = logging.getLogger(__name__)
 
 
 class MetricsMiddleware(BaseHTTPMiddleware):
-    """Record request count and latency per path."""
+    """
+    Record request count and latency per path, plus the request's database
+    statements (count, time, slowest) via database.instrumentation. Adds a
+    Server-Timing header (SERVER_TIMING_ENABLED) and reports repeated query
+    shapes (N+1) when DB_N_PLUS_ONE_THRESHOLD is set: logged, and with
+    DB_N_PLUS_ONE_ACTION=raise also flagged in an X-N-Plus-One response header.
+    """
 
     async def dispatch(self, request: Request, call_next) -> Response:
         if not METRICS_ENABLED:
             return await call_next(request)
+        profile = start_profile()
+        request.state.query_profile = profile
         start = time.perf_counter()
         response = await call_next(request)
         latency = time.perf_counter() - start
         path = request.scope.get("path", "")
         method = request.scope.get("method", "GET")
         record_request(path, method, response.status_code, latency)
+        repeated = profile.repeated()
+        record_request_queries(path, method, profile.count, profile.seconds, profile.slowest(), bool(repeated))
+        if SERVER_TIMING_ENABLED:
+            response.headers.append(
+                "Server-Timing",
+                f'db;dur={profile.seconds * 1000:.1f};desc="{profile.count} queries", app;dur={latency * 1000:.1f}',
+            )
+        if repeated:
+            # The response is already built, so "raise" cannot fail the request here
+            # without turning a success into a 500: flag it in a header and log an error.
+            strict = get_n_plus_one_action() == "raise"
+            if strict:
+                response.headers["X-N-Plus-One"] = str(max(repeated.values()))
+            for shape, n in repeated.items():
+                logger.log(
+                    logging.ERROR if strict else logging.WARNING,
+                    "Possible N+1 on %s %s: %dx %s",
+                    method,
+                    path,
+                    n,
+                    shape,
+                )
         return response
@@ -1,19 +1,17 @@
 """Application form routes: create draft, get, list, update, contact-information."""
-from uuid import UUID
-
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from auth_deps import get_current_user
-from database.models import User
+from auth_deps import get_principal, user_id_or_401
+from core.principal import Principal
+from core.service_executor import run_service
 from routes import documents as documents_routes
 from services.application_form_service import ApplicationFormService
 from services.forestry_board_service import ForestryBoardService
 from services.contact_information_service import ContactInformationService
 from services.project_information_service import ProjectInformationService
 from services.financial_information_service import FinancialInformationService
-from utils.responses import error_response
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -27,6 +25,8 @@ router.include_router(
 
 class UpdateApplicationBody(BaseModel):
     form_data: dict | None = None
+    # JSON merge patch (RFC 7396) applied to the stored form_data; null removes a key.
+    form_data_patch: dict | None = None
 
 
 class ContactInformationBody(BaseModel):
@@ -70,24 +70,6 @@ class FinancialInformationBody(BaseModel):
     line_item_budget: list[dict] | None = None
 
 
-def _resolve_user_id(payload: dict) -> str | None:
-    """Resolve user id from JWT payload: sub may be UUID (JWT) or email (mock)."""
-    sub = payload.get("sub")
-    if not sub:
-        return None
-    try:
-        UUID(str(sub))
-        return str(sub)
-    except (ValueError, TypeError):
-        pass
-    email = (sub or "").strip().lower()
-    try:
-        user = User.get(User.email == email)
-        return str(user.id)
-    except User.DoesNotExist:
-        return None
-
-
 def _application_form_service() -> ApplicationFormService:
     return ApplicationFormService()
 
@@ -108,26 +90,16 @@ def _forestry_board_service() -> ForestryBoardService:
     return ForestryBoardService()
 
 
-def _user_or_401(user: dict):
-    user_id = _resolve_user_id(user)
-    if not user_id:
-        return None, JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content=error_response("User not found"),
-        )
-    return user_id, None
-
-
 @router.post("")
 async def create_application(
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ApplicationFormService = Depends(_application_form_service),
 ):
     """Create a new draft application for the current user."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.create_draft(user_id)
+    result = await run_service("applications", svc.create_draft, user_id)
     if not result.get("success"):
         code = (result.get("data") or {}).get("code")
         if code == "user_not_found":
@@ -138,14 +110,24 @@ async def create_application(
 
 @router.get("")
 async def list_applications(
-    user: dict = Depends(get_current_user),
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = False,
+    principal: Principal = Depends(get_principal),
     svc: ApplicationFormService = Depends(_application_form_service),
 ):
-    """List current user's applications."""
-    user_id, err = _user_or_401(user)
+    """List the current user's applications, newest first (next_cursor for more)."""
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.list_applications(user_id)
+    result = await run_service(
+        "applications",
+        svc.list_applications,
+        user_id,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
     if not result.get("success"):
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=result)
     return JSONResponse(content=result)
@@ -154,14 +136,14 @@ async def list_applications(
 @router.get("/{application_id}")
 async def get_application(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ApplicationFormService = Depends(_application_form_service),
 ):
     """Retrieve application by id if it belongs to the current user."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.get_application(application_id, user_id)
+    result = await run_service("applications", svc.get_application, application_id, user_id)
     if not result.get("success"):
         if (result.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
@@ -173,14 +155,21 @@ async def get_application(
 async def update_application(
     application_id: str,
     body: UpdateApplicationBody,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ApplicationFormService = Depends(_application_form_service),
 ):
     """Update draft application form data."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.update_application(application_id, user_id, form_data=body.form_data)
+    result = await run_service(
+        "applications",
+        svc.update_application,
+        application_id,
+        user_id,
+        form_data=body.form_data,
+        form_data_patch=body.form_data_patch,
+    )
     if not result.get("success"):
         code = (result.get("data") or {}).get("code")
         if code == "not_found":
@@ -194,14 +183,14 @@ async def update_application(
 @router.get("/{application_id}/contact-information")
 async def get_contact_information(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ContactInformationService = Depends(_contact_information_service),
 ):
     """Get contact information section for the application."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.get_contact(application_id, user_id)
+    result = await run_service("applications", svc.get_contact, application_id, user_id)
     if not result.get("success"):
         if (result.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
@@ -213,15 +202,15 @@ async def get_contact_information(
 async def put_contact_information(
     application_id: str,
     body: ContactInformationBody,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ContactInformationService = Depends(_contact_information_service),
 ):
     """Update contact information (auto-save). Returns validation errors and section_complete."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
     payload = body.model_dump(exclude_none=True)
-    result = svc.put_contact(application_id, user_id, payload)
+    result = await run_service("applications", svc.put_contact, application_id, user_id, payload)
     if not result.get("success"):
         code = (result.get("data") or {}).get("code")
         if code == "not_found":
@@ -235,14 +224,14 @@ async def put_contact_information(
 @router.get("/{application_id}/project-information")
 async def get_project_information(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ProjectInformationService = Depends(_project_information_service),
 ):
     """Get project information section for the application."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.get_project(application_id, user_id)
+    result = await run_service("applications", svc.get_project, application_id, user_id)
     if not result.get("success"):
         if (result.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
@@ -254,15 +243,15 @@ async def get_project_information(
 async def put_project_information(
     application_id: str,
     body: ProjectInformationBody,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ProjectInformationService = Depends(_project_information_service),
 ):
     """Update project information (auto-save). Returns validation errors and section_complete."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
     payload = body.model_dump(exclude_none=True)
-    result = svc.put_project(application_id, user_id, payload)
+    result = await run_service("applications", svc.put_project, application_id, user_id, payload)
     if not result.get("success"):
         code = (result.get("data") or {}).get("code")
         if code == "not_found":
@@ -276,14 +265,14 @@ async def put_project_information(
 @router.get("/{application_id}/financial-information")
 async def get_financial_information(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: FinancialInformationService = Depends(_financial_information_service),
 ):
     """Get financial information section (with server-computed cost-match percentage)."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.get_financial(application_id, user_id)
+    result = await run_service("applications", svc.get_financial, application_id, user_id)
     if not result.get("success"):
         if (result.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
@@ -295,15 +284,15 @@ async def get_financial_information(
 async def put_financial_information(
     application_id: str,
     body: FinancialInformationBody,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: FinancialInformationService = Depends(_financial_information_service),
 ):
     """Update financial information (auto-save). Cost-match % computed server-side. Returns errors and section_complete."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
     payload = body.model_dump(exclude_none=True)
-    result = svc.put_financial(application_id, user_id, payload)
+    result = await run_service("applications", svc.put_financial, application_id, user_id, payload)
     if not result.get("success"):
         code = (result.get("data") or {}).get("code")
         if code == "not_found":
@@ -317,14 +306,14 @@ async def put_financial_information(
 @router.post("/{application_id}/mark-ready-for-board-review")
 async def mark_ready_for_board_review(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ForestryBoardService = Depends(_forestry_board_service),
 ):
     """Mark application ready for Forestry Board review."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.mark_ready_for_board_review(application_id, user_id)
+    result = await run_service("applications", svc.mark_ready_for_board_review, application_id, user_id)
     if not result.get("success"):
         code = (result.get("data") or {}).get("code")
         if code == "not_found":
@@ -336,14 +325,14 @@ async def mark_ready_for_board_review(
 @router.get("/{application_id}/forestry-board-approval-status")
 async def get_forestry_board_approval_status(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: ForestryBoardService = Depends(_forestry_board_service),
 ):
     """Get Forestry Board approval status for the application."""
-    user_id, err = _user_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.get_approval_status(application_id, user_id)
+    result = await run_service("applications", svc.get_approval_status, application_id, user_id)
     if not result.get("success"):
         if (result.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
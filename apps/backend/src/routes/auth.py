@@ -1,8 +1,18 @@
-"""Auth routes: register, login, logout, forgot-password, reset-password, refresh-token."""
+"""
+Auth routes: register, login, logout, forgot-password, reset-password, refresh-token.
+
+Routes that hash or check a password run the database steps off the event loop
+(route group "auth") and await the bcrypt work on core.password_hasher between
+them, outside the group's concurrency limit, so a full hashing queue answers 429
+with Retry-After instead of waiting behind the group gate.
+"""
 import os
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
+from core.password_hasher import PasswordHasherBusyError, get_password_hasher
+from core.service_executor import run_service
+
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
@@ -45,33 +55,51 @@ def _use_jwt_backend() -> bool:
     return (os.getenv("AUTH_PROVIDER") or "mock").lower() == "jwt"
 
 
+def _busy(e: PasswordHasherBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=e.public_message,
+        headers={"Retry-After": str(e.retry_after_seconds)},
+    )
+
+
 @router.post("/register", response_model=AuthResponse)
-def register(body: RegisterRequest) -> AuthResponse:
+async def register(body: RegisterRequest) -> AuthResponse:
     """Register with email and password; email uniqueness and password complexity enforced."""
     if not _use_jwt_backend():
         raise HTTPException(status_code=501, detail="Registration is only available with JWT auth backend.")
     svc = _auth_service()
     try:
-        out = svc.register(body.email, body.password, body.name)
+        svc.check_registration(body.email, body.password)
+        password_hash = await get_password_hasher().hash_async(body.password)
+        out = await run_service(
+            "auth", svc.register, body.email, body.password, body.name, password_hash=password_hash
+        )
         return AuthResponse(user=out["user"], message=out.get("message", "Registration successful."))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except PasswordHasherBusyError as e:
+        raise _busy(e)
 
 
 @router.post("/login", response_model=AuthResponse)
-def login(body: LoginRequest, request: Request) -> AuthResponse:
+async def login(body: LoginRequest, request: Request) -> AuthResponse:
     """Authenticate; returns JWT and user. Uses DB+JWT when AUTH_PROVIDER=jwt, else mock provider."""
     ip_address = request.client.host if request.client else None
     if _use_jwt_backend():
         svc = _auth_service()
         try:
-            out = svc.login(body.email, body.password, ip_address)
+            user = await run_service("auth", svc.start_login, body.email, ip_address)
+            verified = await get_password_hasher().verify_async(body.password, user.password_hash)
+            out = await run_service("auth", svc.finish_login, user, body.password, verified, ip_address)
             try:
                 from services.audit_service import record_audit
-                record_audit("login", user_id=out["user"].get("id"), request=request)
+                await run_service("auth", record_audit, "login", user_id=out["user"].get("id"), request=request)
             except Exception:
                 pass
             return AuthResponse(token=out["token"], user=out["user"])
+        except PasswordHasherBusyError as e:
+            raise _busy(e)
         except Exception as e:
             from authentication.errors import InvalidCredentialsError, AccountLockedError
             if isinstance(e, AccountLockedError):
@@ -81,12 +109,12 @@ def login(body: LoginRequest, request: Request) -> AuthResponse:
             raise
     from authentication import get_provider
     provider = get_provider()
-    result = provider.authenticate(body.email, body.password)
+    result = await run_service("auth", provider.authenticate, body.email, body.password)
     if result is None:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     try:
         from services.audit_service import record_audit
-        record_audit("login", user_id=result.get("user", {}).get("id"), request=request)
+        await run_service("auth", record_audit, "login", user_id=result.get("user", {}).get("id"), request=request)
     except Exception:
         pass
     return AuthResponse(token=result["token"], user=result["user"])
@@ -109,16 +137,20 @@ def forgot_password(body: ForgotPasswordRequest) -> AuthResponse:
 
 
 @router.post("/reset-password", response_model=AuthResponse)
-def reset_password(body: ResetPasswordRequest) -> AuthResponse:
+async def reset_password(body: ResetPasswordRequest) -> AuthResponse:
     """Reset password with token; validate complexity."""
     if not _use_jwt_backend():
         raise HTTPException(status_code=501, detail="Password reset is only available with JWT auth backend.")
     svc = _auth_service()
     try:
-        out = svc.reset_password(body.token, body.new_password)
+        reset = await run_service("auth", svc.check_reset, body.token, body.new_password)
+        password_hash = await get_password_hasher().hash_async(body.new_password)
+        out = await run_service("auth", svc.complete_reset, reset, password_hash)
         return AuthResponse(message=out["message"])
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except PasswordHasherBusyError as e:
+        raise _busy(e)
 
 
 @router.post("/refresh-token", response_model=AuthResponse)
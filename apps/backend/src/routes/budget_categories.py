@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
 from database.models import BudgetCategory
+from database.routing import use_replica
 from utils.responses import success_response
 
 router = APIRouter(prefix="/budget-categories", tags=["reference"])
@@ -11,6 +12,7 @@ router = APIRouter(prefix="/budget-categories", tags=["reference"])
 @router.get("")
 async def list_budget_categories():
     """List budget categories for financial line item dropdown."""
-    options = BudgetCategory.select().order_by(BudgetCategory.label)
-    data = [{"id": str(o.id), "code": o.code, "label": o.label} for o in options]
+    with use_replica():
+        options = BudgetCategory.select().order_by(BudgetCategory.label)
+        data = [{"id": str(o.id), "code": o.code, "label": o.label} for o in options]
     return JSONResponse(content=success_response(data=data))
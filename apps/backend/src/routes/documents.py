@@ -1,35 +1,35 @@
-"""Document management routes: upload, list, download, delete, status."""
-from io import BytesIO
-from uuid import UUID
+"""Document management routes: upload (streamed or direct to storage), list, download, delete, status."""
+import asyncio
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile, status
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
-from auth_deps import get_current_user
-from database.models import User
+from auth_deps import get_principal, user_id_or_401
+from config import FILE_UPLOAD_MAX_MB
+from core.file_response import serve_stored_file
+from core.multipart_stream import MultipartStream
+from core.principal import Principal
+from core.service_executor import run_service
+from core.upload import MAX_UPLOAD_BODY_BYTES
 from services.document_management_service import DocumentManagementService
+from storage.streaming import UploadRejectedError
 from utils.responses import error_response
 from utils.testing import mock_malware_scanner, mock_storage_backend
 
 router = APIRouter(tags=["documents"])
 
 
-def _user_id_or_401(user: dict) -> tuple[str | None, JSONResponse | None]:
-    """Resolve user id from JWT payload; return (None, 401 response) if not found."""
-    sub = (user or {}).get("sub")
-    if not sub:
-        return None, JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content=error_response("User not found"))
-    try:
-        UUID(str(sub))
-        return str(sub), None
-    except (ValueError, TypeError):
-        pass
-    email = (str(sub) or "").strip().lower()
-    try:
-        u = User.get(User.email == email)
-        return str(u.id), None
-    except User.DoesNotExist:
-        return None, JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content=error_response("User not found"))
+class DirectUploadBody(BaseModel):
+    file_name: str
+    content_type: str
+    file_size: int
+    category: str
+    sha256: str | None = None  # hex digest; checked when the upload is completed
+
+
+class CompleteUploadBody(BaseModel):
+    upload_token: str
 
 
 def _document_service() -> DocumentManagementService:
@@ -47,14 +47,14 @@ def _document_service() -> DocumentManagementService:
 @router.get("/status")
 async def get_document_status(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: DocumentManagementService = Depends(_document_service),
 ):
     """Get document completion status (required: Site Plan, Site Photos)."""
-    user_id, err = _user_id_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.get_document_status(application_id, user_id)
+    result = await run_service("documents", svc.get_document_status, application_id, user_id)
     if not result.get("success"):
         if (result.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
@@ -65,14 +65,14 @@ async def get_document_status(
 @router.get("")
 async def list_documents(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: DocumentManagementService = Depends(_document_service),
 ):
     """List documents for application grouped by category."""
-    user_id, err = _user_id_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.list_documents(application_id, user_id)
+    result = await run_service("documents", svc.list_documents, application_id, user_id)
     if not result.get("success"):
         if (result.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
@@ -80,36 +80,138 @@ async def list_documents(
     return JSONResponse(content=result)
 
 
-@router.post("")
+# The upload route reads the body itself; describe the form for the OpenAPI schema.
+_UPLOAD_FORM = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file", "category"],
+                    "properties": {
+                        "category": {"type": "string"},
+                        "file": {"type": "string", "format": "binary"},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+def _upload_error_response(result: dict) -> JSONResponse:
+    code = (result.get("data") or {}).get("code")
+    if code == "not_found":
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
+    if code == "file_too_large":
+        return JSONResponse(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content=result)
+    if code == "direct_upload_unsupported":
+        return JSONResponse(status_code=status.HTTP_501_NOT_IMPLEMENTED, content=result)
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=result)
+
+
+@router.post("", openapi_extra=_UPLOAD_FORM)
 async def upload_document(
     application_id: str,
-    user: dict = Depends(get_current_user),
+    request: Request,
+    principal: Principal = Depends(get_principal),
     svc: DocumentManagementService = Depends(_document_service),
-    file: UploadFile = File(...),
-    category: str = Form(...),
 ):
-    """Upload document with category. Validates format (PDF, JPG, PNG) and size (10MB)."""
-    user_id, err = _user_id_or_401(user)
+    """
+    Upload document with category (multipart fields file, category). Validates format
+    (PDF, JPG, PNG) and size (FILE_UPLOAD_MAX_MB). The body is streamed to storage, not
+    buffered; a Content-Length over the limit is refused (413) before any of it is read.
+    """
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    content = await file.read()
-    filename = file.filename or "unnamed"
-    content_type = file.content_type or "application/octet-stream"
-    result = svc.upload_document(
+    try:
+        declared = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        declared = 0
+    if declared > MAX_UPLOAD_BODY_BYTES:
+        return _upload_error_response(
+            error_response(f"File size exceeds {FILE_UPLOAD_MAX_MB}MB limit", data={"code": "file_too_large"})
+        )
+    result = await run_service("documents", svc.check_upload_target, application_id, user_id)
+    if not result.get("success"):
+        return _upload_error_response(result)
+    try:
+        form = MultipartStream(request, max_body_bytes=MAX_UPLOAD_BODY_BYTES)
+        part = await form.next_file()
+    except UploadRejectedError as e:
+        return _upload_error_response(error_response(str(e), data={"code": e.code}))
+    if part is None:
+        return _upload_error_response(error_response("No file uploaded", data={"code": "validation_error"}))
+    loop = asyncio.get_running_loop()
+    result = await run_service(
+        "documents",
+        svc.upload_document_stream,
         application_id,
         user_id,
-        file_obj=BytesIO(content),
-        filename=filename,
-        content_type=content_type,
-        category=category,
+        chunks=form.sync_chunks(loop),
+        filename=part.filename or "unnamed",
+        content_type=part.content_type or "application/octet-stream",
+        category=form.sync_field(loop, "category"),
     )
     if not result.get("success"):
-        code = (result.get("data") or {}).get("code")
-        if code == "not_found":
-            return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
-        if code == "not_draft":
-            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=result)
-        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=result)
+        return _upload_error_response(result)
+    return JSONResponse(status_code=status.HTTP_201_CREATED, content=result)
+
+
+@router.post("/uploads")
+async def start_direct_upload(
+    application_id: str,
+    body: DirectUploadBody,
+    principal: Principal = Depends(get_principal),
+    svc: DocumentManagementService = Depends(_document_service),
+):
+    """
+    Start a direct upload: validates the declared file (format, size, category) and
+    returns documentId, an upload grant (method, url, fields, headers, expiresAt) for
+    sending the file straight to storage, and uploadToken for the complete call.
+    501 when the storage backend cannot take direct uploads (use POST "" instead).
+    """
+    user_id, err = user_id_or_401(principal)
+    if err is not None:
+        return err
+    result = await run_service(
+        "documents",
+        svc.start_direct_upload,
+        application_id,
+        user_id,
+        filename=body.file_name,
+        content_type=body.content_type,
+        size=body.file_size,
+        category=body.category,
+        sha256=body.sha256,
+    )
+    if not result.get("success"):
+        return _upload_error_response(result)
+    return JSONResponse(status_code=status.HTTP_201_CREATED, content=result)
+
+
+@router.post("/uploads/{document_id}/complete")
+async def complete_direct_upload(
+    application_id: str,
+    document_id: str,
+    body: CompleteUploadBody,
+    principal: Principal = Depends(get_principal),
+    svc: DocumentManagementService = Depends(_document_service),
+):
+    """
+    Complete a direct upload: checks the stored file's size, content type and sha256
+    against the start call, scans it and creates the document (same response as POST "").
+    """
+    user_id, err = user_id_or_401(principal)
+    if err is not None:
+        return err
+    result = await run_service(
+        "documents", svc.complete_direct_upload, application_id, user_id, document_id, upload_token=body.upload_token
+    )
+    if not result.get("success"):
+        return _upload_error_response(result)
     return JSONResponse(status_code=status.HTTP_201_CREATED, content=result)
 
 
@@ -117,60 +219,61 @@ async def upload_document(
 async def download_thumbnail(
     application_id: str,
     document_id: str,
-    user: dict = Depends(get_current_user),
+    request: Request,
+    principal: Principal = Depends(get_principal),
     svc: DocumentManagementService = Depends(_document_service),
 ):
     """Download thumbnail image for document (JPG/PNG only)."""
-    user_id, err = _user_id_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    content, err_res = svc.download_thumbnail(application_id, document_id, user_id)
+    response, err_res = await serve_stored_file(
+        request, "documents", svc.open_thumbnail, application_id, document_id, user_id
+    )
     if err_res is not None:
         if (err_res.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=err_res)
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=err_res)
-    if content is None:
-        return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=error_response("Download failed"))
-    return Response(content=content, media_type="image/png")
+    return response
 
 
 @router.get("/{document_id}")
 async def download_document(
     application_id: str,
     document_id: str,
-    user: dict = Depends(get_current_user),
+    request: Request,
+    principal: Principal = Depends(get_principal),
     svc: DocumentManagementService = Depends(_document_service),
 ):
-    """Download document file. Requires authentication and application ownership."""
-    user_id, err = _user_id_or_401(user)
+    """
+    Download document file. Requires authentication and application ownership.
+    Streamed from storage; supports Range (206), ETag/If-None-Match and Last-Modified.
+    """
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    content, filename, content_type, err_res = svc.download_document(application_id, document_id, user_id)
+    response, err_res = await serve_stored_file(
+        request, "documents", svc.open_document, application_id, document_id, user_id
+    )
     if err_res is not None:
         if (err_res.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=err_res)
         return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=err_res)
-    if content is None:
-        return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=error_response("Download failed"))
-    return Response(
-        content=content,
-        media_type=content_type or "application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{filename or "document"}"'},
-    )
+    return response
 
 
 @router.delete("/{document_id}")
 async def delete_document(
     application_id: str,
     document_id: str,
-    user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     svc: DocumentManagementService = Depends(_document_service),
 ):
     """Delete document. Blocked after application submission."""
-    user_id, err = _user_id_or_401(user)
+    user_id, err = user_id_or_401(principal)
     if err is not None:
         return err
-    result = svc.delete_document(application_id, document_id, user_id)
+    result = await run_service("documents", svc.delete_document, application_id, document_id, user_id)
     if not result.get("success"):
         if (result.get("data") or {}).get("code") == "not_found":
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=result)
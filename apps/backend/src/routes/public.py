@@ -1,11 +1,13 @@
 """Public API routes: program configuration and public data query (no authentication)."""
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from config import PROGRAM_CONFIG_CACHE_MAX_AGE
+from core.file_response import serve_stored_file
 from services.program_config import get_cached_program_config
 from services.public_data_query_service import PublicDataQueryService
+from utils.responses import error_response
 
 router = APIRouter(prefix="/public", tags=["public"])
 
@@ -47,15 +49,26 @@ def post_data_query(body: DataQueryBody) -> JSONResponse:
     return JSONResponse(content=result)
 
 
-@router.get("/resources/{key:path}")
-def get_public_resource(key: str) -> Response:
-    """Serve a static resource (PDF, etc.) by storage key. No authentication."""
+def _open_resource(key: str, byte_range=None):
+    """(stream, filename, content_type, error_response) for a public resource key."""
+    from core.container import get_storage
+    from storage import RangeNotSatisfiableError
+
+    start, end = byte_range or (None, None)
     try:
-        from storage import get_storage
-        backend = get_storage()
-        data = backend.download(key)
-        meta = backend.get_metadata(key)
-        content_type = (meta and meta.content_type) or "application/octet-stream"
-        return Response(content=data, media_type=content_type)
+        return get_storage().open_stream(key, start, end), None, None, None
     except FileNotFoundError:
+        return None, None, None, error_response("Resource not found", data={"code": "not_found"})
+    except RangeNotSatisfiableError as e:
+        return None, None, None, error_response(
+            "Requested range not satisfiable", data={"code": "range_not_satisfiable", "size": e.total_size}
+        )
+
+
+@router.get("/resources/{key:path}")
+async def get_public_resource(key: str, request: Request) -> Response:
+    """Serve a static resource (PDF, etc.) by storage key. No authentication. Streamed; supports Range."""
+    response, err = await serve_stored_file(request, "public", _open_resource, key, disposition="inline")
+    if err is not None:
         raise HTTPException(status_code=404, detail="Resource not found")
+    return response
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
 from database.models import SiteOwnership
+from database.routing import use_replica
 from utils.responses import success_response
 
 router = APIRouter(prefix="/site-ownership", tags=["reference"])
@@ -11,6 +12,7 @@ router = APIRouter(prefix="/site-ownership", tags=["reference"])
 @router.get("")
 async def list_site_ownership():
     """List site ownership options for project information dropdown."""
-    options = SiteOwnership.select().order_by(SiteOwnership.label)
-    data = [{"id": str(o.id), "code": o.code, "label": o.label} for o in options]
+    with use_replica():
+        options = SiteOwnership.select().order_by(SiteOwnership.label)
+        data = [{"id": str(o.id), "code": o.code, "label": o.label} for o in options]
     return JSONResponse(content=success_response(data=data))
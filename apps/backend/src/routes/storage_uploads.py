@@ -0,0 +1,62 @@
+"""
+Signed direct-upload endpoint for local storage.
+
+LocalStorageBackend.presign_upload() (LOCAL_UPLOAD_URL=/api/v1/storage/uploads)
+hands out PUT URLs under this route so the direct upload flow works without S3.
+The signed token in the path is the authorization, as with an S3 presigned URL;
+no bearer token is required. The bytes still pass through an API worker here,
+so this is for development and single-host deployments.
+"""
+import asyncio
+
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import JSONResponse
+
+from core.service_executor import run_service
+from core.upload import sync_body_chunks
+from storage.signing import InvalidTokenError
+from storage.streaming import UploadRejectedError, UploadTooLargeError
+from utils.responses import error_response
+
+router = APIRouter(prefix="/storage", tags=["storage"])
+
+
+def _accept_signed_upload():
+    """The configured backend's accept_signed_upload, or None if it does not take signed uploads."""
+    try:
+        from core.container import get_storage
+        storage = get_storage()
+    except Exception:
+        return None
+    if not getattr(storage, "upload_url", None):
+        return None
+    return getattr(storage, "accept_signed_upload", None)
+
+
+@router.put("/uploads/{token}")
+async def put_signed_upload(token: str, request: Request):
+    """Store the request body at the key signed into token (204). 403 bad/expired token, 413 too large."""
+    accept = _accept_signed_upload()
+    if accept is None:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content=error_response("Signed uploads are not enabled", data={"code": "not_found"}),
+        )
+    loop = asyncio.get_running_loop()
+    try:
+        await run_service(
+            "documents",
+            accept,
+            token,
+            sync_body_chunks(request, loop),
+            content_type=request.headers.get("content-type", ""),
+        )
+    except InvalidTokenError as e:
+        return JSONResponse(status_code=status.HTTP_403_FORBIDDEN, content=error_response(str(e), data={"code": e.code}))
+    except UploadTooLargeError as e:
+        return JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content=error_response(str(e), data={"code": e.code})
+        )
+    except UploadRejectedError as e:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=error_response(str(e), data={"code": e.code}))
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,160 @@
+"""
+Application aggregates: an application with its contact, project, financial,
+approval and revision rows, loaded in a constant number of queries.
+
+One query LEFT JOINs the one-to-one sections (and the approving board member);
+one more query per 500 applications fetches revision requests. Board and
+applicant views build on this instead of looking up each section per row.
+"""
+from dataclasses import dataclass, field
+from typing import Iterable
+from uuid import UUID
+
+from peewee import JOIN, ModelSelect
+
+from database.models import (
+    Application,
+    ContactInformation,
+    FinancialInformation,
+    ForestryBoard,
+    ForestryBoardApproval,
+    ProjectInformation,
+    RevisionRequest,
+    normalize_county_key,
+)
+from database.pagination import Page, paginate
+
+_REVISION_BATCH = 500
+
+
+@dataclass
+class ApplicationAggregate:
+    """Application plus its related rows (None when a section does not exist yet)."""
+
+    application: Application
+    contact: ContactInformation | None = None
+    project: ProjectInformation | None = None
+    financial: FinancialInformation | None = None
+    approval: ForestryBoardApproval | None = None
+    revisions: list[RevisionRequest] = field(default_factory=list)  # oldest first
+
+    @property
+    def county(self) -> str | None:
+        return self.contact.county if self.contact else None
+
+    def in_county(self, county: str | None) -> bool:
+        """True if the application's county matches (case/whitespace-insensitive)."""
+        mine = self.county
+        return bool(mine and county and mine.strip().lower() == county.strip().lower())
+
+    @property
+    def approval_status(self) -> str:
+        if self.approval is not None:
+            return self.approval.status
+        return "pending" if self.application.ready_for_board_review_at else "not_submitted"
+
+    @property
+    def project_name(self) -> str:
+        return (self.project.project_name if self.project else None) or "Application"
+
+
+class ApplicationAggregateLoader:
+    """Load ApplicationAggregates for an Application query without per-row lookups."""
+
+    def __init__(self, include_financial: bool = True, include_revisions: bool = True) -> None:
+        self.include_financial = include_financial
+        self.include_revisions = include_revisions
+
+    def query(self) -> ModelSelect:
+        """Application select with one-to-one sections joined; add where/order_by as needed."""
+        models = [Application, ContactInformation, ProjectInformation, ForestryBoardApproval, ForestryBoard]
+        if self.include_financial:
+            models.append(FinancialInformation)
+        q = (
+            Application.select(*models)
+            .join(ContactInformation, JOIN.LEFT_OUTER, on=(ContactInformation.application == Application.id), attr="_contact")
+            .switch(Application)
+            .join(ProjectInformation, JOIN.LEFT_OUTER, on=(ProjectInformation.application == Application.id), attr="_project")
+            .switch(Application)
+            .join(
+                ForestryBoardApproval,
+                JOIN.LEFT_OUTER,
+                on=(ForestryBoardApproval.application == Application.id),
+                attr="_approval",
+            )
+            .join(ForestryBoard, JOIN.LEFT_OUTER, on=(ForestryBoardApproval.board_member == ForestryBoard.id))
+        )
+        if self.include_financial:
+            q = q.switch(Application).join(
+                FinancialInformation,
+                JOIN.LEFT_OUTER,
+                on=(FinancialInformation.application == Application.id),
+                attr="_financial",
+            )
+        return q.switch(Application)
+
+    def load(self, query: Iterable[Application]) -> list[ApplicationAggregate]:
+        """
+        Run a query built from query() (or take its rows) and attach revisions
+        in a batched follow-up query.
+        """
+        aggregates = [
+            ApplicationAggregate(
+                application=app,
+                contact=getattr(app, "_contact", None),
+                project=getattr(app, "_project", None),
+                financial=getattr(app, "_financial", None),
+                approval=getattr(app, "_approval", None),
+            )
+            for app in query
+        ]
+        if self.include_revisions and aggregates:
+            self._attach_revisions(aggregates)
+        return aggregates
+
+    def get(self, application_id: UUID, user_id: UUID | None = None) -> ApplicationAggregate | None:
+        """Load one application (optionally restricted to its owner)."""
+        q = self.query().where(Application.id == application_id)
+        if user_id is not None:
+            q = q.where(Application.user_id == user_id)
+        found = self.load(q.limit(1))
+        return found[0] if found else None
+
+    def board_queue(
+        self,
+        county: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> Page:
+        """
+        One page of applications ready for board review in a county, newest
+        submission first; items are ApplicationAggregates. A keyset range scan of
+        the (county_key, ready_for_board_review_at) index.
+        """
+        q = self.query().where(
+            (Application.county_key == normalize_county_key(county))
+            & Application.ready_for_board_review_at.is_null(False)
+        )
+        page = paginate(
+            q,
+            limit,
+            cursor,
+            key=Application.ready_for_board_review_at,
+            include_total=include_total,
+        )
+        page.items = self.load(page.items)
+        return page
+
+    def _attach_revisions(self, aggregates: Iterable[ApplicationAggregate]) -> None:
+        by_id = {agg.application.id: agg for agg in aggregates}
+        ids = list(by_id)
+        for start in range(0, len(ids), _REVISION_BATCH):
+            batch = ids[start:start + _REVISION_BATCH]
+            rows = (
+                RevisionRequest.select()
+                .where(RevisionRequest.application.in_(batch))
+                .order_by(RevisionRequest.created_at)
+            )
+            for rev in rows:
+                by_id[rev.application_id].revisions.append(rev)
@@ -1,10 +1,22 @@
-"""Application form service: create and retrieve applications (MVP)."""
-import json
+"""
+Application form service: create and retrieve applications (MVP).
+
+Applicant views load applications through ApplicationAggregateLoader, so each
+application comes with its section and board-approval rows in one joined query
+instead of a lookup per section.
+"""
 from typing import Any
 from uuid import UUID
 
+from database.json_fields import merge_patch_json
 from database.models import Application, User
-from utils.responses import error_response, success_response
+from database.pagination import InvalidCursor, paginate
+from database.sqlite_profile import serialized_write
+from services.application_aggregate import ApplicationAggregate, ApplicationAggregateLoader
+from utils.responses import error_response, paginated_response, success_response
+
+# Applicant views show section completion and board status, not revision comments.
+_loader = ApplicationAggregateLoader(include_revisions=False)
 
 
 class ApplicationFormService:
@@ -26,7 +38,7 @@ class ApplicationFormService:
             return error_response("User not found", data={"code": "user_not_found"})
         app = Application.create(user_id=uid, status="draft")
         return success_response(
-            data=_application_to_dict(app),
+            data=_application_to_dict(ApplicationAggregate(application=app)),
             message="Application created",
         )
 
@@ -40,43 +52,75 @@ class ApplicationFormService:
             uid = UUID(user_id)
         except (ValueError, TypeError):
             return error_response("Invalid id", data={"code": "invalid_id"})
-        try:
-            app = Application.get((Application.id == aid) & (Application.user_id == uid))
-        except Application.DoesNotExist:
+        agg = _loader.get(aid, user_id=uid)
+        if agg is None:
             return error_response("Application not found", data={"code": "not_found"})
-        return success_response(data=_application_to_dict(app))
+        return success_response(data=_application_to_dict(agg))
 
-    def list_applications(self, user_id: str) -> dict[str, Any]:
-        """List applications for the user (newest first)."""
+    def list_applications(
+        self,
+        user_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> dict[str, Any]:
+        """List applications for the user (newest first), one keyset page at a time."""
         try:
             uid = UUID(user_id)
         except (ValueError, TypeError):
             return error_response("Invalid user", data={"code": "invalid_user"})
-        apps = Application.select().where(Application.user_id == uid).order_by(Application.created_at.desc())
-        return success_response(data=[_application_to_dict(a) for a in apps])
+        try:
+            page = paginate(
+                _loader.query().where(Application.user_id == uid),
+                limit,
+                cursor,
+                include_total=include_total,
+            )
+        except InvalidCursor:
+            return error_response("Invalid cursor", data={"code": "invalid_cursor"})
+        return paginated_response(
+            [_application_to_dict(agg) for agg in _loader.load(page.items)],
+            page.next_cursor,
+            page.limit,
+            page.total,
+        )
 
+    @serialized_write
     def update_application(
-        self, application_id: str, user_id: str, form_data: dict[str, Any] | None = None
+        self,
+        application_id: str,
+        user_id: str,
+        form_data: dict[str, Any] | None = None,
+        form_data_patch: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Update draft application form_data. Returns updated application."""
+        """
+        Update draft application form_data. form_data replaces the whole document;
+        form_data_patch is a JSON merge patch (RFC 7396: null removes a key) applied
+        in the database. Returns updated application.
+        """
         try:
             aid = UUID(application_id)
             uid = UUID(user_id)
         except (ValueError, TypeError):
             return error_response("Invalid id", data={"code": "invalid_id"})
-        try:
-            app = Application.get((Application.id == aid) & (Application.user_id == uid))
-        except Application.DoesNotExist:
+        agg = _loader.get(aid, user_id=uid)
+        if agg is None:
             return error_response("Application not found", data={"code": "not_found"})
+        app = agg.application
         if app.status != "draft":
             return error_response("Only draft applications can be updated", data={"code": "not_draft"})
         if form_data is not None:
-            app.form_data = json.dumps(form_data) if form_data else None
-            app.save()
-        return success_response(data=_application_to_dict(app), message="Application updated")
+            app.form_data = form_data or None
+            # Only our columns: a full save would write back a county_key read before a
+            # concurrent contact-information save changed it.
+            app.save(only=[Application.form_data, Application.updated_at])
+        if form_data_patch:
+            merge_patch_json(app, Application.form_data, form_data_patch)
+        return success_response(data=_application_to_dict(agg), message="Application updated")
 
 
-def _application_to_dict(app: Application) -> dict[str, Any]:
+def _application_to_dict(agg: ApplicationAggregate) -> dict[str, Any]:
+    app = agg.application
     data: dict[str, Any] = {
         "id": str(app.id),
         "user_id": str(app.user_id),
@@ -84,11 +128,11 @@ def _application_to_dict(app: Application) -> dict[str, Any]:
         "created_at": app.created_at.isoformat() + "Z" if app.created_at else None,
         "last_modified": app.updated_at.isoformat() + "Z" if app.updated_at else None,
     }
-    if app.form_data:
-        try:
-            data["form_data"] = json.loads(app.form_data)
-        except (TypeError, ValueError):
-            data["form_data"] = None
-    else:
-        data["form_data"] = None
+    data["form_data"] = app.form_data or None
+    data["sections"] = {
+        "contact_information": agg.contact is not None,
+        "project_information": agg.project is not None,
+        "financial_information": agg.financial is not None,
+    }
+    data["board_status"] = agg.approval_status
     return data
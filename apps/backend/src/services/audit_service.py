@@ -1,8 +1,75 @@
-"""Audit service: record security-relevant actions without PII."""
-from uuid import UUID
+"""
+Audit service: record security-relevant actions without PII.
+
+By default (AUDIT_LOG_MODE=buffered) record_audit only queues the entry; a
+background writer (core.buffered_writer) inserts queued entries in batches
+with insert_many and is drained on shutdown. AUDIT_LOG_MODE=sync writes each
+entry before record_audit returns, for deployments where an audited action
+must not complete without its log row. Without a running writer (scripts,
+tests, in-memory SQLite) entries are always written synchronously.
+"""
+from datetime import datetime
 from typing import Any
+from uuid import UUID
 
+from peewee import SqliteDatabase, chunked
+
+from config import AUDIT_LOG_BATCH_SIZE, AUDIT_LOG_FLUSH_SECONDS, AUDIT_LOG_MAX_QUEUE, AUDIT_LOG_MODE
+from core.buffered_writer import BufferedWriter, get_buffered_writer, start_buffered_writer
+from database.connection import database_proxy
 from database.models import AuditLog, User
+from database.sqlite_profile import is_file_sqlite
+
+AUDIT_WRITER = "audit_log"
+_INSERT_CHUNK = 90  # rows per INSERT: 10 columns each stays under SQLite's 999 parameters
+
+
+def _audit_row(
+    action: str,
+    user_id: str | None,
+    resource_type: str | None,
+    resource_id: str | None,
+    details_redacted: str | None,
+    request: Any,
+) -> dict[str, Any]:
+    try:
+        uid = UUID(user_id) if user_id else None
+    except (ValueError, TypeError):
+        uid = None
+    ip = None
+    ua = None
+    if request:
+        ip = request.client.host if getattr(request, "client", None) else None
+        ua = (request.headers.get("user-agent") or "")[:512]
+    now = datetime.utcnow()  # time of the action, not of the flush
+    return {
+        "user": uid,
+        "action": action[:64],
+        "resource_type": resource_type[:64] if resource_type else None,
+        "resource_id": resource_id[:255] if resource_id else None,
+        "details_redacted": details_redacted,
+        "ip_address": ip,
+        "user_agent": ua,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def write_audit_rows(rows: list[dict[str, Any]]) -> None:
+    """
+    Insert audit rows in one transaction. User ids are checked with one query per
+    batch; ids that are not in users (e.g. mock auth accounts) are stored as NULL.
+    """
+    uids = {row["user"] for row in rows if row["user"] is not None}
+    known = set()
+    if uids:
+        known = {u.id for u in User.select(User.id).where(User.id.in_(list(uids)))}
+    for row in rows:
+        if row["user"] not in known:
+            row["user"] = None
+    with AuditLog._meta.database.atomic():
+        for chunk in chunked(rows, _INSERT_CHUNK):
+            AuditLog.insert_many(chunk).execute()
 
 
 def record_audit(
@@ -17,23 +84,26 @@ def record_audit(
     Record an audit log entry. Do not pass PII in details_redacted.
     request can be a Starlette Request for IP and User-Agent.
     """
-    try:
-        uid = UUID(user_id) if user_id else None
-        if uid and not User.select().where(User.id == uid).exists():
-            uid = None
-    except (ValueError, TypeError):
-        uid = None
-    ip = None
-    ua = None
-    if request:
-        ip = request.client.host if getattr(request, "client", None) else None
-        ua = (request.headers.get("user-agent") or "")[:512]
-    AuditLog.create(
-        user_id=uid,
-        action=action[:64],
-        resource_type=resource_type[:64] if resource_type else None,
-        resource_id=resource_id[:255] if resource_id else None,
-        details_redacted=details_redacted,
-        ip_address=ip,
-        user_agent=ua,
+    row = _audit_row(action, user_id, resource_type, resource_id, details_redacted, request)
+    writer = get_buffered_writer(AUDIT_WRITER)
+    if writer is not None:
+        writer.submit(row)  # a full queue drops the entry (counted in metrics)
+        return
+    write_audit_rows([row])
+
+
+def start_audit_writer() -> BufferedWriter | None:
+    """
+    Start the buffered audit writer (call from lifespan after init_db). None in
+    sync mode or on in-memory SQLite, whose tables another thread cannot see.
+    """
+    db = getattr(database_proxy, "obj", None)
+    if AUDIT_LOG_MODE == "sync" or db is None or (isinstance(db, SqliteDatabase) and not is_file_sqlite(db)):
+        return None
+    return start_buffered_writer(
+        AUDIT_WRITER,
+        write_audit_rows,
+        batch_size=AUDIT_LOG_BATCH_SIZE,
+        flush_seconds=AUDIT_LOG_FLUSH_SECONDS,
+        max_queue=AUDIT_LOG_MAX_QUEUE,
     )
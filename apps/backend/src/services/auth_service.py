@@ -6,14 +6,16 @@ from typing import Any
 from authentication import (
     InvalidCredentialsError,
     AccountLockedError,
-    hash_password,
-    verify_password,
+    needs_rehash,
     validate_password_complexity,
     create_token,
     validate_token,
     LockoutTracker,
     validate_email_format,
 )
+from core.auth_state import get_auth_state
+from core.password_hasher import PasswordHasherBusyError, get_password_hasher
+from core.principal import invalidate_principal, principal_claims, resolve_principal
 from database.models import User, PasswordReset, LoginAttempt
 
 try:
@@ -21,8 +23,8 @@ try:
 except ImportError:
     send_email = None  # type: ignore
 
-# Lockout: 5 attempts, 15 min window
-_lockout = LockoutTracker(max_attempts=5, lockout_seconds=900)
+# Lockout: 5 attempts, 15 min window; shared across workers unless AUTH_STATE_BACKEND=memory
+_lockout = LockoutTracker(max_attempts=5, lockout_seconds=900, state=get_auth_state())
 RESET_TOKEN_EXPIRE_HOURS = 24
 
 
@@ -36,19 +38,35 @@ class UserAuthenticationService:
     def __init__(self) -> None:
         pass
 
-    def register(self, email: str, password: str, name: str | None = None) -> dict[str, Any]:
-        """Register user: validate email and password, create user, send confirmation email."""
+    def check_registration(self, email: str, password: str) -> str:
+        """Validate email format and password complexity (no database); returns the normalized email."""
         ok, msg = validate_email_format(email)
         if not ok:
             raise ValueError(msg)
-        email = email.strip().lower()
         ok, msg = validate_password_complexity(password)
         if not ok:
             raise ValueError(msg)
+        return email.strip().lower()
+
+    def register(
+        self,
+        email: str,
+        password: str,
+        name: str | None = None,
+        *,
+        password_hash: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Register user: validate email and password, create user, send confirmation email.
+        Routes hash on the event loop and pass password_hash; otherwise it is hashed here.
+        """
+        email = self.check_registration(email, password)
         if User.select().where(User.email == email).exists():
             raise ValueError("This email is already registered.")
-        password_hash = hash_password(password)
+        if password_hash is None:
+            password_hash = get_password_hasher().hash(password)
         user = User.create(email=email, password_hash=password_hash, account_status="active")
+        invalidate_principal(email=email)  # a cached "no such user" for this email
         if name:
             pass  # User model has no name field; could add later
         if send_email:
@@ -61,6 +79,12 @@ class UserAuthenticationService:
 
     def login(self, email: str, password: str, ip_address: str | None = None) -> dict[str, Any]:
         """Authenticate user; record attempt; enforce lockout; return JWT and user."""
+        user = self.start_login(email, ip_address)
+        verified = get_password_hasher().verify(password, user.password_hash)
+        return self.finish_login(user, password, verified, ip_address)
+
+    def start_login(self, email: str, ip_address: str | None = None) -> User:
+        """First half of login(): lockout check and user lookup, before the password check."""
         email = (email or "").strip().lower()
         if _lockout.is_locked(email):
             raise AccountLockedError()
@@ -72,14 +96,20 @@ class UserAuthenticationService:
             raise InvalidCredentialsError()
         if user.account_status == "locked":
             raise AccountLockedError()
-        if not verify_password(password, user.password_hash):
-            _record_attempt(email, False, ip_address)
-            _lockout.record_failure(email)
+        return user
+
+    def finish_login(
+        self, user: User, password: str, verified: bool, ip_address: str | None = None
+    ) -> dict[str, Any]:
+        """Second half of login(): record the attempt for the password check result; JWT and user."""
+        if not verified:
+            _record_attempt(user.email, False, ip_address)
+            _lockout.record_failure(user.email)
             raise InvalidCredentialsError()
-        _record_attempt(email, True, ip_address)
-        _lockout.reset(email)
-        payload = {"sub": str(user.id), "email": user.email}
-        token = create_token(payload)
+        _record_attempt(user.email, True, ip_address)
+        _lockout.reset(user.email)
+        _rehash_if_needed(user, password)
+        token = create_token(_token_claims(user))
         return {"token": token, "user": _user_to_dict(user)}
 
     def logout(self, token: str | None) -> None:
@@ -107,6 +137,11 @@ class UserAuthenticationService:
 
     def reset_password(self, token: str, new_password: str) -> dict[str, Any]:
         """Validate token, check password complexity, update password, mark token used."""
+        reset = self.check_reset(token, new_password)
+        return self.complete_reset(reset, get_password_hasher().hash(new_password))
+
+    def check_reset(self, token: str, new_password: str) -> PasswordReset:
+        """First half of reset_password(): password complexity and an unused, unexpired token."""
         ok, msg = validate_password_complexity(new_password)
         if not ok:
             raise ValueError(msg)
@@ -118,8 +153,12 @@ class UserAuthenticationService:
             raise ValueError("Invalid or expired reset token.")
         if pr.expires_at < datetime.now(timezone.utc):
             raise ValueError("Reset token has expired.")
+        return pr
+
+    def complete_reset(self, pr: PasswordReset, password_hash: str) -> dict[str, Any]:
+        """Second half of reset_password(): store the new hash and mark the token used."""
         user = pr.user
-        user.password_hash = hash_password(new_password)
+        user.password_hash = password_hash
         user.save()
         pr.used_at = datetime.now(timezone.utc)
         pr.save()
@@ -137,9 +176,30 @@ class UserAuthenticationService:
             user = User.get(User.id == user_id)
         except User.DoesNotExist:
             raise InvalidCredentialsError()
-        new_token = create_token({"sub": str(user.id), "email": user.email})
+        new_token = create_token(_token_claims(user))  # roles re-read: board changes apply on refresh
         return {"token": new_token, "user": _user_to_dict(user)}
 
 
+def _rehash_if_needed(user: User, password: str) -> None:
+    """After a successful login, re-hash with the current BCRYPT_SALT_ROUNDS if the stored cost differs."""
+    if not needs_rehash(user.password_hash):
+        return
+    try:
+        new_hash = get_password_hasher().hash(password)
+    except PasswordHasherBusyError:
+        return  # under load: keep the old hash, retry on a later login
+    User.update(password_hash=new_hash, updated_at=datetime.utcnow()).where(User.id == user.id).execute()
+    user.password_hash = new_hash
+
+
+def _token_claims(user: User) -> dict[str, Any]:
+    """
+    sub/email plus roles, board_member_id and board_county, so routes authorize
+    without queries while the token is fresh (see core.principal.principal_from_claims).
+    """
+    payload = {"sub": str(user.id), "email": user.email}
+    return {**payload, **principal_claims(resolve_principal(payload))}
+
+
 def _record_attempt(email: str, success: bool, ip_address: str | None) -> None:
     LoginAttempt.create(email=email, success=success, ip_address=ip_address)
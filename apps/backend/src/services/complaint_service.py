@@ -2,8 +2,18 @@
 from uuid import UUID
 from typing import Any
 
+from peewee import ModelSelect
+
 from database.models import Complaint, User, COMPLAINT_CATEGORIES, COMPLAINT_STATUSES
-from utils.responses import error_response, success_response
+from database.pagination import (
+    InvalidCursor,
+    clamp_limit,
+    encode_cursor,
+    estimate_count,
+    paginate,
+)
+from database.routing import read_only
+from utils.responses import error_response, paginated_response, success_response
 
 
 # Simple department routing by category (configurable / extendable)
@@ -84,40 +94,94 @@ class ComplaintService:
             return error_response("Complaint not found", data={"code": "not_found"})
         return success_response(data=_complaint_to_dict(complaint))
 
-    def list_citizen_complaints(self, user_id: str) -> dict[str, Any]:
-        """List complaints submitted by this user."""
+    def list_citizen_complaints(
+        self,
+        user_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> dict[str, Any]:
+        """List complaints submitted by this user (newest first, one keyset page)."""
         try:
             uid = UUID(user_id)
         except (ValueError, TypeError):
             return error_response("Invalid user", data={"code": "invalid_user"})
-        complaints = (
-            Complaint.select()
-            .where(Complaint.submitted_by_id == uid)
-            .order_by(Complaint.created_at.desc())
+        try:
+            page = paginate(
+                Complaint.select().where(Complaint.submitted_by_id == uid),
+                limit,
+                cursor,
+                include_total=include_total,
+            )
+        except InvalidCursor:
+            return error_response("Invalid cursor", data={"code": "invalid_cursor"})
+        return paginated_response(
+            [_complaint_to_dict(c) for c in page.items],
+            page.next_cursor,
+            page.limit,
+            page.total,
         )
-        return success_response(data=[_complaint_to_dict(c) for c in complaints])
 
+    @read_only
     def list_admin_complaints(
         self,
         status: str | None = None,
         category: str | None = None,
         limit: int = 100,
+        cursor: str | None = None,
+        include_total: bool = True,
         offset: int = 0,
     ) -> dict[str, Any]:
-        """List all complaints for admin dashboard with optional filters."""
-        q = Complaint.select().order_by(Complaint.created_at.desc())
+        """
+        List all complaints for admin dashboard with optional filters, newest first.
+        Keyset-paginated: pass next_cursor back for the following page. total is
+        the planner's estimate on Postgres (exact on SQLite) when include_total.
+        offset is deprecated (it rescans every skipped row); it is honoured only
+        without a cursor, and the response still carries a next_cursor to switch to.
+        """
+        q = Complaint.select()
         if status:
             q = q.where(Complaint.status == status)
         if category:
             q = q.where(Complaint.category == category)
-        total = q.count()
-        complaints = list(q.offset(offset).limit(limit))
+        if offset and not cursor:
+            return self._list_admin_complaints_by_offset(
+                q, limit, offset, include_total
+            )
+        try:
+            page = paginate(q, limit, cursor, include_total=include_total)
+        except InvalidCursor:
+            return error_response("Invalid cursor", data={"code": "invalid_cursor"})
+        return success_response(
+            data={
+                "items": [_complaint_to_dict(c) for c in page.items],
+                "total": page.total,
+                "limit": page.limit,
+                "next_cursor": page.next_cursor,
+            }
+        )
+
+    def _list_admin_complaints_by_offset(
+        self, q: ModelSelect, limit: int, offset: int, include_total: bool
+    ) -> dict[str, Any]:
+        """Deprecated offset/limit page of q, in paginate()'s (created_at, id) order."""
+        limit = clamp_limit(limit)
+        rows = list(
+            q.order_by(Complaint.created_at.desc(), Complaint.id.desc())
+            .offset(max(0, offset))
+            .limit(limit + 1)
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
         return success_response(
             data={
-                "items": [_complaint_to_dict(c) for c in complaints],
-                "total": total,
+                "items": [_complaint_to_dict(c) for c in rows],
+                "total": estimate_count(q) if include_total else None,
                 "limit": limit,
                 "offset": offset,
+                "next_cursor": next_cursor,
             }
         )
 
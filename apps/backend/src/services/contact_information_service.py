@@ -4,6 +4,7 @@ from typing import Any
 from uuid import UUID
 
 from database.models import Application, ContactInformation, User
+from database.sqlite_profile import serialized_write
 from utils.responses import error_response, success_response
 
 # Email: basic format
@@ -147,6 +148,7 @@ class ContactInformationService:
             },
         )
 
+    @serialized_write
     def put_contact(
         self, application_id: str, user_id: str, payload: dict[str, Any]
     ) -> dict[str, Any]:
@@ -1,18 +1,30 @@
 """Document management service: upload, list, download, delete with ownership verification."""
-import uuid
+import tempfile
 from io import BytesIO
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, Callable, Iterable
 from uuid import UUID
 
+from peewee import IntegrityError
+
+from config import DIRECT_UPLOAD_EXPIRY_SECONDS, UPLOAD_SIGNING_KEY
+from core.upload import MAX_UPLOAD_BYTES, UPLOAD_CHUNK_BYTES, validate_upload
+from database.ids import new_id
 from database.models import Application, Document, DocumentThumbnail
 from documents.categories import (
     DOCUMENT_CATEGORY_SITE_PHOTOS,
     DOCUMENT_CATEGORY_SITE_PLAN,
     normalize_category,
+    validate_category,
 )
-from documents.validation import validate_document_upload_and_scan
+from storage.interfaces.base import FileStream, RangeNotSatisfiableError
+from storage.scanning import start_scan
+from storage.signing import InvalidTokenError, sign_token, verify_token
+from storage.streaming import ChunkReader, UploadRejectedError, UploadStream, UploadTooLargeError, iter_file_chunks
 from utils.responses import error_response, success_response
 
+THUMBNAIL_TYPES = ("image/jpeg", "image/png")
+SHA256_HEX_LENGTH = 64
+
 
 class DocumentManagementService:
     """Document upload, retrieval, download, delete. Constructor injection for storage and scanner."""
@@ -21,9 +33,11 @@ class DocumentManagementService:
         self,
         storage=None,
         malware_scanner=None,
+        signing_key: str | None = None,
     ) -> None:
         self.storage = storage
         self.malware_scanner = malware_scanner
+        self._signing_key = (signing_key or UPLOAD_SIGNING_KEY).encode("utf-8")
 
     def _get_app_or_error(self, application_id: str, user_id: str) -> tuple[Application | None, dict | None]:
         """Return (app, None) if found and owned, else (None, error_response)."""
@@ -43,10 +57,33 @@ class DocumentManagementService:
         ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else "bin"
         return f"documents/{application_id}/{document_id}.{ext}"
 
+    def _build_staging_key(self, document_id: str) -> str:
+        """Key a direct-upload grant writes to; only verified bytes are moved to the document's key."""
+        return f"uploads/pending/{document_id}"
+
     def _build_thumbnail_key(self, application_id: str, document_id: str) -> str:
         """Build storage key for thumbnail."""
         return f"documents/{application_id}/{document_id}/thumb.png"
 
+    def _get_upload_target(self, application_id: str, user_id: str) -> tuple[Application | None, dict | None]:
+        """Return (app, None) if documents may be uploaded to it, else (None, error_response)."""
+        app, err = self._get_app_or_error(application_id, user_id)
+        if err is not None:
+            return None, err
+        if app.status != "draft":
+            return None, error_response(
+                "Documents cannot be modified after application submission",
+                data={"code": "not_draft"},
+            )
+        if not self.storage:
+            return None, error_response("Storage not configured", data={"code": "storage_error"})
+        return app, None
+
+    def check_upload_target(self, application_id: str, user_id: str) -> dict[str, Any]:
+        """Ownership/draft/storage checks an upload route runs before reading the request body."""
+        _, err = self._get_upload_target(application_id, user_id)
+        return err if err is not None else success_response()
+
     def upload_document(
         self,
         application_id: str,
@@ -60,71 +97,134 @@ class DocumentManagementService:
         """
         Upload document: validate, scan, store, create DB record. Optionally generate thumbnail for images.
         """
-        app, err = self._get_app_or_error(application_id, user_id)
-        if err is not None:
-            return err
-        if app.status != "draft":
-            return error_response(
-                "Documents cannot be modified after application submission",
-                data={"code": "not_draft"},
-            )
-        if not self.storage:
-            return error_response("Storage not configured", data={"code": "storage_error"})
-
-        size = 0
         if hasattr(file_obj, "seek"):
             file_obj.seek(0)
-        data = file_obj.read()
-        size = len(data)
-
-        ok, msg = validate_document_upload_and_scan(
+        return self.upload_document_stream(
+            application_id,
+            user_id,
+            chunks=iter_file_chunks(file_obj, UPLOAD_CHUNK_BYTES),
             filename=filename,
             content_type=content_type,
-            size=size,
             category=category,
-            file_obj=BytesIO(data),
-            scanner=self.malware_scanner,
         )
+
+    def upload_document_stream(
+        self,
+        application_id: str,
+        user_id: str,
+        *,
+        chunks: Iterable[bytes],
+        filename: str,
+        content_type: str,
+        category: str | Callable[[], str | None],
+    ) -> dict[str, Any]:
+        """
+        Upload a document from an iterable of chunks in one pass: size limit, sha256,
+        content sniffing and malware scan run per chunk while it is written to storage.
+        category may be a getter, resolved once the chunks are exhausted (multipart
+        fields can follow the file). Rejected uploads leave nothing in storage.
+        """
+        app, err = self._get_upload_target(application_id, user_id)
+        if err is not None:
+            return err
+        ok, msg = validate_upload(filename=filename, content_type=content_type, size=0)
+        if ok and isinstance(category, str):
+            ok, msg = validate_category(category)
         if not ok:
             return error_response(msg, data={"code": "validation_error"})
 
-        category_normalized = normalize_category(category) or category
-        doc_id = uuid.uuid4()
-        storage_key = self._build_storage_key(application_id, str(doc_id), filename)
+        resolved: dict[str, str] = {}
+
+        def resolve_category() -> None:
+            value = (category() if callable(category) else category) or ""
+            ok, msg = validate_category(value)
+            if not ok:
+                raise UploadRejectedError(msg)
+            resolved["category"] = normalize_category(value) or value
 
+        doc_id = new_id()  # same generator as Document.id (DATABASE_UUID_VERSION)
+        storage_key = self._build_storage_key(application_id, str(doc_id), filename)
+        # Images are also spooled (memory up to one chunk, then disk) for the thumbnail.
+        thumb_source = (
+            tempfile.SpooledTemporaryFile(max_size=UPLOAD_CHUNK_BYTES) if content_type in THUMBNAIL_TYPES else None
+        )
+        stream = UploadStream(
+            chunks,
+            max_bytes=MAX_UPLOAD_BYTES,
+            declared_type=content_type,
+            scan=start_scan(self.malware_scanner, filename),
+            tee=thumb_source,
+            on_end=resolve_category,
+        )
         try:
-            meta = self.storage.upload(
-                BytesIO(data),
-                key=storage_key,
+            try:
+                meta = self._store_stream(stream, storage_key, content_type, filename)
+            except UploadRejectedError as e:
+                return error_response(str(e), data={"code": e.code})
+            except Exception as e:
+                return error_response(f"Upload failed: {e}", data={"code": "upload_error"})
+            finally:
+                stream.close()
+
+            size = meta.size if hasattr(meta, "size") else stream.size
+            return self._save_document(
+                app,
+                doc_id,
+                storage_key=storage_key,
+                filename=filename,
                 content_type=content_type,
-                original_filename=filename,
+                size=size,
+                sha256=stream.sha256,
+                category=resolved["category"],
+                user_id=user_id,
+                thumb_source=thumb_source,
             )
-        except Exception as e:
-            return error_response(f"Upload failed: {e}", data={"code": "upload_error"})
+        finally:
+            if thumb_source is not None:
+                thumb_source.close()
 
+    def _save_document(
+        self,
+        app: Application,
+        doc_id: UUID,
+        *,
+        storage_key: str,
+        filename: str,
+        content_type: str,
+        size: int,
+        sha256: str,
+        category: str,
+        user_id: str,
+        thumb_source: BinaryIO | None,
+    ) -> dict[str, Any]:
+        """Create the Document row for a stored, verified file (and its thumbnail); the upload response."""
         try:
-            user_uuid = UUID(user_id)
             doc = Document.create(
                 id=doc_id,
                 application_id=app.id,
                 file_name=filename,
                 file_path=storage_key,
-                file_size=meta.size if hasattr(meta, "size") else size,
+                file_size=size,
                 file_type=content_type,
-                category=category_normalized,
-                uploader_user=user_uuid,
+                category=category,
+                uploader_user=UUID(user_id),
             )
+        except IntegrityError as e:
+            # An overlapping complete for the same ticket saved this id first; its
+            # row references the file, so answer with that document and keep the file.
+            existing = Document.get_or_none((Document.id == doc_id) & (Document.application_id == app.id))
+            if existing is not None:
+                return self._existing_document_response(existing, sha256)
+            self._discard(storage_key)
+            return error_response(f"Failed to save document record: {e}", data={"code": "db_error"})
         except Exception as e:
-            try:
-                self.storage.delete(storage_key)
-            except Exception:
-                pass
+            self._discard(storage_key)
             return error_response(f"Failed to save document record: {e}", data={"code": "db_error"})
 
         thumb_url: str | None = None
-        if content_type in ("image/jpeg", "image/png"):
+        if thumb_source is not None:
             thumb_key, thumb_size = self._generate_and_store_thumbnail(
-                application_id, str(doc_id), BytesIO(data), content_type
+                str(app.id), str(doc_id), thumb_source, content_type
             )
             if thumb_key:
                 DocumentThumbnail.create(
@@ -134,18 +234,206 @@ class DocumentManagementService:
                 )
                 thumb_url = self.storage.get_url(thumb_key) if self.storage else None
 
+        return self._document_response(doc, sha256, thumb_url)
+
+    def _document_response(self, doc: Document, sha256: str | None, thumb_url: str | None) -> dict[str, Any]:
         upload_date = doc.upload_date.isoformat() + "Z" if hasattr(doc.upload_date, "isoformat") else str(doc.upload_date)
         return success_response(
             data={
                 "documentId": str(doc.id),
-                "fileName": filename,
-                "fileSize": meta.size if hasattr(meta, "size") else size,
+                "fileName": doc.file_name,
+                "fileSize": doc.file_size,
+                "sha256": sha256,
                 "uploadDate": upload_date,
                 "thumbnailUrl": thumb_url,
             },
             message="Document uploaded",
         )
 
+    def _existing_document_response(self, doc: Document, sha256: str | None) -> dict[str, Any]:
+        """Upload response for a document an earlier (or overlapping) complete already saved."""
+        thumb_path, _ = self._thumbnail_path(doc)
+        thumb_url = self.storage.get_url(thumb_path) if thumb_path else None
+        return self._document_response(doc, sha256, thumb_url)
+
+    def _store_stream(self, stream: UploadStream, key: str, content_type: str, filename: str) -> Any:
+        """Write stream via the backend's upload_stream (upload() over a reader for backends without it)."""
+        upload_stream = getattr(self.storage, "upload_stream", None)
+        if upload_stream is not None:
+            return upload_stream(stream, key=key, content_type=content_type, original_filename=filename)
+        return self.storage.upload(ChunkReader(stream), key=key, content_type=content_type, original_filename=filename)
+
+    def start_direct_upload(
+        self,
+        application_id: str,
+        user_id: str,
+        *,
+        filename: str,
+        content_type: str,
+        size: int,
+        category: str,
+        sha256: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        First phase of a direct upload: validate the declared file, allocate the
+        document id and storage key, and return a presigned upload (the client sends
+        the bytes straight to storage) plus a signed ticket for complete_direct_upload.
+        Nothing is written to the database until the upload is completed.
+        """
+        app, err = self._get_upload_target(application_id, user_id)
+        if err is not None:
+            return err
+        if size > MAX_UPLOAD_BYTES:
+            too_large = UploadTooLargeError(MAX_UPLOAD_BYTES)
+            return error_response(str(too_large), data={"code": too_large.code})
+        ok, msg = validate_upload(filename=filename, content_type=content_type, size=size)
+        if ok:
+            ok, msg = validate_category(category)
+        if ok and size <= 0:
+            ok, msg = False, "File is empty"
+        if ok and sha256 is not None and (
+            len(sha256) != SHA256_HEX_LENGTH or any(c not in "0123456789abcdef" for c in sha256.lower())
+        ):
+            ok, msg = False, "sha256 must be a hex SHA-256 digest"
+        if not ok:
+            return error_response(msg, data={"code": "validation_error"})
+
+        doc_id = new_id()
+        storage_key = self._build_storage_key(str(app.id), str(doc_id), filename)
+        staging_key = self._build_staging_key(str(doc_id))
+        content_type = content_type.strip().lower()
+        try:
+            grant = self.storage.presign_upload(
+                staging_key, content_type=content_type, max_bytes=size, expires_in=DIRECT_UPLOAD_EXPIRY_SECONDS
+            )
+        except (NotImplementedError, AttributeError):
+            return error_response(
+                "Direct uploads are not available; upload through the API instead",
+                data={"code": "direct_upload_unsupported"},
+            )
+        except Exception as e:
+            return error_response(f"Upload failed: {e}", data={"code": "upload_error"})
+        ticket = sign_token(
+            {
+                "document_id": str(doc_id),
+                "application_id": str(app.id),
+                "user_id": str(UUID(user_id)),
+                "staging_key": staging_key,
+                "storage_key": storage_key,
+                "file_name": filename,
+                "content_type": content_type,
+                "size": size,
+                "category": normalize_category(category) or category,
+                "sha256": sha256.lower() if sha256 else None,
+            },
+            self._signing_key,
+            DIRECT_UPLOAD_EXPIRY_SECONDS,
+        )
+        return success_response(
+            data={
+                "documentId": str(doc_id),
+                "uploadToken": ticket,
+                "upload": {
+                    "method": grant.method,
+                    "url": grant.url,
+                    "fields": grant.fields,
+                    "headers": grant.headers,
+                    "expiresAt": grant.expires_at.isoformat() if grant.expires_at else None,
+                },
+            },
+            message="Upload the file, then complete the upload",
+        )
+
+    def complete_direct_upload(
+        self, application_id: str, user_id: str, document_id: str, *, upload_token: str
+    ) -> dict[str, Any]:
+        """
+        Second phase: move the uploaded object from the staging key (the only key the
+        grant can write) to the document's key, read it back once (streamed, bounded
+        memory) to check its size, content type and sha256 against the ticket and scan
+        it, then create the Document. Verifying after the move means a re-upload with
+        the same grant can only replace the staging object, never the verified file.
+        A rejected object is deleted. Completing an already completed upload returns
+        the same document, including when two completes for the same ticket overlap.
+        """
+        app, err = self._get_upload_target(application_id, user_id)
+        if err is not None:
+            return err
+        try:
+            ticket = verify_token(upload_token, self._signing_key)
+            owner = (UUID(ticket["application_id"]), UUID(ticket["user_id"]), UUID(ticket["document_id"]))
+            if owner != (app.id, UUID(user_id), UUID(document_id)):
+                raise InvalidTokenError("Upload token does not match this document")
+            staging_key, storage_key = ticket["staging_key"], ticket["storage_key"]
+        except InvalidTokenError as e:
+            return error_response(str(e), data={"code": e.code})
+        except (KeyError, ValueError, TypeError):
+            return error_response("Invalid upload token", data={"code": InvalidTokenError.code})
+        doc_id = UUID(document_id)
+        existing = Document.get_or_none((Document.id == doc_id) & (Document.application_id == app.id))
+        if existing is not None:
+            return self._existing_document_response(existing, ticket.get("sha256"))
+
+        content_type = ticket["content_type"]
+        filename = ticket["file_name"]
+        try:
+            self.storage.move(staging_key, storage_key)
+        except FileNotFoundError:
+            pass  # moved by an earlier attempt that failed before saving; verified again below
+        except Exception as e:
+            return error_response(f"Upload failed: {e}", data={"code": "upload_error"})
+        stored, err = self._open(storage_key, None, "Uploaded file not found; upload it before completing")
+        if err is not None:
+            return err
+        thumb_source = (
+            tempfile.SpooledTemporaryFile(max_size=UPLOAD_CHUNK_BYTES) if content_type in THUMBNAIL_TYPES else None
+        )
+        stream = UploadStream(
+            stored,
+            max_bytes=MAX_UPLOAD_BYTES,
+            declared_type=content_type,
+            scan=start_scan(self.malware_scanner, filename),
+            tee=thumb_source,
+        )
+        try:
+            try:
+                for _ in stream:
+                    pass
+                if stream.size != ticket["size"]:
+                    raise UploadRejectedError(f"Uploaded file is {stream.size} bytes, expected {ticket['size']}")
+                if ticket.get("sha256") and stream.sha256 != ticket["sha256"]:
+                    raise UploadRejectedError("Uploaded file does not match its sha256 checksum")
+            except UploadRejectedError as e:
+                self._discard(storage_key)
+                return error_response(str(e), data={"code": e.code})
+            except Exception as e:
+                return error_response(f"Upload verification failed: {e}", data={"code": "upload_error"})
+            finally:
+                stream.close()
+                stored.close()
+            return self._save_document(
+                app,
+                doc_id,
+                storage_key=storage_key,
+                filename=filename,
+                content_type=content_type,
+                size=stream.size,
+                sha256=stream.sha256,
+                category=ticket["category"],
+                user_id=user_id,
+                thumb_source=thumb_source,
+            )
+        finally:
+            if thumb_source is not None:
+                thumb_source.close()
+
+    def _discard(self, key: str) -> None:
+        """Delete a stored object that will not be referenced by a Document (best effort)."""
+        try:
+            self.storage.delete(key)
+        except Exception:
+            pass
+
     def _get_app_by_id(self, application_id: str) -> tuple[Application | None, dict | None]:
         """Return (app, None) if found, else (None, error_response). No ownership check."""
         try:
@@ -180,8 +468,15 @@ class DocumentManagementService:
             "sitePhotos": [],
             "supportingDocuments": [],
         }
+        # One query for all thumbnails instead of an exists() per document.
+        thumbnailed = {
+            row.document_id
+            for row in DocumentThumbnail.select(DocumentThumbnail.document)
+            .join(Document)
+            .where(Document.application_id == app.id)
+        }
         for doc in docs:
-            has_thumb = DocumentThumbnail.select().where(DocumentThumbnail.document_id == doc.id).exists()
+            has_thumb = doc.id in thumbnailed
             upload_date = doc.upload_date.isoformat() + "Z" if hasattr(doc.upload_date, "isoformat") else str(doc.upload_date)
             item = {
                 "documentId": str(doc.id),
@@ -198,85 +493,145 @@ class DocumentManagementService:
                 grouped["supportingDocuments"].append(item)
         return success_response(data={"documents": grouped})
 
-    def download_document_for_application(
-        self, application_id: str, document_id: str
-    ) -> tuple[bytes | None, str | None, str | None, dict | None]:
-        """Download document (no ownership check). For board members after county access verified."""
-        app, err = self._get_app_by_id(application_id)
-        if err is not None:
-            return None, None, None, err
+    def _find_document(self, app: Application, document_id: str) -> tuple[Document | None, dict | None]:
+        """Return (document, None) if document_id belongs to app, else (None, error_response)."""
         try:
             doc_id = UUID(document_id)
         except (ValueError, TypeError):
-            return None, None, None, error_response("Invalid document id", data={"code": "invalid_id"})
+            return None, error_response("Invalid document id", data={"code": "invalid_id"})
         try:
-            doc = Document.get((Document.id == doc_id) & (Document.application_id == app.id))
+            return Document.get((Document.id == doc_id) & (Document.application_id == app.id)), None
         except Document.DoesNotExist:
-            return None, None, None, error_response("Document not found", data={"code": "not_found"})
-        if not self.storage:
-            return None, None, None, error_response("Storage not configured", data={"code": "storage_error"})
-        try:
-            content = self.storage.download(doc.file_path)
-            return content, doc.file_name, doc.file_type, None
-        except FileNotFoundError:
-            return None, None, None, error_response("File not found", data={"code": "not_found"})
-        except Exception as e:
-            return None, None, None, error_response(f"Download failed: {e}", data={"code": "download_error"})
+            return None, error_response("Document not found", data={"code": "not_found"})
 
-    def download_thumbnail(
-        self, application_id: str, document_id: str, user_id: str
-    ) -> tuple[bytes | None, dict | None]:
-        """Download thumbnail for document. Returns (content, error_response)."""
+    def _owned_document(self, application_id: str, document_id: str, user_id: str) -> tuple[Document | None, dict | None]:
         app, err = self._get_app_or_error(application_id, user_id)
         if err is not None:
             return None, err
-        try:
-            doc_id = UUID(document_id)
-        except (ValueError, TypeError):
-            return None, error_response("Invalid document id", data={"code": "invalid_id"})
-        try:
-            doc = Document.get((Document.id == doc_id) & (Document.application_id == app.id))
-        except Document.DoesNotExist:
-            return None, error_response("Document not found", data={"code": "not_found"})
+        return self._find_document(app, document_id)
+
+    def _application_document(self, application_id: str, document_id: str) -> tuple[Document | None, dict | None]:
+        app, err = self._get_app_by_id(application_id)
+        if err is not None:
+            return None, err
+        return self._find_document(app, document_id)
+
+    def _thumbnail_path(self, doc: Document) -> tuple[str | None, dict | None]:
         thumb = DocumentThumbnail.select().where(DocumentThumbnail.document_id == doc.id).first()
         if not thumb:
             return None, error_response("Thumbnail not found", data={"code": "not_found"})
+        return thumb.thumbnail_path, None
+
+    def _read(self, key: str, not_found: str = "File not found") -> tuple[bytes | None, dict | None]:
+        if not self.storage:
+            return None, error_response("Storage not configured", data={"code": "storage_error"})
+        try:
+            return self.storage.download(key), None
+        except FileNotFoundError:
+            return None, error_response(not_found, data={"code": "not_found"})
+        except Exception as e:
+            return None, error_response(f"Download failed: {e}", data={"code": "download_error"})
+
+    def _open(
+        self, key: str, byte_range: tuple[int | None, int | None] | None, not_found: str = "File not found"
+    ) -> tuple[FileStream | None, dict | None]:
+        """Open key (optionally a byte range) as a FileStream without reading it into memory."""
         if not self.storage:
             return None, error_response("Storage not configured", data={"code": "storage_error"})
+        start, end = byte_range or (None, None)
         try:
-            content = self.storage.download(thumb.thumbnail_path)
-            return content, None
+            open_stream = getattr(self.storage, "open_stream", None)
+            if open_stream is None:
+                return FileStream.from_bytes(key, self.storage.download(key), start=start, end=end), None
+            return open_stream(key, start, end), None
         except FileNotFoundError:
-            return None, error_response("Thumbnail file not found", data={"code": "not_found"})
+            return None, error_response(not_found, data={"code": "not_found"})
+        except RangeNotSatisfiableError as e:
+            return None, error_response(
+                "Requested range not satisfiable", data={"code": "range_not_satisfiable", "size": e.total_size}
+            )
         except Exception as e:
             return None, error_response(f"Download failed: {e}", data={"code": "download_error"})
 
+    def download_document_for_application(
+        self, application_id: str, document_id: str
+    ) -> tuple[bytes | None, str | None, str | None, dict | None]:
+        """Download document (no ownership check). For board members after county access verified."""
+        doc, err = self._application_document(application_id, document_id)
+        if err is not None:
+            return None, None, None, err
+        content, err = self._read(doc.file_path)
+        if err is not None:
+            return None, None, None, err
+        return content, doc.file_name, doc.file_type, None
+
+    def open_document_for_application(
+        self, application_id: str, document_id: str, byte_range: tuple[int | None, int | None] | None = None
+    ) -> tuple[FileStream | None, str | None, str | None, dict | None]:
+        """Streaming download_document_for_application: (stream, filename, content_type, error_response)."""
+        doc, err = self._application_document(application_id, document_id)
+        if err is not None:
+            return None, None, None, err
+        stream, err = self._open(doc.file_path, byte_range)
+        if err is not None:
+            return None, None, None, err
+        return stream, doc.file_name, doc.file_type, None
+
+    def download_thumbnail(
+        self, application_id: str, document_id: str, user_id: str
+    ) -> tuple[bytes | None, dict | None]:
+        """Download thumbnail for document. Returns (content, error_response)."""
+        doc, err = self._owned_document(application_id, document_id, user_id)
+        if err is not None:
+            return None, err
+        path, err = self._thumbnail_path(doc)
+        if err is not None:
+            return None, err
+        return self._read(path, "Thumbnail file not found")
+
+    def open_thumbnail(
+        self, application_id: str, document_id: str, user_id: str, byte_range: tuple[int | None, int | None] | None = None
+    ) -> tuple[FileStream | None, str | None, str | None, dict | None]:
+        """Streaming download_thumbnail: (stream, None, "image/png", error_response)."""
+        doc, err = self._owned_document(application_id, document_id, user_id)
+        if err is not None:
+            return None, None, None, err
+        path, err = self._thumbnail_path(doc)
+        if err is not None:
+            return None, None, None, err
+        stream, err = self._open(path, byte_range, "Thumbnail file not found")
+        if err is not None:
+            return None, None, None, err
+        return stream, None, "image/png", None
+
     def download_document(
         self, application_id: str, document_id: str, user_id: str
     ) -> tuple[bytes | None, str | None, str | None, dict | None]:
         """
         Download document file. Returns (content, filename, content_type, error_response).
         """
-        app, err = self._get_app_or_error(application_id, user_id)
+        doc, err = self._owned_document(application_id, document_id, user_id)
         if err is not None:
             return None, None, None, err
-        try:
-            doc_id = UUID(document_id)
-        except (ValueError, TypeError):
-            return None, None, None, error_response("Invalid document id", data={"code": "invalid_id"})
-        try:
-            doc = Document.get((Document.id == doc_id) & (Document.application_id == app.id))
-        except Document.DoesNotExist:
-            return None, None, None, error_response("Document not found", data={"code": "not_found"})
-        if not self.storage:
-            return None, None, None, error_response("Storage not configured", data={"code": "storage_error"})
-        try:
-            content = self.storage.download(doc.file_path)
-            return content, doc.file_name, doc.file_type, None
-        except FileNotFoundError:
-            return None, None, None, error_response("File not found", data={"code": "not_found"})
-        except Exception as e:
-            return None, None, None, error_response(f"Download failed: {e}", data={"code": "download_error"})
+        content, err = self._read(doc.file_path)
+        if err is not None:
+            return None, None, None, err
+        return content, doc.file_name, doc.file_type, None
+
+    def open_document(
+        self, application_id: str, document_id: str, user_id: str, byte_range: tuple[int | None, int | None] | None = None
+    ) -> tuple[FileStream | None, str | None, str | None, dict | None]:
+        """
+        Streaming download_document: (stream, filename, content_type, error_response).
+        byte_range is (start, end) / (start, None) / (None, suffix_length) as in an HTTP Range.
+        """
+        doc, err = self._owned_document(application_id, document_id, user_id)
+        if err is not None:
+            return None, None, None, err
+        stream, err = self._open(doc.file_path, byte_range)
+        if err is not None:
+            return None, None, None, err
+        return stream, doc.file_name, doc.file_type, None
 
     def delete_document(self, application_id: str, document_id: str, user_id: str) -> dict[str, Any]:
         """Delete document. Blocked after application submission."""
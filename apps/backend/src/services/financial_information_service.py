@@ -1,9 +1,9 @@
 """Financial information section: validation, calculations, get/put, section completion."""
-import json
 from typing import Any
 from uuid import UUID
 
 from database.models import Application, BudgetCategory, FinancialInformation, User
+from database.sqlite_profile import serialized_write
 from utils.responses import error_response, success_response
 
 CURRENCY_DECIMALS = 2
@@ -179,16 +179,10 @@ def _financial_to_dict(f: FinancialInformation) -> dict[str, Any]:
         "matching_funds": [],
         "line_item_budget": [],
     }
-    if f.matching_funds:
-        try:
-            data["matching_funds"] = json.loads(f.matching_funds)
-        except (TypeError, ValueError):
-            pass
-    if f.line_item_budget:
-        try:
-            data["line_item_budget"] = json.loads(f.line_item_budget)
-        except (TypeError, ValueError):
-            pass
+    if isinstance(f.matching_funds, list):
+        data["matching_funds"] = f.matching_funds
+    if isinstance(f.line_item_budget, list):
+        data["line_item_budget"] = f.line_item_budget
     matching_total = _sum_matching_funds(data["matching_funds"])
     if f.total_project_cost and f.total_project_cost > 0:
         data["cost_match_percentage"] = compute_cost_match_percentage(f.total_project_cost, matching_total)
@@ -242,6 +236,7 @@ class FinancialInformationService:
             },
         )
 
+    @serialized_write
     def put_financial(
         self, application_id: str, user_id: str, payload: dict[str, Any]
     ) -> dict[str, Any]:
@@ -279,15 +274,15 @@ class FinancialInformationService:
             defaults={
                 "total_project_cost": total_cost,
                 "grant_amount_requested": grant,
-                "matching_funds": json.dumps(matching_list) if matching_list else None,
-                "line_item_budget": json.dumps(line_list) if line_list else None,
+                "matching_funds": matching_list or None,
+                "line_item_budget": line_list or None,
             },
         )
         if not created:
             fin.total_project_cost = total_cost
             fin.grant_amount_requested = grant
-            fin.matching_funds = json.dumps(matching_list) if matching_list else None
-            fin.line_item_budget = json.dumps(line_list) if line_list else None
+            fin.matching_funds = matching_list or None
+            fin.line_item_budget = line_list or None
             fin.save()
 
         out_data = _financial_to_dict(fin)
@@ -5,14 +5,12 @@ from uuid import UUID
 
 from database.models import (
     Application,
-    ContactInformation,
     ForestryBoard,
     ForestryBoardApproval,
-    ProjectInformation,
-    FinancialInformation,
     RevisionRequest,
 )
-from forestry_board.county_filter import get_application_county
+from database.pagination import InvalidCursor
+from database.routing import read_only
 from forestry_board.email_templates import (
     BOARD_REVIEW_REQUEST_SUBJECT,
     BOARD_REVIEW_REQUEST_BODY,
@@ -23,6 +21,7 @@ from forestry_board.email_templates import (
 )
 from forestry_board.signature import validate_signature
 from forestry_board.states import ApprovalStatus
+from services.application_aggregate import ApplicationAggregate, ApplicationAggregateLoader
 from utils.responses import error_response, success_response
 
 
@@ -34,13 +33,6 @@ def _get_email_service():
         return None
 
 
-def _get_application_county_safe(app: Application) -> str | None:
-    try:
-        return get_application_county(app)
-    except Exception:
-        return None
-
-
 class ForestryBoardService:
     """County-based application filtering, approval, and revision requests."""
 
@@ -51,29 +43,20 @@ class ForestryBoardService:
             uid = UUID(user_id)
         except (ValueError, TypeError):
             return error_response("Invalid id", data={"code": "invalid_id"})
-        try:
-            app = Application.get((Application.id == aid) & (Application.user_id == uid))
-        except Application.DoesNotExist:
+        agg = ApplicationAggregateLoader(include_financial=False, include_revisions=False).get(aid, user_id=uid)
+        if agg is None:
             return error_response("Application not found", data={"code": "not_found"})
+        app, contact = agg.application, agg.contact
         if app.status != "draft":
             return error_response("Only draft applications can be marked for board review", data={"code": "not_draft"})
-        county = _get_application_county_safe(app)
+        county = agg.county
         if not county:
             return error_response("County is required in contact information", data={"code": "county_required"})
-        # Ensure contact info exists and is complete enough
-        try:
-            contact = ContactInformation.get(ContactInformation.application == app)
-        except ContactInformation.DoesNotExist:
-            return error_response("Contact information is required", data={"code": "contact_required"})
         app.ready_for_board_review_at = datetime.now(timezone.utc)
-        app.save()
-        try:
-            approval = ForestryBoardApproval.get(ForestryBoardApproval.application == app)
-            if approval.status == "revision_requested":
-                approval.status = "pending"
-                approval.save()
-        except ForestryBoardApproval.DoesNotExist:
-            pass
+        app.save(only=[Application.ready_for_board_review_at, Application.updated_at])  # keep county_key
+        if agg.approval is not None and agg.approval.status == "revision_requested":
+            agg.approval.status = "pending"
+            agg.approval.save()
         board_emails = [b.email for b in ForestryBoard.select().where(ForestryBoard.county == county)]
         board_contact_email = board_emails[0] if board_emails else None
         if board_emails:
@@ -81,7 +64,7 @@ class ForestryBoardService:
             body = BOARD_REVIEW_REQUEST_BODY.format(
                 applicant_name=contact.primary_contact_name or "Applicant",
                 organization_name=contact.organization_name or "",
-                project_name=_get_project_name(app),
+                project_name=agg.project_name,
                 county=county or "",
                 review_link="{base_url}/board/review",
             )
@@ -94,8 +77,15 @@ class ForestryBoardService:
             message="Application marked ready for board review",
         )
 
-    def list_applications_for_board_member(self, board_member_id: str) -> dict[str, Any]:
-        """List applications from board member's county in review queue."""
+    @read_only
+    def list_applications_for_board_member(
+        self,
+        board_member_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
+    ) -> dict[str, Any]:
+        """List applications in the board member's county review queue (keyset page)."""
         try:
             bmid = UUID(board_member_id)
         except (ValueError, TypeError):
@@ -104,28 +94,32 @@ class ForestryBoardService:
             board = ForestryBoard.get(ForestryBoard.id == bmid)
         except ForestryBoard.DoesNotExist:
             return error_response("Board member not found", data={"code": "not_found"})
-        county = board.county
-        apps = (
-            Application.select()
-            .where(Application.ready_for_board_review_at.is_null(False))
-            .order_by(Application.ready_for_board_review_at.desc())
-        )
+        loader = ApplicationAggregateLoader(include_financial=False, include_revisions=False)
+        try:
+            page = loader.board_queue(
+                board.county, limit=limit, cursor=cursor, include_total=include_total
+            )
+        except InvalidCursor:
+            return error_response("Invalid cursor", data={"code": "invalid_cursor"})
         out = []
-        for app in apps:
-            app_county = _get_application_county_safe(app)
-            if app_county and app_county.strip().lower() == county.strip().lower():
-                contact = _get_contact_or_none(app)
-                proj = _get_project_or_none(app)
-                out.append({
-                    "applicationId": str(app.id),
-                    "applicantName": contact.primary_contact_name if contact else "",
-                    "organizationName": contact.organization_name if contact else "",
-                    "projectName": proj.project_name if proj else "",
-                    "county": app_county,
-                    "status": _derive_approval_status(app),
-                    "submittedForReviewDate": _format_datetime(app.ready_for_board_review_at),
-                })
-        return success_response(data={"applications": out})
+        for agg in page.items:
+            contact, proj = agg.contact, agg.project
+            out.append({
+                "applicationId": str(agg.application.id),
+                "applicantName": contact.primary_contact_name if contact else "",
+                "organizationName": contact.organization_name if contact else "",
+                "projectName": proj.project_name if proj else "",
+                "county": agg.county,
+                "status": agg.approval_status,
+                "submittedForReviewDate": _format_datetime(agg.application.ready_for_board_review_at),
+            })
+        return success_response(
+            data={
+                "applications": out,
+                "nextCursor": page.next_cursor,
+                "total": page.total,
+            }
+        )
 
     def get_application_for_board_member(self, board_member_id: str, application_id: str) -> dict[str, Any]:
         """Get full application details for board review with county access check."""
@@ -138,24 +132,19 @@ class ForestryBoardService:
             board = ForestryBoard.get(ForestryBoard.id == bmid)
         except ForestryBoard.DoesNotExist:
             return error_response("Board member not found", data={"code": "not_found"})
-        try:
-            app = Application.get(Application.id == aid)
-        except Application.DoesNotExist:
-            return error_response("Application not found", data={"code": "not_found"})
-        app_county = _get_application_county_safe(app)
-        if not app_county or app_county.strip().lower() != board.county.strip().lower():
-            return error_response("Access denied: application not in your county", data={"code": "access_denied"})
+        agg, err = _load_for_board(board, aid)
+        if err is not None:
+            return err
+        app = agg.application
         if not app.ready_for_board_review_at:
             return error_response("Application not submitted for board review", data={"code": "not_ready"})
-        contact = _get_contact_or_none(app)
-        proj = _get_project_or_none(app)
-        fin = _get_financial_or_none(app)
+        contact, proj, fin = agg.contact, agg.project, agg.financial
         revision_history = [
             {
                 "requestDate": r.created_at.isoformat().replace("+00:00", "Z") if r.created_at else None,
                 "comments": r.comments,
             }
-            for r in RevisionRequest.select().where(RevisionRequest.application == app).order_by(RevisionRequest.created_at)
+            for r in agg.revisions
         ]
         sections = {}
         if contact:
@@ -193,9 +182,8 @@ class ForestryBoardService:
                 "description": proj.description,
             }
         if fin:
-            import json
-            mf = json.loads(fin.matching_funds) if fin.matching_funds else None
-            lib = json.loads(fin.line_item_budget) if fin.line_item_budget else None
+            mf = fin.matching_funds or None
+            lib = fin.line_item_budget or None
             sections["financialInformation"] = {
                 "total_project_cost": float(fin.total_project_cost) if fin.total_project_cost is not None else None,
                 "grant_amount_requested": float(fin.grant_amount_requested) if fin.grant_amount_requested is not None else None,
@@ -208,8 +196,8 @@ class ForestryBoardService:
             "organizationName": contact.organization_name if contact else "",
             "projectName": proj.project_name if proj else "",
             "projectDescription": proj.description if proj else "",
-            "county": app_county,
-            "status": _derive_approval_status(app),
+            "county": agg.county,
+            "status": agg.approval_status,
             "sections": sections,
             "revisionHistory": revision_history,
         })
@@ -232,17 +220,13 @@ class ForestryBoardService:
             board = ForestryBoard.get(ForestryBoard.id == bmid)
         except ForestryBoard.DoesNotExist:
             return error_response("Board member not found", data={"code": "not_found"})
-        try:
-            app = Application.get(Application.id == aid)
-        except Application.DoesNotExist:
-            return error_response("Application not found", data={"code": "not_found"})
-        app_county = _get_application_county_safe(app)
-        if not app_county or app_county.strip().lower() != board.county.strip().lower():
-            return error_response("Access denied: application not in your county", data={"code": "access_denied"})
-        approval, created = ForestryBoardApproval.get_or_create(
-            application=app,
+        agg, err = _load_for_board(board, aid, include_revisions=False)
+        if err is not None:
+            return err
+        approval = agg.approval or ForestryBoardApproval.get_or_create(
+            application=agg.application,
             defaults={"board_member": board, "status": "pending"},
-        )
+        )[0]
         if approval.status == "approved":
             return error_response("Application already approved; approval cannot be revoked", data={"code": "already_approved"})
         if approval.status == "revision_requested":
@@ -254,7 +238,7 @@ class ForestryBoardService:
         approval.approval_date = approval_date
         approval.status = "approved"
         approval.save()
-        contact = _get_contact_or_none(app)
+        contact = agg.contact
         applicant_email = contact.primary_contact_email if contact else None
         if applicant_email:
             svc = _get_email_service()
@@ -263,7 +247,7 @@ class ForestryBoardService:
                     to=applicant_email,
                     subject=BOARD_APPROVAL_CONFIRMATION_SUBJECT,
                     body_text=BOARD_APPROVAL_CONFIRMATION_BODY.format(
-                        project_name=_get_project_name(app),
+                        project_name=agg.project_name,
                         board_member_name=board.board_member_name,
                         approval_date=approval_date.strftime("%Y-%m-%d"),
                     ),
@@ -289,27 +273,24 @@ class ForestryBoardService:
             board = ForestryBoard.get(ForestryBoard.id == bmid)
         except ForestryBoard.DoesNotExist:
             return error_response("Board member not found", data={"code": "not_found"})
-        try:
-            app = Application.get(Application.id == aid)
-        except Application.DoesNotExist:
-            return error_response("Application not found", data={"code": "not_found"})
-        app_county = _get_application_county_safe(app)
-        if not app_county or app_county.strip().lower() != board.county.strip().lower():
-            return error_response("Access denied: application not in your county", data={"code": "access_denied"})
-        approval, _ = ForestryBoardApproval.get_or_create(
+        agg, err = _load_for_board(board, aid)
+        if err is not None:
+            return err
+        app = agg.application
+        approval = agg.approval or ForestryBoardApproval.get_or_create(
             application=app,
             defaults={"board_member": board, "status": "revision_requested"},
-        )
+        )[0]
         if approval.status == "approved":
             return error_response("Application already approved; cannot request revisions", data={"code": "already_approved"})
         comments_clean = (comments or "").strip()
         if not comments_clean:
             return error_response("Comments are required for revision request", data={"code": "comments_required"})
-        rev_num = RevisionRequest.select().where(RevisionRequest.application == app).count() + 1
+        rev_num = len(agg.revisions) + 1
         RevisionRequest.create(application=app, board_member=board, comments=comments_clean, revision_number=rev_num)
         approval.status = "revision_requested"
         approval.save()
-        contact = _get_contact_or_none(app)
+        contact = agg.contact
         applicant_email = contact.primary_contact_email if contact else None
         if applicant_email:
             svc = _get_email_service()
@@ -318,7 +299,7 @@ class ForestryBoardService:
                     to=applicant_email,
                     subject=REVISION_REQUEST_NOTIFICATION_SUBJECT,
                     body_text=REVISION_REQUEST_NOTIFICATION_BODY.format(
-                        project_name=_get_project_name(app),
+                        project_name=agg.project_name,
                         comments=comments_clean,
                     ),
                 )
@@ -331,23 +312,19 @@ class ForestryBoardService:
             uid = UUID(user_id)
         except (ValueError, TypeError):
             return error_response("Invalid id", data={"code": "invalid_id"})
-        try:
-            app = Application.get((Application.id == aid) & (Application.user_id == uid))
-        except Application.DoesNotExist:
+        agg = ApplicationAggregateLoader(include_financial=False).get(aid, user_id=uid)
+        if agg is None:
             return error_response("Application not found", data={"code": "not_found"})
-        status = _derive_approval_status(app)
-        result = {"status": status, "boardMemberName": None, "boardMemberTitle": None, "approvalDate": None, "revisionRequested": False, "revisionComments": None}
-        try:
-            approval = ForestryBoardApproval.get(ForestryBoardApproval.application == app)
+        result = {"status": agg.approval_status, "boardMemberName": None, "boardMemberTitle": None, "approvalDate": None, "revisionRequested": False, "revisionComments": None}
+        approval = agg.approval
+        if approval is not None:
             result["boardMemberName"] = approval.board_member.board_member_name
             result["boardMemberTitle"] = approval.board_member.title
             result["approvalDate"] = approval.approval_date.isoformat().replace("+00:00", "Z") if approval.approval_date else None
             result["revisionRequested"] = approval.status == "revision_requested"
             if approval.status == "revision_requested":
-                latest = RevisionRequest.select().where(RevisionRequest.application == app).order_by(RevisionRequest.created_at.desc()).first()
+                latest = agg.revisions[-1] if agg.revisions else None
                 result["revisionComments"] = latest.comments if latest else None
-        except ForestryBoardApproval.DoesNotExist:
-            pass
         return success_response(data=result)
 
 
@@ -360,35 +337,13 @@ def _format_datetime(dt) -> str | None:
     return str(dt)
 
 
-def _get_contact_or_none(app: Application) -> ContactInformation | None:
-    try:
-        return ContactInformation.get(ContactInformation.application == app)
-    except ContactInformation.DoesNotExist:
-        return None
-
-
-def _get_project_or_none(app: Application) -> ProjectInformation | None:
-    try:
-        return ProjectInformation.get(ProjectInformation.application == app)
-    except ProjectInformation.DoesNotExist:
-        return None
-
-
-def _get_financial_or_none(app: Application) -> FinancialInformation | None:
-    try:
-        return FinancialInformation.get(FinancialInformation.application == app)
-    except FinancialInformation.DoesNotExist:
-        return None
-
-
-def _get_project_name(app: Application) -> str:
-    proj = _get_project_or_none(app)
-    return proj.project_name or "Application" if proj else "Application"
-
-
-def _derive_approval_status(app: Application) -> str:
-    try:
-        approval = ForestryBoardApproval.get(ForestryBoardApproval.application == app)
-        return approval.status
-    except ForestryBoardApproval.DoesNotExist:
-        return "pending" if app.ready_for_board_review_at else "not_submitted"
+def _load_for_board(
+    board: ForestryBoard, application_id: UUID, include_revisions: bool = True
+) -> tuple[ApplicationAggregate | None, dict[str, Any] | None]:
+    """Load an application aggregate and enforce the board member's county access."""
+    agg = ApplicationAggregateLoader(include_revisions=include_revisions).get(application_id)
+    if agg is None:
+        return None, error_response("Application not found", data={"code": "not_found"})
+    if not agg.in_county(board.county):
+        return None, error_response("Access denied: application not in your county", data={"code": "access_denied"})
+    return agg, None
@@ -1,11 +1,91 @@
-"""User preference capture: record interactions and return simple recommendations."""
-from uuid import UUID
-from collections import Counter
+"""
+User preference capture: record interactions and return simple recommendations.
+
+Interactions are the highest-volume write, so they are sampled and rate-limited
+per interaction_type before they reach the database (INTERACTION_SAMPLE_RATES,
+INTERACTION_TYPE_LIMITS). Accepted events go to a buffered writer
+(core.buffered_writer) that inserts them in batches; without a running writer
+they are inserted directly with one insert_many per call. Each write also
+updates the per-user rollups (UserPreferenceRollup), so recommendations read a
+handful of counter rows instead of the interaction history; sampled events count
+1 / sample_rate there.
+"""
+import json
+import random
+import threading
+import time
+from datetime import datetime
 from typing import Any
+from uuid import UUID
 
-from database.models import User, UserInteraction
+from peewee import SqliteDatabase, chunked, fn
+
+from config import (
+    INTERACTION_BATCH_MAX,
+    INTERACTION_FLUSH_SECONDS,
+    INTERACTION_MAX_QUEUE,
+    INTERACTION_SAMPLE_RATES,
+    INTERACTION_TYPE_LIMITS,
+    INTERACTION_WRITE_BATCH_SIZE,
+)
+from core.buffered_writer import BufferedWriter, get_buffered_writer, start_buffered_writer
+from database.connection import database_proxy
+from database.models import User, UserInteraction, UserPreferenceRollup
+from database.models.user_preference_rollup import DIMENSION_TARGET, DIMENSION_TYPE
+from database.sqlite_profile import is_file_sqlite
 from utils.responses import error_response, success_response
 
+INTERACTION_WRITER = "user_interactions"
+_INSERT_CHUNK = 140  # rows per INSERT: 7 columns each stays under SQLite's 999 parameters
+_LIMIT_WINDOW_SECONDS = 60
+
+
+class _TypeLimiter:
+    """Per (user, interaction_type) fixed one-minute windows, in process memory."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._windows: dict[tuple[str, str], tuple[int, int]] = {}  # key -> (window, count)
+
+    def allow(self, user_id: str, interaction_type: str, limit: int, now: float | None = None) -> bool:
+        window = int((now if now is not None else time.time()) // _LIMIT_WINDOW_SECONDS)
+        key = (user_id, interaction_type)
+        with self._lock:
+            start, count = self._windows.get(key, (window, 0))
+            if start != window:
+                count = 0
+            if count >= limit:
+                return False
+            self._windows[key] = (window, count + 1)
+            if len(self._windows) > 50_000:  # drop finished windows to bound memory
+                self._windows = {k: v for k, v in self._windows.items() if v[0] == window}
+            return True
+
+
+_limiter = _TypeLimiter()
+
+
+def write_interaction_rows(rows: list[dict[str, Any]]) -> None:
+    """Insert interaction rows and add them to the users' rollups, in one transaction (no per-row lookups)."""
+    with UserInteraction._meta.database.atomic():
+        for chunk in chunked(rows, _INSERT_CHUNK):
+            UserInteraction.insert_many(chunk).execute()
+        UserPreferenceRollup.record(rows)
+
+
+def start_interaction_writer() -> BufferedWriter | None:
+    """Start the buffered interaction writer (lifespan); None on in-memory SQLite."""
+    db = getattr(database_proxy, "obj", None)
+    if db is None or (isinstance(db, SqliteDatabase) and not is_file_sqlite(db)):
+        return None
+    return start_buffered_writer(
+        INTERACTION_WRITER,
+        write_interaction_rows,
+        batch_size=INTERACTION_WRITE_BATCH_SIZE,
+        flush_seconds=INTERACTION_FLUSH_SECONDS,
+        max_queue=INTERACTION_MAX_QUEUE,
+    )
+
 
 class PreferenceService:
     """Record user interactions and provide personalized recommendations."""
@@ -21,21 +101,74 @@ class PreferenceService:
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Record a single interaction (e.g. page_view, form_section_used)."""
+        result = self.record_interactions(
+            user_id, [{"interaction_type": interaction_type, "target_id": target_id, "metadata": metadata}]
+        )
+        if not result.get("success"):
+            return result
+        return success_response(message="Recorded")
+
+    def record_interactions(self, user_id: str, items: list[dict[str, Any]]) -> dict[str, Any]:
+        """
+        Record a batch of interactions (dicts with interaction_type, target_id, metadata).
+        Each event is sampled by its type's rate and counted against the per-user type
+        limit; data reports how many were accepted, sampled out, over the limit, or
+        dropped because the write queue was full. Sampled events carry their rate in
+        metadata ("sample_rate") so counts can be re-weighted.
+        """
         try:
             uid = UUID(user_id)
         except (ValueError, TypeError):
             return error_response("Invalid user", data={"code": "invalid_user"})
+        if len(items) > INTERACTION_BATCH_MAX:
+            return error_response(
+                f"At most {INTERACTION_BATCH_MAX} interactions per request",
+                data={"code": "batch_too_large"},
+            )
         if not User.select().where(User.id == uid).exists():
             return error_response("User not found", data={"code": "user_not_found"})
-        import json
-        meta_json = json.dumps(metadata) if metadata else None
-        UserInteraction.create(
-            user_id=uid,
-            interaction_type=(interaction_type or "unknown")[:64],
-            target_id=target_id[:255] if target_id else None,
-            metadata_json=meta_json,
+        now = datetime.utcnow()
+        rows: list[dict[str, Any]] = []
+        sampled_out = limited = 0
+        for item in items:
+            interaction_type = (item.get("interaction_type") or "unknown")[:64]
+            rate = INTERACTION_SAMPLE_RATES.get(interaction_type, 1.0)
+            if rate < 1.0 and random.random() >= rate:
+                sampled_out += 1
+                continue
+            limit = INTERACTION_TYPE_LIMITS.get(interaction_type)
+            if limit is not None and not _limiter.allow(str(uid), interaction_type, limit):
+                limited += 1
+                continue
+            metadata = item.get("metadata")
+            if rate < 1.0:
+                metadata = {**(metadata or {}), "sample_rate": rate}
+            target_id = item.get("target_id")
+            rows.append(
+                {
+                    "user": uid,
+                    "interaction_type": interaction_type,
+                    "target_id": target_id[:255] if target_id else None,
+                    "metadata_json": json.dumps(metadata) if metadata else None,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        dropped = 0
+        writer = get_buffered_writer(INTERACTION_WRITER)
+        if writer is not None:
+            dropped = sum(1 for row in rows if not writer.submit(row))
+        elif rows:
+            write_interaction_rows(rows)
+        return success_response(
+            data={
+                "accepted": len(rows) - dropped,
+                "sampledOut": sampled_out,
+                "limited": limited,
+                "dropped": dropped,
+            },
+            message="Recorded",
         )
-        return success_response(message="Recorded")
 
     def get_recommendations(self, user_id: str, limit: int = 5) -> dict[str, Any]:
         """Return personalized recommendations based on interaction history."""
@@ -43,24 +176,49 @@ class PreferenceService:
             uid = UUID(user_id)
         except (ValueError, TypeError):
             return error_response("Invalid user", data={"code": "invalid_user"})
-        interactions = (
-            UserInteraction.select(UserInteraction.interaction_type, UserInteraction.target_id)
-            .where(UserInteraction.user_id == uid)
-            .order_by(UserInteraction.created_at.desc())
-            .limit(500)
-        )
-        type_counts: Counter = Counter()
-        target_counts: Counter = Counter()
-        for i in interactions:
-            type_counts[i.interaction_type] += 1
-            if i.target_id:
-                target_counts[i.target_id] += 1
+        # Rollup rows: one per interaction type the user has used (kept current on write).
+        type_counts = {
+            r.key: r.count
+            for r in UserPreferenceRollup.select(UserPreferenceRollup.key, UserPreferenceRollup.count).where(
+                (UserPreferenceRollup.user == uid) & (UserPreferenceRollup.dimension == DIMENSION_TYPE)
+            )
+        }
         # Simple recommendations: suggest services/pages they haven't used much
         suggestions = []
         if type_counts.get("page_view", 0) > 2 and type_counts.get("form_section", 0) == 0:
             suggestions.append({"type": "service", "title": "Complete an application", "reason": "You’ve been browsing; consider starting an application.", "link": "/dashboard/application"})
-        if type_counts.get("page_view", 0) > 0 and "complaints" not in str(target_counts.keys()).lower():
+        if type_counts.get("page_view", 0) > 0 and not self._has_target(uid, "complaints"):
             suggestions.append({"type": "service", "title": "File or track a complaint", "reason": "Based on your activity.", "link": "/complaints"})
         if type_counts.get("page_view", 0) > 0:
             suggestions.append({"type": "data", "title": "Explore public data", "reason": "See program statistics.", "link": "/data"})
         return success_response(data={"recommendations": suggestions[:limit]})
+
+    def _has_target(self, uid: UUID, segment: str) -> bool:
+        """
+        True if the user interacted with the path segment itself or anything under it
+        ("/complaints", "/complaints/42"; not "/my-complaints"), case-insensitive.
+        """
+        key = UserPreferenceRollup.key
+        return (
+            UserPreferenceRollup.select()
+            .where(
+                (UserPreferenceRollup.user == uid)
+                & (UserPreferenceRollup.dimension == DIMENSION_TARGET)
+                & (
+                    (fn.LOWER(key) << [segment, f"/{segment}"])
+                    | key.startswith(f"{segment}/")
+                    | key.startswith(f"/{segment}/")
+                )
+            )
+            .exists()
+        )
+
+    def rebuild_rollups(self, user_id: str | None = None) -> dict[str, Any]:
+        """Recompute preference rollups from user_interactions (one user, or everyone)."""
+        if user_id is not None:
+            try:
+                UUID(user_id)
+            except (ValueError, TypeError):
+                return error_response("Invalid user", data={"code": "invalid_user"})
+        rows = UserPreferenceRollup.rebuild(user_id)
+        return success_response(data={"rows": rows}, message="Rollups rebuilt")
@@ -4,6 +4,7 @@ from typing import Any
 from uuid import UUID
 
 from database.models import Application, ProjectInformation, ProjectType, SiteOwnership, User
+from database.sqlite_profile import serialized_write
 from utils.responses import error_response, success_response
 
 ACREAGE_MIN = 0.01
@@ -183,6 +184,7 @@ class ProjectInformationService:
             },
         )
 
+    @serialized_write
     def put_project(
         self, application_id: str, user_id: str, payload: dict[str, Any]
     ) -> dict[str, Any]:
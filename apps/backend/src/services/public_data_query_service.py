@@ -3,6 +3,7 @@ import re
 from typing import Any
 
 from database.models import Application, County
+from database.routing import read_only
 from utils.responses import error_response, success_response
 
 
@@ -75,6 +76,7 @@ class PublicDataQueryService:
             }
         )
 
+    @read_only
     def query(self, natural_language: str) -> dict[str, Any]:
         """Run a safe query based on natural language input. Returns rows as list of dicts."""
         q = _normalize(natural_language or "")
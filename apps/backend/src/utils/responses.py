@@ -22,6 +22,19 @@ def success_response(data: Any = None, message: str | None = None) -> dict[str,
     return api_response(success=True, message=message, data=data)
 
 
+def paginated_response(
+    items: list[Any],
+    next_cursor: str | None,
+    limit: int,
+    total: int | None = None,
+    message: str | None = None,
+) -> dict[str, Any]:
+    """Success response whose data is one page of items, plus a pagination block."""
+    out = success_response(data=items, message=message)
+    out["pagination"] = {"next_cursor": next_cursor, "limit": limit, "total": total}
+    return out
+
+
 def error_response(message: str, data: Any = None) -> dict[str, Any]:
     """Error response with message and optional extra data."""
     return api_response(success=False, message=message, data=data)
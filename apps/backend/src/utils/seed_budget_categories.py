@@ -1,18 +1,17 @@
-"""Seed budget category options if table is empty."""
+"""Seed budget category options (bulk upsert by code)."""
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 def seed_budget_categories() -> None:
-    """Insert default budget categories if empty."""
+    """Upsert default budget categories; labels follow the seed data."""
     try:
+        from database.bulk import bulk_upsert
         from database.models import BudgetCategory
         from data.budget_categories_seed import DEFAULT_BUDGET_CATEGORIES
     except ImportError as e:
         logger.warning("Budget categories seed skipped: %s", e)
         return
-    if BudgetCategory.select().count() == 0:
-        for row in DEFAULT_BUDGET_CATEGORIES:
-            BudgetCategory.get_or_create(code=row["code"], defaults={"label": row["label"]})
-        logger.info("Seeded %d budget categories", len(DEFAULT_BUDGET_CATEGORIES))
+    bulk_upsert(BudgetCategory, DEFAULT_BUDGET_CATEGORIES, conflict_target=["code"], update=["label"])
+    logger.info("Seeded %d budget categories", len(DEFAULT_BUDGET_CATEGORIES))
@@ -1,22 +1,18 @@
-"""Seed counties table from default list if empty."""
+"""Seed counties table from the default list (bulk upsert, one statement)."""
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 def seed_counties() -> None:
-    """Insert default counties if the table is empty."""
+    """Insert default counties that are missing; existing rows are left as-is."""
     try:
+        from database.bulk import bulk_upsert
         from database.models import County
         from data.counties_seed import DEFAULT_COUNTIES
     except ImportError as e:
         logger.warning("County seed skipped: %s", e)
         return
-    if County.select().count() > 0:
-        return
-    for row in DEFAULT_COUNTIES:
-        County.get_or_create(
-            name=row["name"],
-            state_code=row.get("state_code", ""),
-        )
-    logger.info("Seeded %d counties", len(DEFAULT_COUNTIES))
+    rows = [{"name": row["name"], "state_code": row.get("state_code", "")} for row in DEFAULT_COUNTIES]
+    bulk_upsert(County, rows, conflict_target=["name", "state_code"])
+    logger.info("Seeded %d counties", len(rows))
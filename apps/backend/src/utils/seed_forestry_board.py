@@ -1,4 +1,5 @@
 """Seed Forestry Board members for development/testing."""
+from core.principal import invalidate_principal
 from database.models import ForestryBoard, User
 
 
@@ -20,3 +21,4 @@ def seed_forestry_board() -> None:
                 title=title,
                 email=user.email,
             )
+            invalidate_principal(user_id=user.id)
@@ -1,22 +1,19 @@
-"""Seed site ownership and project type options if tables are empty."""
+"""Seed site ownership and project type options (bulk upsert by code)."""
 import logging
 
 logger = logging.getLogger(__name__)
 
 
 def seed_project_options() -> None:
-    """Insert default site ownership and project type options if empty."""
+    """Upsert default site ownership and project type options; labels follow the seed data."""
     try:
+        from database.bulk import bulk_upsert
         from database.models import SiteOwnership, ProjectType
         from data.project_seed import DEFAULT_SITE_OWNERSHIP, DEFAULT_PROJECT_TYPES
     except ImportError as e:
         logger.warning("Project options seed skipped: %s", e)
         return
-    if SiteOwnership.select().count() == 0:
-        for row in DEFAULT_SITE_OWNERSHIP:
-            SiteOwnership.get_or_create(code=row["code"], defaults={"label": row["label"]})
-        logger.info("Seeded %d site ownership options", len(DEFAULT_SITE_OWNERSHIP))
-    if ProjectType.select().count() == 0:
-        for row in DEFAULT_PROJECT_TYPES:
-            ProjectType.get_or_create(code=row["code"], defaults={"label": row["label"]})
-        logger.info("Seeded %d project type options", len(DEFAULT_PROJECT_TYPES))
+    bulk_upsert(SiteOwnership, DEFAULT_SITE_OWNERSHIP, conflict_target=["code"], update=["label"])
+    logger.info("Seeded %d site ownership options", len(DEFAULT_SITE_OWNERSHIP))
+    bulk_upsert(ProjectType, DEFAULT_PROJECT_TYPES, conflict_target=["code"], update=["label"])
+    logger.info("Seeded %d project type options", len(DEFAULT_PROJECT_TYPES))
@@ -23,8 +23,9 @@ def _emails_from_mock_env() -> list[str]:
 
 
 def seed_users() -> None:
-    """Create User rows for default seed emails + MOCK_AUTH_USERS if not present."""
+    """Create User rows for default seed emails + MOCK_AUTH_USERS if not present (existing users untouched)."""
     try:
+        from database.bulk import bulk_upsert
         from database.models import User
         from data.seed_users_data import DEFAULT_SEED_USERS
     except ImportError as e:
@@ -34,15 +35,13 @@ def seed_users() -> None:
     for e in _emails_from_mock_env():
         emails_to_seed.add(e)
     by_email = {row["email"]: row for row in DEFAULT_SEED_USERS}
-    created = 0
-    for email in emails_to_seed:
-        row = by_email.get(email)
-        defaults = {
-            "password_hash": row["password_hash"] if row else "seeded",
+    rows = [
+        {
+            "email": email,
+            "password_hash": by_email[email]["password_hash"] if email in by_email else "seeded",
             "account_status": "active",
         }
-        _, created_this = User.get_or_create(email=email, defaults=defaults)
-        if created_this:
-            created += 1
-    if created:
-        logger.info("Seeded %d users", created)
\ No newline at end of file
+        for email in sorted(emails_to_seed)
+    ]
+    bulk_upsert(User, rows, conflict_target=["email"])
+    logger.info("Seeded %d users", len(rows))
@@ -1,5 +1,5 @@
 """Unit testing utilities: mock factories for email, storage, and scanner dependencies."""
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, Iterable
 
 
 class MockEmailService:
@@ -52,6 +52,20 @@ class MockStorageBackend:
         }
         return self._meta[key]
 
+    def upload_stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        key: str,
+        content_type: str,
+        original_filename: str,
+    ) -> Any:
+        from io import BytesIO
+        # Join first: a chunk iterator that raises leaves nothing stored.
+        return self.upload(
+            BytesIO(b"".join(chunks)), key=key, content_type=content_type, original_filename=original_filename
+        )
+
     def download(self, key: str) -> bytes:
         if key not in self._store:
             raise FileNotFoundError(key)
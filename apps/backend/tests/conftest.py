@@ -147,3 +147,12 @@ def api_client_no_auth(memory_db, monkeypatch: pytest.MonkeyPatch):
     from main import app
     with TestClient(app) as client:
         yield client
+
+
+@pytest.fixture(autouse=True)
+def fresh_principal_cache():
+    """Cached principals belong to the test's database; start and end each test empty."""
+    from core.principal import clear_principal_cache
+    clear_principal_cache()
+    yield
+    clear_principal_cache()
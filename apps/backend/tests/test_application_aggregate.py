@@ -0,0 +1,131 @@
+"""Application aggregate loader: sections load in a constant number of queries."""
+from datetime import datetime, timezone
+
+import pytest
+
+from database.instrumentation import profile_queries
+from database.models import (
+    Application,
+    ContactInformation,
+    FinancialInformation,
+    ForestryBoard,
+    ForestryBoardApproval,
+    ProjectInformation,
+    RevisionRequest,
+)
+from services.application_aggregate import ApplicationAggregateLoader
+from services.application_form_service import ApplicationFormService
+from services.forestry_board_service import ForestryBoardService
+
+
+@pytest.fixture
+def board_member(memory_db, make_user):
+    user = make_user(email="board@test.com")
+    return ForestryBoard.create(
+        user=user, county="Baltimore", board_member_name="Jane Reviewer", title="Chair", email=user.email
+    )
+
+
+def _add_sections(app: Application, board: ForestryBoard, county: str, i: int) -> None:
+    ContactInformation.create(
+        application=app,
+        organization_name=f"Org {i}",
+        address_line1="1 Main St",
+        city="City",
+        state_code="MD",
+        zip_code="21201",
+        county=county,
+        primary_contact_name=f"Applicant {i}",
+        primary_contact_email=f"applicant{i}@test.com",
+    )
+    ProjectInformation.create(
+        application=app,
+        project_name=f"Project {i}",
+        site_city="City",
+        project_type="planting",
+    )
+    FinancialInformation.create(application=app, total_project_cost=1000)
+    ForestryBoardApproval.create(application=app, board_member=board, status="revision_requested")
+    for r in range(2):
+        RevisionRequest.create(application=app, board_member=board, comments=f"fix {r}", revision_number=r + 1)
+
+
+@pytest.fixture
+def make_ready_applications(make_application):
+    """Factory: n applications ready for board review in county, each with every section and two revisions."""
+
+    def _create(n: int, board: ForestryBoard, county: str = "Baltimore", user=None) -> list[Application]:
+        apps = []
+        for i in range(n):
+            app, _ = make_application(user=user, ready_for_board_review_at=datetime.now(timezone.utc))
+            _add_sections(app, board, county, i)
+            apps.append(app)
+        return apps
+
+    return _create
+
+
+def test_board_queue_query_count_is_flat(board_member, make_ready_applications) -> None:
+    """Listing the board queue issues the same number of queries for 2 or 12 applications."""
+    svc = ForestryBoardService()
+    make_ready_applications(2, board_member)
+    make_ready_applications(1, board_member, county="Howard")
+    with profile_queries() as small_profile:
+        small = svc.list_applications_for_board_member(str(board_member.id))
+    assert len(small["data"]["applications"]) == 2
+
+    make_ready_applications(10, board_member, county="baltimore ")
+    with profile_queries() as large_profile:
+        large = svc.list_applications_for_board_member(str(board_member.id))
+    assert len(large["data"]["applications"]) == 12
+    assert large_profile.count == small_profile.count
+    assert {a["status"] for a in large["data"]["applications"]} == {"revision_requested"}
+
+
+def test_loader_attaches_sections_and_revisions(board_member, make_ready_applications) -> None:
+    """Every section and all revisions arrive in two queries regardless of row count."""
+    make_ready_applications(5, board_member)
+    loader = ApplicationAggregateLoader()
+    with profile_queries() as profile:
+        aggregates = loader.board_queue("Baltimore").items
+    assert profile.count == 2
+    assert len(aggregates) == 5
+    for agg in aggregates:
+        assert agg.contact and agg.project and agg.financial and agg.approval
+        assert agg.approval.board_member.board_member_name == "Jane Reviewer"
+        assert [r.comments for r in agg.revisions] == ["fix 0", "fix 1"]
+
+
+def test_detail_view_query_count(board_member, make_ready_applications) -> None:
+    """The board detail view loads the application in a fixed number of queries."""
+    apps = make_ready_applications(3, board_member)
+    svc = ForestryBoardService()
+    with profile_queries() as profile:
+        result = svc.get_application_for_board_member(str(board_member.id), str(apps[0].id))
+    assert result["success"] is True
+    assert len(result["data"]["revisionHistory"]) == 2
+    assert profile.count == 3  # board lookup, joined application, revisions
+
+
+def test_applicant_views_query_count_is_flat(board_member, make_ready_applications, make_user) -> None:
+    """The applicant's list and detail views read every section from one joined query."""
+    svc = ApplicationFormService()
+    applicant = make_user()
+    apps = make_ready_applications(2, board_member, user=applicant)
+    with profile_queries() as small_profile:
+        small = svc.list_applications(str(applicant.id))
+    make_ready_applications(10, board_member, user=applicant)
+    with profile_queries() as large_profile:
+        large = svc.list_applications(str(applicant.id))
+    assert len(small["data"]) == 2 and len(large["data"]) == 12
+    assert large_profile.count == small_profile.count == 1
+
+    with profile_queries() as profile:
+        detail = svc.get_application(str(apps[0].id), str(applicant.id))
+    assert profile.count == 1
+    assert detail["data"]["board_status"] == "revision_requested"
+    assert detail["data"]["sections"] == {
+        "contact_information": True,
+        "project_information": True,
+        "financial_information": True,
+    }
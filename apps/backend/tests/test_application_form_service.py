@@ -1,23 +1,14 @@
 """Tests for ApplicationFormService."""
 import pytest
 
-from database.connection import database_proxy
 from database.models import User, Application
+from services import application_form_service
 from services.application_form_service import ApplicationFormService
 
 
 @pytest.fixture(autouse=True)
-def use_memory_db(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
-    import database.connection as conn
-    conn._db = None
-    db = conn.get_db()
-    database_proxy.initialize(db)
-    db.create_tables([User, Application])
-    yield
-    database_proxy.initialize(None)
-    db.close()
-    conn._db = None
+def use_memory_db(memory_db) -> None:
+    """Full schema: applicant views join the section tables."""
 
 
 @pytest.fixture
@@ -93,3 +84,50 @@ def test_update_application(service: ApplicationFormService, user_id: str) -> No
     result = service.update_application(app_id, user_id, form_data={"contact": {"email": "a@b.com"}})
     assert result["success"] is True
     assert result["data"]["form_data"] == {"contact": {"email": "a@b.com"}}
+
+
+def test_update_application_keeps_concurrent_county_key(
+    service: ApplicationFormService, user_id: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app_id = service.create_draft(user_id)["data"]["id"]
+    get = application_form_service._loader.get
+
+    def get_then_county_changes(*args, **kwargs):
+        agg = get(*args, **kwargs)
+        # A contact-information save in another request lands after our read.
+        Application.update(county_key="kent").where(Application.id == agg.application.id).execute()
+        return agg
+
+    monkeypatch.setattr(application_form_service._loader, "get", get_then_county_changes)
+    service.update_application(app_id, user_id, form_data={"contact": {"email": "a@b.com"}})
+    monkeypatch.undo()
+    app = Application.get_by_id(app_id)
+    assert app.county_key == "kent"
+    assert app.form_data == {"contact": {"email": "a@b.com"}}
+
+
+def test_list_applications_keyset_pages(service: ApplicationFormService, user_id: str) -> None:
+    for _ in range(5):
+        service.create_draft(user_id)
+    first = service.list_applications(user_id, limit=2, include_total=True)
+    assert len(first["data"]) == 2
+    assert first["pagination"]["total"] == 5
+    ids = [a["id"] for a in first["data"]]
+    cursor = first["pagination"]["next_cursor"]
+    while cursor:
+        page = service.list_applications(user_id, limit=2, cursor=cursor)
+        ids.extend(a["id"] for a in page["data"])
+        cursor = page["pagination"]["next_cursor"]
+    assert len(set(ids)) == 5
+    bad = service.list_applications(user_id, cursor="garbage")
+    assert bad["success"] is False
+    assert bad["data"]["code"] == "invalid_cursor"
+
+
+def test_update_application_form_data_patch(service: ApplicationFormService, user_id: str) -> None:
+    app_id = service.create_draft(user_id)["data"]["id"]
+    service.update_application(app_id, user_id, form_data={"contact": {"email": "a@b.com", "phone": "1"}, "notes": "x"})
+    result = service.update_application(app_id, user_id, form_data_patch={"contact": {"phone": None}, "project": {"name": "Trees"}})
+    assert result["success"] is True
+    assert result["data"]["form_data"] == {"contact": {"email": "a@b.com"}, "notes": "x", "project": {"name": "Trees"}}
+    assert service.get_application(app_id, user_id)["data"]["form_data"] == result["data"]["form_data"]
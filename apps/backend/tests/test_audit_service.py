@@ -0,0 +1,114 @@
+"""Tests for audit logging: synchronous writes and the buffered background writer."""
+import threading
+import time
+
+import pytest
+from peewee import SqliteDatabase
+
+from core.buffered_writer import BufferedWriter, get_buffered_writer, stop_buffered_writers
+from database.connection import database_proxy
+from database.models import AuditLog, User
+from services import audit_service
+from services.audit_service import record_audit, start_audit_writer
+
+
+@pytest.fixture
+def audit_db(tmp_path):
+    """File SQLite so the writer thread sees the same tables."""
+    db = SqliteDatabase(str(tmp_path / "audit.db"), check_same_thread=False)
+    database_proxy.initialize(db)
+    db.create_tables([User, AuditLog])
+    yield db
+    stop_buffered_writers()
+    database_proxy.initialize(None)
+    db.close()
+
+
+def test_sync_write_without_writer(audit_db):
+    """No running writer: the entry is written before record_audit returns; unknown users become NULL."""
+    user = User.create(email="audit@example.com", password_hash="x")
+    record_audit("login", user_id=str(user.id))
+    record_audit("login", user_id="00000000-0000-0000-0000-000000000000")
+    record_audit("login", user_id="mock-user")
+    rows = list(AuditLog.select().order_by(AuditLog.id))
+    assert [r.user_id for r in rows] == [user.id, None, None]
+
+
+def test_buffered_writer_batches_and_drains(audit_db, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(audit_service, "AUDIT_LOG_BATCH_SIZE", 50)
+    monkeypatch.setattr(audit_service, "AUDIT_LOG_FLUSH_SECONDS", 60.0)
+    writer = start_audit_writer()
+    assert writer is not None
+    for i in range(120):
+        record_audit("complaint_submit", resource_type="complaint", resource_id=str(i))
+    deadline = time.monotonic() + 5
+    while writer.stats()["written"] < 100 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.stats()["written"] == 100  # two full batches; 20 wait for the timer
+    stop_buffered_writers()  # shutdown drains the rest
+    assert get_buffered_writer(audit_service.AUDIT_WRITER) is None
+    stats = writer.stats()
+    assert (stats["queued"], stats["submitted"], stats["written"], stats["dropped"]) == (0, 120, 120, 0)
+    assert AuditLog.select().count() == 120
+
+
+def test_sync_mode_and_in_memory_sqlite_skip_writer(audit_db, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(audit_service, "AUDIT_LOG_MODE", "sync")
+    assert start_audit_writer() is None
+    monkeypatch.setattr(audit_service, "AUDIT_LOG_MODE", "buffered")
+    memory = SqliteDatabase(":memory:")
+    database_proxy.initialize(memory)
+    assert start_audit_writer() is None
+
+
+def test_full_queue_drops_and_counts():
+    release = threading.Event()
+    written: list[int] = []
+
+    def slow_flush(items):
+        release.wait(5)
+        written.extend(items)
+
+    writer = BufferedWriter("test", slow_flush, batch_size=1, flush_seconds=0, max_queue=3)
+    try:
+        accepted = [writer.submit(i) for i in range(10)]
+    finally:
+        release.set()
+        writer.stop()
+    stats = writer.stats()
+    assert accepted.count(False) == stats["dropped"] > 0
+    assert stats["written"] == len(written) == 10 - stats["dropped"]
+
+
+def test_flush_timer_and_failures_counted():
+    calls: list[list[int]] = []
+
+    def flaky(items):
+        calls.append(items)
+        if len(calls) == 1:
+            raise RuntimeError("database unavailable")
+
+    writer = BufferedWriter("test", flaky, batch_size=100, flush_seconds=0.05)
+    writer.submit(1)
+    time.sleep(0.3)
+    writer.submit(2)
+    writer.stop()
+    assert calls == [[1], [2]]  # each flushed by the timer, well below batch_size
+    assert writer.stats()["failed"] == 1 and writer.stats()["written"] == 1
+
+
+def test_failed_batch_is_retried_row_by_row():
+    calls: list[list[int]] = []
+
+    def rejects_negative(items):
+        calls.append(items)
+        if any(i < 0 for i in items):
+            raise ValueError("constraint violated")
+
+    writer = BufferedWriter("test", rejects_negative, batch_size=3, flush_seconds=10)
+    for i in (1, -1, 2):
+        writer.submit(i)
+    writer.stop()
+    assert calls == [[1, -1, 2], [1], [-1], [2]]
+    stats = writer.stats()
+    assert stats["written"] == 2 and stats["failed"] == 1 and stats["flushes"] == 1
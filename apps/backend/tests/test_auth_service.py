@@ -2,7 +2,7 @@
 import pytest
 
 from database.connection import database_proxy
-from database.models import User, PasswordReset, LoginAttempt, Application
+from database.models import User, PasswordReset, LoginAttempt, Application, ForestryBoard
 
 
 @pytest.fixture(autouse=True)
@@ -12,7 +12,7 @@ def use_memory_db(monkeypatch: pytest.MonkeyPatch) -> None:
     conn._db = None
     db = conn.get_db()
     database_proxy.initialize(db)
-    db.create_tables([User, PasswordReset, LoginAttempt, Application])
+    db.create_tables([User, PasswordReset, LoginAttempt, Application, ForestryBoard])
     yield
     database_proxy.initialize(None)
     db.close()
@@ -23,6 +23,8 @@ def use_memory_db(monkeypatch: pytest.MonkeyPatch) -> None:
 def jwt_secret(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("AUTH_PROVIDER", "jwt")
     monkeypatch.setenv("JWT_SECRET", "test-secret")
+    from authentication.utils.jwt import reload_keys
+    reload_keys()
 
 
 def test_register_and_login() -> None:
@@ -34,6 +36,34 @@ def test_register_and_login() -> None:
     assert out["user"]["email"] == "u@example.com"
 
 
+def test_login_embeds_role_claims() -> None:
+    from authentication import validate_token
+    from services.auth_service import UserAuthenticationService
+    svc = UserAuthenticationService()
+    svc.register("admin@example.com", "SecureP4ss")
+    claims = validate_token(svc.login("admin@example.com", "SecureP4ss")["token"])
+    assert claims["roles"] == ["user", "admin"]
+    assert claims["board_member_id"] is None and claims["board_county"] is None
+    user = User.get(User.email == "admin@example.com")
+    board = ForestryBoard.create(user=user, county="Baltimore", board_member_name="A", email=user.email)
+    claims = validate_token(svc.login("admin@example.com", "SecureP4ss")["token"])
+    assert claims["roles"] == ["user", "admin", "board_member"]
+    assert claims["board_member_id"] == str(board.id) and claims["board_county"] == "Baltimore"
+
+
+def test_login_rehashes_when_cost_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    from authentication.utils.password import get_hash_rounds
+    from services.auth_service import UserAuthenticationService
+    svc = UserAuthenticationService()
+    monkeypatch.setenv("BCRYPT_SALT_ROUNDS", "10")
+    svc.register("u@example.com", "SecureP4ss")
+    assert get_hash_rounds(User.get(User.email == "u@example.com").password_hash) == 10
+    monkeypatch.setenv("BCRYPT_SALT_ROUNDS", "11")
+    svc.login("u@example.com", "SecureP4ss")
+    assert get_hash_rounds(User.get(User.email == "u@example.com").password_hash) == 11
+    svc.login("u@example.com", "SecureP4ss")  # still the same password
+
+
 def test_login_wrong_password() -> None:
     from authentication import InvalidCredentialsError
     from services.auth_service import UserAuthenticationService
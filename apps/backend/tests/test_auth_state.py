@@ -0,0 +1,34 @@
+"""Tests for the database-backed lockout state (AUTH_STATE_BACKEND=database)."""
+from datetime import datetime, timedelta
+
+from authentication.utils.lockout import LockoutTracker
+
+from core.auth_state import LoginAttemptState
+from database.models import LoginAttempt
+
+
+def _attempt(email, success, seconds_ago=0):
+    LoginAttempt.create(email=email, success=success, attempt_time=datetime.utcnow() - timedelta(seconds=seconds_ago))
+
+
+def test_lockout_counts_failed_attempts_since_last_success(memory_db):
+    worker_a = LockoutTracker(max_attempts=3, lockout_seconds=900, state=LoginAttemptState())
+    worker_b = LockoutTracker(max_attempts=3, lockout_seconds=900, state=LoginAttemptState())
+    _attempt("u@example.com", False, seconds_ago=1000)  # outside the window
+    _attempt("u@example.com", False, seconds_ago=30)
+    _attempt("u@example.com", True, seconds_ago=20)  # success ends the streak
+    _attempt("u@example.com", False, seconds_ago=10)
+    _attempt("u@example.com", False, seconds_ago=5)
+    assert worker_a.remaining_attempts("u@example.com") == 1
+    _attempt("u@example.com", False)
+    worker_a.record_failure("u@example.com")
+    assert worker_b.is_locked("u@example.com") is True
+    assert worker_b.is_locked("other@example.com") is False
+
+
+def test_other_keys_use_fallback_memory():
+    state = LoginAttemptState()
+    state.set("mock:token:abc", "{}", ttl_seconds=60)
+    assert state.get("mock:token:abc") == "{}"
+    state.delete("mock:token:abc")
+    assert state.get("mock:token:abc") is None
@@ -0,0 +1,51 @@
+"""Tests for ComplaintService admin listing."""
+import pytest
+
+from database.connection import database_proxy
+from database.models import Complaint, User
+from services.complaint_service import ComplaintService
+
+
+@pytest.fixture(autouse=True)
+def use_memory_db(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
+    import database.connection as conn
+    conn._db = None
+    db = conn.get_db()
+    database_proxy.initialize(db)
+    db.create_tables([User, Complaint])
+    yield
+    database_proxy.initialize(None)
+    db.close()
+    conn._db = None
+
+
+@pytest.fixture
+def service() -> ComplaintService:
+    svc = ComplaintService()
+    for i in range(5):
+        svc.submit_complaint(f"Subject {i}", "Description", "other")
+    return svc
+
+
+def test_list_admin_complaints_keyset_pages(service: ComplaintService) -> None:
+    first = service.list_admin_complaints(limit=2)
+    assert first["data"]["total"] == 5
+    ids = [c["id"] for c in first["data"]["items"]]
+    cursor = first["data"]["next_cursor"]
+    while cursor:
+        page = service.list_admin_complaints(limit=2, cursor=cursor)
+        ids.extend(c["id"] for c in page["data"]["items"])
+        cursor = page["data"]["next_cursor"]
+    assert len(set(ids)) == 5
+
+
+def test_list_admin_complaints_deprecated_offset(service: ComplaintService) -> None:
+    keyset = [c["id"] for c in service.list_admin_complaints(limit=5)["data"]["items"]]
+    page = service.list_admin_complaints(limit=2, offset=2)
+    assert [c["id"] for c in page["data"]["items"]] == keyset[2:4]
+    assert page["data"]["offset"] == 2
+    assert page["data"]["total"] == 5
+    rest = service.list_admin_complaints(limit=2, cursor=page["data"]["next_cursor"])
+    assert [c["id"] for c in rest["data"]["items"]] == keyset[4:]
+    assert rest["data"]["next_cursor"] is None
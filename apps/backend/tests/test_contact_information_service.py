@@ -143,3 +143,15 @@ def test_put_contact_updates_existing(
     result = service.put_contact(application_id, user_id, updated)
     assert result["success"] is True
     assert result["data"]["contact_information"]["organization_name"] == "Updated Org"
+
+
+def test_put_contact_syncs_application_county_key(
+    service: ContactInformationService, application_id: str, user_id: str
+) -> None:
+    """Saving contact info keeps the application's indexed county_key normalized and current."""
+    service.put_contact(application_id, user_id, {**VALID_PAYLOAD, "county": "  Albany "})
+    assert Application.get_by_id(application_id).county_key == "albany"
+    service.put_contact(application_id, user_id, {**VALID_PAYLOAD, "county": "Saratoga"})
+    assert Application.get_by_id(application_id).county_key == "saratoga"
+    service.put_contact(application_id, user_id, {**VALID_PAYLOAD, "county": ""})
+    assert Application.get_by_id(application_id).county_key is None
@@ -4,6 +4,7 @@ import pytest
 from peewee import SqliteDatabase
 
 from database.connection import database_proxy
+from database.instrumentation import assert_no_n_plus_one
 from database.models import Application, Document, DocumentThumbnail, User
 from services.document_management_service import DocumentManagementService
 from utils.testing import MockMalwareScanner, MockStorageBackend, mock_malware_scanner, mock_storage_backend
@@ -101,6 +102,28 @@ def test_list_documents_grouped(app_and_user):
     assert docs["sitePlan"][0]["fileName"] == "plan.pdf"
 
 
+def test_list_documents_does_not_query_per_document(app_and_user):
+    """Thumbnail flags for all documents come from one query."""
+    app, user, (db, storage, scanner) = app_and_user
+    for i in range(5):
+        doc = Document.create(
+            application=app,
+            file_name=f"photo{i}.jpg",
+            file_path=f"documents/a/photo{i}.jpg",
+            file_size=200,
+            file_type="image/jpeg",
+            category="site_photos",
+            uploader_user=user,
+        )
+        if i % 2 == 0:
+            DocumentThumbnail.create(document=doc, thumbnail_path=f"thumbs/{i}.jpg", thumbnail_size=10)
+    svc = DocumentManagementService(storage=storage, malware_scanner=scanner)
+    with assert_no_n_plus_one(threshold=3):
+        result = svc.list_documents(str(app.id), str(user.id))
+    photos = result["data"]["documents"]["sitePhotos"]
+    assert [p["hasThumbnail"] for p in photos] == [True, False, True, False, True]
+
+
 def test_download_document(app_and_user):
     """Download returns file content from storage."""
     app, user, (db, storage, scanner) = app_and_user
@@ -233,3 +256,383 @@ def test_upload_oversized_rejected(app_and_user):
     )
     assert result["success"] is False
     assert "size" in result["message"].lower() or "limit" in result["message"].lower()
+
+
+def test_upload_stream_resolves_category_after_file(app_and_user):
+    """Chunks are stored in one pass; a category getter is read once the file is consumed."""
+    app, user, (db, storage, scanner) = app_and_user
+    svc = DocumentManagementService(storage=storage, malware_scanner=scanner)
+    chunks = [b"%PDF-1.4 ", b"x" * 1000, b"y" * 1000]
+    fields: dict[str, str] = {}
+
+    def stream():
+        yield from chunks
+        fields["category"] = "site_plan"  # arrives after the file, as in a file-first form
+
+    result = svc.upload_document_stream(
+        str(app.id), str(user.id),
+        chunks=stream(), filename="plan.pdf", content_type="application/pdf", category=lambda: fields.get("category"),
+    )
+    assert result["success"] is True
+    assert result["data"]["fileSize"] == sum(map(len, chunks))
+    assert len(result["data"]["sha256"]) == 64
+    assert Document.get(Document.application_id == app.id).category == "site_plan"
+    assert scanner.scanned == [("plan.pdf", scanner.scanned[0][1])]
+
+
+def test_upload_stream_rejections_store_nothing(app_and_user):
+    """Type mismatch, scanner verdict and bad late category leave neither object nor row."""
+    app, user, (db, storage, _) = app_and_user
+    cases = [
+        (mock_malware_scanner(), [b"\x89PNG\r\n\x1a\n"], "application/pdf", "site_plan"),
+        (mock_malware_scanner(safe=False), [b"%PDF-1.4"], "application/pdf", "site_plan"),
+        (mock_malware_scanner(), [b"%PDF-1.4"], "application/pdf", lambda: "not_a_category"),
+    ]
+    for scanner, chunks, content_type, category in cases:
+        svc = DocumentManagementService(storage=storage, malware_scanner=scanner)
+        result = svc.upload_document_stream(
+            str(app.id), str(user.id),
+            chunks=iter(chunks), filename="plan.pdf", content_type=content_type, category=category,
+        )
+        assert result["success"] is False
+        assert result["data"]["code"] == "validation_error"
+    assert storage._store == {}
+    assert Document.select().count() == 0
+
+
+def test_upload_stream_stops_at_size_limit(app_and_user):
+    """The pipeline stops pulling chunks once FILE_UPLOAD_MAX_MB is passed."""
+    from core.upload import MAX_UPLOAD_BYTES
+
+    app, user, (db, storage, scanner) = app_and_user
+    svc = DocumentManagementService(storage=storage, malware_scanner=scanner)
+    pulled = 0
+
+    def endless():
+        nonlocal pulled
+        yield b"%PDF-1.4"
+        while True:
+            pulled += 1
+            yield b"\0" * (1024 * 1024)
+
+    result = svc.upload_document_stream(
+        str(app.id), str(user.id),
+        chunks=endless(), filename="plan.pdf", content_type="application/pdf", category="site_plan",
+    )
+    assert result["data"]["code"] == "file_too_large"
+    assert pulled == MAX_UPLOAD_BYTES // (1024 * 1024)  # the chunk that crosses the limit is the last
+    assert storage._store == {}
+
+
+def _documents_client(tmp_path, storage):
+    """Documents router on a file DB (service calls run on worker threads) with the given storage."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from auth_deps import get_principal
+    from core.principal import Principal
+    from routes import documents as documents_routes
+    from routes import storage_uploads
+
+    db = SqliteDatabase(str(tmp_path / "documents.db"), check_same_thread=False)
+    database_proxy.initialize(db)
+    db.create_tables([User, Application, Document, DocumentThumbnail])
+    user = User.create(email="stream@example.com", password_hash="x", account_status="active")
+    application = Application.create(user=user, status="draft")
+    api = FastAPI()
+    api.include_router(documents_routes.router, prefix="/applications/{application_id}/documents")
+    api.include_router(storage_uploads.router)
+    api.dependency_overrides[get_principal] = lambda: Principal(user_id=str(user.id))
+    api.dependency_overrides[documents_routes._document_service] = lambda: DocumentManagementService(
+        storage=storage, malware_scanner=mock_malware_scanner()
+    )
+    try:
+        yield TestClient(api), f"/applications/{application.id}/documents", storage
+    finally:
+        database_proxy.initialize(None)
+        db.close()
+
+
+@pytest.fixture
+def upload_client(tmp_path):
+    yield from _documents_client(tmp_path, mock_storage_backend())
+
+
+@pytest.fixture(params=["mock", "local"])
+def download_client(request, tmp_path):
+    """Documents router with a streamed (mock) or file-served (local disk) backend."""
+    from storage.implementations.local import LocalStorageBackend
+
+    storage = mock_storage_backend() if request.param == "mock" else LocalStorageBackend(tmp_path / "files")
+    yield from _documents_client(tmp_path, storage)
+
+
+def _multipart(*parts: tuple[str, str | None, bytes], boundary: str = "upload-boundary"):
+    """Yield a multipart/form-data body part by part (no Content-Length: sent chunked)."""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"' + (f'; filename="{filename}"' if filename else "")
+        head = f"--{boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if filename:
+            head += "Content-Type: application/pdf\r\n"
+        yield (head + "\r\n").encode()
+        yield content
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
+
+
+def test_upload_route_streams_file_first_form(upload_client):
+    """The route accepts the file before the category field and stores the exact bytes."""
+    client, url, storage = upload_client
+    content = b"%PDF-1.4 " + b"z" * 200_000
+    response = client.post(
+        url,
+        content=_multipart(("file", "plan.pdf", content), ("category", None, b"site_plan")),
+        headers={"Content-Type": "multipart/form-data; boundary=upload-boundary"},
+    )
+    assert response.status_code == 201, response.text
+    assert response.json()["data"]["fileSize"] == len(content)
+    assert list(storage._store.values()) == [content]
+
+
+def test_upload_route_rejects_declared_oversize_before_reading_body(upload_client):
+    """A Content-Length over the limit is answered with 413 without receiving the body."""
+    from core.upload import MAX_UPLOAD_BODY_BYTES
+
+    client, url, storage = upload_client
+    received = 0
+
+    def body():
+        nonlocal received
+        received += 1
+        yield b"never read"
+
+    response = client.post(
+        url,
+        content=body(),
+        headers={
+            "Content-Type": "multipart/form-data; boundary=upload-boundary",
+            "Content-Length": str(MAX_UPLOAD_BODY_BYTES + 1),
+        },
+    )
+    assert response.status_code == 413
+    assert response.json()["data"]["code"] == "file_too_large"
+    assert storage._store == {}
+
+
+def test_upload_route_rejects_chunked_body_over_limit(upload_client):
+    """Without a Content-Length the limit is enforced while streaming; nothing is stored."""
+    from core.upload import MAX_UPLOAD_BYTES
+
+    client, url, storage = upload_client
+    response = client.post(
+        url,
+        content=_multipart(("category", None, b"site_plan"), ("file", "big.pdf", b"%PDF-1.4" + b"\0" * MAX_UPLOAD_BYTES)),
+        headers={"Content-Type": "multipart/form-data; boundary=upload-boundary"},
+    )
+    assert response.status_code == 413
+    assert storage._store == {}
+    assert Document.select().count() == 0
+
+
+def test_download_route_supports_range_and_validators(download_client):
+    """Downloads stream with Content-Length, ETag, 206 ranges, 304 revalidation and 416."""
+    client, url, _ = download_client
+    content = b"%PDF-1.4 " + bytes(range(256)) * 400
+    upload = client.post(
+        url,
+        content=_multipart(("category", None, b"site_plan"), ("file", "plan.pdf", content)),
+        headers={"Content-Type": "multipart/form-data; boundary=upload-boundary"},
+    )
+    doc_url = f"{url}/{upload.json()['data']['documentId']}"
+
+    full = client.get(doc_url)
+    assert full.status_code == 200
+    assert full.content == content
+    assert full.headers["content-length"] == str(len(content))
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["content-disposition"] == 'attachment; filename="plan.pdf"'
+    assert full.headers["content-type"] == "application/pdf"
+    etag = full.headers["etag"]
+
+    part = client.get(doc_url, headers={"Range": "bytes=100-199"})
+    assert part.status_code == 206
+    assert part.content == content[100:200]
+    assert part.headers["content-range"] == f"bytes 100-199/{len(content)}"
+    assert part.headers["content-length"] == "100"
+
+    tail = client.get(doc_url, headers={"Range": "bytes=-10"})
+    assert tail.status_code == 206 and tail.content == content[-10:]
+
+    stale = client.get(doc_url, headers={"Range": "bytes=0-9", "If-Range": '"other"'})
+    assert stale.status_code == 200 and stale.content == content
+
+    assert client.get(doc_url, headers={"If-None-Match": etag}).status_code == 304
+    beyond = client.get(doc_url, headers={"Range": f"bytes={len(content)}-"})
+    assert beyond.status_code == 416
+    assert beyond.headers["content-range"] == f"bytes */{len(content)}"
+
+
+@pytest.fixture
+def direct_upload_client(tmp_path, monkeypatch):
+    """Documents router on local storage with signed upload URLs under /storage/uploads."""
+    from routes import storage_uploads
+    from storage.implementations.local import LocalStorageBackend
+
+    storage = LocalStorageBackend(tmp_path / "files", upload_url="/storage/uploads", signing_key="test-key")
+    monkeypatch.setattr(storage_uploads, "_accept_signed_upload", lambda: storage.accept_signed_upload)
+    yield from _documents_client(tmp_path, storage)
+
+
+def _start_direct_upload(client, url, content: bytes, **overrides):
+    import hashlib
+
+    body = {
+        "file_name": "plan.pdf",
+        "content_type": "application/pdf",
+        "file_size": len(content),
+        "category": "site_plan",
+        "sha256": hashlib.sha256(content).hexdigest(),
+        **overrides,
+    }
+    response = client.post(f"{url}/uploads", json=body)
+    assert response.status_code == 201, response.text
+    return response.json()["data"]
+
+
+def test_direct_upload_round_trip(direct_upload_client):
+    """Start, PUT to the signed URL, complete: the document exists only after completion."""
+    client, url, storage = direct_upload_client
+    content = b"%PDF-1.4 " + b"d" * 150_000
+    started = _start_direct_upload(client, url, content)
+    grant = started["upload"]
+    assert grant["method"] == "PUT" and grant["url"].startswith("/storage/uploads/")
+
+    put = client.put(grant["url"], content=content, headers=grant["headers"])
+    assert put.status_code == 204, put.text
+    assert Document.select().count() == 0
+
+    complete_url = f"{url}/uploads/{started['documentId']}/complete"
+    done = client.post(complete_url, json={"upload_token": started["uploadToken"]})
+    assert done.status_code == 201, done.text
+    assert done.json()["data"]["documentId"] == started["documentId"]
+    assert done.json()["data"]["fileSize"] == len(content)
+    assert Document.get().category == "site_plan"
+    assert client.get(f"{url}/{started['documentId']}").content == content
+
+    again = client.post(complete_url, json={"upload_token": started["uploadToken"]})
+    assert again.status_code == 201
+    assert again.json()["data"]["documentId"] == started["documentId"]
+    assert Document.select().count() == 1
+
+
+@pytest.mark.parametrize(
+    "overrides, code",
+    [
+        ({"sha256": "0" * 64}, "validation_error"),  # checksum mismatch
+        ({"content_type": "image/png", "file_name": "plan.png"}, "validation_error"),  # PDF bytes
+    ],
+)
+def test_direct_upload_complete_rejects_and_deletes_object(direct_upload_client, overrides, code):
+    client, url, storage = direct_upload_client
+    content = b"%PDF-1.4 mismatched"
+    started = _start_direct_upload(client, url, content, **overrides)
+    put = client.put(started["upload"]["url"], content=content, headers=started["upload"]["headers"])
+    assert put.status_code == 204, put.text
+    done = client.post(
+        f"{url}/uploads/{started['documentId']}/complete", json={"upload_token": started["uploadToken"]}
+    )
+    assert done.status_code == 400
+    assert done.json()["data"]["code"] == code
+    assert Document.select().count() == 0
+    assert [p for p in storage.root.rglob("*") if p.is_file()] == []  # neither staging nor final copy
+
+
+def test_direct_upload_reupload_after_complete_cannot_replace_document(direct_upload_client):
+    """The grant only reaches the staging key: reusing it after completion leaves the document as verified."""
+    client, url, storage = direct_upload_client
+    content = b"%PDF-1.4 clean"
+    started = _start_direct_upload(client, url, content)
+    grant = started["upload"]
+    assert client.put(grant["url"], content=content, headers=grant["headers"]).status_code == 204
+    complete_url = f"{url}/uploads/{started['documentId']}/complete"
+    assert client.post(complete_url, json={"upload_token": started["uploadToken"]}).status_code == 201
+
+    swapped = b"%PDF-1.4 evil!"  # same size, never scanned or checksummed
+    assert client.put(grant["url"], content=swapped, headers=grant["headers"]).status_code == 204
+    again = client.post(complete_url, json={"upload_token": started["uploadToken"]})
+    assert again.status_code == 201
+    assert again.json()["data"]["documentId"] == started["documentId"]
+    assert client.get(f"{url}/{started['documentId']}").content == content
+    assert storage.download(Document.get().file_path) == content
+
+
+def test_direct_upload_overlapping_completes_keep_the_file(direct_upload_client):
+    """A second complete that saves first does not make the first one delete the verified file."""
+    client, url, storage = direct_upload_client
+    content = b"%PDF-1.4 raced"
+    started = _start_direct_upload(client, url, content)
+    grant = started["upload"]
+    assert client.put(grant["url"], content=content, headers=grant["headers"]).status_code == 204
+
+    application, user = Application.get(), User.get()
+    svc = DocumentManagementService(storage=storage, malware_scanner=mock_malware_scanner())
+    move, overlapped = storage.move, []
+
+    def complete() -> dict:
+        return svc.complete_direct_upload(
+            str(application.id), str(user.id), started["documentId"], upload_token=started["uploadToken"]
+        )
+
+    def move_then_overlap(src: str, dst: str) -> None:
+        move(src, dst)
+        if not overlapped:  # the first complete has passed its existing-row check; the second runs to the end
+            overlapped.append(complete())
+
+    storage.move = move_then_overlap
+    first = complete()
+    assert overlapped[0]["success"] is True
+    assert first["success"] is True
+    assert first["data"]["documentId"] == overlapped[0]["data"]["documentId"] == started["documentId"]
+    assert Document.select().count() == 1
+    assert storage.download(Document.get().file_path) == content
+
+
+def test_direct_upload_signed_url_enforces_grant(direct_upload_client):
+    """The signed URL takes only the declared size and type; tokens cannot be forged or reused elsewhere."""
+    client, url, storage = direct_upload_client
+    content = b"%PDF-1.4 small"
+    started = _start_direct_upload(client, url, content)
+    grant = started["upload"]
+    assert client.put(grant["url"], content=content + b"more", headers=grant["headers"]).status_code == 413
+    assert client.put(grant["url"], content=content, headers={"Content-Type": "image/png"}).status_code == 400
+    assert client.put(grant["url"] + "x", content=content, headers=grant["headers"]).status_code == 403
+
+    complete_url = f"{url}/uploads/{started['documentId']}/complete"
+    missing = client.post(complete_url, json={"upload_token": started["uploadToken"]})
+    assert missing.status_code == 404  # nothing uploaded yet
+    other = _start_direct_upload(client, url, content)
+    wrong = client.post(complete_url, json={"upload_token": other["uploadToken"]})
+    assert wrong.status_code == 400
+    assert wrong.json()["data"]["code"] == "invalid_upload_token"
+
+
+def _declaration(**overrides) -> dict:
+    return {"file_name": "a.pdf", "content_type": "application/pdf", "file_size": 10, "category": "site_plan", **overrides}
+
+
+def test_direct_upload_validates_declaration(direct_upload_client):
+    client, url, _ = direct_upload_client
+    too_big = client.post(f"{url}/uploads", json=_declaration(file_size=50 * 1024 * 1024))
+    assert too_big.status_code == 413
+    bad_type = client.post(f"{url}/uploads", json=_declaration(file_name="a.exe", content_type="application/x-msdownload"))
+    assert bad_type.status_code == 400
+    bad_category = client.post(f"{url}/uploads", json=_declaration(category="photos"))
+    assert bad_category.status_code == 400
+
+
+def test_direct_upload_unsupported_backend(upload_client):
+    """In-memory storage cannot presign: 501 tells the client to upload through the API."""
+    client, url, _ = upload_client
+    response = client.post(f"{url}/uploads", json=_declaration())
+    assert response.status_code == 501
+    assert response.json()["data"]["code"] == "direct_upload_unsupported"
@@ -69,6 +69,27 @@ def test_mark_ready_for_board_review_success(service, application_with_contact,
     assert app.ready_for_board_review_at is not None
 
 
+def test_mark_ready_for_board_review_keeps_concurrent_county_key(
+    service, application_with_contact, user, monkeypatch
+):
+    from services import forestry_board_service
+
+    get = forestry_board_service.ApplicationAggregateLoader.get
+
+    def get_then_county_changes(self, *args, **kwargs):
+        agg = get(self, *args, **kwargs)
+        # A contact-information save in another request lands after our read.
+        Application.update(county_key="kent").where(Application.id == application_with_contact.id).execute()
+        return agg
+
+    monkeypatch.setattr(forestry_board_service.ApplicationAggregateLoader, "get", get_then_county_changes)
+    result = service.mark_ready_for_board_review(str(application_with_contact.id), str(user.id))
+    assert result["success"] is True
+    app = Application.get_by_id(application_with_contact.id)
+    assert app.county_key == "kent"
+    assert app.ready_for_board_review_at is not None
+
+
 def test_mark_ready_for_board_review_no_county(service, application, user):
     ContactInformation.create(
         application=application,
@@ -0,0 +1,62 @@
+"""Tests for MetricsMiddleware query instrumentation (Server-Timing, per-path DB metrics, N+1)."""
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from peewee import SqliteDatabase
+
+from database.connection import database_proxy
+from database.models import User
+from observability.metrics import get_metrics_snapshot, prometheus_format
+from observability.middleware import MetricsMiddleware
+
+
+@pytest.fixture
+def client(tmp_path):
+    """App with MetricsMiddleware over a file SQLite DB (requests run on other threads)."""
+    db = SqliteDatabase(str(tmp_path / "metrics.db"), check_same_thread=False)
+    database_proxy.initialize(db)
+    db.create_tables([User])
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/users/{n}")
+    def lookups(n: int, request: Request):  # sync route: runs in a worker thread
+        for _ in range(n):
+            User.select().where(User.email == "nobody@example.com").exists()
+        return {"queries": request.state.query_profile.count}
+
+    yield TestClient(app)
+    database_proxy.initialize(None)
+    db.close()
+
+
+def test_server_timing_and_metrics(client, monkeypatch: pytest.MonkeyPatch) -> None:
+    from observability import middleware
+
+    monkeypatch.setattr(middleware, "SERVER_TIMING_ENABLED", False)  # default unless DEBUG
+    assert "server-timing" not in client.get("/users/2").headers
+    monkeypatch.setattr(middleware, "SERVER_TIMING_ENABLED", True)
+    response = client.get("/users/2")
+    assert response.status_code == 200
+    assert response.json() == {"queries": 2}
+    timing = response.headers["server-timing"]
+    assert 'desc="2 queries"' in timing and "app;dur=" in timing
+    snap = get_metrics_snapshot()
+    assert snap["db_query_count"]["GET_/users/2"] >= 2
+    assert any(q["path"] == "GET_/users/2" for q in snap["slow_queries"])
+    assert 'db_queries_total{path="GET_/users/2"}' in prometheus_format()
+
+
+def test_n_plus_one_raise_mode_flags_without_failing(client, monkeypatch: pytest.MonkeyPatch, caplog) -> None:
+    monkeypatch.setenv("DB_N_PLUS_ONE_THRESHOLD", "3")
+    monkeypatch.setenv("DB_N_PLUS_ONE_ACTION", "raise")
+    ok = client.get("/users/2")
+    assert ok.status_code == 200 and "x-n-plus-one" not in ok.headers
+    with caplog.at_level("ERROR", logger="observability.middleware"):
+        flagged = client.get("/users/3")
+    assert flagged.status_code == 200  # the handler succeeded; the detector does not turn it into a 500
+    assert flagged.json() == {"queries": 3}
+    assert flagged.headers["x-n-plus-one"] == "3"
+    assert any("Possible N+1 on GET /users/3" in r.getMessage() for r in caplog.records)
+    monkeypatch.setenv("DB_N_PLUS_ONE_ACTION", "log")
+    assert "x-n-plus-one" not in client.get("/users/3").headers
@@ -0,0 +1,105 @@
+"""Tests for the bounded password hashing pool, 429 on overload and rehash on login."""
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+
+from core.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+def test_rejects_when_workers_and_queue_are_full():
+    hasher = PasswordHasher(workers=1, max_queue=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow(_):
+        started.set()
+        release.wait(5)
+        return "done"
+
+    running = threading.Thread(target=hasher._run, args=("hash", slow, "a"))
+    running.start()
+    started.wait(5)
+    queued = threading.Thread(target=hasher._run, args=("hash", slow, "b"))
+    queued.start()
+    deadline = time.monotonic() + 5
+    while hasher.stats()["queued"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    with pytest.raises(PasswordHasherBusyError):
+        hasher.hash("SecureP4ss")
+    release.set()
+    running.join(5)
+    queued.join(5)
+    stats = hasher.stats()
+    assert stats["rejected"] == 1 and stats["hashes"] == 2
+    assert stats["queued"] == 0 and stats["active"] == 0
+    hasher.shutdown()
+
+
+def test_hash_and_verify_on_pool(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("BCRYPT_SALT_ROUNDS", "10")
+    hasher = PasswordHasher(workers=2, max_queue=4)
+    hashed = hasher.hash("SecureP4ss")
+    assert hasher.verify("SecureP4ss", hashed) is True
+    assert hasher.verify("wrong", hashed) is False
+    assert hasher.stats()["verifies"] == 2
+    hasher.shutdown()
+
+
+def test_login_route_answers_429_when_hasher_is_busy(monkeypatch: pytest.MonkeyPatch):
+    """Default config: the hasher queue, not the "auth" route-group gate, bounds concurrent logins."""
+    import asyncio
+    import types
+
+    import httpx
+
+    from core import password_hasher
+    from routes import auth
+
+    release = threading.Event()
+
+    def slow_verify(password, hashed):
+        release.wait(10)
+        return True
+
+    class Service:
+        def start_login(self, email, ip_address=None):
+            return types.SimpleNamespace(email=email, password_hash="stored-hash")
+
+        def finish_login(self, user, password, verified, ip_address=None):
+            return {"token": "t", "user": {"email": user.email}}
+
+    monkeypatch.setenv("AUTH_PROVIDER", "jwt")
+    monkeypatch.setattr(auth, "_auth_service", Service)
+    monkeypatch.setattr(password_hasher, "verify_password", slow_verify)
+    monkeypatch.setattr(password_hasher, "_hasher", None)
+    hasher = password_hasher.get_password_hasher()
+    capacity = hasher.workers + hasher.max_queue
+    extra = 5
+    app = FastAPI()
+    app.include_router(auth.router)
+
+    async def burst():
+        async def release_when_shed():
+            deadline = time.monotonic() + 5
+            while hasher.stats()["rejected"] < extra and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            release.set()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            body = {"email": "u@example.com", "password": "SecureP4ss"}
+            logins = [client.post("/auth/login", json=body) for _ in range(capacity + extra)]
+            *responses, _ = await asyncio.gather(*logins, release_when_shed())
+        return responses
+
+    try:
+        responses = asyncio.run(burst())
+    finally:
+        release.set()
+        password_hasher.shutdown_password_hasher()
+    statuses = [r.status_code for r in responses]
+    assert statuses.count(200) == capacity
+    assert statuses.count(429) == extra
+    assert all(r.headers["retry-after"] == "1" for r in responses if r.status_code == 429)
@@ -0,0 +1,162 @@
+"""Tests for interaction capture: batch endpoint, sampling, per-type limits and buffered writes."""
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from peewee import SqliteDatabase
+
+from auth_deps import get_principal
+from core.buffered_writer import stop_buffered_writers
+from core.principal import Principal
+from database.connection import database_proxy
+from database.models import User, UserInteraction, UserPreferenceRollup
+from routes import preferences
+from services import preference_service
+from services.preference_service import PreferenceService, _TypeLimiter, start_interaction_writer
+
+
+@pytest.fixture
+def interactions_db(memory_db):
+    memory_db.create_tables([UserInteraction, UserPreferenceRollup])
+    return memory_db
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(preference_service, "_limiter", _TypeLimiter())
+
+
+def test_batch_is_inserted_without_per_row_queries(interactions_db, make_user, monkeypatch: pytest.MonkeyPatch):
+    user = make_user()
+    statements: list[str] = []
+    original = interactions_db.execute_sql
+    monkeypatch.setattr(interactions_db, "execute_sql", lambda sql, *a, **k: statements.append(sql) or original(sql, *a, **k))
+    items = [{"interaction_type": "page_view", "target_id": f"/page/{i}"} for i in range(40)]
+    result = PreferenceService().record_interactions(str(user.id), items)
+    assert result["success"] is True
+    assert result["data"] == {"accepted": 40, "sampledOut": 0, "limited": 0, "dropped": 0}
+    queries = [s for s in statements if s.startswith(("SELECT", "INSERT", "UPDATE"))]
+    assert len(queries) == 3  # user exists check, interactions insert, rollup upsert
+    assert UserInteraction.select().count() == 40
+
+
+def test_sampling_and_type_limits(interactions_db, make_user, monkeypatch: pytest.MonkeyPatch):
+    user = make_user()
+    monkeypatch.setattr(preference_service, "INTERACTION_SAMPLE_RATES", {"scroll": 0.0, "hover": 0.5})
+    monkeypatch.setattr(preference_service, "INTERACTION_TYPE_LIMITS", {"page_view": 3})
+    monkeypatch.setattr(preference_service.random, "random", lambda: 0.25)  # keep every 0.5-rate event
+    items = (
+        [{"interaction_type": "page_view"}] * 5
+        + [{"interaction_type": "scroll"}] * 4
+        + [{"interaction_type": "hover", "metadata": {"x": 1}}]
+    )
+    result = PreferenceService().record_interactions(str(user.id), items)
+    assert result["data"] == {"accepted": 4, "sampledOut": 4, "limited": 2, "dropped": 0}
+    hover = UserInteraction.get(UserInteraction.interaction_type == "hover")
+    assert json.loads(hover.metadata_json) == {"x": 1, "sample_rate": 0.5}
+    # The limit is per user per minute: a second batch in the same window is still capped.
+    again = PreferenceService().record_interactions(str(user.id), [{"interaction_type": "page_view"}])
+    assert again["data"]["limited"] == 1
+
+
+def test_limiter_window_resets() -> None:
+    limiter = _TypeLimiter()
+    assert [limiter.allow("u", "page_view", 2, now=0) for _ in range(3)] == [True, True, False]
+    assert limiter.allow("u", "page_view", 2, now=61)
+    assert limiter.allow("other", "page_view", 2, now=0)
+
+
+def test_batch_too_large(interactions_db, make_user, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(preference_service, "INTERACTION_BATCH_MAX", 2)
+    result = PreferenceService().record_interactions(str(make_user().id), [{"interaction_type": "x"}] * 3)
+    assert result["success"] is False
+    assert result["data"]["code"] == "batch_too_large"
+
+
+def test_buffered_writer_path(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "interactions.db"), check_same_thread=False)
+    database_proxy.initialize(db)
+    db.create_tables([User, UserInteraction, UserPreferenceRollup])
+    try:
+        user = User.create(email="pv@example.com", password_hash="x")
+        writer = start_interaction_writer()
+        assert writer is not None
+        result = PreferenceService().record_interactions(str(user.id), [{"interaction_type": "page_view"}] * 3)
+        assert result["data"]["accepted"] == 3
+        stop_buffered_writers()
+        assert writer.stats()["written"] == 3
+        assert UserInteraction.select().count() == 3
+    finally:
+        stop_buffered_writers()
+        database_proxy.initialize(None)
+        db.close()
+
+
+def test_interactions_endpoint(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "route.db"), check_same_thread=False)
+    database_proxy.initialize(db)
+    db.create_tables([User, UserInteraction, UserPreferenceRollup])
+    try:
+        user = User.create(email="route@example.com", password_hash="x")
+        app = FastAPI()
+        app.include_router(preferences.router)
+        app.dependency_overrides[get_principal] = lambda: Principal(user_id=str(user.id))
+        client = TestClient(app)
+        body = {"interactions": [{"interaction_type": "page_view", "target_id": "/dashboard"}] * 2}
+        response = client.post("/preferences/interactions", json=body)
+        assert response.status_code == 202
+        assert response.json()["data"]["accepted"] == 2
+        assert UserInteraction.select().count() == 2
+        too_many = {"interactions": [{"interaction_type": "page_view"}] * (preference_service.INTERACTION_BATCH_MAX + 1)}
+        assert client.post("/preferences/interactions", json=too_many).status_code == 422
+    finally:
+        database_proxy.initialize(None)
+        db.close()
+
+
+def test_rollups_track_writes_and_drive_recommendations(interactions_db, make_user):
+    user = make_user()
+    svc = PreferenceService()
+    svc.record_interactions(str(user.id), [{"interaction_type": "page_view", "target_id": "/dashboard"}] * 3)
+    svc.record_interaction(str(user.id), "page_view", target_id="/dashboard")
+    counts = {
+        (r.dimension, r.key): r.count
+        for r in UserPreferenceRollup.select().where(UserPreferenceRollup.user == user.id)
+    }
+    assert counts == {("type", "page_view"): 4, ("target", "/dashboard"): 4}
+    titles = [r["title"] for r in svc.get_recommendations(str(user.id))["data"]["recommendations"]]
+    assert titles == ["Complete an application", "File or track a complaint", "Explore public data"]
+    svc.record_interaction(str(user.id), "page_view", target_id="/my-complaints-archive")
+    titles = [r["title"] for r in svc.get_recommendations(str(user.id))["data"]["recommendations"]]
+    assert "File or track a complaint" in titles  # a segment match, not a substring
+    svc.record_interaction(str(user.id), "page_view", target_id="/Complaints/42")
+    titles = [r["title"] for r in svc.get_recommendations(str(user.id))["data"]["recommendations"]]
+    assert "File or track a complaint" not in titles
+
+
+def test_rollups_weight_sampled_interactions(interactions_db, make_user, monkeypatch):
+    user = make_user()
+    svc = PreferenceService()
+    monkeypatch.setattr(preference_service, "INTERACTION_SAMPLE_RATES", {"scroll": 0.25})
+    monkeypatch.setattr(preference_service.random, "random", lambda: 0.0)  # keep every sampled event
+    svc.record_interactions(str(user.id), [{"interaction_type": "scroll", "target_id": "/data"}] * 2)
+    svc.record_interaction(str(user.id), "page_view")
+    counts = {(r.dimension, r.key): r.count for r in UserPreferenceRollup.select()}
+    assert counts == {("type", "scroll"): 8, ("target", "/data"): 8, ("type", "page_view"): 1}
+    UserPreferenceRollup.update(count=0).execute()
+    svc.rebuild_rollups(str(user.id))
+    assert {(r.dimension, r.key): r.count for r in UserPreferenceRollup.select()} == counts
+
+
+def test_rebuild_recomputes_from_interactions(interactions_db, make_user):
+    user, other = make_user(), make_user()
+    svc = PreferenceService()
+    svc.record_interactions(str(user.id), [{"interaction_type": "page_view", "target_id": "/a"}] * 2)
+    svc.record_interactions(str(other.id), [{"interaction_type": "form_section"}])
+    UserPreferenceRollup.update(count=99).execute()  # drift
+    UserPreferenceRollup.delete().where(UserPreferenceRollup.user == other.id).execute()
+    assert svc.rebuild_rollups(str(user.id))["data"]["rows"] == 2
+    assert svc.rebuild_rollups()["data"]["rows"] == 3
+    counts = {(r.user_id, r.key): r.count for r in UserPreferenceRollup.select()}
+    assert counts == {(user.id, "page_view"): 2, (user.id, "/a"): 2, (other.id, "form_section"): 1}
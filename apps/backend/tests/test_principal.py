@@ -0,0 +1,178 @@
+"""Tests for request principal resolution: role claims, one query per resolution, cached across requests, invalidation."""
+import time
+from uuid import uuid4
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from peewee import SqliteDatabase
+
+from auth_deps import get_current_user, get_principal, user_id_or_401
+from core import principal as principal_module
+from core.principal import (
+    Principal,
+    cached_principal,
+    invalidate_principal,
+    load_principal,
+    principal_claims,
+    principal_from_claims,
+    resolve_principal,
+)
+from database.connection import database_proxy
+from database.instrumentation import profile_queries
+from database.models import ForestryBoard, User
+from services.auth_service import UserAuthenticationService
+
+
+def _board(user, county="Baltimore"):
+    return ForestryBoard.create(user=user, county=county, board_member_name="Member", email=user.email)
+
+
+def test_resolves_uuid_subject_with_one_query(memory_db, make_user):
+    user = make_user(email="admin@example.com")
+    board = _board(user)
+    with profile_queries() as profile:
+        p = resolve_principal({"sub": str(user.id)})
+    assert profile.count == 1  # users left-joined to forestry_board
+    assert p == Principal(
+        user_id=str(user.id),
+        email="admin@example.com",
+        is_admin=True,
+        board_member_id=str(board.id),
+        board_county="Baltimore",
+    )
+
+
+def test_resolves_email_subject(memory_db, make_user):
+    user = make_user(email="citizen@example.com")
+    p = resolve_principal({"sub": "Citizen@Example.com"})
+    assert p.user_id == str(user.id)
+    assert not p.is_admin and not p.is_board_member
+    assert resolve_principal({"sub": "nobody@example.com"}).user_id is None
+    assert resolve_principal({}).user_id is None
+
+
+def test_cached_until_invalidated(memory_db, make_user):
+    user = make_user()
+    claims = {"sub": str(user.id), "email": user.email}
+    assert cached_principal(claims) is None
+    load_principal(claims)
+    with profile_queries() as profile:
+        assert cached_principal(claims).user_id == str(user.id)
+    assert profile.count == 0
+    _board(user)
+    assert not cached_principal(claims).is_board_member  # stale until invalidated
+    invalidate_principal(user_id=user.id)
+    assert cached_principal(claims) is None
+    assert load_principal(claims).is_board_member
+
+
+def test_register_invalidates_cached_missing_user(memory_db, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("services.auth_service.send_email", None)
+    claims = {"sub": "new@example.com"}
+    assert load_principal(claims).user_id is None
+    UserAuthenticationService().register("new@example.com", "Password1")
+    assert cached_principal(claims) is None
+    assert load_principal(claims).user_id is not None
+
+
+def test_dependency_resolves_once_then_hits_cache(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    db = SqliteDatabase(str(tmp_path / "principal.db"), check_same_thread=False)
+    database_proxy.initialize(db)
+    db.create_tables([User, ForestryBoard])
+    try:
+        user = User.create(email="board@example.com", password_hash="x")
+        _board(user, county="Montgomery")
+        resolutions = []
+        original = principal_module.resolve_principal
+        monkeypatch.setattr(principal_module, "resolve_principal", lambda c: resolutions.append(c) or original(c))
+        app = FastAPI()
+
+        @app.get("/me")
+        async def me(principal: Principal = Depends(get_principal)):
+            user_id, err = user_id_or_401(principal)
+            if err is not None:
+                return err
+            return {"id": user_id, "county": principal.board_county}
+
+        app.dependency_overrides[get_current_user] = lambda: {"sub": "board@example.com"}
+        client = TestClient(app)
+        for _ in range(3):
+            response = client.get("/me")
+            assert response.json() == {"id": str(user.id), "county": "Montgomery"}
+        assert len(resolutions) == 1
+        app.dependency_overrides[get_current_user] = lambda: {"sub": "ghost@example.com"}
+        assert client.get("/me").status_code == 401
+    finally:
+        database_proxy.initialize(None)
+        db.close()
+
+
+def test_role_claims_authorize_without_database():
+    board_member = Principal(user_id=str(uuid4()), email="b@example.com", board_member_id=str(uuid4()), board_county="Kent")
+    claims = {"sub": board_member.user_id, "email": "b@example.com", "iat": int(time.time()) + 1, **principal_claims(board_member)}
+    assert claims["roles"] == ["user", "board_member"]
+    assert principal_from_claims(claims) == board_member  # no database bound at all
+    assert principal_from_claims({"sub": "mock@example.com", "roles": ["user"]}) is None
+    assert principal_from_claims({"sub": board_member.user_id}) is None  # token without role claims
+
+
+def test_role_claims_ignored_after_roles_change():
+    user_id = str(uuid4())
+    admin = Principal(user_id=user_id, email="admin@example.com", is_admin=True)
+    claims = {"sub": user_id, "email": "admin@example.com", "iat": int(time.time()) - 5, **principal_claims(admin)}
+    assert principal_from_claims(claims).is_admin
+    invalidate_principal(user_id=user_id)
+    assert principal_from_claims(claims) is None  # falls back to a database lookup
+    assert principal_from_claims({**claims, "iat": int(time.time()) + 1}).is_admin  # refreshed token
+
+
+def test_ten_minute_old_token_authorizes_without_queries(memory_db, make_user):
+    user = make_user(email="board@example.com")
+    board_member = Principal(
+        user_id=str(user.id), email="board@example.com", board_member_id=str(_board(user).id), board_county="Baltimore"
+    )
+    claims = {"sub": str(user.id), "email": "board@example.com", "iat": int(time.time()) - 600, **principal_claims(board_member)}
+    with profile_queries() as profile:
+        assert principal_from_claims(claims) == board_member
+    assert profile.count == 0
+
+
+def test_role_claims_trusted_only_within_claims_ttl(monkeypatch):
+    board_member = Principal(user_id=str(uuid4()), email="b@example.com", board_member_id=str(uuid4()), board_county="Kent")
+    claims = {"sub": board_member.user_id, "email": "b@example.com", **principal_claims(board_member)}
+    monkeypatch.setenv("JWT_EXPIRE_SECONDS", "7200")
+    assert principal_from_claims({**claims, "iat": int(time.time()) - 7000}) == board_member
+    assert principal_from_claims({**claims, "iat": int(time.time()) - 7300}) is None  # past the token lifetime
+    monkeypatch.setattr(principal_module, "PRINCIPAL_CLAIMS_TTL_SECONDS", 30)
+    assert principal_from_claims({**claims, "iat": int(time.time()) - 10}) == board_member
+    assert principal_from_claims({**claims, "iat": int(time.time()) - 60}) is None
+    assert principal_from_claims(claims) is None  # no iat at all
+
+
+def test_role_change_in_another_worker_reaches_claims(monkeypatch):
+    """invalidate_principal records the change in the shared auth state; claims issued before it are ignored."""
+    from authentication.utils.shared_state import MemoryState
+
+    state = MemoryState()
+    monkeypatch.setattr(principal_module, "get_shared_state", lambda: state)
+    user_id = str(uuid4())
+    claims = {"sub": user_id, "email": "b@example.com", "iat": int(time.time()) - 600, "roles": ["user", "board_member"]}
+    assert principal_from_claims(claims) is not None
+    invalidate_principal(user_id=user_id)
+    principal_module._roles_changed_at.clear()  # as seen from a worker that did not make the change
+    assert principal_from_claims(claims) is None
+    assert principal_from_claims({**claims, "iat": int(time.time()) + 1}) is not None  # refreshed token
+
+
+def test_admin_flag_rechecked_against_admin_emails(monkeypatch, memory_db, make_user):
+    user = make_user(email="admin@example.com")
+    claims = {"sub": str(user.id), "email": "admin@example.com", "iat": int(time.time())}
+    token_claims = {**claims, **principal_claims(Principal(user_id=str(user.id), email="admin@example.com", is_admin=True))}
+    load_principal(claims)
+    monkeypatch.setattr(principal_module, "ADMIN_EMAILS", set())  # removed from ADMIN_EMAILS since issue
+    assert not principal_from_claims(token_claims).is_admin
+    assert not cached_principal(claims).is_admin
+    other = {**claims, "email": "b@example.com", "roles": ["user", "admin"]}
+    monkeypatch.setattr(principal_module, "ADMIN_EMAILS", {"admin@example.com"})
+    assert not principal_from_claims(other).is_admin  # the roles claim alone never grants admin
@@ -0,0 +1,86 @@
+"""Tests for the service execution layer: off-loop service calls and per-group limits."""
+import asyncio
+import time
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from core.service_executor import ServiceExecutor
+
+
+def test_group_limit_queues_excess_calls():
+    """With a group limit of 1, a second call waits (queue depth 1) until the first finishes."""
+    executor = ServiceExecutor(max_workers=4, group_limits={"documents": 1})
+    observed: list[dict] = []
+
+    async def main():
+        slow = asyncio.create_task(executor.run("documents", time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+        queued = asyncio.create_task(executor.run("documents", lambda: "done"))
+        await asyncio.sleep(0.05)
+        observed.append(executor.stats()["groups"]["documents"])
+        await slow
+        return await queued
+
+    try:
+        assert asyncio.run(main()) == "done"
+    finally:
+        executor.shutdown()
+    assert observed[0]["limit"] == 1
+    assert observed[0]["active"] == 1
+    assert observed[0]["waiting"] == 1
+    final = executor.stats()["groups"]["documents"]
+    assert final["calls"] == 2
+    assert final["waiting"] == 0 and final["active"] == 0
+
+
+def test_event_loop_stays_responsive_during_slow_service_call(monkeypatch: pytest.MonkeyPatch):
+    """A slow (blocking) auto-save must not stall the loop or other in-flight requests."""
+    from auth_deps import get_principal
+    from core.principal import Principal
+    from main import app
+    from services.contact_information_service import ContactInformationService
+
+    def slow_put_contact(self, application_id, user_id, payload):
+        time.sleep(0.5)  # simulate a slow query holding the worker thread
+        return {"success": True, "data": {"contact_information": payload}}
+
+    monkeypatch.setattr(ContactInformationService, "put_contact", slow_put_contact)
+    user_id = str(uuid4())
+    app.dependency_overrides[get_principal] = lambda: Principal(user_id=user_id)
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            ticks = 0
+            stop = asyncio.Event()
+
+            async def ticker():
+                nonlocal ticks
+                while not stop.is_set():
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            tick_task = asyncio.create_task(ticker())
+            slow = asyncio.create_task(
+                client.put(f"/api/v1/applications/{uuid4()}/contact-information", json={"city": "Towson"})
+            )
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            health = await client.get("/api/health")
+            health_elapsed = time.perf_counter() - start
+            slow_resp = await slow
+            stop.set()
+            await tick_task
+            return ticks, health, health_elapsed, slow_resp
+
+    try:
+        ticks, health, health_elapsed, slow_resp = asyncio.run(main())
+    finally:
+        app.dependency_overrides.pop(get_principal, None)
+    assert slow_resp.status_code == 200
+    assert health.status_code == 200
+    assert health_elapsed < 0.3
+    # ~50 ticks fit in 0.5s; a blocked loop would manage only a handful.
+    assert ticks >= 20
@@ -0,0 +1,71 @@
+"""Tests for fast start: fingerprinted bootstrap, leader lock and startup report."""
+import threading
+
+import pytest
+
+from core.startup import StartupReport, bootstrap_database, compute_fingerprint, stored_fingerprint
+
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """File-backed SQLite bound to the model proxy (migrations create the schema)."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'startup.db'}")
+    monkeypatch.delenv("MOCK_AUTH_USERS", raising=False)
+    import database.connection as conn
+    conn._db = None
+    db = conn.init_db()
+    yield db
+    conn.close_db()
+
+
+def test_bootstrap_runs_once_then_skips(file_db) -> None:
+    """First boot migrates and seeds; a boot with the same fingerprint skips both."""
+    from database.models import County
+
+    first = StartupReport()
+    assert bootstrap_database(file_db, first, mode="auto") is True
+    assert stored_fingerprint(file_db) == compute_fingerprint()
+    assert County.select().count() > 0
+    assert {name for name, _ in first.steps} >= {"migrations", "seed_counties", "seed_users"}
+
+    second = StartupReport()
+    assert bootstrap_database(file_db, second, mode="auto") is False
+    assert [name for name, _ in second.steps] == ["fingerprint"]
+    assert "unchanged" in second.notes[0]
+
+
+def test_fingerprint_tracks_seed_settings(file_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Changing MOCK_AUTH_USERS changes the fingerprint, so the next boot seeds again."""
+    from database.models import User
+
+    assert bootstrap_database(file_db, mode="auto") is True
+    monkeypatch.setenv("MOCK_AUTH_USERS", "new.user@example.com:pw")
+    assert stored_fingerprint(file_db) != compute_fingerprint()
+    assert bootstrap_database(file_db, mode="auto") is True
+    assert User.select().where(User.email == "new.user@example.com").exists()
+
+
+def test_modes_off_and_always(file_db) -> None:
+    """off never bootstraps; always ignores a matching fingerprint."""
+    assert bootstrap_database(file_db, mode="off") is False
+    assert stored_fingerprint(file_db) is None
+    assert bootstrap_database(file_db, mode="auto") is True
+    assert bootstrap_database(file_db, mode="always") is True
+
+
+def test_concurrent_workers_bootstrap_once(file_db) -> None:
+    """Workers racing at startup take the leader lock; only one runs migrations and seeds."""
+    results: list[bool] = []
+    barrier = threading.Barrier(3)
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(bootstrap_database(file_db, mode="auto"))
+        file_db.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(results) == [False, False, True]
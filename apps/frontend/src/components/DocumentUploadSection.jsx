@@ -5,7 +5,7 @@ import {
   getDocumentStatus,
   getThumbnailUrl,
   listDocuments,
-  uploadDocument,
+  uploadDocumentDirect,
 } from '../services/documentApi';
 import { getErrorMessage } from '../utils/errorHandler';
 import { Button, ConfirmationDialog, Modal } from './ui';
@@ -120,7 +120,7 @@ export function DocumentUploadSection({ applicationId, applicationStatus = 'draf
     const file = files[0];
     setUploading((prev) => ({ ...prev, [category]: true }));
     setUploadProgress((prev) => ({ ...prev, [category]: 0 }));
-    uploadDocument(applicationId, file, category, (p) => {
+    uploadDocumentDirect(applicationId, file, category, (p) => {
       setUploadProgress((prev) => ({ ...prev, [category]: p }));
     })
       .then(() => {
@@ -6,7 +6,7 @@ import { Button } from '../components/ui';
 import { LoadingSpinner } from '../components/LoadingSpinner';
 
 export function AdminComplaintsPage() {
-  const [data, setData] = useState({ items: [], total: 0 });
+  const [data, setData] = useState({ items: [], total: 0, nextCursor: null });
   const [categories, setCategories] = useState({ categories: [], statuses: [] });
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
@@ -14,17 +14,19 @@ export function AdminComplaintsPage() {
   const [categoryFilter, setCategoryFilter] = useState('');
   const [updatingId, setUpdatingId] = useState(null);
 
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const filters = () => ({ status: statusFilter || undefined, category: categoryFilter || undefined });
+
   const load = () => {
     setLoading(true);
     setError('');
-    Promise.all([
-      listAllComplaints({ status: statusFilter || undefined, category: categoryFilter || undefined }),
-      getCategories(),
-    ])
+    Promise.all([listAllComplaints(filters()), getCategories()])
       .then(([listData, catData]) => {
         setData({
           items: listData?.items ?? listData ?? [],
           total: listData?.total ?? (Array.isArray(listData) ? listData.length : 0),
+          nextCursor: listData?.next_cursor ?? null,
         });
         setCategories({
           categories: catData?.categories ?? [],
@@ -35,6 +37,20 @@ export function AdminComplaintsPage() {
       .finally(() => setLoading(false));
   };
 
+  const loadMore = () => {
+    setLoadingMore(true);
+    listAllComplaints({ ...filters(), cursor: data.nextCursor })
+      .then((listData) => {
+        setData((prev) => ({
+          items: [...prev.items, ...(listData?.items ?? [])],
+          total: listData?.total ?? prev.total,
+          nextCursor: listData?.next_cursor ?? null,
+        }));
+      })
+      .catch((err) => setError(getErrorMessage(err)))
+      .finally(() => setLoadingMore(false));
+  };
+
   useEffect(() => { load(); }, [statusFilter, categoryFilter]);
 
   const handleStatusChange = (complaintId, newStatus) => {
@@ -115,6 +131,13 @@ export function AdminComplaintsPage() {
               </tbody>
             </table>
             {data.items.length === 0 && <p style={{ marginTop: '0.5rem' }}>No complaints match the filters.</p>}
+            {data.nextCursor && (
+              <p style={{ marginTop: '0.5rem' }}>
+                <Button type="button" variant="secondary" onClick={loadMore} disabled={loadingMore}>
+                  {loadingMore ? 'Loading…' : `Load more (${data.items.length} of ${data.total})`}
+                </Button>
+              </p>
+            )}
           </div>
         )}
       </div>
@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
-import { apiJson } from '../services/api';
+import { apiJsonAllPages } from '../services/api';
 import { recordInteraction, getRecommendations } from '../services/preferenceApi';
 import { getErrorMessage } from '../utils/errorHandler';
 import { Button } from '../components/ui';
@@ -28,11 +28,9 @@ export function DashboardPage() {
 
   useEffect(() => {
     let cancelled = false;
-    apiJson('/api/v1/applications')
-      .then((res) => {
-        if (cancelled) return;
-        const data = res?.data ?? res;
-        setApplications(Array.isArray(data) ? data : []);
+    apiJsonAllPages('/api/v1/applications?limit=200')
+      .then((apps) => {
+        if (!cancelled) setApplications(apps);
       })
       .catch((err) => {
         if (!cancelled) setError(getErrorMessage(err));
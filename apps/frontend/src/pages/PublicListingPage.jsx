@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
-import { apiJson } from '../services/api';
+import { apiJsonAllPages } from '../services/api';
 import { getProgramConfig } from '../services/publicApi';
 import { ProgramInfoDisplay } from '../components/public/ProgramInfoDisplay';
 import { ResourceDownloader } from '../components/public/ResourceDownloader';
@@ -72,12 +72,9 @@ export function PublicListingPage() {
   useEffect(() => {
     if (!isAuthenticated) return;
     let cancelled = false;
-    apiJson('/api/v1/applications')
-      .then((res) => {
-        if (cancelled) return;
-        const data = res?.data ?? res;
-        const apps = Array.isArray(data) ? data : [];
-        setDraftApplications(apps.filter((a) => a?.status === 'draft'));
+    apiJsonAllPages('/api/v1/applications?limit=200')
+      .then((apps) => {
+        if (!cancelled) setDraftApplications(apps.filter((a) => a?.status === 'draft'));
       })
       .catch(() => {
         if (!cancelled) setDraftApplications([]);
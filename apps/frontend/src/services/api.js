@@ -43,4 +43,29 @@ export async function apiJson(path, options = {}) {
   return data;
 }
 
+const listPage = (body) => ({
+  items: Array.isArray(body?.data) ? body.data : [],
+  nextCursor: body?.pagination?.next_cursor ?? null,
+});
+
+/**
+ * Follow a cursor-paginated list endpoint to its last page and return every item.
+ * @param {string} path - List path, may already carry a query string (e.g. '?limit=200')
+ * @param {(body: unknown) => { items: unknown[], nextCursor: string | null }} [pageOf] -
+ *   Reads one response body; default is the { data: [...], pagination: { next_cursor } } shape.
+ * @returns {Promise<unknown[]>}
+ */
+export async function apiJsonAllPages(path, pageOf = listPage) {
+  const items = [];
+  let cursor = null;
+  do {
+    const sep = path.includes('?') ? '&' : '?';
+    const body = await apiJson(cursor ? `${path}${sep}cursor=${encodeURIComponent(cursor)}` : path);
+    const page = pageOf(body);
+    items.push(...page.items);
+    cursor = page.nextCursor;
+  } while (cursor);
+  return items;
+}
+
 export { getBaseUrl, getToken };
@@ -1,15 +1,18 @@
 /**
  * Forestry Board API: list applications, get details, approve, request revision.
  */
-import { apiJson } from './api';
+import { apiJson, apiJsonAllPages } from './api';
 
 /**
- * List applications for the current board member's county.
+ * List applications for the current board member's county (follows nextCursor through every page).
  * @returns {Promise<{ applications: Array<{ applicationId, applicantName, organizationName, projectName, county, status, submittedForReviewDate }> }>}
  */
 export async function listBoardApplications() {
-  const res = await apiJson('/api/v1/board/board-members/me/applications');
-  return res?.data ?? res;
+  const applications = await apiJsonAllPages('/api/v1/board/board-members/me/applications?limit=200', (res) => ({
+    items: res?.data?.applications ?? [],
+    nextCursor: res?.data?.nextCursor ?? null,
+  }));
+  return { applications };
 }
 
 /**
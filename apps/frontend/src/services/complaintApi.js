@@ -2,7 +2,7 @@
  * Complaint API: submit, list mine, get one, categories.
  * Admin: list all, update status, assign (uses same apiFetch with token).
  */
-import { apiFetch, apiJson } from './api';
+import { apiFetch, apiJson, apiJsonAllPages } from './api';
 
 const V1 = '/api/v1/complaints';
 
@@ -24,10 +24,9 @@ export async function submitComplaint({ subject, description, category = 'other'
   return data?.data ?? data;
 }
 
-/** List current user's complaints (requires auth). */
+/** List current user's complaints, every page (requires auth). */
 export async function listMyComplaints() {
-  const data = await apiJson(`${V1}`);
-  return data?.data ?? data;
+  return apiJsonAllPages(`${V1}?limit=200`);
 }
 
 /** Get one complaint by id (own or admin). */
@@ -36,13 +35,13 @@ export async function getComplaint(id) {
   return data?.data ?? data;
 }
 
-/** Admin: list all complaints. */
-export async function listAllComplaints({ status: statusFilter, category, limit = 100, offset = 0 } = {}) {
+/** Admin: list all complaints (newest first; pass the previous page's next_cursor for more). */
+export async function listAllComplaints({ status: statusFilter, category, limit = 100, cursor } = {}) {
   const params = new URLSearchParams();
   if (statusFilter) params.set('status_filter', statusFilter);
   if (category) params.set('category', category);
   params.set('limit', String(limit));
-  params.set('offset', String(offset));
+  if (cursor) params.set('cursor', cursor);
   const data = await apiJson(`${V1}/admin/all?${params.toString()}`);
   return data?.data ?? data;
 }
@@ -1,5 +1,5 @@
 /**
- * Document management API: upload, list, status, download, delete.
+ * Document management API: upload (through the API or direct to storage), list, status, download, delete.
  */
 import { apiFetch, apiJson, getBaseUrl, getToken } from './api';
 
@@ -12,22 +12,17 @@ const authHeaders = () => {
 };
 
 /**
- * Upload a document. Uses multipart/form-data.
- * @param {string} applicationId
- * @param {File} file
- * @param {string} category - site_plan | site_photos | supporting_documents
+ * Send a request body with upload progress; resolves with the JSON response ({} when empty).
+ * @param {string} method
+ * @param {string} url
+ * @param {Document|XMLHttpRequestBodyInit} body
+ * @param {Record<string, string>} headers
  * @param {(percent: number) => void} [onProgress]
- * @returns {Promise<{ success: boolean, data?: object }>}
  */
-export async function uploadDocument(applicationId, file, category, onProgress) {
-  const formData = new FormData();
-  formData.append('file', file);
-  formData.append('category', category);
-
-  const url = `${base()}/api/v1/applications/${applicationId}/documents`;
+function sendWithProgress(method, url, body, headers, onProgress) {
   const xhr = new XMLHttpRequest();
-  xhr.open('POST', url);
-  xhr.setRequestHeader('Authorization', `Bearer ${getToken()}`);
+  xhr.open(method, url);
+  Object.entries(headers).forEach(([name, value]) => xhr.setRequestHeader(name, value));
   xhr.responseType = 'json';
 
   return new Promise((resolve, reject) => {
@@ -37,22 +32,83 @@ export async function uploadDocument(applicationId, file, category, onProgress)
       }
     };
     xhr.onload = () => {
-      try {
-        const data = xhr.response && typeof xhr.response === 'object' ? xhr.response : JSON.parse(xhr.responseText || '{}');
-        if (xhr.status >= 200 && xhr.status < 300) {
-          resolve(data);
-        } else {
-          const err = new Error(data?.message ?? data?.detail ?? 'Upload failed');
-          err.status = xhr.status;
-          err.data = data;
-          reject(err);
-        }
-      } catch {
-        reject(new Error('Invalid response'));
+      const data = xhr.response && typeof xhr.response === 'object' ? xhr.response : {};
+      if (xhr.status >= 200 && xhr.status < 300) {
+        resolve(data);
+      } else {
+        const err = new Error(data?.message ?? data?.detail ?? 'Upload failed');
+        err.status = xhr.status;
+        err.data = data;
+        reject(err);
       }
     };
     xhr.onerror = () => reject(new Error('Network error'));
-    xhr.send(formData);
+    xhr.send(body);
+  });
+}
+
+/**
+ * Upload a document. Uses multipart/form-data.
+ * @param {string} applicationId
+ * @param {File} file
+ * @param {string} category - site_plan | site_photos | supporting_documents
+ * @param {(percent: number) => void} [onProgress]
+ * @returns {Promise<{ success: boolean, data?: object }>}
+ */
+export async function uploadDocument(applicationId, file, category, onProgress) {
+  const formData = new FormData();
+  // Category first: the API streams the file and can check the category before the file arrives.
+  formData.append('category', category);
+  formData.append('file', file);
+
+  const url = `${base()}/api/v1/applications/${applicationId}/documents`;
+  return sendWithProgress('POST', url, formData, { Authorization: `Bearer ${getToken()}` }, onProgress);
+}
+
+async function sha256Hex(file) {
+  if (!globalThis.crypto?.subtle) return undefined;
+  const digest = await crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('');
+}
+
+/**
+ * Upload a document straight to storage: start (presigned grant), send the file, complete.
+ * Falls back to uploadDocument() when the API's storage does not support direct uploads (501).
+ * Same arguments and result as uploadDocument.
+ */
+export async function uploadDocumentDirect(applicationId, file, category, onProgress) {
+  const path = `/api/v1/applications/${applicationId}/documents/uploads`;
+  let started;
+  try {
+    started = await apiJson(path, {
+      method: 'POST',
+      body: JSON.stringify({
+        file_name: file.name,
+        content_type: file.type || 'application/octet-stream',
+        file_size: file.size,
+        category,
+        sha256: await sha256Hex(file),
+      }),
+    });
+  } catch (err) {
+    if (err.status === 501) return uploadDocument(applicationId, file, category, onProgress);
+    throw err;
+  }
+  const { documentId, uploadToken, upload } = started.data;
+  // Storage URLs are absolute (S3); local signed uploads are API paths. No Authorization header:
+  // the grant itself authorizes the upload.
+  const target = upload.url.startsWith('/') ? `${base()}${upload.url}` : upload.url;
+  if (upload.method === 'POST') {
+    const form = new FormData();
+    Object.entries(upload.fields || {}).forEach(([name, value]) => form.append(name, value));
+    form.append('file', file);
+    await sendWithProgress('POST', target, form, {}, onProgress);
+  } else {
+    await sendWithProgress(upload.method, target, file, upload.headers || {}, onProgress);
+  }
+  return apiJson(`${path}/${documentId}/complete`, {
+    method: 'POST',
+    body: JSON.stringify({ upload_token: uploadToken }),
   });
 }
 
@@ -1,22 +1,59 @@
 /**
  * Preference API: record interactions and get recommendations.
+ * recordInteraction queues events and sends them in batches (POST /interactions)
+ * every few seconds, when the queue fills, or when the page is hidden.
  */
 import { apiJson } from './api';
 
 const V1 = '/api/v1/preferences';
+const FLUSH_MS = 3000;
+const MAX_BATCH = 50;
 
-export async function recordInteraction({ interaction_type, target_id, metadata }) {
-  const data = await apiJson(`${V1}/interaction`, {
+let queue = [];
+let timer = null;
+
+const scheduleFlush = (ms) => {
+  timer = setTimeout(() => flushInteractions().catch(() => {}), ms);
+};
+
+export async function recordInteractions(interactions, { keepalive = false } = {}) {
+  const data = await apiJson(`${V1}/interactions`, {
     method: 'POST',
-    body: JSON.stringify({
-      interaction_type: interaction_type || 'page_view',
-      target_id: target_id || null,
-      metadata: metadata || null,
-    }),
+    keepalive,
+    body: JSON.stringify({ interactions }),
   });
   return data?.data ?? data;
 }
 
+export function flushInteractions({ keepalive = false } = {}) {
+  if (timer) {
+    clearTimeout(timer);
+    timer = null;
+  }
+  if (!queue.length) return Promise.resolve(null);
+  const batch = queue.splice(0, MAX_BATCH);
+  const sent = recordInteractions(batch, { keepalive });
+  if (queue.length) scheduleFlush(0);
+  return sent;
+}
+
+export function recordInteraction({ interaction_type, target_id, metadata }) {
+  queue.push({
+    interaction_type: interaction_type || 'page_view',
+    target_id: target_id || null,
+    metadata: metadata || null,
+  });
+  if (queue.length >= MAX_BATCH) return flushInteractions();
+  if (!timer) scheduleFlush(FLUSH_MS);
+  return Promise.resolve(null);
+}
+
+if (typeof document !== 'undefined') {
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') flushInteractions({ keepalive: true }).catch(() => {});
+  });
+}
+
 export async function getRecommendations(limit = 5) {
   const data = await apiJson(`${V1}/recommendations?limit=${limit}`);
   return data?.data ?? data;
@@ -60,14 +60,22 @@ from authentication.errors import (
 )
 from authentication.utils import (
     hash_password,
+    needs_rehash,
     verify_password,
     validate_password_complexity,
     create_token,
     decode_token,
     validate_token,
+    reload_keys,
+    get_token_cache_stats,
     SESSION_EXPIRE_SECONDS,
     WARNING_BEFORE_EXPIRE_SECONDS,
     LockoutTracker,
+    MemoryState,
+    RedisState,
+    SharedState,
+    get_shared_state,
+    set_shared_state,
     validate_email_format,
 )
 
@@ -81,13 +89,21 @@ __all__ = [
     "TokenInvalidError",
     "PasswordComplexityError",
     "hash_password",
+    "needs_rehash",
     "verify_password",
     "validate_password_complexity",
     "create_token",
     "decode_token",
     "validate_token",
+    "reload_keys",
+    "get_token_cache_stats",
     "SESSION_EXPIRE_SECONDS",
     "WARNING_BEFORE_EXPIRE_SECONDS",
     "LockoutTracker",
+    "SharedState",
+    "MemoryState",
+    "RedisState",
+    "get_shared_state",
+    "set_shared_state",
     "validate_email_format",
 ]
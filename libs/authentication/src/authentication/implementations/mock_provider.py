@@ -1,4 +1,12 @@
-"""Mock authentication for development: configurable users, in-memory tokens and lockout."""
+"""
+Mock authentication for development: configurable users, tokens and lockout.
+
+Tokens and locked accounts are kept in a SharedState (see
+authentication.utils.shared_state): with AUTH_STATE_BACKEND=redis every worker
+sees the same sessions, so the API can run more than one worker under mock auth.
+Tokens expire after JWT_EXPIRE_SECONDS like real sessions.
+"""
+import json
 import os
 import secrets
 from typing import Any
@@ -6,6 +14,11 @@ from typing import Any
 from authentication.interfaces.auth_provider import AuthProvider
 from authentication.utils import validate_password_complexity
 from authentication.utils.email_validator import validate_email_format
+from authentication.utils.jwt import get_token_expire_seconds
+from authentication.utils.shared_state import SharedState, resolve_state
+
+_TOKEN_PREFIX = "mock:token:"
+_LOCKED_PREFIX = "mock:locked:"
 
 
 def _parse_fake_users() -> list[tuple[str, str, str]]:
@@ -32,24 +45,30 @@ def _parse_fake_users() -> list[tuple[str, str, str]]:
 class MockAuthProvider(AuthProvider):
     """In-memory auth: configurable users, token store, lockout, register, refresh, reset."""
 
-    def __init__(self) -> None:
+    def __init__(self, state: SharedState | None = None) -> None:
         self._users: list[tuple[str, str, str]] = _parse_fake_users()  # email, password, name
-        self._tokens: dict[str, dict[str, Any]] = {}  # token -> {sub, email, name}
-        self._locked: set[str] = set()  # emails
+        self._state = resolve_state(state)  # tokens -> {sub, email, name}; locked emails
+
+    def _issue(self, data: dict[str, Any]) -> str:
+        token = secrets.token_urlsafe(32)
+        self._state.set(_TOKEN_PREFIX + token, json.dumps(data), get_token_expire_seconds())
+        return token
 
     def authenticate(self, email: str, password: str) -> dict[str, Any] | None:
         email = (email or "").strip().lower()
-        if email in self._locked:
+        if self._state.get(_LOCKED_PREFIX + email) is not None:
             return None
         for e, p, name in self._users:
             if e == email and p == password:
-                token = secrets.token_urlsafe(32)
-                self._tokens[token] = {"sub": e, "email": e, "name": name}
+                token = self._issue({"sub": e, "email": e, "name": name})
                 return {"token": token, "user": {"id": e, "email": e, "name": name, "role": "user"}}
         return None
 
     def verify(self, token: str) -> dict[str, Any] | None:
-        return self._tokens.get(token)
+        if not token:
+            return None
+        raw = self._state.get(_TOKEN_PREFIX + token)
+        return json.loads(raw) if raw is not None else None
 
     def register(self, email: str, password: str, **kwargs: Any) -> dict[str, Any]:
         ok, msg = validate_email_format(email)
@@ -66,15 +85,14 @@ class MockAuthProvider(AuthProvider):
         return {"user": {"id": email, "email": email, "name": name, "role": "user"}, "message": "Registration successful."}
 
     def logout(self, token: str) -> None:
-        self._tokens.pop(token, None)
+        self._state.delete(_TOKEN_PREFIX + token)
 
     def refresh_token(self, token: str) -> dict[str, Any] | None:
-        data = self._tokens.get(token)
+        data = self.verify(token)
         if not data:
             return None
-        self._tokens.pop(token, None)
-        new_token = secrets.token_urlsafe(32)
-        self._tokens[new_token] = data
+        self._state.delete(_TOKEN_PREFIX + token)
+        new_token = self._issue(data)
         return {"token": new_token, "user": {"id": data["sub"], "email": data["email"], "name": data["name"], "role": "user"}}
 
     def reset_password(self, token: str, new_password: str) -> dict[str, Any]:
@@ -87,7 +105,7 @@ class MockAuthProvider(AuthProvider):
         return {"message": "Password has been reset."}
 
     def lock_account(self, identifier: str) -> None:
-        self._locked.add(identifier.strip().lower())
+        self._state.set(_LOCKED_PREFIX + identifier.strip().lower(), "1")
 
     def unlock_account(self, identifier: str) -> None:
-        self._locked.discard(identifier.strip().lower())
+        self._state.delete(_LOCKED_PREFIX + identifier.strip().lower())
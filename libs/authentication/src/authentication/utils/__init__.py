@@ -1,26 +1,48 @@
 """Authentication utilities: JWT, password, session, lockout, email."""
 from authentication.utils.password import (
     hash_password,
+    needs_rehash,
     verify_password,
     validate_password_complexity,
 )
-from authentication.utils.jwt import create_token, decode_token, validate_token
+from authentication.utils.jwt import (
+    create_token,
+    decode_token,
+    get_token_cache_stats,
+    reload_keys,
+    validate_token,
+)
 from authentication.utils.session import (
     SESSION_EXPIRE_SECONDS,
     WARNING_BEFORE_EXPIRE_SECONDS,
 )
 from authentication.utils.lockout import LockoutTracker
+from authentication.utils.shared_state import (
+    MemoryState,
+    RedisState,
+    SharedState,
+    get_shared_state,
+    set_shared_state,
+)
 from authentication.utils.email_validator import validate_email_format
 
 __all__ = [
     "hash_password",
+    "needs_rehash",
     "verify_password",
     "validate_password_complexity",
     "create_token",
     "decode_token",
     "validate_token",
+    "reload_keys",
+    "get_token_cache_stats",
     "SESSION_EXPIRE_SECONDS",
     "WARNING_BEFORE_EXPIRE_SECONDS",
     "LockoutTracker",
+    "SharedState",
+    "MemoryState",
+    "RedisState",
+    "get_shared_state",
+    "set_shared_state",
     "validate_email_format",
 ]
@@ -1,5 +1,22 @@
-"""JWT token generation, validation, and expiration handling."""
+"""
+JWT token generation, validation, and expiration handling.
+
+JWT_SECRET and JWT_ALGORITHM are read once; call reload_keys() after rotating
+them in-process. validate_token keeps recently verified tokens in a bounded LRU
+cache keyed by the token's SHA-256 digest, so repeated requests with the same
+token skip signature verification and claim decoding. An entry lives until the
+token's exp or JWT_CACHE_TTL_SECONDS, whichever comes first; rejected tokens are
+never cached and reload_keys() clears the cache.
+
+Environment:
+  JWT_CACHE_SIZE          verified tokens kept (default 10000; 0 disables the cache)
+  JWT_CACHE_TTL_SECONDS   max seconds a verification is reused (default 300)
+"""
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from typing import Any
 
@@ -7,17 +24,123 @@ import jwt
 
 DEFAULT_ALGORITHM = "HS256"
 DEFAULT_EXPIRE_SECONDS = 7200  # 2 hours
+DEFAULT_CACHE_SIZE = 10_000
+DEFAULT_CACHE_TTL_SECONDS = 300
+
+_keys: tuple[str, str] | None = None  # (secret, algorithm)
+_keys_lock = threading.Lock()
+
+
+def _int_env(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name, "").strip() or default))
+    except ValueError:
+        return default
+
+
+class VerifiedTokenCache:
+    """Thread-safe LRU of token digest -> (expires_at, payload)."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return dict(entry[1])  # callers may modify their copy
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        key = self._digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hits, misses, evictions (LRU), current entries and capacity."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+def _new_cache() -> VerifiedTokenCache | None:
+    size = _int_env("JWT_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+    if size == 0:
+        return None
+    return VerifiedTokenCache(size, _int_env("JWT_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS))
+
+
+_cache: VerifiedTokenCache | None = _new_cache()
+
+
+def _get_keys() -> tuple[str, str]:
+    global _keys
+    keys = _keys
+    if keys is None:
+        secret = os.getenv("JWT_SECRET", "")
+        if not secret:
+            raise ValueError("JWT_SECRET must be set for JWT authentication")
+        keys = _keys = (secret, os.getenv("JWT_ALGORITHM", DEFAULT_ALGORITHM))
+    return keys
 
 
 def _get_secret() -> str:
-    secret = os.getenv("JWT_SECRET", "")
-    if not secret:
-        raise ValueError("JWT_SECRET must be set for JWT authentication")
-    return secret
+    return _get_keys()[0]
 
 
 def _get_algorithm() -> str:
-    return os.getenv("JWT_ALGORITHM", DEFAULT_ALGORITHM)
+    return _get_keys()[1]
+
+
+def reload_keys() -> None:
+    """
+    Re-read JWT_SECRET / JWT_ALGORITHM (and the cache settings) after a key rotation;
+    drops every cached verification so tokens are checked against the new key.
+    """
+    global _keys, _cache
+    with _keys_lock:
+        _keys = None
+        _cache = _new_cache()
+
+
+def get_token_cache_stats() -> dict[str, Any] | None:
+    """Verified-token cache counters, or None when the cache is disabled."""
+    cache = _cache
+    return cache.stats() if cache is not None else None
 
 
 def get_token_expire_seconds() -> int:
@@ -60,7 +183,15 @@ def decode_token(token: str) -> dict[str, Any]:
 
 def validate_token(token: str) -> dict[str, Any] | None:
     """Validate token (signature and expiration). Returns payload or None if invalid."""
+    cache = _cache
+    if cache is not None and token:
+        cached = cache.get(token)
+        if cached is not None:
+            return cached
     try:
-        return decode_token(token)
+        payload = decode_token(token)
     except jwt.InvalidTokenError:
         return None
+    if cache is not None:
+        cache.put(token, payload)
+    return payload
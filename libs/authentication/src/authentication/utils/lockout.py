@@ -1,7 +1,7 @@
 """Account lockout tracking for brute-force prevention (5 failed attempts = lockout)."""
 import os
-import time
-from threading import Lock
+
+from authentication.utils.shared_state import SharedState, resolve_state
 
 DEFAULT_MAX_ATTEMPTS = 5
 DEFAULT_LOCKOUT_SECONDS = 900  # 15 min
@@ -9,61 +9,50 @@ DEFAULT_LOCKOUT_SECONDS = 900  # 15 min
 
 class LockoutTracker:
     """
-    Tracks failed login attempts per identifier (e.g. email).
-    After max_attempts failures, account is locked for lockout_seconds.
-    Thread-safe in-memory store; replace with Redis/DB for multi-process.
+    Tracks failed login attempts per identifier (e.g. email) in a sliding window.
+    An identifier is locked while it has max_attempts failures within the last
+    window_seconds (LOCKOUT_WINDOW_SECONDS, default lockout_seconds), i.e. until
+    enough of them age out. Counters live in a SharedState: the configured shared
+    backend (AUTH_STATE_BACKEND) when there is one, else a private MemoryState.
+    Every counter expires with its window, so probed identifiers do not pile up.
     """
 
+    KEY_PREFIX = "lockout:"
+
     def __init__(
         self,
         max_attempts: int | None = None,
         lockout_seconds: int | None = None,
+        state: SharedState | None = None,
+        window_seconds: int | None = None,
     ) -> None:
         self._max_attempts = max_attempts or int(os.getenv("LOCKOUT_MAX_ATTEMPTS", str(DEFAULT_MAX_ATTEMPTS)))
         self._lockout_seconds = lockout_seconds or int(os.getenv("LOCKOUT_SECONDS", str(DEFAULT_LOCKOUT_SECONDS)))
-        self._failures: dict[str, list[float]] = {}
-        self._locked_until: dict[str, float] = {}
-        self._lock = Lock()
+        self._window_seconds = window_seconds or int(os.getenv("LOCKOUT_WINDOW_SECONDS", "0")) or self._lockout_seconds
+        self._state = resolve_state(state)
 
     def _key(self, identifier: str) -> str:
-        return (identifier or "").strip().lower()
+        return self.KEY_PREFIX + (identifier or "").strip().lower()
 
     def record_failure(self, identifier: str) -> None:
         """Record a failed attempt for identifier."""
-        key = self._key(identifier)
-        if not key:
+        if not (identifier or "").strip():
             return
-        with self._lock:
-            self._failures.setdefault(key, []).append(time.time())
-            # Trim to last max_attempts
-            self._failures[key] = self._failures[key][-self._max_attempts :]
-            if len(self._failures[key]) >= self._max_attempts:
-                self._locked_until[key] = time.time() + self._lockout_seconds
+        self._state.hit(self._key(identifier), self._window_seconds)
 
     def reset(self, identifier: str) -> None:
         """Clear failure count and lockout for identifier (e.g. after successful login)."""
-        key = self._key(identifier)
-        with self._lock:
-            self._failures.pop(key, None)
-            self._locked_until.pop(key, None)
+        self._state.delete(self._key(identifier))
 
     def is_locked(self, identifier: str) -> bool:
         """True if identifier is currently locked out."""
-        key = self._key(identifier)
-        with self._lock:
-            until = self._locked_until.get(key, 0)
-            if until and time.time() < until:
-                return True
-            if until:
-                del self._locked_until[key]
-                self._failures.pop(key, None)
-            return False
+        return self._failures(identifier) >= self._max_attempts
 
     def remaining_attempts(self, identifier: str) -> int:
         """Remaining attempts before lockout (0 if already locked)."""
-        if self.is_locked(identifier):
+        return max(0, self._max_attempts - self._failures(identifier))
+
+    def _failures(self, identifier: str) -> int:
+        if not (identifier or "").strip():
             return 0
-        key = self._key(identifier)
-        with self._lock:
-            n = len(self._failures.get(key, []))
-            return max(0, self._max_attempts - n)
+        return self._state.hits(self._key(identifier), self._window_seconds)
@@ -17,14 +17,27 @@ def get_salt_rounds() -> int:
         return DEFAULT_SALT_ROUNDS
 
 
-def hash_password(password: str) -> str:
-    """Hash password with bcrypt. Returns encoded hash string."""
+def hash_password(password: str, rounds: int | None = None) -> str:
+    """Hash password with bcrypt (rounds defaults to get_salt_rounds()). Returns encoded hash string."""
     return bcrypt.hashpw(
         password.encode("utf-8"),
-        bcrypt.gensalt(rounds=get_salt_rounds()),
+        bcrypt.gensalt(rounds=rounds or get_salt_rounds()),
     ).decode("utf-8")
 
 
+def get_hash_rounds(hashed: str) -> int | None:
+    """Cost factor of a bcrypt hash ("$2b$12$..." -> 12), or None if it is not one."""
+    parts = (hashed or "").split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def needs_rehash(hashed: str, rounds: int | None = None) -> bool:
+    """True when hashed was made with a different cost than the configured one (rehash on next login)."""
+    return get_hash_rounds(hashed) != (rounds or get_salt_rounds())
+
+
 def verify_password(password: str, hashed: str) -> bool:
     """Return True if password matches hash."""
     try:
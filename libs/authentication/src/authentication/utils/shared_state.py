@@ -0,0 +1,221 @@
+"""
+Shared state for lockout counters and mock-auth tokens, so several API workers agree.
+
+SharedState offers the two primitives both need: sliding-window counters
+(hit/hits: events in the last window_seconds) and values with a TTL
+(set/get/delete). Every key expires, so memory stays bounded no matter how many
+identifiers are probed.
+
+- MemoryState: one process (the default; fine for a single worker and tests).
+- RedisState: any Redis-protocol server (Redis, Valkey, KeyDB) through a
+  redis-py compatible client; counters are sorted sets trimmed on each hit.
+
+Environment (read by get_shared_state):
+  AUTH_STATE_BACKEND     memory (default) or redis
+  AUTH_STATE_REDIS_URL   redis://host:6379/0 (falls back to REDIS_URL)
+  AUTH_STATE_PREFIX      key prefix in Redis (default "auth:")
+"""
+import math
+import os
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any
+
+_SWEEP_EVERY = 256  # MemoryState writes between sweeps of expired keys
+
+
+class SharedState(ABC):
+    """Sliding-window counters and TTL values keyed by string."""
+
+    @abstractmethod
+    def hit(self, key: str, window_seconds: float) -> int:
+        """Record one event now; return events in the last window_seconds (including this one)."""
+
+    @abstractmethod
+    def hits(self, key: str, window_seconds: float) -> int:
+        """Events recorded for key in the last window_seconds."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: float | None = None) -> None:
+        """Store value; it expires after ttl_seconds (None = until deleted)."""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Stored value, or None if missing or expired."""
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """Remove values and counters."""
+
+
+class MemoryState(SharedState):
+    """Process-local SharedState; expired keys are swept every few hundred writes."""
+
+    def __init__(self) -> None:
+        self._events: dict[str, deque[float]] = {}
+        self._windows: dict[str, float] = {}
+        self._values: dict[str, tuple[str, float | None]] = {}  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _trim(self, key: str, window_seconds: float, now: float) -> deque[float] | None:
+        events = self._events.get(key)
+        if events is None:
+            return None
+        cutoff = now - window_seconds
+        while events and events[0] <= cutoff:
+            events.popleft()
+        if not events:
+            del self._events[key]
+            self._windows.pop(key, None)
+            return None
+        return events
+
+    def _sweep(self, now: float) -> None:
+        self._writes += 1
+        if self._writes % _SWEEP_EVERY:
+            return
+        for key in [k for k, (_, exp) in self._values.items() if exp is not None and exp <= now]:
+            del self._values[key]
+        for key in [k for k, events in self._events.items() if events[-1] <= now - self._windows[k]]:
+            del self._events[key]
+            del self._windows[key]
+
+    def hit(self, key: str, window_seconds: float) -> int:
+        now = time.time()
+        with self._lock:
+            self._sweep(now)
+            events = self._trim(key, window_seconds, now)
+            if events is None:
+                events = self._events[key] = deque()
+            events.append(now)
+            self._windows[key] = window_seconds
+            return len(events)
+
+    def hits(self, key: str, window_seconds: float) -> int:
+        with self._lock:
+            events = self._trim(key, window_seconds, time.time())
+            return len(events) if events else 0
+
+    def set(self, key: str, value: str, ttl_seconds: float | None = None) -> None:
+        now = time.time()
+        with self._lock:
+            self._sweep(now)
+            self._values[key] = (value, now + ttl_seconds if ttl_seconds is not None else None)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._values[key]
+                return None
+            return value
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
+                self._events.pop(key, None)
+                self._windows.pop(key, None)
+
+    def __len__(self) -> int:
+        """Keys currently held (values + counters), for tests and metrics."""
+        with self._lock:
+            return len(self._values) + len(self._events)
+
+
+class RedisState(SharedState):
+    """
+    SharedState on a Redis-protocol server. client is a redis-py compatible
+    client (redis.Redis, fakeredis.FakeRedis); each counter is a sorted set of
+    event timestamps, trimmed to the window and given a TTL of one window.
+    """
+
+    def __init__(self, client: Any, prefix: str = "auth:") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "auth:") -> "RedisState":
+        import redis  # optional dependency: pip install redis
+
+        return cls(redis.Redis.from_url(url), prefix)
+
+    def _k(self, key: str) -> str:
+        return self._prefix + key
+
+    def hit(self, key: str, window_seconds: float) -> int:
+        now = time.time()
+        k = self._k(key)
+        pipe = self._client.pipeline()  # MULTI/EXEC: trim, add and count atomically
+        pipe.zremrangebyscore(k, 0, now - window_seconds)
+        pipe.zadd(k, {f"{now:.6f}:{uuid.uuid4().hex[:8]}": now})
+        pipe.zcard(k)
+        pipe.expire(k, max(1, math.ceil(window_seconds)))
+        return int(pipe.execute()[2])
+
+    def hits(self, key: str, window_seconds: float) -> int:
+        return int(self._client.zcount(self._k(key), f"({time.time() - window_seconds}", "+inf"))
+
+    def set(self, key: str, value: str, ttl_seconds: float | None = None) -> None:
+        if ttl_seconds is None:
+            self._client.set(self._k(key), value)
+        else:
+            self._client.set(self._k(key), value, px=max(1, int(ttl_seconds * 1000)))
+
+    def get(self, key: str) -> str | None:
+        value = self._client.get(self._k(key))
+        if value is None:
+            return None
+        return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._client.delete(*(self._k(key) for key in keys))
+
+
+_shared: SharedState | None = None
+_shared_lock = threading.Lock()
+_configured = False
+
+
+def set_shared_state(state: SharedState | None) -> None:
+    """Use state for lockout and mock tokens created from now on (None = per-instance memory)."""
+    global _shared, _configured
+    with _shared_lock:
+        _shared = state
+        _configured = True
+
+
+def get_shared_state() -> SharedState | None:
+    """
+    The process-wide shared backend from AUTH_STATE_BACKEND, or None for memory
+    (then each LockoutTracker / MockAuthProvider keeps its own MemoryState).
+    """
+    global _shared, _configured
+    if not _configured:
+        with _shared_lock:
+            if not _configured:
+                backend = (os.getenv("AUTH_STATE_BACKEND") or "memory").strip().lower()
+                if backend == "redis":
+                    url = os.getenv("AUTH_STATE_REDIS_URL") or os.getenv("REDIS_URL") or "redis://localhost:6379/0"
+                    _shared = RedisState.from_url(url, os.getenv("AUTH_STATE_PREFIX", "auth:"))
+                _configured = True
+    return _shared
+
+
+def resolve_state(state: SharedState | None = None) -> SharedState:
+    """
+    state if given, else the process-wide shared state, else a new MemoryState.
+    Compares with None: an empty MemoryState is falsy (__len__) but still the one to use.
+    """
+    if state is not None:
+        return state
+    shared = get_shared_state()
+    return shared if shared is not None else MemoryState()
@@ -4,9 +4,13 @@ from datetime import datetime, timezone, timedelta
 import pytest
 import jwt as pyjwt
 
+from authentication.utils import jwt as jwt_utils
 from authentication.utils.jwt import (
+    VerifiedTokenCache,
     create_token,
     decode_token,
+    get_token_cache_stats,
+    reload_keys,
     validate_token,
     get_token_expire_seconds,
 )
@@ -15,6 +19,7 @@ from authentication.utils.jwt import (
 @pytest.fixture(autouse=True)
 def set_jwt_secret(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("JWT_SECRET", "test-secret-for-unit-tests")
+    reload_keys()
 
 
 def test_create_and_validate() -> None:
@@ -50,3 +55,57 @@ def test_wrong_signature_returns_none() -> None:
     # Tamper: replace one char in token
     bad_token = token[:-1] + ("X" if token[-1] != "X" else "Y")
     assert validate_token(bad_token) is None
+
+
+def test_cache_hit_skips_verification(monkeypatch: pytest.MonkeyPatch) -> None:
+    token = create_token({"sub": "cached"})
+    assert validate_token(token)["sub"] == "cached"
+    calls = []
+    monkeypatch.setattr(jwt_utils, "decode_token", lambda t: calls.append(t))
+    first = validate_token(token)
+    first["sub"] = "mutated"  # callers get a copy
+    assert validate_token(token)["sub"] == "cached"
+    assert calls == []
+    assert get_token_cache_stats()["hits"] == 2
+
+
+def test_invalid_tokens_are_not_cached() -> None:
+    assert validate_token("invalid.token.here") is None
+    assert validate_token("invalid.token.here") is None
+    assert get_token_cache_stats()["entries"] == 0
+
+
+def test_key_rotation_invalidates_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    token = create_token({"sub": "u"})
+    assert validate_token(token) is not None
+    monkeypatch.setenv("JWT_SECRET", "rotated-secret")
+    assert validate_token(token) is not None  # keys are loaded once...
+    reload_keys()
+    assert validate_token(token) is None  # ...until reload_keys()
+    assert validate_token(create_token({"sub": "u"})) is not None
+
+
+def test_cache_expiry_and_lru_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = VerifiedTokenCache(maxsize=2, ttl_seconds=60)
+    now = [1000.0]
+    monkeypatch.setattr(jwt_utils.time, "time", lambda: now[0])
+    cache.put("a", {"sub": "a", "exp": 1010})
+    cache.put("b", {"sub": "b", "exp": 5000})
+    assert cache.get("a")["sub"] == "a"  # a is now most recently used
+    cache.put("c", {"sub": "c", "exp": 5000})
+    assert cache.get("b") is None  # evicted
+    now[0] = 1010.0
+    assert cache.get("a") is None  # past exp
+    now[0] = 1061.0
+    assert cache.get("c") is None  # past the TTL
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_can_be_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("JWT_CACHE_SIZE", "0")
+    reload_keys()
+    token = create_token({"sub": "u"})
+    assert validate_token(token)["sub"] == "u"
+    assert get_token_cache_stats() is None
+    monkeypatch.delenv("JWT_CACHE_SIZE")
+    reload_keys()
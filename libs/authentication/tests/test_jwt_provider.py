@@ -7,6 +7,7 @@ import pytest
 from authentication import AccountLockedError
 from authentication.implementations.jwt_provider import JwtAuthProvider
 from authentication.utils import hash_password
+from authentication.utils.jwt import reload_keys
 
 
 class InMemoryUser:
@@ -82,6 +83,7 @@ def repo() -> FakeUserRepository:
 @pytest.fixture(autouse=True)
 def jwt_secret(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("JWT_SECRET", "test-secret")
+    reload_keys()
 
 
 def test_jwt_register_and_authenticate(repo: FakeUserRepository) -> None:
@@ -5,7 +5,9 @@ from authentication.utils.password import (
     hash_password,
     verify_password,
     validate_password_complexity,
+    get_hash_rounds,
     get_salt_rounds,
+    needs_rehash,
 )
 
 
@@ -21,6 +23,17 @@ def test_verify_invalid_hash() -> None:
     assert verify_password("any", "not-a-valid-bcrypt-hash") is False
 
 
+def test_needs_rehash_when_cost_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BCRYPT_SALT_ROUNDS", "10")
+    hashed = hash_password("SecureP4ss")
+    assert get_hash_rounds(hashed) == 10
+    assert needs_rehash(hashed) is False
+    monkeypatch.setenv("BCRYPT_SALT_ROUNDS", "11")
+    assert needs_rehash(hashed) is True
+    assert get_hash_rounds(hash_password("SecureP4ss", rounds=11)) == 11
+    assert get_hash_rounds("seeded") is None and needs_rehash("seeded") is True
+
+
 def test_complexity_valid() -> None:
     ok, msg = validate_password_complexity("Abcd1234")
     assert ok is True
@@ -0,0 +1,120 @@
+"""Tests for shared auth state: sliding-window counters, TTL values, and lockout/mock tokens across workers."""
+import os
+
+import pytest
+
+from authentication.implementations.mock_provider import MockAuthProvider
+from authentication.utils import shared_state
+from authentication.utils.lockout import LockoutTracker
+from authentication.utils.shared_state import MemoryState, RedisState
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(shared_state.time, "time", lambda: now[0])
+    return now
+
+
+def _memory_state():
+    return MemoryState()
+
+
+def _fakeredis_state():
+    import fakeredis
+
+    return RedisState(fakeredis.FakeRedis(), prefix="test:")
+
+
+def _server_redis_state():
+    state = RedisState.from_url(os.environ["TEST_REDIS_URL"], prefix="test-auth-state:")
+    state._client.flushdb()
+    return state
+
+
+def _state_factories():
+    """Factories (not instances): every test gets a fresh, empty state."""
+    yield pytest.param(_memory_state, id="MemoryState")
+    try:
+        import fakeredis  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        yield pytest.param(_fakeredis_state, id="RedisState")
+    if os.getenv("TEST_REDIS_URL"):
+        yield pytest.param(_server_redis_state, id="RedisServer")
+
+
+@pytest.fixture(params=list(_state_factories()))
+def state(request):
+    return request.param()
+
+
+def test_sliding_window_counter(state, clock):
+    assert state.hit("k", 60) == 1
+    clock[0] += 30
+    assert state.hit("k", 60) == 2
+    clock[0] += 31  # the first hit has left the window
+    assert state.hits("k", 60) == 1
+    state.delete("k")
+    assert state.hits("k", 60) == 0
+
+
+def test_values_expire(state, clock):
+    state.set("v", "1", ttl_seconds=10)
+    state.set("forever", "x")
+    assert state.get("v") == "1"
+    clock[0] += 11
+    if isinstance(state, RedisState):
+        pytest.skip("server-side expiry does not follow the patched clock")
+    assert state.get("v") is None
+    assert state.get("forever") == "x"
+
+
+def test_memory_state_sweeps_expired_keys(clock):
+    state = MemoryState()
+    for i in range(shared_state._SWEEP_EVERY):
+        state.hit(f"probe-{i}@example.com", 60)
+    clock[0] += 61
+    for i in range(shared_state._SWEEP_EVERY):
+        state.set(f"t{i}", "1", ttl_seconds=1)
+    assert len(state) <= shared_state._SWEEP_EVERY  # the expired counters are gone
+
+
+def test_lockout_shared_between_workers(state, clock):
+    worker_a = LockoutTracker(max_attempts=3, lockout_seconds=60, state=state)
+    worker_b = LockoutTracker(max_attempts=3, lockout_seconds=60, state=state)
+    worker_a.record_failure("u@x.com")
+    worker_b.record_failure("u@x.com")
+    assert worker_a.remaining_attempts("u@x.com") == 1
+    worker_a.record_failure("u@x.com")
+    assert worker_b.is_locked("u@x.com") is True
+    clock[0] += 61  # all failures aged out of the window
+    assert worker_b.is_locked("u@x.com") is False
+
+
+def test_mock_tokens_shared_between_workers(state, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("MOCK_AUTH_USERS", raising=False)
+    worker_a = MockAuthProvider(state=state)
+    worker_b = MockAuthProvider(state=state)
+    token = worker_a.authenticate("dev@example.com", "dev")["token"]
+    assert worker_b.verify(token)["email"] == "dev@example.com"
+    new_token = worker_b.refresh_token(token)["token"]
+    assert worker_a.verify(token) is None
+    worker_a.logout(new_token)
+    assert worker_b.verify(new_token) is None
+    worker_a.lock_account("dev@example.com")
+    assert worker_b.authenticate("dev@example.com", "dev") is None
+
+
+def test_empty_memory_state_is_not_replaced(monkeypatch: pytest.MonkeyPatch):
+    """An empty MemoryState is falsy; injected and process-wide states must still be used."""
+    injected = MemoryState()
+    assert LockoutTracker(3, 60, state=injected)._state is injected
+    monkeypatch.delenv("MOCK_AUTH_USERS", raising=False)
+    monkeypatch.setattr(shared_state, "_shared", None)
+    monkeypatch.setattr(shared_state, "_configured", False)
+    shared = MemoryState()
+    shared_state.set_shared_state(shared)
+    assert LockoutTracker(3, 60)._state is shared
+    assert MockAuthProvider()._state is shared
@@ -0,0 +1,189 @@
+"""
+Bulk seeding: upsert whole datasets with insert_many(...).on_conflict(...).
+
+Rows are consumed lazily and written in chunks (one statement per chunk, all in
+one transaction), so large CSV/JSON inputs stream from disk without holding
+every row in memory or paying a round trip per row. The conflict target must be
+a primary key or unique index.
+"""
+import csv
+import json
+import os
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator
+
+from peewee import Model, SqliteDatabase
+
+# SQLite builds before 3.32 allow at most 999 bound parameters per statement.
+SQLITE_MAX_VARIABLES = 999
+DEFAULT_BATCH_ROWS = 1000
+_READ_CHUNK = 64 * 1024
+
+
+def _batch_rows(model: type[Model], columns: int) -> int:
+    db = model._meta.database
+    db = getattr(db, "obj", None) or db  # unwrap DatabaseProxy
+    if isinstance(db, SqliteDatabase):
+        return max(1, SQLITE_MAX_VARIABLES // max(1, columns))
+    return DEFAULT_BATCH_ROWS
+
+
+def _with_defaults(model: type[Model], row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Keep only model fields and fill missing ones (id, timestamps, nullable columns)
+    so every row in a chunk has the same columns. Extra dataset columns are dropped.
+    """
+    fields = model._meta.fields
+    out = {k: v for k, v in row.items() if k in fields}
+    for name, field in fields.items():
+        if name in out:
+            continue
+        if field.default is not None:
+            out[name] = field.default() if callable(field.default) else field.default
+        elif field.null:
+            out[name] = None
+    return out
+
+
+def bulk_upsert(
+    model: type[Model],
+    rows: Iterable[dict[str, Any]],
+    conflict_target: list[str],
+    update: list[str] | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """
+    Insert rows, resolving conflicts on conflict_target: overwrite the `update`
+    columns from the incoming row, or keep the existing row when update is empty.
+    Returns the number of rows processed. batch_size defaults to the largest chunk
+    the database accepts in one statement.
+    """
+    fields = model._meta.fields
+    target = [fields[name] for name in conflict_target]
+    preserve = [fields[name] for name in update or []]
+    if preserve and "updated_at" in fields and "updated_at" not in (update or []):
+        preserve.append(fields["updated_at"])
+    iterator = (_with_defaults(model, row) for row in rows)
+    db = model._meta.database
+    total = 0
+    with db.atomic():
+        while True:
+            first = next(iterator, None)
+            if first is None:
+                break
+            size = batch_size or _batch_rows(model, len(first))
+            chunk = [first, *islice(iterator, size - 1)]
+            query = model.insert_many(chunk)
+            if preserve:
+                query = query.on_conflict(conflict_target=target, preserve=preserve)
+            else:
+                query = query.on_conflict(conflict_target=target, action="IGNORE")
+            query.execute()
+            total += len(chunk)
+    return total
+
+
+def iter_csv(fp: IO[str]) -> Iterator[dict[str, Any]]:
+    """Stream CSV rows as dicts keyed by the header row; empty cells become None."""
+    for row in csv.DictReader(fp):
+        yield {k.strip(): (v if v != "" else None) for k, v in row.items() if k}
+
+
+def _iter_json_array(fp: IO[str]) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        chunk = fp.read(_READ_CHUNK)
+        buf, pos = buf[pos:] + chunk, 0
+        eof = not chunk
+        return bool(chunk)
+
+    def skip_ws() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf) or not fill():
+                return
+
+    skip_ws()
+    if buf[pos:pos + 1] != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    while True:
+        skip_ws()
+        if buf[pos:pos + 1] == "]":
+            return
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise
+                continue
+            if end == len(buf) and not eof and fill():
+                continue  # value may continue in the next chunk (e.g. a number)
+            break
+        yield item
+        pos = end
+        skip_ws()
+        if buf[pos:pos + 1] == ",":
+            pos += 1
+        elif buf[pos:pos + 1] != "]":
+            raise ValueError("Malformed JSON array")
+
+
+def iter_json(fp: IO[str]) -> Iterator[dict[str, Any]]:
+    """
+    Stream records from a JSON array (parsed incrementally) or JSON Lines
+    (one object per line). Memory stays bounded by the largest record.
+    """
+    head = fp.read(1)
+    while head and head.isspace():
+        head = fp.read(1)
+    if not head:
+        return
+    if head == "[":
+        yield from _iter_json_array(_Prefixed(head, fp))
+        return
+    # JSON Lines
+    first_line = head + fp.readline()
+    if first_line.strip():
+        yield json.loads(first_line)
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+
+class _Prefixed:
+    """File-like reader that replays already-consumed text before the rest of fp."""
+
+    def __init__(self, prefix: str, fp: IO[str]) -> None:
+        self._prefix = prefix
+        self._fp = fp
+
+    def read(self, size: int = -1) -> str:
+        prefix, self._prefix = self._prefix, ""
+        return prefix + self._fp.read(size)
+
+
+def iter_records(path: str) -> Iterator[dict[str, Any]]:
+    """Stream records from a .csv, .json, .jsonl or .ndjson file."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in (".csv", ".json", ".jsonl", ".ndjson"):
+        raise ValueError(f"Unsupported file type: {ext}")
+    with open(path, encoding="utf-8", newline="" if ext == ".csv" else None) as fp:
+        yield from iter_csv(fp) if ext == ".csv" else iter_json(fp)
+
+
+def bulk_load(
+    model: type[Model],
+    path: str,
+    conflict_target: list[str],
+    update: list[str] | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """Stream a CSV/JSON file into model with bulk_upsert. Returns rows processed."""
+    return bulk_upsert(model, iter_records(path), conflict_target, update, batch_size)
@@ -1,15 +1,20 @@
-"""Database connection pool and initialization."""
+"""Database connection, optional connection pool, and initialization."""
 import os
 from typing import Optional
 
 from peewee import Database
-from peewee import DatabaseProxy
-from playhouse.db_url import connect
+from playhouse.db_url import connect, parse
+
+from database.json_fields import POSTGRES_FIELD_TYPES
+from database.pool import POOLED_SCHEMES, get_pool_config
+from database.routing import RoutingDatabaseProxy, get_replica_urls, get_replicas, set_replicas
+from database.sqlite_profile import get_sqlite_pragmas, get_write_queue, start_write_queue, stop_write_queue
 
 _db: Optional[Database] = None
 
 # Proxy allows models to be defined before the database is initialized.
-database_proxy: DatabaseProxy = DatabaseProxy()
+# It also routes read-only queries to replicas when DATABASE_REPLICA_URLS is set.
+database_proxy: RoutingDatabaseProxy = RoutingDatabaseProxy()
 
 
 def get_database_url() -> str:
@@ -31,27 +36,110 @@ def _ensure_sqlite_directory(url: str) -> None:
         os.makedirs(parent, exist_ok=True)
 
 
+def _db_options(url: str) -> dict:
+    """
+    Extra Database options by scheme: JSONField maps to JSONB on PostgreSQL;
+    file-backed SQLite gets the WAL/busy_timeout profile (database.sqlite_profile).
+    """
+    scheme = url.split("://", 1)[0].lower()
+    if scheme.startswith("postgres"):
+        return {"field_types": POSTGRES_FIELD_TYPES}
+    if scheme == "sqlite" and parse(url).get("database") not in (None, "", ":memory:"):
+        pragmas = get_sqlite_pragmas()
+        return {"pragmas": pragmas} if pragmas else {}
+    return {}
+
+
+def _connect_pooled(url: str, pool: dict[str, int | None]) -> Database | None:
+    """Build a pooled database for postgres/sqlite URLs; None if the URL cannot be pooled."""
+    scheme = url.split("://", 1)[0].lower()
+    db_class = POOLED_SCHEMES.get(scheme)
+    if db_class is None:
+        return None
+    kwargs = {**parse(url), **_db_options(url)}
+    if scheme == "sqlite":
+        if kwargs.get("database") in (None, "", ":memory:"):
+            return None  # each pooled connection would be a separate empty database
+        # Connections are returned to the pool and reused from other threads.
+        kwargs["check_same_thread"] = False
+    return db_class(
+        max_connections=pool["max_connections"],
+        max_idle=pool["max_idle"],
+        stale_timeout=pool["stale_timeout"],
+        timeout=pool["timeout"],
+        **kwargs,
+    )
+
+
+def _open(url: str) -> Database:
+    """Open a database for url, pooled when DATABASE_POOL_SIZE > 0 and the URL supports it."""
+    _ensure_sqlite_directory(url)
+    pool = get_pool_config()
+    db = _connect_pooled(url, pool) if pool["max_connections"] else None
+    return db if db is not None else connect(url, **_db_options(url))
+
+
 def get_db() -> Database:
-    """Return the global database instance; initializes on first call."""
+    """
+    Return the global (primary) database instance; initializes on first call.
+    With DATABASE_POOL_SIZE > 0 (postgres or file-backed sqlite) the instance is a
+    connection pool and each request checks out its own connection.
+    """
     global _db
     if _db is None:
-        url = get_database_url()
-        _ensure_sqlite_directory(url)
-        _db = connect(url)
+        _db = _open(get_database_url())
     return _db
 
 
+def is_pooled(db: Database | None = None) -> bool:
+    """True if the (global) database is a connection pool."""
+    db = db if db is not None else _db
+    return db is not None and hasattr(db, "pool_stats")
+
+
+def get_pool_stats() -> dict | None:
+    """Pool usage snapshot for metrics, or None when pooling is disabled."""
+    if not is_pooled():
+        return None
+    return _db.pool_stats()
+
+
+def release_connection() -> None:
+    """Return the current context's connections (primary and replicas) to their pools."""
+    for db in [_db, *get_replicas()]:
+        if is_pooled(db) and not db.is_closed():
+            db.close()
+
+
 def init_db() -> Database:
-    """Initialize database connection and bind proxy. Idempotent."""
+    """
+    Initialize database connection, replicas (DATABASE_REPLICA_URLS) and bind proxy.
+    A file-backed SQLite primary also gets its serialized writer (SQLITE_WRITE_QUEUE). Idempotent.
+    """
     db = get_db()
     database_proxy.initialize(db)
+    if not get_replicas():
+        set_replicas([_open(url) for url in get_replica_urls()])
+    queue = get_write_queue()
+    if queue is None or queue.db is not db:
+        start_write_queue(db)
     return db
 
 
 def close_db() -> None:
-    """Close the global database connection."""
+    """Close the global database connection and any replicas."""
     global _db
+    stop_write_queue()
     if _db is not None:
-        _db.close()
+        if is_pooled(_db):
+            _db.close_all()
+        else:
+            _db.close()
         _db = None
         database_proxy.initialize(None)
+    for replica in get_replicas():
+        if is_pooled(replica):
+            replica.close_all()
+        else:
+            replica.close()
+    set_replicas([])
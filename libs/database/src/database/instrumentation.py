@@ -0,0 +1,153 @@
+"""
+Per-request query instrumentation and N+1 detection.
+
+Every statement that goes through the model proxy (database.connection.database_proxy)
+is timed while a QueryProfile is active: statement count, total database time,
+the slowest statements and how often each query shape (SQL with placeholders,
+IN lists collapsed) repeats. The backend's MetricsMiddleware starts a profile
+per request; tests can use profile_queries() directly.
+
+N+1 detection is opt-in: a shape executed DB_N_PLUS_ONE_THRESHOLD or more times
+in one profile is reported by QueryProfile.repeated(), and assert_no_n_plus_one()
+/ check_n_plus_one() turn it into an NPlusOneError. DB_N_PLUS_ONE_ACTION tells
+request middleware how loudly to report it ("raise" = strict).
+"""
+import heapq
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+DEFAULT_SLOWEST = 5
+_IN_LIST = re.compile(r"IN \((?:\s*(?:\?|%s)\s*,)*\s*(?:\?|%s)\s*\)")
+
+_profile: ContextVar["QueryProfile | None"] = ContextVar("database_query_profile", default=None)
+
+
+class NPlusOneError(AssertionError):
+    """A query shape repeated at least the threshold number of times within one profile."""
+
+
+def get_n_plus_one_threshold() -> int:
+    """DB_N_PLUS_ONE_THRESHOLD from environment (0 = detection off)."""
+    try:
+        return max(0, int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "0") or 0))
+    except ValueError:
+        return 0
+
+
+def get_n_plus_one_action() -> str:
+    """DB_N_PLUS_ONE_ACTION: "log" (default) or "raise" (strict reporting)."""
+    action = os.getenv("DB_N_PLUS_ONE_ACTION", "log").strip().lower()
+    return action if action in ("log", "raise") else "log"
+
+
+def query_shape(sql: str) -> str:
+    """Normalized statement: whitespace collapsed and IN (?, ?, ...) reduced to IN (?)."""
+    return _IN_LIST.sub("IN (?)", " ".join(sql.split()))
+
+
+class QueryProfile:
+    """Statements recorded for one request (safe to share with worker threads)."""
+
+    def __init__(self, keep_slowest: int = DEFAULT_SLOWEST) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.keep_slowest = keep_slowest
+        self._slowest: list[tuple[float, int, str]] = []  # min-heap of (seconds, seq, sql)
+        self.shapes: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, seconds: float) -> None:
+        shape = query_shape(sql)
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+            self.shapes[shape] += 1
+            entry = (seconds, self.count, shape)
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, entry)
+            elif seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self) -> list[dict[str, Any]]:
+        """Slowest statements, slowest first: [{"sql", "ms"}]."""
+        with self._lock:
+            ordered = sorted(self._slowest, reverse=True)
+        return [{"sql": sql, "ms": round(seconds * 1000, 3)} for seconds, _, sql in ordered]
+
+    def repeated(self, threshold: int | None = None) -> dict[str, int]:
+        """Query shapes run at least threshold times (default DB_N_PLUS_ONE_THRESHOLD; {} when 0)."""
+        threshold = get_n_plus_one_threshold() if threshold is None else threshold
+        if threshold <= 0:
+            return {}
+        with self._lock:
+            return {shape: n for shape, n in self.shapes.items() if n >= threshold}
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.seconds * 1000, 3),
+            "slowest": self.slowest(),
+            "repeated": self.repeated(),
+        }
+
+
+def current_profile() -> "QueryProfile | None":
+    return _profile.get()
+
+
+def record_query(sql: str, seconds: float) -> None:
+    """Record a statement on the active profile (no-op outside a profile)."""
+    profile = _profile.get()
+    if profile is not None:
+        profile.record(sql, seconds)
+
+
+def timed_execute(db: Any, sql: str, params: Any, commit: Any = None) -> Any:
+    """db.execute_sql, timed into the active profile."""
+    if _profile.get() is None:
+        return db.execute_sql(sql, params, commit=commit)
+    start = time.perf_counter()
+    try:
+        return db.execute_sql(sql, params, commit=commit)
+    finally:
+        record_query(sql, time.perf_counter() - start)
+
+
+def start_profile(keep_slowest: int = DEFAULT_SLOWEST) -> QueryProfile:
+    """Begin recording for the current context (e.g. at the start of a request)."""
+    profile = QueryProfile(keep_slowest)
+    _profile.set(profile)
+    return profile
+
+
+@contextmanager
+def profile_queries(keep_slowest: int = DEFAULT_SLOWEST) -> Iterator[QueryProfile]:
+    """Record statements run inside the block."""
+    profile = QueryProfile(keep_slowest)
+    token = _profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _profile.reset(token)
+
+
+def check_n_plus_one(profile: QueryProfile, threshold: int | None = None) -> None:
+    """Raise NPlusOneError if any query shape repeated at least threshold times."""
+    repeated = profile.repeated(threshold)
+    if repeated:
+        details = "; ".join(f"{n}x {shape}" for shape, n in sorted(repeated.items(), key=lambda kv: -kv[1]))
+        raise NPlusOneError(f"Repeated query shapes (possible N+1): {details}")
+
+
+@contextmanager
+def assert_no_n_plus_one(threshold: int = 3) -> Iterator[QueryProfile]:
+    """Test helper: fail if the block runs any query shape threshold or more times."""
+    with profile_queries() as profile:
+        yield profile
+    check_n_plus_one(profile, threshold)
@@ -0,0 +1,84 @@
+"""
+Portable JSON columns: JSONB on PostgreSQL, JSON1 text on SQLite.
+
+JSONField stores Python dicts/lists directly (no json.dumps/json.loads in
+services). merge_patch_json applies an RFC 7396 JSON merge patch to one row
+without rewriting it from the client.
+"""
+import json
+from datetime import datetime
+from typing import Any
+
+from peewee import Database, Field, Model, PostgresqlDatabase, Value, fn
+
+# Passed as field_types when opening PostgreSQL databases (see database.connection).
+POSTGRES_FIELD_TYPES = {"JSON": "JSONB"}
+
+
+def _is_postgres(db: Database | None) -> bool:
+    db = getattr(db, "obj", None) or db  # unwrap DatabaseProxy
+    return isinstance(db, PostgresqlDatabase)
+
+
+class JSONField(Field):
+    """JSON document column (dict, list or scalar); None is SQL NULL."""
+
+    field_type = "JSON"
+
+    def db_value(self, value: Any) -> Any:
+        if value is None or isinstance(value, Value):
+            return value
+        return json.dumps(value, separators=(",", ":"))
+
+    def python_value(self, value: Any) -> Any:
+        if _is_postgres(self.model._meta.database):
+            return value  # psycopg2 already decodes json/jsonb; a str here is a JSON string value
+        if not isinstance(value, (str, bytes, bytearray)):
+            return value  # NULL, or a number SQLite's NUMERIC affinity stored as one
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """RFC 7396 JSON merge patch: objects merge recursively, null removes a key, anything else replaces."""
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+def merge_patch_json(instance: Model, field: JSONField, patch: dict[str, Any]) -> Any:
+    """
+    Apply a merge patch to instance.<field> in the database and return the new value
+    (also set on the instance); updated_at is bumped when the model has one. SQLite runs json_patch() in the UPDATE itself;
+    PostgreSQL locks the row (SELECT ... FOR UPDATE) and writes the merged document,
+    since jsonb's || operator is a shallow merge without null removal.
+    """
+    model = type(instance)
+    db = model._meta.database
+    pk = model._meta.primary_key
+    extra: dict[Any, Any] = {}
+    updated_at = model._meta.fields.get("updated_at")
+    if updated_at is not None:
+        extra[updated_at] = datetime.utcnow()
+    with db.atomic():
+        if _is_postgres(db):
+            current = model.select(field).where(pk == instance._pk).for_update().tuples().get()[0]
+            value = merge_patch(current, patch)
+            model.update({field: value, **extra}).where(pk == instance._pk).execute()
+        else:
+            payload = Value(json.dumps(patch, separators=(",", ":")), converter=False)
+            patched = fn.json_patch(fn.COALESCE(field, Value("{}", converter=False)), payload)
+            model.update({field: patched, **extra}).where(pk == instance._pk).execute()
+            value = model.select(field).where(pk == instance._pk).tuples().get()[0]
+    setattr(instance, field.name, value)
+    if updated_at is not None:
+        setattr(instance, "updated_at", extra[updated_at])
+    return value
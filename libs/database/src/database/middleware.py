@@ -0,0 +1,82 @@
+"""ASGI middleware: per-request connection lifecycle and read-your-writes replica pinning."""
+import math
+import time
+from http.cookies import SimpleCookie
+from typing import Any, Awaitable, Callable
+
+from database.connection import is_pooled, release_connection
+from database.pool import reset_connection_state
+from database.routing import begin_request, get_pin_seconds, has_replicas, request_wrote
+
+PRIMARY_PIN_COOKIE = "db_primary_until"
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class ConnectionMiddleware:
+    """
+    Give each HTTP request its own connection state and return the connection to
+    the pool when the request finishes. The connection is checked out lazily on the
+    request's first query, so requests that never touch the database never wait on
+    the pool. Pass-through when pooling is disabled.
+    """
+
+    def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not is_pooled():
+            await self.app(scope, receive, send)
+            return
+        reset_connection_state()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            release_connection()
+
+
+def _pinned_until(scope: Scope) -> float:
+    for name, value in scope.get("headers") or []:
+        if name == b"cookie":
+            morsel = SimpleCookie(value.decode("latin-1")).get(PRIMARY_PIN_COOKIE)
+            if morsel is not None:
+                try:
+                    return float(morsel.value)
+                except ValueError:
+                    return 0.0
+    return 0.0
+
+
+class ReadYourWritesMiddleware:
+    """
+    Keep a client on the primary right after it writes. A request that writes gets a
+    short-lived cookie (DATABASE_REPLICA_PIN_SECONDS); while it is valid, that client's
+    reads skip the replicas, so it always sees its own auto-saves. Pass-through when no
+    replicas are configured.
+    """
+
+    def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not has_replicas():
+            await self.app(scope, receive, send)
+            return
+        begin_request(pinned=_pinned_until(scope) > time.time())
+
+        seconds = get_pin_seconds()
+
+        async def send_wrapper(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start" and seconds and request_wrote():
+                cookie = (
+                    f"{PRIMARY_PIN_COOKIE}={time.time() + seconds:.3f}; Max-Age={math.ceil(seconds)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                headers = list(message.get("headers") or [])
+                headers.append((b"set-cookie", cookie.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
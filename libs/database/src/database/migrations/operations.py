@@ -0,0 +1,98 @@
+"""Schema operations available to migrations (idempotent, Postgres- and SQLite-aware)."""
+from typing import Any, Iterable
+
+from peewee import Database, Field, PostgresqlDatabase
+from playhouse.migrate import SchemaMigrator, migrate
+
+
+def concrete_models() -> list[type]:
+    """All concrete models (non-abstract subclasses of BaseModel)."""
+    from database.models import BaseModel
+
+    def collect(cls: type) -> list[type]:
+        result: list[type] = []
+        for c in cls.__subclasses__():
+            if not getattr(c, "__abstract__", False):
+                result.append(c)
+            result.extend(collect(c))
+        return result
+
+    return collect(BaseModel)
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class MigrationContext:
+    """
+    Passed to each migration's upgrade(ctx). Operations are safe to re-run, so a
+    migration can follow an initial create_tables that already has the change.
+    """
+
+    def __init__(self, db: Database) -> None:
+        self.db = db
+
+    @property
+    def is_postgres(self) -> bool:
+        return isinstance(self.db, PostgresqlDatabase)
+
+    def execute(self, sql: str, params: Iterable[Any] | None = None) -> Any:
+        """Run raw SQL against the primary."""
+        return self.db.execute_sql(sql, params)
+
+    def create_tables(self, models: list[type]) -> None:
+        """Create tables (and their Meta.indexes) that do not exist yet."""
+        with self.db.bind_ctx(models):
+            self.db.create_tables(models, safe=True)
+
+    def has_column(self, table: str, column: str) -> bool:
+        return any(c.name == column for c in self.db.get_columns(table))
+
+    def add_column(self, table: str, column: str, field: Field) -> None:
+        """Add a column unless it already exists."""
+        if not self.has_column(table, column):
+            migrate(SchemaMigrator.from_database(self.db).add_column(table, column, field))
+
+    def has_index(self, table: str, name: str, unique: bool | None = None) -> bool:
+        """True if the index exists (and, when unique is given, has that uniqueness)."""
+        return any(
+            i.name == name and (unique is None or bool(i.unique) == unique) for i in self.db.get_indexes(table)
+        )
+
+    def drop_index(self, name: str) -> None:
+        """Drop an index if it exists (CONCURRENTLY on Postgres outside a transaction)."""
+        concurrently = " CONCURRENTLY" if self.is_postgres and not self.db.in_transaction() else ""
+        self.db.execute_sql(f"DROP INDEX{concurrently} IF EXISTS {_quote(name)}")
+
+    def create_index(
+        self,
+        table: str,
+        columns: list[str],
+        unique: bool = False,
+        name: str | None = None,
+    ) -> str:
+        """
+        Create an index unless it exists; returns its name (default "<table>_<col>_<col>";
+        pass the model's Peewee index name to match Meta.indexes). On Postgres
+        outside a transaction the index is built CONCURRENTLY, so writes to the
+        table are not blocked; an INVALID index left by an earlier failed
+        concurrent build is dropped and rebuilt.
+        """
+        name = name or f"{table}_{'_'.join(columns)}"
+        cols = ", ".join(_quote(c) for c in columns)
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        if self.is_postgres and not self.db.in_transaction():
+            invalid = self.db.execute_sql(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = %s AND NOT i.indisvalid",
+                (name,),
+            ).fetchone()
+            if invalid:
+                self.db.execute_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {_quote(name)}")
+            self.db.execute_sql(
+                f"CREATE {kind} CONCURRENTLY IF NOT EXISTS {_quote(name)} ON {_quote(table)} ({cols})"
+            )
+        else:
+            self.db.execute_sql(f"CREATE {kind} IF NOT EXISTS {_quote(name)} ON {_quote(table)} ({cols})")
+        return name
@@ -1,24 +1,103 @@
-"""Run migrations to apply schema updates on startup."""
+"""
+Versioned migrations: apply pending forward migrations and record them in schema_migrations.
 
+Migrations live in database.migrations.versions as modules named
+"<version>_<name>.py" (e.g. 0002_performance_indexes.py) defining
+upgrade(ctx: MigrationContext). A module may set `atomic = False` to run outside
+a transaction (required for CREATE INDEX CONCURRENTLY on Postgres).
+"""
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from datetime import datetime
+from types import ModuleType
 
-def _concrete_subclasses(cls: type) -> list[type]:
-    """Recursively collect all non-abstract subclasses."""
-    result: list[type] = []
-    for c in cls.__subclasses__():
-        if getattr(c, "__abstract__", False):
-            result.extend(_concrete_subclasses(c))
-        else:
-            result.append(c)
-            result.extend(_concrete_subclasses(c))
-    return result
+from peewee import CharField, Database, DateTimeField, Model
+
+from database.migrations.operations import MigrationContext
+
+VERSIONS_PACKAGE = "database.migrations.versions"
+
+
+class SchemaMigration(Model):
+    """One row per applied migration."""
+
+    version = CharField(max_length=32, primary_key=True)
+    name = CharField(max_length=255)
+    applied_at = DateTimeField(default=datetime.utcnow)
+
+    class Meta:
+        table_name = "schema_migrations"
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: str
+    name: str
+    module: ModuleType
+
+    @property
+    def atomic(self) -> bool:
+        return getattr(self.module, "atomic", True)
 
 
-def run_migrations() -> None:
-    """Create tables for all concrete models (subclasses of BaseModel)."""
+def discover_migrations() -> list[Migration]:
+    """All migrations in the versions package, ordered by version."""
+    package = importlib.import_module(VERSIONS_PACKAGE)
+    found: list[Migration] = []
+    for info in pkgutil.iter_modules(package.__path__):
+        version, sep, name = info.name.partition("_")
+        if not sep or not version.isdigit():
+            continue
+        module = importlib.import_module(f"{VERSIONS_PACKAGE}.{info.name}")
+        found.append(Migration(version=version, name=name, module=module))
+    found.sort(key=lambda m: m.version)
+    return found
+
+
+def _db(db: Database | None) -> Database:
+    if db is not None:
+        return db
     from database.connection import get_db
-    from database.models import BaseModel
+    return get_db()
+
+
+def applied_versions(db: Database | None = None) -> set[str]:
+    """Versions recorded in schema_migrations (creates the table if missing)."""
+    db = _db(db)
+    with db.bind_ctx([SchemaMigration]):
+        db.create_tables([SchemaMigration], safe=True)
+        return {row.version for row in SchemaMigration.select(SchemaMigration.version)}
+
+
+def pending_migrations(db: Database | None = None) -> list[Migration]:
+    """Migrations not yet applied, in order."""
+    applied = applied_versions(db)
+    return [m for m in discover_migrations() if m.version not in applied]
+
+
+def apply_migration(migration: Migration, db: Database | None = None) -> None:
+    """Run one migration and record it."""
+    db = _db(db)
+    ctx = MigrationContext(db)
+    with db.bind_ctx([SchemaMigration]):
+        if migration.atomic:
+            with db.atomic():
+                migration.module.upgrade(ctx)
+                SchemaMigration.create(version=migration.version, name=migration.name)
+        else:
+            # Operations must be idempotent: a failure here leaves the version unrecorded.
+            migration.module.upgrade(ctx)
+            SchemaMigration.create(version=migration.version, name=migration.name)
+
 
-    db = get_db()
-    models = _concrete_subclasses(BaseModel)
-    if models:
-        db.create_tables(models, safe=True)
+def run_migrations(target: str | None = None, db: Database | None = None) -> list[str]:
+    """Apply pending migrations (up to and including target, if given). Returns applied versions."""
+    db = _db(db)
+    applied: list[str] = []
+    for migration in pending_migrations(db):
+        if target is not None and migration.version > target:
+            break
+        apply_migration(migration, db)
+        applied.append(migration.version)
+    return applied
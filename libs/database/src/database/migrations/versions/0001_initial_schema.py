@@ -0,0 +1,6 @@
+"""Initial schema: create every model table (no-op for tables that already exist)."""
+from database.migrations.operations import MigrationContext, concrete_models
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    ctx.create_tables(concrete_models())
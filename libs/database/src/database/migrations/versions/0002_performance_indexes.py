@@ -0,0 +1,14 @@
+"""Indexes for the applicant list, board queue, audit trail and interaction history."""
+from database.migrations.operations import MigrationContext
+
+# Built CONCURRENTLY on Postgres, which cannot run inside a transaction.
+atomic = False
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    # Names match the indexes Peewee creates from each model's Meta.indexes.
+    ctx.create_index("applications", ["user_id", "created_at"], name="application_user_id_created_at")
+    ctx.create_index("applications", ["ready_for_board_review_at"], name="application_ready_for_board_review_at")
+    ctx.create_index("audit_logs", ["user_id", "created_at"], name="auditlog_user_id_created_at")
+    ctx.create_index("audit_logs", ["resource_type", "resource_id"], name="auditlog_resource_type_resource_id")
+    ctx.create_index("user_interactions", ["user_id", "created_at"], name="userinteraction_user_id_created_at")
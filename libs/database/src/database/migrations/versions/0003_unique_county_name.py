@@ -0,0 +1,24 @@
+"""Make counties (name, state_code) unique so reference data can be bulk upserted."""
+from database.migrations.operations import MigrationContext
+
+# Index rebuilt CONCURRENTLY on Postgres, which cannot run inside a transaction.
+atomic = False
+
+INDEX = "county_name_state_code"
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    if ctx.has_index("counties", INDEX, unique=True):
+        return
+    # Drop duplicate rows (counties are referenced by name, not id) before enforcing uniqueness.
+    seen: set[tuple[str, str]] = set()
+    duplicates = []
+    for county_id, name, state_code in ctx.execute('SELECT id, name, state_code FROM "counties" ORDER BY created_at'):
+        key = (name, state_code)
+        if key in seen:
+            duplicates.append(county_id)
+        seen.add(key)
+    for county_id in duplicates:
+        ctx.execute('DELETE FROM "counties" WHERE id = ' + ctx.db.param, (county_id,))
+    ctx.drop_index(INDEX)
+    ctx.create_index("counties", ["name", "state_code"], unique=True, name=INDEX)
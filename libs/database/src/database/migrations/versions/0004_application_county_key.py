@@ -0,0 +1,23 @@
+"""Indexed, normalized county on applications for the Forestry Board review queue."""
+from peewee import CharField
+
+from database.migrations.operations import MigrationContext
+
+# Index built CONCURRENTLY on Postgres, which cannot run inside a transaction.
+atomic = False
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    ctx.add_column("applications", "county_key", CharField(max_length=128, null=True))
+    # Backfill from contact information (same normalization as normalize_county_key).
+    ctx.execute(
+        'UPDATE "applications" SET "county_key" = ('
+        'SELECT NULLIF(LOWER(TRIM(c."county")), \'\') FROM "contact_information" c '
+        'WHERE c."application_id" = "applications"."id") '
+        'WHERE "county_key" IS NULL'
+    )
+    ctx.create_index(
+        "applications",
+        ["county_key", "ready_for_board_review_at"],
+        name="application_county_key_ready_for_board_review_at",
+    )
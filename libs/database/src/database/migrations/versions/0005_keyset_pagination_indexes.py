@@ -0,0 +1,12 @@
+"""Composite (filter, created_at) indexes so keyset-paginated complaint lists stay index range scans."""
+from database.migrations.operations import MigrationContext
+
+# Built CONCURRENTLY on Postgres, which cannot run inside a transaction.
+atomic = False
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    # Applications already have (user_id, created_at) and (county_key, ready_for_board_review_at).
+    ctx.create_index("complaints", ["submitted_by_id", "created_at"], name="complaint_submitted_by_id_created_at")
+    ctx.create_index("complaints", ["status", "created_at"], name="complaint_status_created_at")
+    ctx.create_index("complaints", ["category", "created_at"], name="complaint_category_created_at")
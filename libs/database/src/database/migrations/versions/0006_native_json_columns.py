@@ -0,0 +1,23 @@
+"""Store form_data, matching_funds and line_item_budget as native JSON (JSONB on Postgres)."""
+from database.migrations.operations import MigrationContext
+
+COLUMNS = (
+    ("applications", "form_data"),
+    ("financial_information", "matching_funds"),
+    ("financial_information", "line_item_budget"),
+)
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    # SQLite keeps the JSON text as-is (JSON1 functions read it directly); only
+    # Postgres changes the column type. Empty strings become NULL.
+    if not ctx.is_postgres:
+        return
+    for table, column in COLUMNS:
+        current = {c.name: c.data_type.lower() for c in ctx.db.get_columns(table)}.get(column)
+        if current == "jsonb":
+            continue
+        ctx.execute(
+            f'ALTER TABLE "{table}" ALTER COLUMN "{column}" TYPE JSONB '
+            f'USING NULLIF(TRIM("{column}"), \'\')::jsonb'
+        )
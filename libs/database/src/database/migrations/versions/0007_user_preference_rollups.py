@@ -0,0 +1,10 @@
+"""Per-user interaction rollups for recommendations, backfilled from user_interactions."""
+from database.migrations.operations import MigrationContext
+from database.models import UserInteraction, UserPreferenceRollup
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    ctx.create_tables([UserPreferenceRollup])
+    with ctx.db.bind_ctx([UserInteraction, UserPreferenceRollup]):
+        if not UserPreferenceRollup.select().exists():
+            UserPreferenceRollup.rebuild()
@@ -0,0 +1,13 @@
+"""Preference rollup counts weighted by 1 / sample_rate: a REAL count column, recomputed."""
+from database.migrations.operations import MigrationContext
+from database.models import UserInteraction, UserPreferenceRollup
+
+
+def upgrade(ctx: MigrationContext) -> None:
+    # SQLite stores non-integral values in the INTEGER-affinity column as REAL; only
+    # Postgres changes the column type.
+    if ctx.is_postgres:
+        ctx.execute('ALTER TABLE "user_preference_rollups" ALTER COLUMN "count" TYPE DOUBLE PRECISION')
+    with ctx.db.bind_ctx([UserInteraction, UserPreferenceRollup]):
+        if UserInteraction.select().where(UserInteraction.metadata_json.contains('"sample_rate"')).exists():
+            UserPreferenceRollup.rebuild()
@@ -0,0 +1 @@
+"""Versioned migrations, applied in order by database.migrations.runner."""
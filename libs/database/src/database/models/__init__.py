@@ -3,7 +3,7 @@ from database.models.base import BaseModel
 from database.models.user import User
 from database.models.password_reset import PasswordReset
 from database.models.login_attempt import LoginAttempt
-from database.models.application import Application
+from database.models.application import Application, normalize_county_key
 from database.models.county import County
 from database.models.contact_information import ContactInformation
 from database.models.site_ownership import SiteOwnership
@@ -18,6 +18,7 @@ from database.models.forestry_board_approval import ForestryBoardApproval
 from database.models.revision_request import RevisionRequest
 from database.models.complaint import Complaint, COMPLAINT_CATEGORIES, COMPLAINT_STATUSES
 from database.models.user_interaction import UserInteraction
+from database.models.user_preference_rollup import UserPreferenceRollup
 from database.models.audit_log import AuditLog
 
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     "PasswordReset",
     "LoginAttempt",
     "Application",
+    "normalize_county_key",
     "County",
     "ContactInformation",
     "SiteOwnership",
@@ -43,5 +45,6 @@ __all__ = [
     "COMPLAINT_CATEGORIES",
     "COMPLAINT_STATUSES",
     "UserInteraction",
+    "UserPreferenceRollup",
     "AuditLog",
 ]
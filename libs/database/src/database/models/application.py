@@ -1,25 +1,37 @@
 """Application model for grant applications."""
-from peewee import CharField, DateTimeField, ForeignKeyField, TextField
+from peewee import CharField, DateTimeField, ForeignKeyField
 
+from database.json_fields import JSONField
 from database.models.base import BaseModel
 from database.models.user import User
 
 
+def normalize_county_key(county: str | None) -> str | None:
+    """Normalized county used for board queue lookups (trimmed, lower-case)."""
+    key = (county or "").strip().lower()
+    return key or None
+
+
 class Application(BaseModel):
     """
     Grant application: belongs to a user, status draft or submitted.
-    form_data: JSON string for section data (e.g. contact information).
+    form_data: JSON document for section data (e.g. contact information); JSONB on Postgres.
     ready_for_board_review_at: when applicant marked ready for Forestry Board review.
+    county_key: normalize_county_key(contact county); kept in sync when contact info is saved.
     """
 
     user = ForeignKeyField(User, backref="applications", on_delete="CASCADE")
     status = CharField(max_length=32, default="draft", index=True)  # draft | submitted
-    form_data = TextField(null=True, default=None)  # JSON string
+    form_data = JSONField(null=True, default=None)
     ready_for_board_review_at = DateTimeField(null=True, default=None)
+    county_key = CharField(max_length=128, null=True, default=None)
 
     class Meta:
         table_name = "applications"
         indexes = (
             (("user_id",), False),
             (("created_at",), False),
+            (("user_id", "created_at"), False),
+            (("ready_for_board_review_at",), False),
+            (("county_key", "ready_for_board_review_at"), False),
         )
@@ -1,6 +1,7 @@
 """Audit log for sensitive actions (no PII stored in action_details)."""
-from peewee import CharField, DateTimeField, ForeignKeyField, TextField
+from peewee import CharField, DateTimeField, ForeignKeyField, TextField, UUIDField
 
+from database.ids import uuid7
 from database.models.base import BaseModel
 from database.models.user import User
 
@@ -12,6 +13,7 @@ class AuditLog(BaseModel):
     PII or full request bodies here.
     """
 
+    id = UUIDField(primary_key=True, default=uuid7)  # append-only: keys in insert order
     user = ForeignKeyField(User, backref="audit_logs", on_delete="SET NULL", null=True, default=None)
     action = CharField(max_length=64, index=True)  # e.g. login, application_submit, complaint_submit
     resource_type = CharField(max_length=64, null=True, default=None)  # e.g. application, complaint
@@ -25,4 +27,6 @@ class AuditLog(BaseModel):
         indexes = (
             (("action",), False),
             (("created_at",), False),
+            (("user_id", "created_at"), False),
+            (("resource_type", "resource_id"), False),
         )
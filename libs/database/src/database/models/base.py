@@ -1,17 +1,21 @@
 """Base model with UUID primary key and timestamps."""
-import uuid
 from datetime import datetime
 from typing import Any
 
 from peewee import DateTimeField, Model, UUIDField
 
 from database.connection import database_proxy
+from database.ids import new_id
 
 
 class BaseModel(Model):
-    """Base for all models: UUID primary key, created_at, updated_at."""
+    """
+    Base for all models: UUID primary key, created_at, updated_at. Keys are
+    uuid4 unless DATABASE_UUID_VERSION=7 (see database.ids); append-only tables
+    can opt in on their own with id = UUIDField(primary_key=True, default=uuid7).
+    """
 
-    id = UUIDField(primary_key=True, default=uuid.uuid4)
+    id = UUIDField(primary_key=True, default=new_id)
     created_at = DateTimeField(default=datetime.utcnow)
     updated_at = DateTimeField(default=datetime.utcnow)
 
@@ -53,4 +53,8 @@ class Complaint(BaseModel):
             (("status",), False),
             (("category",), False),
             (("created_at",), False),
+            # Keyset pagination: newest first within a filter
+            (("submitted_by_id", "created_at"), False),
+            (("status", "created_at"), False),
+            (("category", "created_at"), False),
         )
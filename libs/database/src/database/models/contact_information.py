@@ -1,7 +1,9 @@
 """Contact information for an application: organization, address, county, primary/alternate contact."""
+from typing import Any
+
 from peewee import CharField, ForeignKeyField, TextField
 
-from database.models.application import Application
+from database.models.application import Application, normalize_county_key
 from database.models.base import BaseModel
 
 
@@ -9,6 +11,7 @@ class ContactInformation(BaseModel):
     """
     Contact information section: one-to-one with Application.
     Organization, mailing address, county, primary and alternate contact.
+    Saving also syncs the application's indexed county_key.
     """
 
     application = ForeignKeyField(Application, backref="contact_information", on_delete="CASCADE", unique=True)
@@ -38,3 +41,13 @@ class ContactInformation(BaseModel):
 
     class Meta:
         table_name = "contact_information"
+
+    def save(self, *args: Any, **kwargs: Any) -> int:
+        """Save and keep Application.county_key in sync with county."""
+        result = super().save(*args, **kwargs)
+        key = normalize_county_key(self.county)
+        stale = Application.county_key.is_null() if key is not None else Application.county_key.is_null(False)
+        if key is not None:
+            stale = stale | (Application.county_key != key)
+        Application.update(county_key=key).where((Application.id == self.application_id) & stale).execute()
+        return result
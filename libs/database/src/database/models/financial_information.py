@@ -1,6 +1,7 @@
 """Financial information for an application: costs, grant, matching funds, line item budget."""
-from peewee import FloatField, ForeignKeyField, TextField
+from peewee import FloatField, ForeignKeyField
 
+from database.json_fields import JSONField
 from database.models.application import Application
 from database.models.base import BaseModel
 
@@ -18,9 +19,9 @@ class FinancialInformation(BaseModel):
     total_project_cost = FloatField(null=True)   # currency, 2 decimal precision
     grant_amount_requested = FloatField(null=True)
     # JSON: [ {"source_name": str, "amount": float, "type": "cash"|"in_kind"}, ... ]
-    matching_funds = TextField(null=True, default=None)
+    matching_funds = JSONField(null=True, default=None)
     # JSON: [ {"category": str, "description": str, "amount": float}, ... ]
-    line_item_budget = TextField(null=True, default=None)
+    line_item_budget = JSONField(null=True, default=None)
 
     class Meta:
         table_name = "financial_information"
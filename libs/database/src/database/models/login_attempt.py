@@ -1,14 +1,16 @@
 """Login attempt tracking for lockout and audit."""
 from datetime import datetime
 
-from peewee import BooleanField, CharField, DateTimeField
+from peewee import BooleanField, CharField, DateTimeField, UUIDField
 
+from database.ids import uuid7
 from database.models.base import BaseModel
 
 
 class LoginAttempt(BaseModel):
     """Record of a login attempt: email, time, success, optional ip_address."""
 
+    id = UUIDField(primary_key=True, default=uuid7)  # append-only: keys in insert order
     email = CharField(index=True, max_length=255)
     attempt_time = DateTimeField(default=datetime.utcnow)
     success = BooleanField()
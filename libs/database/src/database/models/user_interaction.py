@@ -1,6 +1,7 @@
 """User interaction model for preference capture and personalization."""
-from peewee import CharField, ForeignKeyField, TextField
+from peewee import CharField, ForeignKeyField, TextField, UUIDField
 
+from database.ids import uuid7
 from database.models.base import BaseModel
 from database.models.user import User
 
@@ -11,6 +12,7 @@ class UserInteraction(BaseModel):
     for learning preferences and powering personalized recommendations.
     """
 
+    id = UUIDField(primary_key=True, default=uuid7)  # append-only: keys in insert order
     user = ForeignKeyField(User, backref="interactions", on_delete="CASCADE")
     interaction_type = CharField(max_length=64, index=True)  # e.g. page_view, form_section, service_used
     target_id = CharField(max_length=255, null=True, default=None)  # e.g. page path, section id, service id
@@ -21,4 +23,5 @@ class UserInteraction(BaseModel):
         indexes = (
             (("user_id", "interaction_type"), False),
             (("created_at",), False),
+            (("user_id", "created_at"), False),
         )
@@ -0,0 +1,134 @@
+"""Per-user interaction counts (by interaction type and by target) for recommendations."""
+import json
+from collections import Counter
+from datetime import datetime
+from typing import Any, Iterable
+from uuid import UUID
+
+from peewee import EXCLUDED, CharField, DateTimeField, FloatField, ForeignKeyField, chunked
+
+from database.bulk import bulk_upsert
+from database.models.base import BaseModel
+from database.models.user import User
+from database.models.user_interaction import UserInteraction
+
+DIMENSION_TYPE = "type"
+DIMENSION_TARGET = "target"
+_UPSERT_CHUNK = 120  # 8 columns per row stays under SQLite's 999 parameters
+
+RollupKey = tuple[UUID, str, str]
+
+
+def interaction_weight(row: dict[str, Any]) -> float:
+    """
+    How many interactions one stored row stands for: 1 / the "sample_rate" in its
+    metadata (set when a sampled interaction type was kept), else 1.
+    """
+    raw = row.get("metadata_json")
+    if not raw:
+        return 1.0
+    try:
+        rate = float((json.loads(raw) if isinstance(raw, str) else raw).get("sample_rate", 1.0))
+    except (TypeError, ValueError, AttributeError):
+        return 1.0
+    return 1.0 / rate if 0.0 < rate < 1.0 else 1.0
+
+
+def _tally(interactions: Iterable[dict[str, Any]]) -> tuple[Counter[RollupKey], dict[RollupKey, datetime]]:
+    """Weighted counts and latest created_at per (user, dimension, key)."""
+    counts: Counter[RollupKey] = Counter()
+    seen: dict[RollupKey, datetime] = {}
+    for row in interactions:
+        at = row.get("created_at") or datetime.utcnow()
+        weight = interaction_weight(row)
+        keys = [(row["user"], DIMENSION_TYPE, row["interaction_type"])]
+        if row.get("target_id"):
+            keys.append((row["user"], DIMENSION_TARGET, row["target_id"]))
+        for k in keys:
+            counts[k] += weight
+            seen[k] = max(seen.get(k, at), at)
+    return counts, seen
+
+
+class UserPreferenceRollup(BaseModel):
+    """
+    Running count of a user's interactions for one key: an interaction_type
+    (dimension "type") or a target_id (dimension "target"). Sampled interactions
+    count 1 / sample_rate each, so count estimates the events actually seen.
+    Kept up to date by record() in the same transaction that inserts the
+    interactions; rebuild() recomputes it from user_interactions (backfills, repairs).
+    """
+
+    user = ForeignKeyField(User, backref="preference_rollups", on_delete="CASCADE")
+    dimension = CharField(max_length=16)
+    key = CharField(max_length=255)
+    count = FloatField(default=0)
+    last_seen_at = DateTimeField(null=True)
+
+    class Meta:
+        table_name = "user_preference_rollups"
+        indexes = ((("user_id", "dimension", "key"), True),)
+
+    @classmethod
+    def record(cls, interactions: Iterable[dict[str, Any]]) -> None:
+        """
+        Add interaction rows (dicts with user, interaction_type, target_id, created_at,
+        metadata_json) to the counts: one upsert per chunk of distinct keys, count = count + new.
+        """
+        counts, seen = _tally(interactions)
+        if not counts:
+            return
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": cls.id.default(),
+                "user": user,
+                "dimension": dimension,
+                "key": key,
+                "count": n,
+                "last_seen_at": seen[(user, dimension, key)],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (user, dimension, key), n in counts.items()
+        ]
+        with cls._meta.database.atomic():
+            for chunk in chunked(rows, _UPSERT_CHUNK):
+                cls.insert_many(chunk).on_conflict(
+                    conflict_target=[cls.user, cls.dimension, cls.key],
+                    update={
+                        cls.count: cls.count + EXCLUDED.count,
+                        cls.last_seen_at: EXCLUDED.last_seen_at,
+                        cls.updated_at: EXCLUDED.updated_at,
+                    },
+                ).execute()
+
+    @classmethod
+    def rebuild(cls, user_id: UUID | str | None = None) -> int:
+        """
+        Recompute counts from user_interactions (one user or everyone); returns rollup
+        rows written. Rows are streamed and weighted like record(), since sample rates
+        live in each row's metadata.
+        """
+        source = UserInteraction.select(
+            UserInteraction.user,
+            UserInteraction.interaction_type,
+            UserInteraction.target_id,
+            UserInteraction.metadata_json,
+            UserInteraction.created_at,
+        )
+        if user_id is not None:
+            source = source.where(UserInteraction.user == user_id)
+        with cls._meta.database.atomic():
+            delete = cls.delete()
+            if user_id is not None:
+                delete = delete.where(cls.user == user_id)
+            delete.execute()
+            counts, seen = _tally(source.dicts().iterator())
+            rows = (
+                {"user": k[0], "dimension": k[1], "key": k[2], "count": n, "last_seen_at": seen[k]}
+                for k, n in counts.items()
+            )
+            return bulk_upsert(
+                cls, rows, conflict_target=["user", "dimension", "key"], update=["count", "last_seen_at"]
+            )
@@ -0,0 +1,109 @@
+"""
+Keyset (cursor) pagination, newest first.
+
+Pages are ordered by (key, id) descending, where key is created_at unless given,
+and the next page starts strictly after the last row seen. Unlike
+offset(...).limit(...), page N costs the same as page 1 when (filter..., key)
+is indexed. Cursors are opaque URL-safe strings; clients pass back next_cursor
+unchanged.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from peewee import Field, ModelSelect, PostgresqlDatabase, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded."""
+
+
+@dataclass
+class Page:
+    """One page of results. next_cursor is None on the last page."""
+
+    items: list[Any] = field(default_factory=list)
+    next_cursor: str | None = None
+    limit: int = DEFAULT_PAGE_SIZE
+    total: int | None = None  # only when requested; estimated on Postgres
+
+
+def clamp_limit(limit: int | None, default: int = DEFAULT_PAGE_SIZE, maximum: int = MAX_PAGE_SIZE) -> int:
+    """Page size from a client value: default when missing, at least 1, at most maximum."""
+    if not limit:
+        return default
+    return max(1, min(int(limit), maximum))
+
+
+def encode_cursor(key: Any, row_id: Any) -> str:
+    """Opaque cursor for the row (key, id)."""
+    if isinstance(key, datetime):
+        payload = {"t": "dt", "k": key.isoformat(), "id": str(row_id)}
+    else:
+        payload = {"t": "s", "k": key, "id": str(row_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, UUID]:
+    """Return (key, id) from a cursor made by encode_cursor; raises InvalidCursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        key = datetime.fromisoformat(payload["k"]) if payload["t"] == "dt" else payload["k"]
+        return key, UUID(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def estimate_count(query: ModelSelect) -> int:
+    """
+    Row count for a query: the planner's estimate on Postgres (no table scan),
+    an exact count elsewhere.
+    """
+    db = query.model._meta.database
+    target = getattr(db, "obj", None) or db  # unwrap DatabaseProxy
+    unordered = query.order_by()
+    if not isinstance(target, PostgresqlDatabase):
+        return unordered.count()
+    sql, params = unordered.sql()
+    plan = db.execute_sql("EXPLAIN (FORMAT JSON) " + sql, params).fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def paginate(
+    query: ModelSelect,
+    limit: int | None = None,
+    cursor: str | None = None,
+    key: Field | None = None,
+    include_total: bool = False,
+) -> Page:
+    """
+    Fetch one page of query (already filtered, not ordered) newest first by
+    (key, id). Reads limit + 1 rows to know whether another page follows.
+    """
+    model = query.model
+    key = key or model.created_at
+    limit = clamp_limit(limit)
+    total = estimate_count(query) if include_total else None
+    page_query = query.order_by(key.desc(), model.id.desc())
+    if cursor:
+        last_key, last_id = decode_cursor(cursor)
+        after = Tuple(key.to_value(last_key), model.id.to_value(last_id))
+        page_query = page_query.where(Tuple(key, model.id) < after)
+    rows = list(page_query.limit(limit + 1))
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, key.name), last.id)
+    return Page(items=rows, next_cursor=next_cursor, limit=limit, total=total)
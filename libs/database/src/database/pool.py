@@ -0,0 +1,161 @@
+"""
+Connection pooling: pooled Postgres/SQLite databases with checkout metrics.
+
+Enabled by DATABASE_POOL_SIZE > 0 (see database.connection.get_db). Each
+request (asyncio task or worker thread) gets its own connection state, so a
+connection is checked out on the first query and returned to the pool when
+the request ends (see database.middleware.ConnectionMiddleware).
+"""
+import heapq
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any
+
+from peewee import Database, _ConnectionState
+from playhouse.pool import MaxConnectionsExceeded, PooledPostgresqlDatabase, PooledSqliteDatabase
+
+DEFAULT_POOL_SIZE = 0  # 0 = pooling disabled (single global connection per thread)
+DEFAULT_STALE_TIMEOUT = 300  # seconds a connection may live before it is recycled
+DEFAULT_WAIT_TIMEOUT = 10  # seconds to wait for a free connection before failing
+
+# Per-context map of database state id -> connection state (primary and replicas each get one).
+_state_var: ContextVar[dict[int, dict[str, Any]] | None] = ContextVar("database_connection_state", default=None)
+
+
+def _int_env(name: str, default: int | None) -> int | None:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return default
+
+
+def get_pool_config() -> dict[str, int | None]:
+    """
+    Pool settings from environment:
+    DATABASE_POOL_SIZE (max connections per process, 0 disables pooling),
+    DATABASE_POOL_MAX_IDLE (idle connections kept open; default = pool size),
+    DATABASE_POOL_STALE_TIMEOUT (seconds), DATABASE_POOL_TIMEOUT (checkout wait, seconds).
+    """
+    size = _int_env("DATABASE_POOL_SIZE", DEFAULT_POOL_SIZE) or 0
+    return {
+        "max_connections": size,
+        "max_idle": _int_env("DATABASE_POOL_MAX_IDLE", None),
+        "stale_timeout": _int_env("DATABASE_POOL_STALE_TIMEOUT", DEFAULT_STALE_TIMEOUT),
+        "timeout": _int_env("DATABASE_POOL_TIMEOUT", DEFAULT_WAIT_TIMEOUT),
+    }
+
+
+class ContextConnectionState(_ConnectionState):
+    """
+    Peewee connection state kept in a ContextVar instead of a thread-local.
+    Worker threads started by the server copy the request context, so a request
+    uses one connection whether its code runs on the event loop or in the thread pool.
+    """
+
+    def _current(self) -> dict[str, Any]:
+        states = _state_var.get()
+        if states is None:
+            states = {}
+            _state_var.set(states)
+        state = states.get(id(self))
+        if state is None:
+            state = states[id(self)] = {"closed": True, "conn": None, "ctx": [], "transactions": []}
+        return state
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._current()[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._current()[name] = value
+
+
+def reset_connection_state() -> None:
+    """Give the current context a fresh connection state (call at the start of a request)."""
+    _state_var.set({})
+
+
+class PoolMetricsMixin:
+    """Adds max-idle enforcement and checkout metrics to a playhouse pooled database."""
+
+    def __init__(self, *args: Any, max_idle: int | None = None, **kwargs: Any) -> None:
+        self._max_idle = max_idle
+        self._metrics_lock = threading.Lock()
+        self._waiting = 0
+        self._checkouts = 0
+        self._checkout_seconds = 0.0
+        self._checkout_timeouts = 0
+        super().__init__(*args, **kwargs)
+        self._state = ContextConnectionState()
+
+    def connect(self, reuse_if_open: bool = False) -> bool:
+        if reuse_if_open and not self.is_closed():
+            return False
+        start = time.perf_counter()
+        with self._metrics_lock:
+            self._waiting += 1
+        try:
+            opened = super().connect(reuse_if_open)
+        except MaxConnectionsExceeded:
+            with self._metrics_lock:
+                self._checkout_timeouts += 1
+            raise
+        else:
+            # Only checkouts that got a connection; timeouts are counted above.
+            elapsed = time.perf_counter() - start
+            with self._metrics_lock:
+                self._checkouts += 1
+                self._checkout_seconds += elapsed
+            return opened
+        finally:
+            with self._metrics_lock:
+                self._waiting -= 1
+
+    def _close(self, conn: Any, close_conn: bool = False) -> None:
+        with self._pool_lock:
+            super()._close(conn, close_conn)
+            if close_conn or self._max_idle is None:
+                return
+            # Idle connections are a heap ordered oldest first; close the oldest surplus.
+            while len(self._connections) > self._max_idle:
+                _, _, idle = heapq.heappop(self._connections)
+                super()._close(idle, close_conn=True)
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Snapshot of pool usage: size, in_use, idle, waiting, checkouts, latency sum, timeouts."""
+        with self._pool_lock:
+            in_use = len(self._in_use)
+            idle = len(self._connections)
+        with self._metrics_lock:
+            return {
+                "max_connections": self._max_connections,
+                "max_idle": self._max_idle,
+                "in_use": in_use,
+                "idle": idle,
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "checkout_seconds_sum": self._checkout_seconds,
+                "checkout_timeouts": self._checkout_timeouts,
+            }
+
+
+class MonitoredPooledPostgresqlDatabase(PoolMetricsMixin, PooledPostgresqlDatabase):
+    """Pooled PostgreSQL database with checkout metrics."""
+
+
+class MonitoredPooledSqliteDatabase(PoolMetricsMixin, PooledSqliteDatabase):
+    """Pooled SQLite database with checkout metrics."""
+
+
+POOLED_SCHEMES: dict[str, type[Database]] = {
+    "postgres": MonitoredPooledPostgresqlDatabase,
+    "postgresql": MonitoredPooledPostgresqlDatabase,
+    "sqlite": MonitoredPooledSqliteDatabase,
+}
@@ -0,0 +1,136 @@
+"""
+Read-replica routing with read-your-writes.
+
+With DATABASE_REPLICA_URLS set (comma-separated), queries issued inside a
+read-only scope (the `read_only` decorator or `use_replica()` context manager)
+go to a replica. Everything else goes to the primary, and so do reads that:
+
+- run inside a transaction on the primary,
+- come after a write in the same request, or
+- belong to a request pinned to the primary because the client wrote within the
+  last DATABASE_REPLICA_PIN_SECONDS (see database.middleware.ReadYourWritesMiddleware).
+"""
+import functools
+import os
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, TypeVar
+
+from peewee import Database, DatabaseProxy, SelectBase
+
+from database import instrumentation
+
+DEFAULT_PIN_SECONDS = 5.0
+
+T = TypeVar("T")
+
+_replicas: list[Database] = []
+_read_only: ContextVar[bool] = ContextVar("database_read_only", default=False)
+# Mutable per-request holder so writes made in worker threads (copied contexts) are visible to the middleware.
+_request_state: ContextVar[dict[str, bool] | None] = ContextVar("database_request_state", default=None)
+
+
+def get_replica_urls() -> list[str]:
+    """DATABASE_REPLICA_URLS from environment (comma-separated; empty = no replicas)."""
+    raw = os.getenv("DATABASE_REPLICA_URLS", "")
+    return [u.strip() for u in raw.split(",") if u.strip()]
+
+
+def get_pin_seconds() -> float:
+    """Seconds a client stays on the primary after a write (DATABASE_REPLICA_PIN_SECONDS)."""
+    try:
+        return max(0.0, float(os.getenv("DATABASE_REPLICA_PIN_SECONDS", DEFAULT_PIN_SECONDS)))
+    except ValueError:
+        return DEFAULT_PIN_SECONDS
+
+
+def set_replicas(replicas: list[Database]) -> None:
+    """Register replica databases (called by database.connection.init_db)."""
+    _replicas[:] = replicas
+
+
+def get_replicas() -> list[Database]:
+    """Registered replica databases."""
+    return list(_replicas)
+
+
+def has_replicas() -> bool:
+    """True if at least one replica is configured."""
+    return bool(_replicas)
+
+
+@contextmanager
+def use_replica() -> Iterator[None]:
+    """Route reads in this block to a replica (subject to read-your-writes)."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def read_only(fn: Callable[..., T]) -> Callable[..., T]:
+    """Decorator for read-only service methods: their queries may be served by a replica."""
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with use_replica():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def begin_request(pinned: bool = False) -> None:
+    """Start read-your-writes tracking for a request; pinned=True sends all its reads to the primary."""
+    _request_state.set({"pinned": pinned, "wrote": False})
+
+
+def request_wrote() -> bool:
+    """True if the current request has written to the primary."""
+    state = _request_state.get()
+    return bool(state and state["wrote"])
+
+
+def _mark_write() -> None:
+    state = _request_state.get()
+    if state is not None:
+        state["wrote"] = True
+
+
+def _prefer_replica(primary: Database) -> bool:
+    if not _replicas or not _read_only.get():
+        return False
+    state = _request_state.get()
+    if state is not None and (state["pinned"] or state["wrote"]):
+        return False
+    return not primary.in_transaction()
+
+
+class RoutingDatabaseProxy(DatabaseProxy):
+    """
+    DatabaseProxy that sends read-only SELECTs to a replica; all other statements
+    (and every other Database method) go to the primary it was initialized with.
+    """
+
+    def _target(self, is_select: bool) -> Database:
+        if self.obj is None:
+            raise AttributeError("Cannot use uninitialized Proxy.")
+        if not is_select:
+            _mark_write()
+            return self.obj
+        if _prefer_replica(self.obj):
+            return random.choice(_replicas)
+        return self.obj
+
+    def execute(self, query: Any, commit: Any = None, **context_options: Any) -> Any:
+        db = self._target(isinstance(query, SelectBase))
+        if instrumentation.current_profile() is None:
+            return db.execute(query, commit=commit, **context_options)
+        # Same as Database.execute, but timed into the request's query profile.
+        sql, params = db.get_sql_context(**context_options).sql(query).query()
+        return instrumentation.timed_execute(db, sql, params, commit=commit)
+
+    def execute_sql(self, sql: str, params: Any = None, commit: Any = None) -> Any:
+        db = self._target(sql.lstrip()[:7].upper().startswith(("SELECT", "EXPLAIN")))
+        return instrumentation.timed_execute(db, sql, params, commit=commit)
@@ -0,0 +1,226 @@
+"""
+SQLite single-node profile: connection pragmas and a serialized writer queue.
+
+File-backed SQLite databases are opened with WAL journaling, synchronous=NORMAL,
+a memory-mapped read window and a busy timeout (see get_sqlite_pragmas). SQLite
+allows one writer at a time, so concurrent auto-saves otherwise contend for the
+write lock and fail with "database is locked". With the write queue enabled,
+functions decorated with @serialized_write run on one writer thread, and
+writes submitted concurrently are committed together in one transaction (one
+WAL sync per batch; each write is a savepoint, so a failing write does not roll
+back the others).
+
+Environment:
+  SQLITE_PROFILE           "wal" (default) or "off" for SQLite's defaults
+  SQLITE_BUSY_TIMEOUT_MS   lock wait before "database is locked" (default 5000)
+  SQLITE_MMAP_SIZE         bytes of the file memory-mapped for reads (default 256 MiB)
+  SQLITE_WRITE_QUEUE       1 (default) to serialize @serialized_write calls, 0 to run inline
+  SQLITE_WRITE_BATCH       max writes committed per transaction (default 64)
+"""
+import functools
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from contextvars import copy_context
+from typing import Any, Callable, TypeVar
+
+from peewee import Database, SqliteDatabase
+
+from database import instrumentation, routing
+from database.pool import reset_connection_state
+
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_WRITE_BATCH = 64
+
+T = TypeVar("T")
+
+_write_queue: "SQLiteWriteQueue | None" = None
+
+
+def _int_env(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name, "").strip() or default))
+    except ValueError:
+        return default
+
+
+def profile_enabled() -> bool:
+    return os.getenv("SQLITE_PROFILE", "wal").strip().lower() not in ("off", "0", "false", "default")
+
+
+def get_sqlite_pragmas() -> dict[str, Any]:
+    """Pragmas applied to every connection of a file-backed SQLite database ({} when SQLITE_PROFILE=off)."""
+    if not profile_enabled():
+        return {}
+    return {
+        "journal_mode": "wal",
+        "synchronous": "normal",  # WAL stays consistent; a power loss may drop the last commits
+        "busy_timeout": _int_env("SQLITE_BUSY_TIMEOUT_MS", DEFAULT_BUSY_TIMEOUT_MS),
+        "mmap_size": _int_env("SQLITE_MMAP_SIZE", DEFAULT_MMAP_SIZE),
+    }
+
+
+def is_file_sqlite(db: Database | None) -> bool:
+    db = getattr(db, "obj", None) or db  # unwrap DatabaseProxy
+    return isinstance(db, SqliteDatabase) and db.database not in (None, "", ":memory:")
+
+
+class _Job:
+    __slots__ = ("fn", "args", "kwargs", "future", "request_state", "profile")
+
+    def __init__(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        # Read-your-writes tracking of the submitting request (a shared mutable dict).
+        self.request_state = routing._request_state.get()
+        self.profile = instrumentation.current_profile()
+
+
+class SQLiteWriteQueue:
+    """
+    Single writer thread for a SQLite database. submit() blocks until the write
+    has been committed and returns its result (or raises its exception).
+    """
+
+    def __init__(self, db: Database, max_batch: int = DEFAULT_WRITE_BATCH) -> None:
+        self.db = db
+        self.max_batch = max(1, max_batch)
+        self._queue: "queue.Queue[_Job | None]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._writes = 0
+        self._failed = 0
+        self._max_batch_seen = 0
+        # The writer keeps one context (and therefore one connection) for its lifetime.
+        self._context = copy_context()
+        self._thread = threading.Thread(target=self._context.run, args=(self._loop,), name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run fn(*args, **kwargs) on the writer thread inside a batched transaction."""
+        if threading.current_thread() is self._thread:
+            return fn(*args, **kwargs)  # nested write from a queued job
+        job = _Job(fn, args, kwargs)
+        self._queue.put(job)
+        return job.future.result()
+
+    def _loop(self) -> None:
+        reset_connection_state()  # do not share the creating thread's connection
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            batch = [job]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    more = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    stop = True
+                    break
+                batch.append(more)
+            self._run_batch(batch)
+            if stop:
+                break
+        self.db.close()
+
+    def _run_batch(self, batch: list[_Job]) -> None:
+        outcomes: list[tuple[_Job, bool, Any]] = []
+        try:
+            with self.db.atomic():
+                for job in batch:
+                    token = routing._request_state.set(job.request_state)
+                    profile_token = instrumentation._profile.set(job.profile)
+                    try:
+                        with self.db.atomic():  # savepoint: a failure only undoes this job
+                            outcomes.append((job, True, job.fn(*job.args, **job.kwargs)))
+                    except Exception as e:
+                        outcomes.append((job, False, e))
+                    finally:
+                        instrumentation._profile.reset(profile_token)
+                        routing._request_state.reset(token)
+        except Exception as e:  # commit failed: nothing in the batch was written
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            with self._lock:
+                self._batches += 1
+                self._failed += len(batch)
+            return
+        failed = 0
+        for job, ok, value in outcomes:
+            if ok:
+                job.future.set_result(value)
+            else:
+                failed += 1
+                job.future.set_exception(value)
+        with self._lock:
+            self._batches += 1
+            self._writes += len(batch)
+            self._failed += failed
+            self._max_batch_seen = max(self._max_batch_seen, len(batch))
+
+    def stats(self) -> dict[str, Any]:
+        """Writes, batches (commits), failed writes, largest batch and current queue depth."""
+        with self._lock:
+            return {
+                "writes": self._writes,
+                "batches": self._batches,
+                "failed": self._failed,
+                "max_batch": self._max_batch_seen,
+                "queued": self._queue.qsize(),
+            }
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Finish queued writes and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+def start_write_queue(db: Database) -> "SQLiteWriteQueue | None":
+    """Start the writer for a file-backed SQLite primary (unless SQLITE_WRITE_QUEUE=0)."""
+    global _write_queue
+    stop_write_queue()
+    if not is_file_sqlite(db) or not _int_env("SQLITE_WRITE_QUEUE", 1):
+        return None
+    _write_queue = SQLiteWriteQueue(db, max_batch=_int_env("SQLITE_WRITE_BATCH", DEFAULT_WRITE_BATCH))
+    return _write_queue
+
+
+def stop_write_queue() -> None:
+    global _write_queue
+    if _write_queue is not None:
+        _write_queue.close()
+        _write_queue = None
+
+
+def get_write_queue() -> "SQLiteWriteQueue | None":
+    return _write_queue
+
+
+def get_write_queue_stats() -> dict[str, Any] | None:
+    """Writer queue stats, or None when no write queue is running."""
+    return _write_queue.stats() if _write_queue is not None else None
+
+
+def serialized_write(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorator for write-heavy service methods (e.g. auto-save). Runs through the
+    SQLite write queue when one is running; otherwise (Postgres, in-memory SQLite,
+    or inside a caller's transaction) calls fn directly.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        wq = _write_queue
+        if wq is None or wq.db.in_transaction():  # caller's own transaction: stay on its connection
+            return fn(*args, **kwargs)
+        return wq.submit(fn, *args, **kwargs)
+
+    return wrapper
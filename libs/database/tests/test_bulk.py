@@ -0,0 +1,98 @@
+"""Tests for bulk upsert seeding and streaming CSV/JSON readers."""
+import io
+import json
+
+import pytest
+from peewee import CharField, IntegerField, Model, SqliteDatabase
+
+from database import bulk
+from database.bulk import bulk_load, bulk_upsert, iter_csv, iter_json
+
+
+class CountingDatabase(SqliteDatabase):
+    """SQLite database that counts INSERT statements."""
+
+    inserts = 0
+
+    def execute_sql(self, sql, params=None, commit=None):
+        if sql.lstrip().upper().startswith("INSERT"):
+            self.inserts += 1
+        return super().execute_sql(sql, params)
+
+
+db = CountingDatabase(":memory:")
+
+
+class Option(Model):
+    code = CharField(unique=True)
+    label = CharField()
+    rank = IntegerField(null=True)
+
+    class Meta:
+        database = db
+
+
+@pytest.fixture(autouse=True)
+def option_table():
+    db.connect(reuse_if_open=True)
+    db.create_tables([Option])
+    db.inserts = 0
+    yield
+    db.drop_tables([Option])
+    db.close()
+
+
+def _labels() -> dict[str, str]:
+    return {o.code: o.label for o in Option.select()}
+
+
+def test_bulk_upsert_one_statement_per_batch() -> None:
+    """Rows are written in one INSERT per batch, not one per row."""
+    rows = [{"code": f"c{i}", "label": f"L{i}"} for i in range(5)]
+    assert bulk_upsert(Option, rows, conflict_target=["code"]) == 5
+    assert db.inserts == 1
+    db.inserts = 0
+    more = ({"code": f"d{i}", "label": "x"} for i in range(5))  # generator input
+    assert bulk_upsert(Option, more, conflict_target=["code"], batch_size=2) == 5
+    assert db.inserts == 3
+    assert Option.select().count() == 10
+
+
+def test_bulk_upsert_update_vs_ignore() -> None:
+    """update overwrites the listed columns on conflict; without it existing rows are kept."""
+    bulk_upsert(Option, [{"code": "a", "label": "Old", "rank": 1}], conflict_target=["code"])
+    bulk_upsert(Option, [{"code": "a", "label": "Ignored"}, {"code": "b", "label": "B"}], conflict_target=["code"])
+    assert _labels() == {"a": "Old", "b": "B"}
+    bulk_upsert(Option, [{"code": "a", "label": "New", "rank": 9}], conflict_target=["code"], update=["label"])
+    row = Option.get(Option.code == "a")
+    assert (row.label, row.rank) == ("New", 1)
+
+
+def test_iter_json_array_streams_across_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A JSON array is parsed incrementally even when values straddle read chunks."""
+    monkeypatch.setattr(bulk, "_READ_CHUNK", 7)
+    records = [{"code": "x" * 20, "n": 12345}, {"code": "y", "nested": {"a": [1, 2]}}, {"code": "z", "n": 7}]
+    text = "  [\n" + ",\n".join(json.dumps(r) for r in records) + "\n]\n"
+    assert list(iter_json(io.StringIO(text))) == records
+    assert list(iter_json(io.StringIO("[]"))) == []
+
+
+def test_iter_json_lines_and_csv() -> None:
+    """JSON Lines yields one record per line; CSV empty cells become None."""
+    lines = '{"code": "a"}\n\n{"code": "b"}\n'
+    assert list(iter_json(io.StringIO(lines))) == [{"code": "a"}, {"code": "b"}]
+    csv_text = "code,label,rank\na,Alpha,\nb,Beta,2\n"
+    assert list(iter_csv(io.StringIO(csv_text))) == [
+        {"code": "a", "label": "Alpha", "rank": None},
+        {"code": "b", "label": "Beta", "rank": "2"},
+    ]
+
+
+def test_bulk_load_csv_file(tmp_path) -> None:
+    """bulk_load streams a file into the table; extra columns are ignored."""
+    path = tmp_path / "options.csv"
+    path.write_text("code,label,extra\na,Alpha,1\nb,Beta,2\n", encoding="utf-8")
+    assert bulk_load(Option, str(path), conflict_target=["code"], update=["label"]) == 2
+    assert _labels() == {"a": "Alpha", "b": "Beta"}
+    with pytest.raises(ValueError):
+        list(bulk.iter_records(str(tmp_path / "options.xml")))
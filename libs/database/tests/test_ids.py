@@ -0,0 +1,52 @@
+"""Tests for primary key generators (uuid4 / time-ordered uuid7)."""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from peewee import SqliteDatabase
+
+from database.connection import database_proxy
+from database.ids import new_id, uuid7, uuid7_time
+from database.models import AuditLog, User
+
+
+def test_uuid7_layout_and_timestamp() -> None:
+    before = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert before <= uuid7_time(value) <= datetime.now(timezone.utc)
+    with pytest.raises(ValueError):
+        uuid7_time(uuid.uuid4())
+
+
+def test_uuid7_is_strictly_increasing() -> None:
+    values = [uuid7() for _ in range(10_000)]  # many per millisecond
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert [v.hex for v in values] == sorted(v.hex for v in values)  # SQLite stores hex text
+
+
+def test_new_id_follows_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DATABASE_UUID_VERSION", raising=False)
+    assert new_id().version == 4
+    monkeypatch.setenv("DATABASE_UUID_VERSION", "7")
+    assert new_id().version == 7
+
+
+def test_models_use_generators(monkeypatch: pytest.MonkeyPatch) -> None:
+    db = SqliteDatabase(":memory:")
+    database_proxy.initialize(db)
+    db.create_tables([User, AuditLog])
+    try:
+        monkeypatch.setenv("DATABASE_UUID_VERSION", "7")
+        user = User.create(email="ids@example.com", password_hash="x")
+        assert User.get_by_id(user.id).id.version == 7
+        monkeypatch.setenv("DATABASE_UUID_VERSION", "4")
+        assert User.create(email="ids4@example.com", password_hash="x").id.version == 4
+        logs = [AuditLog.create(action="login") for _ in range(3)]  # append-only table: always uuid7
+        assert [log.id.version for log in logs] == [7, 7, 7]
+        assert [log.id for log in AuditLog.select().order_by(AuditLog.id)] == [log.id for log in logs]
+    finally:
+        database_proxy.initialize(None)
+        db.close()
@@ -0,0 +1,92 @@
+"""Tests for per-request query instrumentation and N+1 detection."""
+import pytest
+from peewee import CharField, ForeignKeyField, Model, SqliteDatabase
+
+import database.connection as conn
+from database.instrumentation import (
+    NPlusOneError,
+    assert_no_n_plus_one,
+    current_profile,
+    profile_queries,
+    query_shape,
+)
+
+
+class Author(Model):
+    name = CharField()
+
+    class Meta:
+        database = conn.database_proxy
+
+
+class Book(Model):
+    author = ForeignKeyField(Author, backref="books")
+    title = CharField()
+
+    class Meta:
+        database = conn.database_proxy
+
+
+@pytest.fixture
+def library():
+    db = SqliteDatabase(":memory:")
+    conn.database_proxy.initialize(db)
+    db.create_tables([Author, Book])
+    for i in range(4):
+        a = Author.create(name=f"author {i}")
+        Book.create(author=a, title=f"book {i}")
+    yield
+    conn.database_proxy.initialize(None)
+    db.close()
+
+
+def test_query_shape_collapses_in_lists_and_whitespace() -> None:
+    assert query_shape('SELECT "t1"."id"\n  FROM "book" AS "t1" WHERE ("t1"."id" IN (?, ?, ?))') == (
+        'SELECT "t1"."id" FROM "book" AS "t1" WHERE ("t1"."id" IN (?))'
+    )
+
+
+def test_profile_records_count_time_and_slowest(library) -> None:
+    with profile_queries(keep_slowest=2) as profile:
+        list(Author.select())
+        Book.select().count()
+        conn.database_proxy.execute_sql("SELECT 1")
+    assert current_profile() is None
+    assert profile.count == 3
+    assert profile.seconds > 0
+    slowest = profile.slowest()
+    assert len(slowest) == 2
+    assert slowest[0]["ms"] >= slowest[1]["ms"]
+
+
+def test_no_recording_outside_a_profile(library) -> None:
+    list(Author.select())
+    assert current_profile() is None
+
+
+def test_detector_flags_per_row_lookups(library) -> None:
+    with pytest.raises(NPlusOneError, match="4x"):
+        with assert_no_n_plus_one(threshold=3):
+            for book in Book.select():
+                book.author.name  # one SELECT per book
+
+
+def test_detector_passes_batched_loading(library) -> None:
+    with assert_no_n_plus_one(threshold=3) as profile:
+        books = list(Book.select(Book, Author).join(Author))
+        [b.author.name for b in books]
+        ids = [b.author_id for b in books]
+        list(Author.select().where(Author.id.in_(ids[:2])))
+        list(Author.select().where(Author.id.in_(ids)))  # same shape despite different IN lengths
+    assert profile.count == 3
+    assert profile.repeated(threshold=2)
+
+
+def test_threshold_from_environment(library, monkeypatch: pytest.MonkeyPatch) -> None:
+    with profile_queries() as profile:
+        for _ in range(3):
+            Author.get_by_id(1)
+    monkeypatch.delenv("DB_N_PLUS_ONE_THRESHOLD", raising=False)
+    assert profile.repeated() == {}
+    monkeypatch.setenv("DB_N_PLUS_ONE_THRESHOLD", "3")
+    assert list(profile.repeated().values()) == [3]
@@ -0,0 +1,71 @@
+"""Tests for JSONField and JSON merge patch."""
+import uuid
+from datetime import datetime
+
+import pytest
+from peewee import DateTimeField, Model, PostgresqlDatabase, SqliteDatabase, UUIDField
+
+from database.json_fields import POSTGRES_FIELD_TYPES, JSONField, merge_patch, merge_patch_json
+
+db = SqliteDatabase(":memory:")
+
+
+class Doc(Model):
+    id = UUIDField(primary_key=True, default=uuid.uuid4)
+    body = JSONField(null=True)
+    updated_at = DateTimeField(default=datetime(2000, 1, 1))
+
+    class Meta:
+        database = db
+
+
+@pytest.fixture(autouse=True)
+def doc_table():
+    db.connect(reuse_if_open=True)
+    db.create_tables([Doc])
+    yield
+    db.drop_tables([Doc])
+    db.close()
+
+
+def test_json_field_round_trip_and_column_type() -> None:
+    """Documents come back as Python objects; the column is JSON on SQLite and JSONB on Postgres."""
+    doc = Doc.create(body={"contact": {"email": "a@b.com"}, "items": [1, 2]})
+    assert Doc.get_by_id(doc.id).body == {"contact": {"email": "a@b.com"}, "items": [1, 2]}
+    assert Doc.create(body=None).body is None
+    assert [c.data_type for c in db.get_columns("doc") if c.name == "body"] == ["JSON"]
+    pg = PostgresqlDatabase("unused", field_types=POSTGRES_FIELD_TYPES)
+    with pg.bind_ctx([Doc]):
+        sql, _ = pg.get_sql_context().sql(Doc._schema._create_table()).query()
+    assert '"body" JSONB' in sql
+
+
+def test_json_field_decodes_only_sqlite_text() -> None:
+    """SQLite returns stored text to decode; psycopg2 returns decoded values, including top-level strings."""
+    for value in ("abc", "123", 123, 1.5, [1, "2"]):
+        assert Doc.get_by_id(Doc.create(body=value).id).body == value
+    pg = PostgresqlDatabase("unused", field_types=POSTGRES_FIELD_TYPES)
+    with pg.bind_ctx([Doc]):
+        assert Doc.body.python_value("abc") == "abc"
+        assert Doc.body.python_value("123") == "123"
+        assert Doc.body.python_value({"a": [1]}) == {"a": [1]}
+
+
+def test_merge_patch_rfc7396() -> None:
+    """Objects merge recursively, null deletes, arrays and scalars replace."""
+    target = {"a": {"b": 1, "c": 2}, "list": [1, 2], "keep": True}
+    patch = {"a": {"b": None, "d": 3}, "list": [9], "new": "x"}
+    assert merge_patch(target, patch) == {"a": {"c": 2, "d": 3}, "list": [9], "keep": True, "new": "x"}
+    assert merge_patch({"a": 1}, ["replace"]) == ["replace"]
+
+
+def test_merge_patch_json_updates_in_database() -> None:
+    """merge_patch_json patches the stored document (and bumps updated_at) like merge_patch does."""
+    doc = Doc.create(body={"a": {"b": 1, "c": 2}, "keep": True})
+    empty = Doc.create(body=None)
+    value = merge_patch_json(doc, Doc.body, {"a": {"b": None, "d": 3}, "new": [1]})
+    assert value == {"a": {"c": 2, "d": 3}, "keep": True, "new": [1]}
+    reloaded = Doc.get_by_id(doc.id)
+    assert reloaded.body == value and doc.body == value
+    assert reloaded.updated_at > datetime(2000, 1, 1)
+    assert merge_patch_json(empty, Doc.body, {"k": 1}) == {"k": 1}
@@ -0,0 +1,125 @@
+"""Tests for versioned migrations (schema_migrations, ordering, idempotent operations)."""
+import pytest
+from peewee import CharField, SqliteDatabase
+
+import database.models  # noqa: F401 - register all models for the initial migration
+from database.migrations.operations import MigrationContext
+from database.migrations.runner import SchemaMigration, applied_versions, discover_migrations, run_migrations
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SqliteDatabase(str(tmp_path / "migrate.db"))
+    yield database
+    database.close()
+
+
+def _index_names(db, table: str) -> set[str]:
+    return {i.name for i in db.get_indexes(table)}
+
+
+def test_discover_migrations_ordered() -> None:
+    """Migrations are discovered from the versions package in version order."""
+    versions = [m.version for m in discover_migrations()]
+    assert versions[:7] == ["0001", "0002", "0003", "0004", "0005", "0006", "0007"]
+    assert versions == sorted(versions)
+
+
+def test_run_migrations_records_versions_and_is_idempotent(db) -> None:
+    """A fresh database gets every migration once; a second run applies nothing."""
+    applied = run_migrations(db=db)
+    assert applied == [m.version for m in discover_migrations()]
+    assert applied_versions(db) == set(applied)
+    with db.bind_ctx([SchemaMigration]):
+        assert SchemaMigration.get(SchemaMigration.version == "0002").name == "performance_indexes"
+    assert run_migrations(db=db) == []
+    assert "application_user_id_created_at" in _index_names(db, "applications")
+    assert "userinteraction_user_id_created_at" in _index_names(db, "user_interactions")
+
+
+def test_index_migration_upgrades_pre_versioned_database(db) -> None:
+    """A database created before versioning (missing the new indexes) gets them added."""
+    run_migrations(target="0001", db=db)
+    db.execute_sql('DROP INDEX "auditlog_resource_type_resource_id"')
+    assert "auditlog_resource_type_resource_id" not in _index_names(db, "audit_logs")
+    assert run_migrations(db=db)[0] == "0002"
+    assert "auditlog_resource_type_resource_id" in _index_names(db, "audit_logs")
+
+
+def test_context_operations_are_idempotent(db) -> None:
+    """add_column and create_index skip work that is already done."""
+    run_migrations(target="0001", db=db)
+    ctx = MigrationContext(db)
+    ctx.add_column("counties", "region", CharField(null=True))
+    ctx.add_column("counties", "region", CharField(null=True))
+    assert ctx.has_column("counties", "region")
+    name = ctx.create_index("counties", ["region"])
+    assert ctx.create_index("counties", ["region"]) == name
+    assert ctx.has_index("counties", name)
+    assert ctx.is_postgres is False
+
+
+def test_unique_county_migration_removes_duplicates(db) -> None:
+    """Pre-0003 databases (non-unique index, duplicate rows) end up deduplicated with a unique index."""
+    from database.models import County
+
+    run_migrations(target="0002", db=db)
+    db.execute_sql('DROP INDEX "county_name_state_code"')
+    db.execute_sql('CREATE INDEX "county_name_state_code" ON "counties" ("name", "state_code")')
+    with db.bind_ctx([County]):
+        for _ in range(2):
+            County.create(name="Kent", state_code="MD")
+        County.create(name="Kent", state_code="DE")
+        assert run_migrations(db=db)[0] == "0003"
+        assert County.select().count() == 2
+    assert MigrationContext(db).has_index("counties", "county_name_state_code", unique=True)
+
+
+def test_county_key_migration_backfills_from_contact(db) -> None:
+    """0004 fills county_key from contact information and adds the board queue index."""
+    from database.models import Application, ContactInformation, User
+
+    run_migrations(db=db)
+    with db.bind_ctx([User, Application, ContactInformation]):
+        user = User.create(email="a@example.com", password_hash="x")
+        with_contact = Application.create(user=user)
+        without_contact = Application.create(user=user)
+        ContactInformation.create(application=with_contact, county=" Baltimore ")
+        Application.update(county_key=None).execute()  # as if written before the column existed
+    db.execute_sql('DROP INDEX "application_county_key_ready_for_board_review_at"')
+    db.execute_sql("DELETE FROM \"schema_migrations\" WHERE version = '0004'")
+
+    assert run_migrations(db=db) == ["0004"]
+    with db.bind_ctx([Application]):
+        assert Application.get_by_id(with_contact.id).county_key == "baltimore"
+        assert Application.get_by_id(without_contact.id).county_key is None
+    assert "application_county_key_ready_for_board_review_at" in _index_names(db, "applications")
+
+
+def test_rollup_migration_backfills_from_interactions(db) -> None:
+    """0007 creates user_preference_rollups and fills it from existing interactions."""
+    from database.models import User, UserInteraction, UserPreferenceRollup
+
+    run_migrations(target="0006", db=db)
+    with db.bind_ctx([User, UserInteraction]):
+        user = User.create(email="rollup@example.com", password_hash="x")
+        for target in ("/a", "/a", None):
+            UserInteraction.create(user=user, interaction_type="page_view", target_id=target)
+    assert run_migrations(db=db)[0] == "0007"
+    with db.bind_ctx([UserPreferenceRollup]):
+        counts = {(r.dimension, r.key): r.count for r in UserPreferenceRollup.select()}
+    assert counts == {("type", "page_view"): 3, ("target", "/a"): 2}
+
+
+def test_weighted_rollup_migration_reweights_sampled_interactions(db) -> None:
+    """0008 recomputes rollups so sampled interactions count 1 / sample_rate."""
+    from database.models import User, UserInteraction, UserPreferenceRollup
+
+    run_migrations(target="0007", db=db)
+    with db.bind_ctx([User, UserInteraction, UserPreferenceRollup]):
+        user = User.create(email="weighted@example.com", password_hash="x")
+        UserInteraction.create(user=user, interaction_type="scroll", metadata_json='{"sample_rate": 0.25}')
+        UserPreferenceRollup.create(user=user, dimension="type", key="scroll", count=1)
+    assert run_migrations(db=db)[0] == "0008"
+    with db.bind_ctx([UserPreferenceRollup]):
+        assert UserPreferenceRollup.get(UserPreferenceRollup.key == "scroll").count == 4
@@ -0,0 +1,73 @@
+"""Tests for keyset pagination and opaque cursors."""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from peewee import CharField, DateTimeField, Model, SqliteDatabase, UUIDField
+
+from database.pagination import InvalidCursor, clamp_limit, decode_cursor, encode_cursor, paginate
+
+db = SqliteDatabase(":memory:")
+
+
+class Item(Model):
+    id = UUIDField(primary_key=True, default=uuid.uuid4)
+    owner = CharField()
+    created_at = DateTimeField()
+
+    class Meta:
+        database = db
+
+
+@pytest.fixture(autouse=True)
+def items():
+    db.connect(reuse_if_open=True)
+    db.create_tables([Item])
+    start = datetime(2026, 1, 1)
+    # Pairs of rows share a timestamp so the id tie-breaker is exercised.
+    for i in range(9):
+        Item.create(owner="a" if i < 7 else "b", created_at=start + timedelta(minutes=i // 2))
+    yield
+    db.drop_tables([Item])
+    db.close()
+
+
+def _walk(query, limit):
+    seen, cursor = [], None
+    while True:
+        page = paginate(query, limit=limit, cursor=cursor)
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return seen
+
+
+def test_keyset_walk_visits_every_row_once_newest_first() -> None:
+    """Walking pages returns each row exactly once, ordered by (created_at, id) descending."""
+    rows = _walk(Item.select(), limit=2)
+    assert len(rows) == 9
+    assert len({r.id for r in rows}) == 9
+    keys = [(r.created_at, r.id.hex) for r in rows]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_filtered_pages_and_total() -> None:
+    """Filters apply to every page; include_total counts the filtered rows."""
+    page = paginate(Item.select().where(Item.owner == "a"), limit=5, include_total=True)
+    assert (len(page.items), page.total) == (5, 7)
+    rest = paginate(Item.select().where(Item.owner == "a"), limit=5, cursor=page.next_cursor)
+    assert len(rest.items) == 2
+    assert rest.next_cursor is None and rest.total is None
+
+
+def test_cursor_round_trip_and_invalid_cursor() -> None:
+    """Cursors are opaque URL-safe strings; garbage raises InvalidCursor."""
+    when, row_id = datetime(2026, 5, 1, 12, 30, 0, 1234), uuid.uuid4()
+    cursor = encode_cursor(when, row_id)
+    assert "=" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor) == (when, row_id)
+    with pytest.raises(InvalidCursor):
+        decode_cursor("not-a-cursor")
+    assert clamp_limit(None) == 50
+    assert clamp_limit(10_000) == 200
+    assert clamp_limit(-3) == 1
@@ -0,0 +1,138 @@
+"""Tests for read-replica routing and read-your-writes pinning (two SQLite files)."""
+import asyncio
+
+import pytest
+from peewee import CharField, Model
+
+import database.connection as conn
+from database import routing
+from database.middleware import PRIMARY_PIN_COOKIE, ReadYourWritesMiddleware
+from database.routing import begin_request, read_only, request_wrote, use_replica
+
+
+class Item(Model):
+    name = CharField()
+
+    class Meta:
+        database = conn.database_proxy
+
+
+@pytest.fixture
+def replicated_db(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Primary and one replica as separate SQLite files, each seeded with a distinguishable row."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setenv("DATABASE_REPLICA_URLS", f"sqlite:///{tmp_path / 'replica.db'}")
+    monkeypatch.delenv("DATABASE_POOL_SIZE", raising=False)
+    conn._db = None
+    conn.init_db()
+    Item.create_table()
+    Item.create(name="primary")
+    replica = routing.get_replicas()[0]
+    with replica.bind_ctx([Item]):
+        Item.create_table()
+        Item.create(name="replica")
+    yield
+    routing._request_state.set(None)
+    conn.close_db()
+
+
+def _names() -> list[str]:
+    return [i.name for i in Item.select().order_by(Item.id)]
+
+
+def test_no_replicas_configured(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without DATABASE_REPLICA_URLS every query goes to the primary."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'only.db'}")
+    monkeypatch.delenv("DATABASE_REPLICA_URLS", raising=False)
+    conn._db = None
+    conn.init_db()
+    try:
+        assert routing.has_replicas() is False
+        Item.create_table()
+        Item.create(name="primary")
+        with use_replica():
+            assert _names() == ["primary"]
+    finally:
+        conn.close_db()
+
+
+def test_read_only_scope_uses_replica(replicated_db) -> None:
+    """Reads default to the primary; read_only / use_replica send them to a replica."""
+    assert _names() == ["primary"]
+    with use_replica():
+        assert _names() == ["replica"]
+
+    @read_only
+    def count() -> int:
+        return Item.select().count()
+
+    Item.create(name="second")
+    assert count() == 1  # replica still has one row
+    assert Item.select().count() == 2
+
+
+def test_writes_always_go_to_primary(replicated_db) -> None:
+    """A write inside a read-only scope still lands on the primary."""
+    with use_replica():
+        Item.create(name="in-scope")
+    assert _names() == ["primary", "in-scope"]
+
+
+def test_read_your_writes_within_request(replicated_db) -> None:
+    """After a request writes, its later reads are served by the primary."""
+    begin_request()
+    with use_replica():
+        assert _names() == ["replica"]
+        Item.create(name="new")
+        assert request_wrote() is True
+        assert _names() == ["primary", "new"]
+
+
+def test_pinned_request_and_transaction_use_primary(replicated_db) -> None:
+    """Pinned requests and reads inside a primary transaction never go to a replica."""
+    begin_request(pinned=True)
+    with use_replica():
+        assert _names() == ["primary"]
+    begin_request()
+    with conn.get_db().atomic(), use_replica():
+        assert _names() == ["primary"]
+
+
+def test_middleware_sets_and_honors_pin_cookie(replicated_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A writing request gets a pin cookie; a request carrying it reads from the primary."""
+    monkeypatch.setenv("DATABASE_REPLICA_PIN_SECONDS", "30")
+    seen: list[list[str]] = []
+
+    async def app(scope, receive, send):
+        if scope["method"] == "POST":
+            Item.create(name="posted")
+        with use_replica():
+            seen.append(_names())
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def call(method: str, cookie: str | None = None) -> list[tuple[bytes, bytes]]:
+        headers = [(b"cookie", cookie.encode())] if cookie else []
+        sent: list[dict] = []
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": method, "path": "/", "headers": headers}
+        await ReadYourWritesMiddleware(app)(scope, receive, send)
+        return sent[0]["headers"]
+
+    async def main():
+        assert await call("GET") == []
+        headers = await call("POST")
+        cookie = dict(headers)[b"set-cookie"].decode().split(";")[0]
+        assert cookie.startswith(f"{PRIMARY_PIN_COOKIE}=")
+        await call("GET", cookie)
+
+    asyncio.run(main())
+    assert seen[0] == ["replica"]
+    assert seen[1] == ["primary", "posted"]  # read after its own write
+    assert seen[2] == ["primary", "posted"]  # pinned by cookie
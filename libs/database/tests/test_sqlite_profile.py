@@ -0,0 +1,103 @@
+"""Tests for the SQLite profile: connection pragmas and the serialized writer queue."""
+import threading
+import time
+
+import pytest
+from peewee import CharField, IntegrityError, Model, SqliteDatabase
+
+from database import sqlite_profile
+from database.connection import _open
+from database.sqlite_profile import SQLiteWriteQueue, serialized_write
+
+db = SqliteDatabase(None)
+
+
+class Note(Model):
+    text = CharField(unique=True)
+
+    class Meta:
+        database = db
+
+
+@pytest.fixture
+def note_db(tmp_path):
+    db.init(str(tmp_path / "notes.db"), pragmas=sqlite_profile.get_sqlite_pragmas())
+    db.create_tables([Note])
+    yield db
+    db.close()
+
+
+def test_file_sqlite_opens_with_wal_profile(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """File-backed SQLite URLs get WAL, synchronous=NORMAL, busy_timeout and mmap; SQLITE_PROFILE=off skips them."""
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "1234")
+    opened = _open(f"sqlite:///{tmp_path / 'wal.db'}")
+    pragma = lambda name: opened.execute_sql(f"PRAGMA {name}").fetchone()[0]  # noqa: E731
+    assert pragma("journal_mode") == "wal"
+    assert pragma("synchronous") == 1  # NORMAL
+    assert pragma("busy_timeout") == 1234
+    assert pragma("mmap_size") == sqlite_profile.DEFAULT_MMAP_SIZE
+    opened.close()
+    monkeypatch.setenv("SQLITE_PROFILE", "off")
+    plain = _open(f"sqlite:///{tmp_path / 'plain.db'}")
+    assert plain.execute_sql("PRAGMA journal_mode").fetchone()[0] == "delete"
+    plain.close()
+
+
+def test_write_queue_batches_concurrent_writes(note_db) -> None:
+    """Writes submitted while the writer is busy are committed together in one transaction."""
+    wq = SQLiteWriteQueue(note_db, max_batch=50)
+    gate = threading.Event()
+    results: list[str] = []
+
+    def write(text: str, wait: bool = False) -> str:
+        if wait:
+            gate.wait(5)
+        Note.create(text=text)
+        return text
+
+    first = threading.Thread(target=lambda: results.append(wq.submit(write, "first", wait=True)))
+    first.start()
+    time.sleep(0.05)  # writer is now blocked inside the first batch
+    others = [threading.Thread(target=lambda i=i: results.append(wq.submit(write, f"n{i}"))) for i in range(10)]
+    for t in others:
+        t.start()
+    while wq.stats()["queued"] < 10:
+        time.sleep(0.01)
+    gate.set()
+    for t in [first, *others]:
+        t.join(5)
+    wq.close()
+    stats = wq.stats()
+    assert sorted(results) == sorted(["first", *[f"n{i}" for i in range(10)]])
+    assert Note.select().count() == 11
+    assert stats["writes"] == 11
+    assert stats["batches"] == 2
+    assert stats["max_batch"] == 10
+
+
+def test_failed_write_only_rolls_back_itself(note_db) -> None:
+    """Each queued write is a savepoint: an error is raised to its caller, the batch still commits."""
+    wq = SQLiteWriteQueue(note_db)
+    wq.submit(Note.create, text="dup")
+    with pytest.raises(IntegrityError):
+        wq.submit(Note.create, text="dup")
+    wq.submit(Note.create, text="ok")
+    wq.close()
+    assert sorted(n.text for n in Note.select()) == ["dup", "ok"]
+    assert wq.stats()["failed"] == 1
+
+
+def test_serialized_write_runs_inline_without_queue(note_db, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a running write queue the decorated function is called directly."""
+    monkeypatch.setattr(sqlite_profile, "_write_queue", None)
+    caller = threading.current_thread()
+
+    @serialized_write
+    def where() -> threading.Thread:
+        return threading.current_thread()
+
+    assert where() is caller
+    wq = SQLiteWriteQueue(note_db)
+    monkeypatch.setattr(sqlite_profile, "_write_queue", wq)
+    assert where().name == "sqlite-writer"
+    wq.close()
@@ -1,5 +1,5 @@
 """Pluggable file storage library."""
 from storage.factory import get_storage
-from storage.interfaces.base import FileMetadata, StorageBackend
+from storage.interfaces.base import FileMetadata, FileStream, PresignedUpload, RangeNotSatisfiableError, StorageBackend
 
-__all__ = ["get_storage", "StorageBackend", "FileMetadata"]
+__all__ = ["get_storage", "StorageBackend", "FileMetadata", "FileStream", "PresignedUpload", "RangeNotSatisfiableError"]
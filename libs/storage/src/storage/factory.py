@@ -3,7 +3,14 @@ import os
 from pathlib import Path
 
 from storage.implementations.local import LocalStorageBackend
-from storage.implementations.s3 import S3StorageBackend
+from storage.implementations.s3 import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    DEFAULT_RETRY_MODE,
+    MB,
+    S3StorageBackend,
+)
 from storage.interfaces.base import StorageBackend
 
 
@@ -11,7 +18,12 @@ def get_storage() -> StorageBackend:
     """
     Return the configured storage backend.
     STORAGE_PROVIDER=local|s3 (default: local).
-    For local: LOCAL_STORAGE_PATH. For s3: S3_BUCKET, AWS_REGION, optional S3_PREFIX.
+    For local: LOCAL_STORAGE_PATH, optional LOCAL_UPLOAD_URL and UPLOAD_SIGNING_KEY
+    (signed direct-upload URLs; falls back to JWT_SECRET). For s3: S3_BUCKET, AWS_REGION, optional S3_PREFIX,
+    S3_ENDPOINT_URL (MinIO etc.), and tuning: S3_MULTIPART_THRESHOLD_MB, S3_MULTIPART_CHUNK_MB,
+    S3_MAX_CONCURRENCY (parts in flight per upload), S3_MAX_POOL_CONNECTIONS,
+    S3_RETRY_MODE (adaptive|standard|legacy), S3_MAX_ATTEMPTS.
+    Each call builds a new backend (and S3 client); create one per process and reuse it.
     """
     provider = (os.getenv("STORAGE_PROVIDER") or os.getenv("STORAGE_BACKEND") or "local").lower()
     if provider == "s3":
@@ -22,6 +34,18 @@ def get_storage() -> StorageBackend:
             bucket=bucket,
             region=os.getenv("AWS_REGION"),
             prefix=os.getenv("S3_PREFIX", ""),
+            endpoint_url=os.getenv("S3_ENDPOINT_URL") or None,
+            multipart_threshold=int(float(os.getenv("S3_MULTIPART_THRESHOLD_MB", "8")) * MB),
+            multipart_chunksize=int(float(os.getenv("S3_MULTIPART_CHUNK_MB", "8")) * MB),
+            max_concurrency=int(os.getenv("S3_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))),
+            max_pool_connections=int(os.getenv("S3_MAX_POOL_CONNECTIONS", str(DEFAULT_MAX_POOL_CONNECTIONS))),
+            retry_mode=os.getenv("S3_RETRY_MODE", DEFAULT_RETRY_MODE),
+            max_attempts=int(os.getenv("S3_MAX_ATTEMPTS", str(DEFAULT_MAX_ATTEMPTS))),
         )
     path = os.getenv("LOCAL_STORAGE_PATH", "./uploads")
-    return LocalStorageBackend(Path(path))
+    return LocalStorageBackend(
+        Path(path),
+        upload_url=os.getenv("LOCAL_UPLOAD_URL") or None,
+        # Same chain as the API's ticket key, so every worker verifies every worker's URLs.
+        signing_key=os.getenv("UPLOAD_SIGNING_KEY") or os.getenv("JWT_SECRET") or None,
+    )
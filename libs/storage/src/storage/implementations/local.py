@@ -1,18 +1,60 @@
 """Local filesystem storage implementation."""
+import hashlib
+import mimetypes
 import os
-from datetime import datetime, timezone
+import secrets
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Iterable, Iterator
 
-from storage.interfaces.base import FileMetadata, StorageBackend
+from storage.interfaces.base import (
+    DEFAULT_UPLOAD_URL_EXPIRY,
+    FileMetadata,
+    FileStream,
+    PresignedUpload,
+    StorageBackend,
+    resolve_range,
+)
+from storage.signing import InvalidTokenError, sign_token, verify_token
+from storage.streaming import DEFAULT_CHUNK_SIZE, UploadRejectedError, UploadStream, iter_file_chunks
+
+
+def _read_range(path: Path, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) of path; the file is opened on first iteration."""
+    remaining = end - start + 1
+    with open(path, "rb") as f:
+        f.seek(start)
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
 
 
 class LocalStorageBackend(StorageBackend):
-    """Store files on local disk, organized by date/type."""
+    """
+    Store files on local disk, organized by date/type.
 
-    def __init__(self, root_path: str | Path) -> None:
+    With upload_url set, presign_upload() hands out signed PUT URLs under it
+    (upload_url/<token>); the application serves that path and passes the body to
+    accept_signed_upload(). signing_key must be shared by every process that
+    verifies the tokens (a random per-instance key is used when it is omitted).
+    """
+
+    def __init__(
+        self,
+        root_path: str | Path,
+        *,
+        upload_url: str | None = None,
+        signing_key: str | bytes | None = None,
+    ) -> None:
         self.root = Path(root_path)
         self.root.mkdir(parents=True, exist_ok=True)
+        self.upload_url = upload_url.rstrip("/") if upload_url else None
+        if isinstance(signing_key, str):
+            signing_key = signing_key.encode("utf-8")
+        self._signing_key = signing_key or secrets.token_bytes(32)
 
     def _path(self, key: str) -> Path:
         return self.root / key
@@ -25,24 +67,120 @@ class LocalStorageBackend(StorageBackend):
         content_type: str,
         original_filename: str,
     ) -> FileMetadata:
+        return self.upload_stream(
+            iter_file_chunks(file_obj), key=key, content_type=content_type, original_filename=original_filename
+        )
+
+    def upload_stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        key: str,
+        content_type: str,
+        original_filename: str,
+    ) -> FileMetadata:
+        """Write chunks to a temp file beside the target, then rename it into place."""
         path = self._path(key)
         path.parent.mkdir(parents=True, exist_ok=True)
-        data = file_obj.read()
-        path.write_bytes(data)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{id(chunks):x}.part")
+        size = 0
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
         return FileMetadata(
             storage_key=key,
             original_filename=original_filename,
-            size=len(data),
+            size=size,
             content_type=content_type,
             uploaded_at=datetime.now(timezone.utc).isoformat(),
         )
 
+    def presign_upload(
+        self,
+        key: str,
+        *,
+        content_type: str,
+        max_bytes: int,
+        expires_in: int = DEFAULT_UPLOAD_URL_EXPIRY,
+    ) -> PresignedUpload:
+        """Signed PUT URL under upload_url; the token carries key, content type and size limit."""
+        if not self.upload_url:
+            return super().presign_upload(key, content_type=content_type, max_bytes=max_bytes, expires_in=expires_in)
+        token = sign_token({"key": key, "content_type": content_type, "max_bytes": max_bytes}, self._signing_key, expires_in)
+        return PresignedUpload(
+            method="PUT",
+            url=f"{self.upload_url}/{token}",
+            headers={"Content-Type": content_type},
+            expires_at=datetime.now(timezone.utc) + timedelta(seconds=expires_in),
+        )
+
+    def accept_signed_upload(self, token: str, chunks: Iterable[bytes], *, content_type: str) -> FileMetadata:
+        """
+        Store the body of a PUT to a presign_upload() URL. Raises InvalidTokenError for a
+        bad or expired token, UploadRejectedError for another Content-Type or an empty body,
+        UploadTooLargeError past the signed limit (nothing is stored then).
+        """
+        grant = verify_token(token, self._signing_key)
+        key = grant.get("key")
+        if not isinstance(key, str) or not key or ".." in Path(key).parts or Path(key).is_absolute():
+            raise InvalidTokenError("Invalid upload token")
+        if (content_type or "").split(";")[0].strip().lower() != str(grant.get("content_type")).lower():
+            raise UploadRejectedError(f"Content-Type must be {grant.get('content_type')}")
+        stream = UploadStream(chunks, max_bytes=int(grant.get("max_bytes") or 0))
+
+        def non_empty() -> Iterator[bytes]:
+            yield from stream
+            if stream.size == 0:
+                raise UploadRejectedError("Empty upload")
+
+        return self.upload_stream(non_empty(), key=key, content_type=grant["content_type"], original_filename=Path(key).name)
+
     def download(self, key: str) -> bytes:
         path = self._path(key)
         if not path.exists():
             raise FileNotFoundError(key)
         return path.read_bytes()
 
+    def open_stream(self, key: str, start: int | None = None, end: int | None = None) -> FileStream:
+        """Lazy ranged read; path is set so HTTP layers can sendfile the file instead."""
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(key) from None
+        first, last = resolve_range(start, end, stat.st_size)
+        chunks = _read_range(path, first, last, DEFAULT_CHUNK_SIZE)
+        # Same validator Starlette's FileResponse derives from the stat result.
+        etag_base = f"{stat.st_mtime}-{stat.st_size}"
+        return FileStream(
+            storage_key=key,
+            start=first,
+            end=last,
+            total_size=stat.st_size,
+            content_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            etag=f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"',
+            last_modified=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            chunks=chunks,
+            path=path,
+            _close=chunks.close,
+        )
+
+    def move(self, source_key: str, dest_key: str) -> None:
+        """Atomic rename (same filesystem); a later write to source_key does not touch dest_key."""
+        source = self._path(source_key)
+        dest = self._path(dest_key)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(source, dest)
+        except FileNotFoundError:
+            raise FileNotFoundError(source_key) from None
+
     def delete(self, key: str) -> None:
         path = self._path(key)
         if path.exists():
@@ -1,33 +1,98 @@
-"""Amazon S3 storage implementation."""
+"""
+Amazon S3 storage implementation.
+
+Uploads up to multipart_threshold bytes are one PutObject. Larger ones become
+a multipart upload: parts of multipart_chunksize are sent as they fill, at most
+max_concurrency per upload at a time, on a thread pool shared by the backend.
+Memory per upload is therefore about (max_concurrency + 1) parts. If the chunks
+raise (size limit, scan verdict) or a part fails, the outstanding parts are
+cancelled and the upload is aborted, so S3 keeps neither an object nor billable
+orphan parts. The client gets a connection pool of max_pool_connections (at
+least max_concurrency) and retries in the given mode (adaptive: client-side
+rate limiting on throttling).
+"""
 import os
-from datetime import datetime, timezone
-from typing import BinaryIO
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Iterable
 
-from storage.interfaces.base import FileMetadata, StorageBackend
+from storage.interfaces.base import (
+    DEFAULT_UPLOAD_URL_EXPIRY,
+    FileMetadata,
+    FileStream,
+    PresignedUpload,
+    RangeNotSatisfiableError,
+    StorageBackend,
+)
+from storage.streaming import DEFAULT_CHUNK_SIZE, iter_file_chunks
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError:
     boto3 = None  # type: ignore
+    Config = None  # type: ignore
     ClientError = Exception  # type: ignore
 
+MB = 1024 * 1024
+MIN_PART_SIZE = 5 * MB  # S3 minimum for every part but the last
+MAX_PARTS = 10_000
+DEFAULT_MULTIPART_THRESHOLD = 8 * MB
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * MB
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_POOL_CONNECTIONS = 16
+DEFAULT_RETRY_MODE = "adaptive"
+DEFAULT_MAX_ATTEMPTS = 5
+
 
 class S3StorageBackend(StorageBackend):
-    """Store files in Amazon S3."""
+    """Store files in Amazon S3 (or an S3-compatible endpoint such as MinIO)."""
 
     def __init__(
         self,
         bucket: str,
         region: str | None = None,
         prefix: str = "",
+        *,
+        endpoint_url: str | None = None,
+        multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD,
+        multipart_chunksize: int = DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        retry_mode: str = DEFAULT_RETRY_MODE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
     ) -> None:
         if boto3 is None:
             raise RuntimeError("boto3 is required for S3 storage. Install with: pip install boto3")
         self.bucket = bucket
         self.region = region or os.getenv("AWS_REGION", "us-east-1")
         self.prefix = prefix.strip("/")
-        self._client = boto3.client("s3", region_name=self.region)
+        self.multipart_chunksize = max(MIN_PART_SIZE, multipart_chunksize)
+        self.multipart_threshold = max(1, multipart_threshold)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_pool_connections = max(self.max_concurrency, max_pool_connections)
+        self._client = boto3.client(
+            "s3",
+            region_name=self.region,
+            endpoint_url=endpoint_url or None,
+            config=Config(
+                max_pool_connections=self.max_pool_connections,
+                retries={"mode": retry_mode, "total_max_attempts": max(1, max_attempts)},
+            ),
+        )
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def _part_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_pool_connections, thread_name_prefix="s3-part"
+                    )
+        return self._pool
 
     def _key(self, key: str) -> str:
         if self.prefix:
@@ -42,18 +107,101 @@ class S3StorageBackend(StorageBackend):
         content_type: str,
         original_filename: str,
     ) -> FileMetadata:
-        s3_key = self._key(key)
-        data = file_obj.read()
-        self._client.put_object(
-            Bucket=self.bucket,
-            Key=s3_key,
-            Body=data,
-            ContentType=content_type,
+        return self.upload_stream(
+            iter_file_chunks(file_obj), key=key, content_type=content_type, original_filename=original_filename
         )
+
+    def upload_stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        key: str,
+        content_type: str,
+        original_filename: str,
+    ) -> FileMetadata:
+        """
+        PutObject up to multipart_threshold, else a concurrent multipart upload.
+        An error from the chunks aborts the upload, so no object is created.
+        """
+        s3_key = self._key(key)
+        it = iter(chunks)
+        head = bytearray()
+        for chunk in it:
+            head += chunk
+            if len(head) > self.multipart_threshold:
+                break
+        else:
+            self._client.put_object(Bucket=self.bucket, Key=s3_key, Body=bytes(head), ContentType=content_type)
+            return self._metadata(key, original_filename, len(head), content_type)
+        size = self._upload_multipart(s3_key, content_type, head, it)
+        return self._metadata(key, original_filename, size, content_type)
+
+    def _upload_multipart(self, s3_key: str, content_type: str, head: bytearray, rest) -> int:
+        upload_id = self._client.create_multipart_upload(
+            Bucket=self.bucket, Key=s3_key, ContentType=content_type
+        )["UploadId"]
+        slots = threading.Semaphore(self.max_concurrency)  # parts buffered or in flight
+        futures: list[Future] = []
+        size = 0
+
+        def send(number: int, body: bytes) -> dict:
+            resp = self._client.upload_part(
+                Bucket=self.bucket, Key=s3_key, UploadId=upload_id, PartNumber=number, Body=body
+            )
+            return {"PartNumber": number, "ETag": resp["ETag"]}
+
+        def submit(body: bytes) -> None:
+            if len(futures) >= MAX_PARTS:
+                raise ValueError(f"Upload exceeds {MAX_PARTS} parts of {self.multipart_chunksize} bytes")
+            for done in futures:
+                if done.done() and done.exception() is not None:
+                    raise done.exception()
+            slots.acquire()
+            future = self._part_pool().submit(send, len(futures) + 1, body)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+
+        buffer = head
+        try:
+            for chunk in rest:
+                buffer += chunk
+                while len(buffer) >= self.multipart_chunksize:
+                    part = bytes(buffer[: self.multipart_chunksize])
+                    del buffer[: self.multipart_chunksize]
+                    size += len(part)
+                    submit(part)
+            # Trailing bytes (or, if the threshold is below the part size, the whole file).
+            while len(buffer) >= self.multipart_chunksize:
+                size += self.multipart_chunksize
+                submit(bytes(buffer[: self.multipart_chunksize]))
+                del buffer[: self.multipart_chunksize]
+            if buffer or not futures:
+                size += len(buffer)
+                submit(bytes(buffer))
+            parts = [future.result() for future in futures]
+            self._client.complete_multipart_upload(
+                Bucket=self.bucket, Key=s3_key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            for future in futures:
+                try:
+                    future.exception()
+                except BaseException:
+                    pass
+            try:
+                self._client.abort_multipart_upload(Bucket=self.bucket, Key=s3_key, UploadId=upload_id)
+            except Exception:
+                pass  # a bucket lifecycle rule (AbortIncompleteMultipartUpload) cleans up leftovers
+            raise
+        return size
+
+    def _metadata(self, key: str, original_filename: str, size: int, content_type: str) -> FileMetadata:
         return FileMetadata(
             storage_key=key,
             original_filename=original_filename,
-            size=len(data),
+            size=size,
             content_type=content_type,
             uploaded_at=datetime.now(timezone.utc).isoformat(),
         )
@@ -68,6 +216,56 @@ class S3StorageBackend(StorageBackend):
                 raise FileNotFoundError(key) from e
             raise
 
+    def open_stream(self, key: str, start: int | None = None, end: int | None = None) -> FileStream:
+        """One GetObject (with a Range for partial reads); the body is streamed in chunks."""
+        params = {"Bucket": self.bucket, "Key": self._key(key)}
+        if start is not None or end is not None:
+            params["Range"] = f"bytes={'' if start is None else start}-{'' if end is None else end}"
+        try:
+            resp = self._client.get_object(**params)
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in ("NoSuchKey", "404"):
+                raise FileNotFoundError(key) from e
+            if code == "InvalidRange":
+                meta = self.get_metadata(key)
+                raise RangeNotSatisfiableError(meta.size if meta else 0) from e
+            raise
+        length = resp["ContentLength"]
+        content_range = resp.get("ContentRange")  # "bytes 0-99/1234" on ranged reads
+        if content_range:
+            span, total = content_range.split(" ", 1)[-1].split("/")
+            first = int(span.split("-")[0])
+            total_size = int(total)
+        else:
+            first, total_size = 0, length
+        body = resp["Body"]
+        return FileStream(
+            storage_key=key,
+            start=first,
+            end=first + length - 1,
+            total_size=total_size,
+            content_type=resp.get("ContentType", "application/octet-stream"),
+            etag=resp.get("ETag"),
+            last_modified=resp.get("LastModified"),
+            chunks=body.iter_chunks(DEFAULT_CHUNK_SIZE),
+            _close=body.close,
+        )
+
+    def move(self, source_key: str, dest_key: str) -> None:
+        """Server-side CopyObject (one consistent version of the source), then delete the source."""
+        try:
+            self._client.copy_object(
+                Bucket=self.bucket,
+                Key=self._key(dest_key),
+                CopySource={"Bucket": self.bucket, "Key": self._key(source_key)},
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                raise FileNotFoundError(source_key) from e
+            raise
+        self._client.delete_object(Bucket=self.bucket, Key=self._key(source_key))
+
     def delete(self, key: str) -> None:
         s3_key = self._key(key)
         self._client.delete_object(Bucket=self.bucket, Key=s3_key)
@@ -95,3 +293,26 @@ class S3StorageBackend(StorageBackend):
             Params={"Bucket": self.bucket, "Key": s3_key},
             ExpiresIn=3600,
         )
+
+    def presign_upload(
+        self,
+        key: str,
+        *,
+        content_type: str,
+        max_bytes: int,
+        expires_in: int = DEFAULT_UPLOAD_URL_EXPIRY,
+    ) -> PresignedUpload:
+        """Presigned POST: S3 itself refuses another Content-Type or a body outside 1..max_bytes."""
+        post = self._client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=self._key(key),
+            Fields={"Content-Type": content_type},
+            Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, max_bytes]],
+            ExpiresIn=expires_in,
+        )
+        return PresignedUpload(
+            method="POST",
+            url=post["url"],
+            fields=post["fields"],
+            expires_at=datetime.now(timezone.utc) + timedelta(seconds=expires_in),
+        )
@@ -1,4 +1,11 @@
 """Storage interfaces."""
-from storage.interfaces.base import FileMetadata, StorageBackend
+from storage.interfaces.base import (
+    FileMetadata,
+    FileStream,
+    PresignedUpload,
+    RangeNotSatisfiableError,
+    StorageBackend,
+    resolve_range,
+)
 
-__all__ = ["StorageBackend", "FileMetadata"]
+__all__ = ["StorageBackend", "FileMetadata", "FileStream", "PresignedUpload", "RangeNotSatisfiableError", "resolve_range"]
@@ -1,7 +1,10 @@
 """Abstract file storage interface."""
+import hashlib
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import BinaryIO
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator
 
 
 @dataclass
@@ -15,6 +18,111 @@ class FileMetadata:
     uploaded_at: str  # ISO datetime
 
 
+class RangeNotSatisfiableError(ValueError):
+    """The requested byte range starts past the end of the file (HTTP 416)."""
+
+    def __init__(self, total_size: int) -> None:
+        super().__init__(f"Range not satisfiable (size {total_size})")
+        self.total_size = total_size
+
+
+def resolve_range(start: int | None, end: int | None, total_size: int) -> tuple[int, int]:
+    """
+    Absolute inclusive (start, end) for a request like an HTTP byte range:
+    (None, None) whole file, (s, None) from s to the end, (None, n) the last n bytes,
+    (s, e) clipped to the file. Raises RangeNotSatisfiableError past the end.
+    """
+    if start is None and end is None:
+        return 0, total_size - 1
+    if start is None:
+        if not end:
+            raise RangeNotSatisfiableError(total_size)
+        return max(0, total_size - end), total_size - 1
+    if start >= total_size or (end is not None and end < start):
+        raise RangeNotSatisfiableError(total_size)
+    return start, total_size - 1 if end is None else min(end, total_size - 1)
+
+
+@dataclass
+class FileStream:
+    """
+    An open read of a stored file, or of the byte range start..end (inclusive).
+    Iterate it for the bytes; close() when done. path is set when the bytes are
+    a local file (servers can sendfile it instead of iterating).
+    """
+
+    storage_key: str
+    start: int
+    end: int
+    total_size: int
+    content_type: str
+    etag: str | None
+    last_modified: datetime | None
+    chunks: Iterator[bytes]
+    path: Path | None = None
+    _close: Callable[[], None] | None = field(default=None, repr=False)
+
+    @property
+    def size(self) -> int:
+        """Bytes in this read (Content-Length)."""
+        return max(0, self.end - self.start + 1)
+
+    @property
+    def partial(self) -> bool:
+        """True when only part of the file is read (HTTP 206)."""
+        return self.size < self.total_size
+
+    @classmethod
+    def from_bytes(
+        cls,
+        key: str,
+        data: bytes,
+        *,
+        start: int | None = None,
+        end: int | None = None,
+        content_type: str = "application/octet-stream",
+        last_modified: datetime | None = None,
+    ) -> "FileStream":
+        """FileStream over bytes already in memory (backends without a streaming read)."""
+        first, last = resolve_range(start, end, len(data))
+        return cls(
+            storage_key=key,
+            start=first,
+            end=last,
+            total_size=len(data),
+            content_type=content_type,
+            etag=f'"{hashlib.md5(data, usedforsecurity=False).hexdigest()}"',
+            last_modified=last_modified,
+            chunks=iter([data[first:last + 1]]),
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+    def close(self) -> None:
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+
+DEFAULT_UPLOAD_URL_EXPIRY = 900  # seconds a presigned upload stays usable
+
+
+@dataclass
+class PresignedUpload:
+    """
+    How a client uploads one object straight to storage (StorageBackend.presign_upload).
+    POST: a multipart/form-data request with fields first, then the file as "file".
+    PUT: the raw bytes as the body, with headers.
+    """
+
+    method: str
+    url: str
+    fields: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    expires_at: datetime | None = None
+
+
 class StorageBackend(ABC):
     """Abstract interface for file storage (upload, download, delete, metadata)."""
 
@@ -30,11 +138,74 @@ class StorageBackend(ABC):
         """Store a file and return its metadata."""
         ...
 
+    def upload_stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        key: str,
+        content_type: str,
+        original_filename: str,
+    ) -> FileMetadata:
+        """
+        Store a file given as an iterable of chunks (e.g. storage.streaming.UploadStream)
+        without holding it in memory. If iterating raises, nothing is stored and the
+        error propagates. The default adapts the chunks to a file for upload();
+        backends override it to write chunk by chunk.
+        """
+        from storage.streaming import ChunkReader
+
+        return self.upload(ChunkReader(chunks), key=key, content_type=content_type, original_filename=original_filename)
+
     @abstractmethod
     def download(self, key: str) -> bytes:
         """Retrieve file contents by key. Raises if not found."""
         ...
 
+    def open_stream(self, key: str, start: int | None = None, end: int | None = None) -> FileStream:
+        """
+        Open key for reading, optionally only the byte range start..end (see
+        resolve_range). Raises FileNotFoundError or RangeNotSatisfiableError.
+        The default downloads the whole file; backends override it to stream.
+        """
+        meta = self.get_metadata(key)
+        return FileStream.from_bytes(
+            key,
+            self.download(key),
+            start=start,
+            end=end,
+            content_type=meta.content_type if meta else "application/octet-stream",
+        )
+
+    def move(self, source_key: str, dest_key: str) -> None:
+        """
+        Move a stored file to dest_key (replacing it), then remove source_key.
+        Raises FileNotFoundError when source_key does not exist. The default streams
+        the file across; backends override it with a rename or server-side copy.
+        """
+        stream = self.open_stream(source_key)
+        try:
+            self.upload_stream(
+                stream, key=dest_key, content_type=stream.content_type, original_filename=dest_key.rsplit("/", 1)[-1]
+            )
+        finally:
+            stream.close()
+        self.delete(source_key)
+
+    def presign_upload(
+        self,
+        key: str,
+        *,
+        content_type: str,
+        max_bytes: int,
+        expires_in: int = DEFAULT_UPLOAD_URL_EXPIRY,
+    ) -> PresignedUpload:
+        """
+        Grant a client a direct upload of at most max_bytes of content_type to key,
+        valid for expires_in seconds. Raises NotImplementedError when the backend
+        cannot take uploads that bypass the application.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support direct uploads")
+
     @abstractmethod
     def delete(self, key: str) -> None:
         """Remove a file by key. No-op if not found."""
@@ -1,7 +1,27 @@
 """Malware scanning interface. Production can plug in a scanner; development bypasses."""
+import tempfile
 from abc import ABC, abstractmethod
 from typing import BinaryIO
 
+SCAN_SPOOL_BYTES = 1024 * 1024  # BufferedScanSession keeps this much in memory, the rest on disk
+
+
+class ScanSession(ABC):
+    """Incremental scan of one upload: feed() each chunk, then result()."""
+
+    @abstractmethod
+    def feed(self, chunk: bytes) -> None:
+        """Pass the next chunk of the file to the scanner."""
+        ...
+
+    @abstractmethod
+    def result(self) -> tuple[bool, str]:
+        """Verdict once every chunk has been fed. Returns (safe, message)."""
+        ...
+
+    def close(self) -> None:
+        """Release resources (temp files, connections)."""
+
 
 class MalwareScanner(ABC):
     """Interface for scanning uploads. In development, use NoOpScanner."""
@@ -14,9 +34,56 @@ class MalwareScanner(ABC):
         """
         ...
 
+    def start(self, filename: str) -> ScanSession:
+        """
+        Begin a streaming scan. Scanners that accept a stream (e.g. clamd INSTREAM)
+        should override this; the default spools the chunks and calls scan().
+        """
+        return BufferedScanSession(self, filename)
+
+
+class BufferedScanSession(ScanSession):
+    """Spools fed chunks to a SpooledTemporaryFile, then runs scanner.scan() on it."""
+
+    def __init__(self, scanner, filename: str, spool_bytes: int = SCAN_SPOOL_BYTES) -> None:
+        self._scanner = scanner
+        self._filename = filename
+        self._file = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+
+    def feed(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+
+    def result(self) -> tuple[bool, str]:
+        self._file.seek(0)
+        return self._scanner.scan(self._file, self._filename)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _NoOpScanSession(ScanSession):
+    def feed(self, chunk: bytes) -> None:
+        pass
+
+    def result(self) -> tuple[bool, str]:
+        return True, ""
+
 
 class NoOpScanner(MalwareScanner):
     """No-op scanner for development: always reports safe."""
 
     def scan(self, file_obj: BinaryIO, filename: str) -> tuple[bool, str]:
         return True, ""
+
+    def start(self, filename: str) -> ScanSession:
+        return _NoOpScanSession()
+
+
+def start_scan(scanner, filename: str) -> ScanSession | None:
+    """Scan session for scanner (None when there is no scanner); scan()-only scanners are spooled."""
+    if scanner is None:
+        return None
+    start = getattr(scanner, "start", None)
+    if callable(start):
+        return start(filename)
+    return BufferedScanSession(scanner, filename)
@@ -0,0 +1,57 @@
+"""
+HMAC-signed, expiring tokens: a base64url JSON payload and its SHA-256 HMAC.
+
+Used for upload grants that must survive a round trip through the client (the
+local backend's signed upload URLs, an API's pending-upload tickets) without
+server-side state. The payload is readable by the client, so put nothing
+secret in it; the signature only guarantees it was issued with key and is
+unexpired.
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from typing import Any
+
+
+class InvalidTokenError(ValueError):
+    """The token is malformed, its signature does not match, or it has expired."""
+
+    code = "invalid_upload_token"
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _signature(encoded: str, key: bytes) -> str:
+    return _b64encode(hmac.new(key, encoded.encode("ascii"), hashlib.sha256).digest())
+
+
+def sign_token(payload: dict[str, Any], key: bytes, expires_in: int) -> str:
+    """Token for payload (JSON-serializable) valid for expires_in seconds; URL-path safe."""
+    body = dict(payload, exp=int(time.time()) + expires_in)
+    encoded = _b64encode(json.dumps(body, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+    return f"{encoded}.{_signature(encoded, key)}"
+
+
+def verify_token(token: str, key: bytes) -> dict[str, Any]:
+    """Payload of a token from sign_token (with its "exp"); raises InvalidTokenError."""
+    encoded, _, signature = (token or "").partition(".")
+    try:
+        if not encoded or not signature or not hmac.compare_digest(signature, _signature(encoded, key)):
+            raise InvalidTokenError("Invalid upload token")
+        payload = json.loads(_b64decode(encoded))
+    except InvalidTokenError:
+        raise
+    except (ValueError, TypeError, binascii.Error):  # non-ASCII or undecodable
+        raise InvalidTokenError("Invalid upload token") from None
+    if not isinstance(payload, dict) or not isinstance(payload.get("exp"), int) or payload["exp"] < time.time():
+        raise InvalidTokenError("Upload token has expired")
+    return payload
@@ -0,0 +1,147 @@
+"""
+Single-pass upload streaming: size limit, hash, type sniffing and scan feed per chunk.
+
+UploadStream wraps an iterable of byte chunks and is itself iterated by a
+backend's upload_stream(). Each chunk is counted (UploadTooLargeError as soon as
+max_bytes is passed, before anything past the limit is written), hashed,
+sniffed (the first bytes must match the declared content type), fed to the
+malware scan session and optionally copied to a tee file (e.g. a spooled file
+for thumbnailing). The type and scan verdicts and any on_end check are raised
+when the chunks are exhausted (so the size limit takes precedence), before the
+backend publishes the object: a rejected upload is never visible in storage. Only the chunk in flight is held in memory.
+"""
+import hashlib
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+from storage.scanning import ScanSession
+from storage.validation import SNIFF_BYTES, sniff_content_type
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class UploadRejectedError(ValueError):
+    """The upload failed validation or scanning while streaming; nothing was stored."""
+
+    code = "validation_error"
+
+
+class UploadTooLargeError(UploadRejectedError):
+    """The upload passed the size limit; raised before the excess is written."""
+
+    code = "file_too_large"
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(f"File size exceeds {max_bytes // (1024 * 1024)}MB limit")
+        self.max_bytes = max_bytes
+
+
+def iter_file_chunks(file_obj: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the rest of file_obj in chunk_size pieces."""
+    while True:
+        chunk = file_obj.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class ChunkReader:
+    """Minimal read()-able file over an iterable of chunks, for APIs that want a file object."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._buffer = b""
+        self._done = False
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                self._done = True
+        if size < 0 or size >= len(self._buffer):
+            out, self._buffer = self._buffer, b""
+        else:
+            out, self._buffer = self._buffer[:size], self._buffer[size:]
+        return out
+
+
+class UploadStream:
+    """
+    Iterate chunks once, enforcing max_bytes and declared_type, hashing (sha256),
+    feeding scan and writing tee. After iteration: size, sha256, sniffed_type.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        max_bytes: int,
+        declared_type: str | None = None,
+        scan: ScanSession | None = None,
+        tee: BinaryIO | None = None,
+        on_end: Callable[[], None] | None = None,
+    ) -> None:
+        self._chunks = chunks
+        self.max_bytes = max_bytes
+        self.declared_type = (declared_type or "").strip().lower() or None
+        self._scan = scan
+        self._tee = tee
+        self._on_end = on_end
+        self._hash = hashlib.sha256()
+        self._head = b""
+        self.size = 0
+        self.sniffed_type: str | None = None
+        self.completed = False
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def type_matches(self) -> bool:
+        """False if the sniffed content does not match declared_type (known after the first bytes)."""
+        return not self.declared_type or self.sniffed_type == self.declared_type
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.completed:
+            raise RuntimeError("UploadStream can only be iterated once")
+        sniffed = False
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            self.size += len(chunk)
+            if self.size > self.max_bytes:
+                raise UploadTooLargeError(self.max_bytes)
+            if not sniffed:
+                self._head += chunk[: SNIFF_BYTES - len(self._head)]
+                if len(self._head) >= SNIFF_BYTES:
+                    self.sniffed_type = sniff_content_type(self._head)
+                    sniffed = True
+            self._hash.update(chunk)
+            if self._scan is not None:
+                self._scan.feed(chunk)
+            if self._tee is not None:
+                self._tee.write(chunk)
+            yield chunk
+        if not sniffed:
+            self.sniffed_type = sniff_content_type(self._head)
+        if not self.type_matches:
+            raise UploadRejectedError(f"File content does not match content type {self.declared_type}")
+        if self._scan is not None:
+            safe, message = self._scan.result()
+            if not safe:
+                raise UploadRejectedError(message or "File scan failed.")
+        if self._on_end is not None:
+            self._on_end()
+        self.completed = True
+
+    def close(self) -> None:
+        """Release the scan session (call in a finally; safe to call twice)."""
+        if self._scan is not None:
+            self._scan.close()
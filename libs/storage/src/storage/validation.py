@@ -9,6 +9,14 @@ ALLOWED_CONTENT_TYPES: Set[str] = {
 }
 MAX_FILE_SIZE_BYTES: int = 10 * 1024 * 1024  # 10MB
 
+# Leading bytes that identify each allowed type; the declared type must match.
+SNIFF_BYTES: int = 8
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"%PDF-", "application/pdf"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+)
+
 
 def allowed_content_type(content_type: str) -> bool:
     """Return True if content type is allowed."""
@@ -23,9 +31,17 @@ def allowed_extension(filename: str) -> bool:
     return f".{ext}" in ALLOWED_EXTENSIONS
 
 
-def allowed_size(size: int) -> bool:
-    """Return True if size is within limit."""
-    return 0 <= size <= MAX_FILE_SIZE_BYTES
+def allowed_size(size: int, max_bytes: int | None = None) -> bool:
+    """Return True if size is within limit (max_bytes, default MAX_FILE_SIZE_BYTES)."""
+    return 0 <= size <= (MAX_FILE_SIZE_BYTES if max_bytes is None else max_bytes)
+
+
+def sniff_content_type(head: bytes) -> str | None:
+    """Content type of an allowed format from the file's first SNIFF_BYTES bytes, or None."""
+    for signature, content_type in _SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    return None
 
 
 def validate_file(
@@ -33,15 +49,17 @@ def validate_file(
     filename: str,
     content_type: str,
     size: int,
+    max_bytes: int | None = None,
 ) -> tuple[bool, str]:
     """
     Validate file. Returns (ok, error_message).
     error_message is empty when ok is True.
     """
+    limit = MAX_FILE_SIZE_BYTES if max_bytes is None else max_bytes
     if not allowed_extension(filename):
         return False, f"File type not allowed. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
     if not allowed_content_type(content_type):
         return False, f"Content type not allowed: {content_type}"
-    if not allowed_size(size):
-        return False, f"File size exceeds {MAX_FILE_SIZE_BYTES // (1024*1024)}MB limit"
+    if not allowed_size(size, limit):
+        return False, f"File size exceeds {limit // (1024*1024)}MB limit"
     return True, ""
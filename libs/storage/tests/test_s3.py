@@ -0,0 +1,156 @@
+"""Tests for S3StorageBackend uploads against an S3 stand-in: moto, or MinIO via TEST_S3_ENDPOINT_URL."""
+import hashlib
+import os
+import uuid
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from storage.implementations.s3 import MB, S3StorageBackend  # noqa: E402
+from storage.streaming import UploadRejectedError, UploadStream  # noqa: E402
+
+
+def _backend(**kwargs) -> S3StorageBackend:
+    return S3StorageBackend(
+        bucket=os.environ["TEST_S3_BUCKET"],
+        region="us-east-1",
+        prefix="test",
+        endpoint_url=os.getenv("TEST_S3_ENDPOINT_URL"),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def s3(monkeypatch: pytest.MonkeyPatch):
+    """A fresh bucket on MinIO (TEST_S3_ENDPOINT_URL) or in moto; yields the raw client for assertions."""
+    bucket = f"storage-test-{uuid.uuid4().hex[:12]}"
+    monkeypatch.setenv("TEST_S3_BUCKET", bucket)
+    if os.getenv("TEST_S3_ENDPOINT_URL"):
+        client = _backend()._client
+        client.create_bucket(Bucket=bucket)
+        yield client
+        for obj in client.list_objects_v2(Bucket=bucket).get("Contents", []):
+            client.delete_object(Bucket=bucket, Key=obj["Key"])
+        client.delete_bucket(Bucket=bucket)
+        return
+    moto = pytest.importorskip("moto")
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN"):
+        monkeypatch.setenv(name, "testing")
+    with moto.mock_aws():
+        client = _backend()._client
+        client.create_bucket(Bucket=bucket)
+        yield client
+
+
+def _chunks(data: bytes, size: int = 256 * 1024):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def _pending_uploads(client) -> list:
+    return client.list_multipart_uploads(Bucket=os.environ["TEST_S3_BUCKET"]).get("Uploads", [])
+
+
+def test_small_upload_is_single_put(s3) -> None:
+    backend = _backend(multipart_threshold=5 * MB)
+    data = b"%PDF-1.4 small"
+    meta = backend.upload_stream(_chunks(data), key="a/small.pdf", content_type="application/pdf", original_filename="small.pdf")
+    assert meta.size == len(data)
+    head = s3.head_object(Bucket=os.environ["TEST_S3_BUCKET"], Key="test/a/small.pdf")
+    assert "-" not in head["ETag"]  # not a multipart ETag
+    assert head["ContentType"] == "application/pdf"
+    assert backend.download("a/small.pdf") == data
+
+
+def test_large_upload_sends_concurrent_parts(s3) -> None:
+    backend = _backend(multipart_threshold=5 * MB, multipart_chunksize=5 * MB, max_concurrency=3)
+    data = os.urandom(13 * MB)
+    sent: list[int] = []
+    upload_part = backend._client.upload_part
+
+    def counting_upload_part(**kwargs):
+        sent.append(kwargs["PartNumber"])
+        return upload_part(**kwargs)
+
+    backend._client.upload_part = counting_upload_part
+    meta = backend.upload_stream(_chunks(data), key="a/big.pdf", content_type="application/pdf", original_filename="big.pdf")
+    assert meta.size == len(data)
+    assert sorted(sent) == [1, 2, 3]  # 5 MB + 5 MB + 3 MB
+    head = s3.head_object(Bucket=os.environ["TEST_S3_BUCKET"], Key="test/a/big.pdf")
+    assert head["ETag"].strip('"').endswith("-3")
+    assert head["ContentLength"] == len(data)
+    assert hashlib.sha256(b"".join(backend.open_stream("a/big.pdf"))).digest() == hashlib.sha256(data).digest()
+    assert _pending_uploads(s3) == []
+
+
+def test_rejected_stream_aborts_multipart_upload(s3) -> None:
+    backend = _backend(multipart_threshold=5 * MB, multipart_chunksize=5 * MB)
+    data = b"%PDF-1.4" + b"\0" * (12 * MB)
+    stream = UploadStream(_chunks(data), max_bytes=11 * MB)  # fails after two parts were sent
+    with pytest.raises(UploadRejectedError):
+        backend.upload_stream(stream, key="a/rejected.pdf", content_type="application/pdf", original_filename="x.pdf")
+    assert _pending_uploads(s3) == []
+    assert backend.get_metadata("a/rejected.pdf") is None
+
+
+def test_failed_part_aborts_multipart_upload(s3) -> None:
+    backend = _backend(multipart_threshold=5 * MB, multipart_chunksize=5 * MB)
+    upload_part = backend._client.upload_part
+
+    def flaky_upload_part(**kwargs):
+        if kwargs["PartNumber"] == 2:
+            raise ConnectionError("connection reset")
+        return upload_part(**kwargs)
+
+    backend._client.upload_part = flaky_upload_part
+    with pytest.raises(ConnectionError):
+        backend.upload_stream(
+            _chunks(b"\0" * (16 * MB)), key="a/flaky.pdf", content_type="application/pdf", original_filename="x.pdf"
+        )
+    assert _pending_uploads(s3) == []
+    assert backend.get_metadata("a/flaky.pdf") is None
+
+
+def test_move_copies_server_side_and_deletes_source(s3) -> None:
+    backend = _backend()
+    backend.upload_stream([b"%PDF-1.4 staged"], key="pending/1", content_type="application/pdf", original_filename="1")
+    backend.move("pending/1", "docs/1.pdf")
+    assert backend.download("docs/1.pdf") == b"%PDF-1.4 staged"
+    assert backend.get_metadata("docs/1.pdf").content_type == "application/pdf"
+    assert backend.get_metadata("pending/1") is None
+    with pytest.raises(FileNotFoundError):
+        backend.move("pending/1", "docs/1.pdf")
+
+
+def test_client_pool_and_retry_configuration() -> None:
+    backend = S3StorageBackend(
+        bucket="b", region="us-east-1", max_concurrency=8, max_pool_connections=4, retry_mode="adaptive", max_attempts=7
+    )
+    config = backend._client.meta.config
+    assert config.max_pool_connections == 8  # never fewer connections than parts in flight
+    assert config.retries == {"mode": "adaptive", "total_max_attempts": 7}  # first call included
+    assert backend.multipart_chunksize >= 5 * MB
+
+
+def test_presigned_post_upload_is_limited_to_grant(s3) -> None:
+    import base64
+    import json
+
+    requests = pytest.importorskip("requests")
+    backend = _backend()
+    grant = backend.presign_upload("a/direct.pdf", content_type="application/pdf", max_bytes=16)
+    assert grant.method == "POST"
+    assert grant.fields["Content-Type"] == "application/pdf"
+    conditions = json.loads(base64.b64decode(grant.fields["policy"]))["conditions"]
+    assert ["content-length-range", 1, 16] in conditions
+    assert {"Content-Type": "application/pdf"} in conditions
+
+    def post(content: bytes):
+        return requests.post(grant.url, data=grant.fields, files={"file": ("direct.pdf", content)})
+
+    if os.getenv("TEST_S3_ENDPOINT_URL"):  # moto does not evaluate POST policies
+        assert post(b"%PDF-1.4 " + b"x" * 64).status_code == 400
+        assert backend.get_metadata("a/direct.pdf") is None
+    assert post(b"%PDF-1.4 ok").status_code in (200, 204)
+    assert backend.download("a/direct.pdf") == b"%PDF-1.4 ok"
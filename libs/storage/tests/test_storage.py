@@ -53,3 +53,232 @@ def test_validation_size_over() -> None:
 def test_validation_extension() -> None:
     assert allowed_extension("a.pdf") is True
     assert allowed_extension("a.exe") is False
+
+
+def _chunks(head: bytes, total: int, chunk_size: int = 64 * 1024):
+    """Yield head then filler up to total bytes, one chunk at a time."""
+    yield head
+    sent = len(head)
+    while sent < total:
+        n = min(chunk_size, total - sent)
+        yield b"\0" * n
+        sent += n
+
+
+def test_upload_stream_hashes_sniffs_and_stores() -> None:
+    import hashlib
+
+    from storage.streaming import UploadStream
+
+    data = b"%PDF-1.4 streamed" * 1000
+    with tempfile.TemporaryDirectory() as d:
+        backend = LocalStorageBackend(Path(d))
+        stream = UploadStream(
+            (data[i:i + 1000] for i in range(0, len(data), 1000)),
+            max_bytes=len(data),
+            declared_type="application/pdf",
+        )
+        meta = backend.upload_stream(stream, key="a/doc.pdf", content_type="application/pdf", original_filename="doc.pdf")
+        assert meta.size == stream.size == len(data)
+        assert stream.sha256 == hashlib.sha256(data).hexdigest()
+        assert stream.sniffed_type == "application/pdf"
+        assert backend.download("a/doc.pdf") == data
+
+
+def test_upload_stream_rejections_leave_nothing_stored() -> None:
+    from storage.scanning import MalwareScanner
+    from storage.streaming import UploadRejectedError, UploadStream, UploadTooLargeError
+
+    class Infected(MalwareScanner):
+        def scan(self, file_obj, filename):
+            return b"EICAR" not in file_obj.read(), "threat found"
+
+    with tempfile.TemporaryDirectory() as d:
+        backend = LocalStorageBackend(Path(d))
+        cases = [
+            (UploadTooLargeError, UploadStream(_chunks(b"%PDF-", 3000, 1000), max_bytes=2500)),
+            (UploadRejectedError, UploadStream([b"\x89PNG\r\n\x1a\n..."], max_bytes=100, declared_type="application/pdf")),
+            (UploadRejectedError, UploadStream(
+                [b"%PDF-1.4 ", b"EICAR"], max_bytes=100, scan=Infected().start("x.pdf")
+            )),
+        ]
+        for error, stream in cases:
+            with pytest.raises(error):
+                backend.upload_stream(stream, key="a/x.pdf", content_type="application/pdf", original_filename="x.pdf")
+            stream.close()
+        assert list(Path(d).rglob("*.*")) == []
+
+
+def test_local_upload_stream_memory_is_bounded_by_chunk_size() -> None:
+    import tracemalloc
+
+    from storage.scanning import NoOpScanner
+    from storage.streaming import UploadStream
+
+    total = 8 * 1024 * 1024
+    with tempfile.TemporaryDirectory() as d:
+        backend = LocalStorageBackend(Path(d))
+        tracemalloc.start()
+        try:
+            stream = UploadStream(
+                _chunks(b"%PDF-1.4", total),
+                max_bytes=total,
+                declared_type="application/pdf",
+                scan=NoOpScanner().start("big.pdf"),
+            )
+            meta = backend.upload_stream(stream, key="big.pdf", content_type="application/pdf", original_filename="big.pdf")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert meta.size == total
+        assert peak < 512 * 1024  # a few 64 KB chunks, not the 8 MB file
+
+
+def test_sniff_content_type() -> None:
+    from storage.validation import sniff_content_type
+
+    assert sniff_content_type(b"%PDF-1.7") == "application/pdf"
+    assert sniff_content_type(b"\xff\xd8\xff\xe0") == "image/jpeg"
+    assert sniff_content_type(b"\x89PNG\r\n\x1a\n") == "image/png"
+    assert sniff_content_type(b"MZ\x90\x00") is None
+
+
+def test_resolve_range() -> None:
+    from storage.interfaces.base import RangeNotSatisfiableError, resolve_range
+
+    assert resolve_range(None, None, 100) == (0, 99)
+    assert resolve_range(10, None, 100) == (10, 99)
+    assert resolve_range(10, 500, 100) == (10, 99)
+    assert resolve_range(None, 30, 100) == (70, 99)
+    assert resolve_range(None, 300, 100) == (0, 99)
+    for start, end in [(100, None), (50, 10), (None, 0)]:
+        with pytest.raises(RangeNotSatisfiableError):
+            resolve_range(start, end, 100)
+
+
+def test_local_open_stream_reads_ranges_lazily() -> None:
+    from storage.interfaces.base import RangeNotSatisfiableError
+
+    data = bytes(range(256)) * 1024
+    with tempfile.TemporaryDirectory() as d:
+        backend = LocalStorageBackend(Path(d))
+        backend.upload(io.BytesIO(data), key="a/plan.pdf", content_type="application/pdf", original_filename="plan.pdf")
+        whole = backend.open_stream("a/plan.pdf")
+        assert (whole.size, whole.partial, whole.content_type) == (len(data), False, "application/pdf")
+        assert whole.path == Path(d) / "a/plan.pdf" and whole.etag and whole.last_modified
+        assert b"".join(whole) == data
+        part = backend.open_stream("a/plan.pdf", 1000, 200_000)
+        assert (part.start, part.end, part.size, part.partial) == (1000, 200_000, 199_001, True)
+        assert b"".join(part) == data[1000:200_001]
+        unread = backend.open_stream("a/plan.pdf", None, 16)
+        unread.close()  # never iterated: the file was never opened
+        with pytest.raises(RangeNotSatisfiableError):
+            backend.open_stream("a/plan.pdf", len(data))
+        with pytest.raises(FileNotFoundError):
+            backend.open_stream("a/missing.pdf")
+
+
+def test_s3_open_stream_uses_ranged_get_object() -> None:
+    import datetime
+
+    pytest.importorskip("boto3")
+    from botocore.response import StreamingBody
+    from botocore.stub import Stubber
+
+    from storage.implementations.s3 import S3StorageBackend
+
+    backend = S3StorageBackend(bucket="docs", region="us-east-1", prefix="app")
+    modified = datetime.datetime(2026, 1, 2, tzinfo=datetime.timezone.utc)
+    with Stubber(backend._client) as stub:
+        stub.add_response(
+            "get_object",
+            {
+                "Body": StreamingBody(io.BytesIO(b"0123456789"), 10),
+                "ContentLength": 10,
+                "ContentRange": "bytes 100-109/5000",
+                "ContentType": "application/pdf",
+                "ETag": '"abc"',
+                "LastModified": modified,
+            },
+            {"Bucket": "docs", "Key": "app/a/plan.pdf", "Range": "bytes=100-109"},
+        )
+        stream = backend.open_stream("a/plan.pdf", 100, 109)
+        assert (stream.start, stream.end, stream.total_size, stream.partial) == (100, 109, 5000, True)
+        assert (stream.etag, stream.last_modified, stream.path) == ('"abc"', modified, None)
+        assert b"".join(stream) == b"0123456789"
+        stream.close()
+        stub.add_client_error("get_object", service_error_code="NoSuchKey", http_status_code=404)
+        with pytest.raises(FileNotFoundError):
+            backend.open_stream("a/missing.pdf")
+
+
+def test_signed_tokens_detect_tampering_and_expiry() -> None:
+    from storage.signing import InvalidTokenError, sign_token, verify_token
+
+    token = sign_token({"key": "a/b.pdf"}, b"k1", expires_in=60)
+    assert verify_token(token, b"k1")["key"] == "a/b.pdf"
+    payload, _, signature = token.partition(".")
+    for bad in (token + "x", f"{payload[:-2]}xx.{signature}", "", "no-dot", "é.é"):
+        with pytest.raises(InvalidTokenError):
+            verify_token(bad, b"k1")
+    with pytest.raises(InvalidTokenError):
+        verify_token(token, b"k2")
+    with pytest.raises(InvalidTokenError, match="expired"):
+        verify_token(sign_token({}, b"k1", expires_in=-1), b"k1")
+
+
+def test_local_presigned_upload_enforces_grant(tmp_path: Path) -> None:
+    from storage.signing import InvalidTokenError, sign_token
+    from storage.streaming import UploadRejectedError, UploadTooLargeError
+
+    with pytest.raises(NotImplementedError):
+        LocalStorageBackend(tmp_path).presign_upload("a.pdf", content_type="application/pdf", max_bytes=10)
+    backend = LocalStorageBackend(tmp_path, upload_url="/uploads/", signing_key="secret")
+    grant = backend.presign_upload("docs/a.pdf", content_type="application/pdf", max_bytes=10)
+    assert grant.method == "PUT" and grant.url.startswith("/uploads/")
+    assert grant.headers == {"Content-Type": "application/pdf"}
+    token = grant.url.rsplit("/", 1)[1]
+
+    with pytest.raises(UploadTooLargeError):
+        backend.accept_signed_upload(token, [b"0123456789", b"!"], content_type="application/pdf")
+    with pytest.raises(UploadRejectedError):
+        backend.accept_signed_upload(token, [b"x"], content_type="image/png")
+    with pytest.raises(UploadRejectedError):
+        backend.accept_signed_upload(token, [], content_type="application/pdf")
+    assert backend.get_metadata("docs/a.pdf") is None
+
+    meta = backend.accept_signed_upload(token, [b"%PDF", b"-1.4"], content_type="application/pdf; charset=binary")
+    assert meta.size == 8 and backend.download("docs/a.pdf") == b"%PDF-1.4"
+    escape = sign_token({"key": "../outside.pdf", "content_type": "application/pdf", "max_bytes": 10}, b"secret", 60)
+    with pytest.raises(InvalidTokenError):
+        backend.accept_signed_upload(escape, [b"x"], content_type="application/pdf")
+    other = LocalStorageBackend(tmp_path, upload_url="/uploads", signing_key="different")
+    with pytest.raises(InvalidTokenError):
+        other.accept_signed_upload(token, [b"x"], content_type="application/pdf")
+
+
+def test_move_replaces_destination_and_removes_source(tmp_path: Path) -> None:
+    class DownloadOnly(LocalStorageBackend):
+        move = StorageBackend.move  # the streaming default
+        open_stream = StorageBackend.open_stream
+
+    for backend in (LocalStorageBackend(tmp_path / "a"), DownloadOnly(tmp_path / "b")):
+        backend.upload(io.BytesIO(b"new"), key="pending/1", content_type="application/pdf", original_filename="1")
+        backend.upload(io.BytesIO(b"old"), key="docs/1.pdf", content_type="application/pdf", original_filename="1.pdf")
+        backend.move("pending/1", "docs/1.pdf")
+        assert backend.download("docs/1.pdf") == b"new"
+        assert backend.get_metadata("pending/1") is None
+        with pytest.raises(FileNotFoundError):
+            backend.move("pending/1", "docs/1.pdf")
+
+
+def test_factory_signing_key_falls_back_to_jwt_secret(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Backends built in different workers must accept each other's signed URLs."""
+    monkeypatch.setenv("STORAGE_PROVIDER", "local")
+    monkeypatch.setenv("LOCAL_STORAGE_PATH", str(tmp_path))
+    monkeypatch.setenv("LOCAL_UPLOAD_URL", "/uploads")
+    monkeypatch.delenv("UPLOAD_SIGNING_KEY", raising=False)
+    monkeypatch.setenv("JWT_SECRET", "shared-secret")
+    worker_a, worker_b = get_storage(), get_storage()
+    token = worker_a.presign_upload("x.pdf", content_type="application/pdf", max_bytes=8).url.rsplit("/", 1)[1]
+    assert worker_b.accept_signed_upload(token, [b"%PDF-1.4"], content_type="application/pdf").size == 8